@@ -0,0 +1,18 @@
+# Date Created: 17/10/2026
+# Purpose: Supporting modules for the QWhizz Math program. These don't depend on the GUI, so they can be used without a Tk window.
+
+from .journal import ScoreboardJournal
+from .database import ScoreboardDatabase
+from .cache import ScoreboardCache
+from .allocator import RefAllocator
+from .persistence import WriteBehindWorker
+from .settings import SettingsManager
+from .validation import ValidationRecord, find_invalid_entries, remove_invalid_entries
+from .engine import QuestionEngine, GENERATOR_VERSION, generate, make_recipe, generate_from_recipe, Topic, TOPIC_REGISTRY, register_topic
+from .codec import SeededQuizSave
+from .question import Question, AnsweredQuestion
+from .bulk import generate_bulk
+from .prefetch import QuizPrefetcher
+from .adaptive import AccuracyStats, ADAPTIVE
+from .profiling import NavigationProfiler, format_measurement
+from .virtual_rows import VirtualRows
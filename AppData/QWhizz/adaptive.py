@@ -0,0 +1,133 @@
+# Date Created: 17/10/2026
+# Purpose: Adaptive quizzes for QWhizz Math, which choose the difficulty of each question topic from how accurately the user has answered that topic before.
+
+import json, os, random
+from .engine import DIFFICULTIES, GENERATORS, ordered_topics
+from .question import question_to_list
+
+ADAPTIVE = "Adaptive"  # Difficulty shown for adaptive quizzes, which mix the difficulties of the question topics.
+
+MIN_ANSWERS = 10        # Number of answers to a question family needed before the user's accuracy is used to move them to another difficulty.
+PROMOTE_ACCURACY = 0.8  # Accuracy at or above which the user moves up to the next difficulty of a topic.
+DEMOTE_ACCURACY = 0.5   # Accuracy below which the user moves back down to the previous difficulty of a topic.
+
+family_titles = {}  # Question family (difficulty, topic) of each question title, found by generating a question with each generator (see "question_family").
+
+
+class AccuracyStats:
+    # Constructor for the "AccuracyStats" class, which stores the path of the file that the statistics are saved to.
+    # The statistics hold the number of questions each user has answered correctly and in total for each question family, and are updated as each score is submitted, so that choosing an adaptive quiz never needs to read the saved quizzes.
+    def __init__(self, stats_path):
+        self.stats_path = stats_path  # Path of the JSON file storing the statistics (e.g. "AppData/accuracy.json").
+        self.users = {}               # Statistics of each user, mapping the username (in lowercase, since usernames are case insensitive) to a dictionary mapping "difficulty|topic" to [correct answers, answers].
+        self.changed = False          # Flag to track whether the statistics have changed since they were last saved.
+
+
+    # Method for loading the statistics. If the file is missing or invalid, they are rebuilt from the saved quizzes of the "users" list (once), loading each one with "load_quiz_save".
+    def load(self, users, load_quiz_save):
+        try:
+            with open(self.stats_path, "r") as file:
+                data = json.load(file)
+            if not isinstance(data, dict) or not all(isinstance(families, dict) for families in data.values()):
+                raise ValueError("Invalid accuracy statistics")
+            self.users = data
+            self.changed = False
+        except (OSError, ValueError):
+            if users != None:
+                self.rebuild(users, load_quiz_save)
+
+
+    # Method for rebuilding the statistics from the saved quizzes of the "users" list, skipping any that can't be loaded.
+    def rebuild(self, users, load_quiz_save):
+        self.users = {}
+        for user in users:
+            try:
+                quiz_save = load_quiz_save(user[0])
+            except Exception:
+                continue
+            if isinstance(quiz_save, list):
+                self.record(user[1], user[2], quiz_save)
+        self.changed = True
+
+
+    # Method for adding the answers of a completed quiz to the statistics of a user. "difficulty" is the difficulty of the quiz, which is only used for questions whose family can't be found from their title.
+    def record(self, username, difficulty, quiz_save):
+        families = self.users.setdefault(str(username).lower(), {})
+        for question in quiz_save:
+            question = question_to_list(question)
+            if not isinstance(question, list) or len(question) < 7:
+                continue
+            family = question_family(question[0], question[1], difficulty)
+            if family == None:
+                continue
+            counts = families.setdefault(f"{family[0]}|{family[1]}", [0, 0])
+            counts[0] += question[6] == question[4]
+            counts[1] += 1
+        self.changed = True
+
+
+    # Function for getting the accuracy of a user for a question family, as (correct answers, answers).
+    def accuracy(self, username, difficulty, topic):
+        correct, answered = self.users.get(str(username).lower(), {}).get(f"{difficulty}|{topic}", [0, 0])
+        return correct, answered
+
+
+    # Function for choosing the question families of an adaptive quiz for a user, returning (families, weights) for "QuestionEngine.generate_families".
+    # Each topic starts at the easiest difficulty and moves up a difficulty each time the user has answered enough questions of it accurately, or back down if they have answered the harder difficulty poorly. Topics the user answers less accurately are chosen more often.
+    def adaptive_families(self, username, topics):
+        families, weights = [], []
+        for topic in ordered_topics(topics):
+            difficulties = [difficulty for difficulty in DIFFICULTIES if (difficulty, topic) in GENERATORS]
+            if not difficulties:
+                continue
+            level = 0
+            while level + 1 < len(difficulties):
+                correct, answered = self.accuracy(username, difficulties[level], topic)
+                if answered < MIN_ANSWERS or correct < PROMOTE_ACCURACY * answered:
+                    break
+                level += 1
+            correct, answered = self.accuracy(username, difficulties[level], topic)
+            if level > 0 and answered >= MIN_ANSWERS and correct < DEMOTE_ACCURACY * answered:
+                level -= 1  # Move back down if the user is struggling with the harder difficulty.
+                correct, answered = self.accuracy(username, difficulties[level], topic)
+            families.append((difficulties[level], topic))
+            weights.append(2 if answered < MIN_ANSWERS else 1 if correct >= PROMOTE_ACCURACY * answered else 3 if correct < DEMOTE_ACCURACY * answered else 2)
+        return families, weights
+
+
+    # Function for taking a copy of the statistics to save, returning None if they haven't changed since the last copy was taken.
+    # The copy can be written on another thread with "write", while the statistics keep being updated.
+    def snapshot(self):
+        if self.changed == False:
+            return None
+        self.changed = False
+        return {username: {family: list(counts) for family, counts in families.items()} for username, families in self.users.items()}
+
+
+    # Method for writing a copy of the statistics from "snapshot", writing to a temporary file first so that the statistics file is never left half-written.
+    def write(self, stats):
+        if stats == None:
+            return
+        temporary_path = self.stats_path + ".tmp"
+        with open(temporary_path, "w") as file:
+            json.dump(stats, file, separators=(",", ":"))
+        os.replace(temporary_path, self.stats_path)
+
+
+    # Method for saving the statistics if they have changed.
+    def save(self):
+        self.write(self.snapshot())
+
+
+# Function for finding the question family (difficulty, topic) of a question from its topic and title, since each generator gives its questions the same title. If the title isn't known, the difficulty of the quiz is used (or None is returned for adaptive quizzes).
+def question_family(topic, title, difficulty):
+    family = family_titles.get((topic, title))
+    if family == None and len(family_titles) != len(GENERATORS):  # Find the titles of any generators that have been registered since the titles were last found.
+        for generator_family, generator in list(GENERATORS.items()):
+            if generator_family not in family_titles.values():
+                question = generator(random.Random(0))
+                family_titles[(question[0], question[1])] = generator_family
+        family = family_titles.get((topic, title))
+    if family == None and difficulty in DIFFICULTIES:
+        family = (difficulty, topic)
+    return family
@@ -0,0 +1,116 @@
+# Date Created: 17/10/2026
+# Purpose: Allocation of unique reference numbers for QWhizz Math scores, reusing the reference numbers of deleted scores.
+
+import json, os
+
+
+class RefAllocator:
+    # Constructor for the "RefAllocator" class, which stores the path of the file that the allocator state is saved to.
+    # New reference numbers count up from "first_ref" (1000, so that the existing 4-digit reference numbers stay valid), and the reference numbers of deleted scores are reused before new ones are counted.
+    def __init__(self, state_path, first_ref=1000):
+        self.state_path = state_path  # Path of the JSON file storing the allocator state (e.g. "AppData/ref_numbers.json").
+        self.first_ref = first_ref    # Lowest reference number that can be allocated.
+        self.next_ref = first_ref     # Next reference number that has never been allocated.
+        self.free = {}                # Reference numbers that can be reused, stored as dictionary keys so that adding, removing, and taking one are all O(1).
+        self.released = {}            # Reference numbers of scores deleted in this session, which aren't reused until the program restarts, since the deletion can still be undone until then.
+        self.changed = False          # Flag to track whether the state has changed since it was last saved.
+
+
+    # Method for loading the allocator state and checking it against the reference numbers in the "users" list.
+    # If "users" is None (e.g. the scoreboard couldn't be loaded), the saved state is used without being checked. If the state file is missing or doesn't match the "users" list, it is rebuilt from the "users" list.
+    def load(self, users):
+        try:
+            with open(self.state_path, "r") as file:
+                state = json.load(file)
+            self.next_ref = int(state["next"])
+            self.free = dict.fromkeys(int(ref_number) for ref_number in state["free"] + state.get("released", []))  # Reference numbers released in the last session can be reused now.
+            self.released = {}
+            self.changed = bool(state.get("released"))
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            if users == None:
+                return
+            self.rebuild(users)
+            return
+        if users == None:
+            return
+
+        used = used_refs(users)
+        if (used and max(used) >= self.next_ref) or any(ref_number in self.free for ref_number in used):  # Check if any reference number in use could be allocated again.
+            self.rebuild(users)
+
+
+    # Method for rebuilding the allocator state from the reference numbers in the "users" list, freeing every unused reference number below the highest one in use.
+    def rebuild(self, users):
+        used = used_refs(users)
+        self.next_ref = max([self.first_ref - 1] + list(used)) + 1
+        self.free = dict.fromkeys(ref_number for ref_number in range(self.first_ref, self.next_ref) if ref_number not in used)
+        self.released = {}
+        self.changed = True
+
+
+    # Function for allocating a reference number, reusing a freed reference number if there is one.
+    def allocate(self):
+        self.changed = True
+        if self.free:
+            return self.free.popitem()[0]
+        ref_number = self.next_ref
+        self.next_ref += 1
+        return ref_number
+
+
+    # Method for releasing the reference number of a deleted or replaced score, so that it can be reused after the program restarts.
+    def release(self, ref_number):
+        try:
+            self.released[int(ref_number)] = None
+            self.changed = True
+        except (TypeError, ValueError):
+            return
+
+
+    # Method for reserving the reference number of a score that has been restored (e.g. by undoing a deletion), so that it isn't reused.
+    def reserve(self, ref_number):
+        try:
+            ref_number = int(ref_number)
+        except (TypeError, ValueError):
+            return
+        self.released.pop(ref_number, None)
+        self.free.pop(ref_number, None)
+        if ref_number >= self.next_ref:
+            self.free.update(dict.fromkeys(range(self.next_ref, ref_number)))
+            self.next_ref = ref_number + 1
+        self.changed = True
+
+
+    # Function for taking a copy of the allocator state to save, returning None if it hasn't changed since the last copy was taken.
+    # The copy can be written on another thread with "write", while the allocator keeps being used.
+    def snapshot(self):
+        if self.changed == False:
+            return None
+        self.changed = False
+        return {"next": self.next_ref, "free": list(self.free), "released": list(self.released)}
+
+
+    # Method for writing a copy of the allocator state from "snapshot", writing to a temporary file first so that the state file is never left half-written.
+    def write(self, state):
+        if state == None:
+            return
+        temporary_path = self.state_path + ".tmp"
+        with open(temporary_path, "w") as file:
+            json.dump(state, file)
+        os.replace(temporary_path, self.state_path)
+
+
+    # Method for saving the allocator state if it has changed.
+    def save(self):
+        self.write(self.snapshot())
+
+
+# Function for getting the set of reference numbers in use by the "users" list, skipping any that aren't numbers.
+def used_refs(users):
+    used = set()
+    for user in users:
+        try:
+            used.add(int(user[0]))
+        except (TypeError, ValueError, IndexError):
+            continue
+    return used
@@ -0,0 +1,69 @@
+# Date Created: 17/10/2026
+# Purpose: Image asset cache for QWhizz Math, which decodes each image file once so that building a page doesn't read any image files after the first visit.
+# Unlike the rest of the package, this module needs Pillow, so it isn't imported by "__init__".
+
+import os, threading
+from PIL import Image
+
+
+class ImageAssets:
+    # Constructor for the "ImageAssets" class, which stores the folder the images are in and the functions used to create the images shown in the window.
+    # "photo_image" and "ctk_image" work like "ImageTk.PhotoImage" and "CTk.CTkImage" (which they usually are). They are passed in so that this module doesn't need a Tk window, and are only called on the thread running the window.
+    def __init__(self, directory, photo_image=None, ctk_image=None):
+        self.directory = directory      # Folder containing the image files (e.g. "AppData/Images").
+        self.photo_image = photo_image  # Function for creating a Tkinter image from a decoded image.
+        self.ctk_image = ctk_image      # Function for creating a CTk image from a decoded image and a size (width, height).
+        self.images = {}                # Decoded images, mapping each file name to its PIL image.
+        self.photo_images = {}          # Tkinter images, mapping each file name to the image created from it.
+        self.ctk_images = {}            # CTk images, mapping each (file name, size) to the image created from it.
+        self.lock = threading.Lock()    # Lock held while decoding, so that an image being preloaded isn't decoded twice.
+        self.thread = None
+
+
+    # Method for decoding the given images on a background thread, so that they are ready by the time the pages that show them are built. Images that can't be decoded are skipped, and raise their error when they are used instead.
+    def preload(self, names):
+        names = list(names)
+        def decode_all():
+            for name in names:
+                try:
+                    self.image(name)
+                except OSError:
+                    pass
+        self.thread = threading.Thread(target=decode_all, daemon=True)
+        self.thread.start()
+
+
+    # Function for getting the decoded image of a file, decoding it the first time it is needed. The image is fully loaded (not only opened), so its file is closed and never read again.
+    def image(self, name):
+        image = self.images.get(name)
+        if image == None:
+            with self.lock:
+                image = self.images.get(name)
+                if image == None:
+                    with Image.open(os.path.join(self.directory, name)) as file:
+                        file.load()
+                        image = file.copy()
+                    self.images[name] = image
+        return image
+
+
+    # Function for getting the Tkinter image of a file (e.g. for a canvas or the title bar icon), creating it the first time it is needed. Must be called on the thread running the window.
+    def photo(self, name):
+        photo = self.photo_images.get(name)
+        if photo == None:
+            photo = self.photo_images[name] = self.photo_image(self.image(name))
+        return photo
+
+
+    # Function for getting the CTk image of a file at the given size (width, height), creating it the first time that size is needed. Must be called on the thread running the window.
+    def ctk(self, name, size):
+        key = (name, tuple(size))
+        image = self.ctk_images.get(key)
+        if image == None:
+            image = self.ctk_images[key] = self.ctk_image(self.image(name), size=tuple(size))
+        return image
+
+
+    # Function for checking whether an image file exists, without decoding it again if it has already been decoded.
+    def exists(self, name):
+        return name in self.images or os.path.exists(os.path.join(self.directory, name))
@@ -0,0 +1,145 @@
+# Date Created: 17/10/2026
+# Purpose: Benchmarks for the QWhizz Math storage formats. Run with "python -m AppData.QWhizz.benchmarks" from the program folder.
+
+import json, random, time, tracemalloc
+from .codec import encode_quiz_save, decode_quiz_save, SeededQuizSave
+from .engine import generate, make_recipe, DIFFICULTIES, GENERATORS, RejectionDistractors, sampled_distractors
+from .question import Question, AnsweredQuestion
+
+
+# Function for creating a sample quiz save generated by the question engine, with a random difficulty, both topics, and a random user answer for each question. The quiz save keeps the recipe it was generated from.
+def sample_quiz_save(rng, question_amount):
+    recipe = make_recipe(rng.choice(DIFFICULTIES), ["Trigonometry", "Algebra"], question_amount, rng.getrandbits(64))
+    questions = generate(recipe[2], recipe[3], question_amount, recipe[1])
+    return SeededQuizSave([question + [rng.choice([question[4]] + question[5])] for question in questions], recipe)
+
+
+# Function for timing a function, returning the fastest of several runs in seconds (the fastest run is the least affected by other programs).
+def best_time(function, repeats=5):
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+# Function for comparing the size and load time of quiz saves stored as indented JSON (the format of older scoreboard files), compact JSON, and the binary codec.
+def benchmark_quiz_saves(quiz_amount=500, question_amount=20, seed=1):
+    rng = random.Random(seed)
+    quiz_saves = [list(sample_quiz_save(rng, question_amount)) for _ in range(quiz_amount)]  # Drop the recipes, so that the questions themselves are stored.
+    formats = {
+        "JSON (indent=4)": ([json.dumps(quiz_save, indent=4).encode("utf-8") for quiz_save in quiz_saves], lambda data: json.loads(data)),
+        "JSON (compact)": ([json.dumps(quiz_save).encode("utf-8") for quiz_save in quiz_saves], lambda data: json.loads(data)),
+        "Binary codec": ([encode_quiz_save(quiz_save) for quiz_save in quiz_saves], decode_quiz_save),
+    }
+    results = []
+    for name, (encoded, decode) in formats.items():
+        if [decode(data) for data in encoded] != quiz_saves:  # Check that every format loads back exactly the same quiz saves.
+            raise AssertionError(f"{name} did not round-trip the quiz saves")
+        results.append({"format": name, "bytes": sum(len(data) for data in encoded), "load_seconds": best_time(lambda: [decode(data) for data in encoded])})
+    return results
+
+
+# Function for comparing quiz saves generated by the question engine stored as indented JSON, as their questions with the binary codec, and as their recipe (seed) and user answers.
+def benchmark_seeded_quiz_saves(quiz_amount=500, question_amount=20, seed=1):
+    rng = random.Random(seed)
+    quiz_saves = [sample_quiz_save(rng, question_amount) for _ in range(quiz_amount)]
+    formats = {
+        "JSON (indent=4)": ([json.dumps(quiz_save, indent=4).encode("utf-8") for quiz_save in quiz_saves], lambda data: json.loads(data)),
+        "Binary codec": ([encode_quiz_save(list(quiz_save)) for quiz_save in quiz_saves], decode_quiz_save),
+        "Recipe (seed)": ([encode_quiz_save(quiz_save) for quiz_save in quiz_saves], decode_quiz_save),
+    }
+    results = []
+    for name, (encoded, decode) in formats.items():
+        if [decode(data) for data in encoded] != quiz_saves:  # Check that every format loads back exactly the same quiz saves.
+            raise AssertionError(f"{name} did not round-trip the quiz saves")
+        results.append({"format": name, "bytes": sum(len(data) for data in encoded), "load_seconds": best_time(lambda: [decode(data) for data in encoded])})
+    return results
+
+
+# Function for comparing the old scoreboard file (every row holding its quiz save, written with indent=4) with the summary rows and separate encoded quiz saves.
+# The load time covers what is needed to show the scoreboard and review one quiz: the whole old file, or the summary rows and one quiz save.
+def benchmark_scoreboard(quiz_amount=500, question_amount=20, seed=1):
+    rng = random.Random(seed)
+    quiz_saves = [list(sample_quiz_save(rng, question_amount)) for _ in range(quiz_amount)]
+    rows = [[1000 + index, f"Student {index}", "Hard", question_amount, "02:15", f"{rng.randint(0, question_amount)}/{question_amount}"] for index in range(quiz_amount)]
+    old_file = json.dumps([row + [quiz_save] for row, quiz_save in zip(rows, quiz_saves)], indent=4).encode("utf-8")
+    summary_file = json.dumps(rows, indent=4).encode("utf-8")
+    encoded = [encode_quiz_save(quiz_save) for quiz_save in quiz_saves]
+    return [
+        {"format": "Old scoreboard", "bytes": len(old_file), "load_seconds": best_time(lambda: json.loads(old_file))},
+        {"format": "Summary + codec", "bytes": len(summary_file) + sum(len(data) for data in encoded), "load_seconds": best_time(lambda: (json.loads(summary_file), decode_quiz_save(encoded[0])))},
+    ]
+
+
+# Function for comparing the fake answers drawn for each question by the rejection loops of version 1 of the generators with the sampling of "SampledDistractors", for each difficulty and topic.
+# The rejection loops draw one fake answer per pass and draw again whenever it is repeated, while sampling always draws exactly 3.
+# Sampling bounds the work of the worst question rather than making the average question quicker: families with decimal answers (e.g. trigonometry) take about as long as with the rejection loops, or slightly longer.
+def benchmark_distractors(question_amount=100000, seed=1):
+    results = []
+    for (difficulty, topic), generator in GENERATORS.items():
+        rejection = RejectionDistractors()
+        rng = random.Random(seed)
+        draws = []
+        for _ in range(question_amount):
+            before = rejection.draws
+            generator(rng, rejection)
+            draws.append(rejection.draws - before)
+        results.append({"family": f"{difficulty} {topic}", "mean_draws": sum(draws) / question_amount, "max_draws": max(draws),
+                        "rejection_us": time_questions(generator, rejection, question_amount, seed) * 1e6, "sampled_us": time_questions(generator, sampled_distractors, question_amount, seed) * 1e6})
+    return results
+
+
+# Function for timing a question generator with the given fake answer generator, returning the fastest time per question in seconds.
+def time_questions(generator, distractors, question_amount, seed):
+    def run():
+        rng = random.Random(seed)
+        for _ in range(question_amount):
+            generator(rng, distractors)
+    return best_time(run, repeats=3) / question_amount
+
+
+# Function for comparing the memory used to hold the questions of a quiz and its answered questions as lists (the older layout, where answering copied every detail into a new list) and as "Question" and "AnsweredQuestion" records.
+# Only the memory of the lists and records themselves is counted, since the strings and lists inside them are shared by both layouts.
+def benchmark_question_memory(question_amount=10000, seed=1):
+    questions = generate("Medium", ["Algebra"], question_amount, seed)
+    def as_lists():
+        details = [list(question) for question in questions]
+        return details, [details[index][:6] + [details[index][4]] for index in range(question_amount)]
+    def as_records():
+        details = [Question.from_list(question) for question in questions]
+        return details, [AnsweredQuestion(question, question.answer) for question in details]
+    results = []
+    for name, build in (("Lists", as_lists), ("Records", as_records)):
+        tracemalloc.start()
+        kept = build()
+        used = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del kept
+        results.append({"layout": name, "bytes_per_question": used / question_amount})
+    return results
+
+
+# Procedure for printing the benchmark results as a table, including how each format compares to indented JSON.
+def print_results(title, results):
+    print(title)
+    baseline = results[0]
+    for result in results:
+        print(f"  {result['format']:<18} {result['bytes']:>10,} bytes ({baseline['bytes'] / result['bytes']:.1f}x smaller)   {result['load_seconds'] * 1000:>8.2f} ms to load ({baseline['load_seconds'] / result['load_seconds']:.1f}x faster)")
+
+
+# Run the benchmarks only if the module is being run directly.
+if __name__ == "__main__":
+    print_results("Quiz saves (500 quizzes of 20 questions):", benchmark_quiz_saves())
+    seeded_results = benchmark_seeded_quiz_saves()
+    print_results("Generated quiz saves (500 quizzes of 20 questions):", seeded_results)
+    print(f"  Recipe saves are slower to load than indented JSON ({seeded_results[2]['load_seconds'] / seeded_results[0]['load_seconds']:.1f}x the time, {seeded_results[2]['load_seconds'] * 1000 / 500:.2f} ms per quiz), since the questions are generated again. Saving doesn't generate them again.")
+    print("Fake answers drawn per question (100,000 questions per family):")
+    for result in benchmark_distractors():
+        print(f"  {result['family']:<20} rejection: {result['mean_draws']:.3f} mean, {result['max_draws']} worst, {result['rejection_us']:.1f} us/question   sampled: 3 always, {result['sampled_us']:.1f} us/question")
+    print("  Sampling never draws again, but isn't quicker on average for families with decimal answers, since each draw does more work than a rejection pass.")
+    print_results("Scoreboard load and one review (500 scores of 20 questions):", benchmark_scoreboard())
+    print("Memory of each question and its answer (10,000 questions):")
+    for result in benchmark_question_memory():
+        print(f"  {result['layout']:<18} {result['bytes_per_question']:>8.1f} bytes")
@@ -0,0 +1,285 @@
+# Date Created: 17/10/2026
+# Purpose: Bulk question generation for QWhizz Math using NumPy, for producing very large printed practice packs. NumPy is optional, and is only needed if this module's functions are used.
+# Every number is drawn for all questions at once as NumPy arrays, and the answers and fake answers are worked out on whole arrays. Strings are only created at the end, once for each distinct value, following the same formatting rules as the "engine" module.
+
+import math
+from .engine import LETTERS, ordered_topics, format_number, format_signed_term, format_signed_constant
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+SIN_40 = math.sin(math.radians(40))  # Trigonometric ratios of the 40 degree angle, worked out with the "math" module so that answers are exactly the same as the ones from the "engine" module.
+COS_40 = math.cos(math.radians(40))
+TAN_40 = math.tan(math.radians(40))
+
+
+# Function for getting the NumPy module, raising an ImportError with installation instructions if it isn't installed.
+def require_numpy():
+    if numpy == None:
+        raise ImportError("NumPy is needed for bulk question generation. Install it with: pip install numpy")
+    return numpy
+
+
+# Function for drawing an array of random signs (-1 or 1).
+def random_signs(rng, size):
+    return numpy.where(rng.integers(0, 2, size) == 0, -1, 1)
+
+
+# Function for drawing "k" different whole numbers between 0 and "population" - 1 for each of "n" rows, with every ordered choice being equally likely.
+# Small populations are shuffled in one step, and large populations are drawn directly and only the rows with repeated numbers are drawn again (which is rare when "k" is much smaller than the population).
+def distinct_indices(rng, n, population, k=3):
+    if population <= 64:
+        return numpy.argsort(rng.random((n, population)), axis=1)[:, :k]
+    indices = rng.integers(0, population, (n, k))
+    while True:
+        rows = numpy.flatnonzero(repeated_rows(indices))
+        if len(rows) == 0:
+            return indices
+        indices[rows] = rng.integers(0, population, (len(rows), k))
+
+
+# Function for checking which rows of a 2D array contain the same value more than once.
+def repeated_rows(values):
+    repeated = numpy.zeros(len(values), dtype=bool)
+    for first in range(values.shape[1]):
+        for second in range(first + 1, values.shape[1]):
+            repeated |= values[:, first] == values[:, second]
+    return repeated
+
+
+# Function for creating the string of every item from an array of keys, where items with the same key have the same string.
+# "format_item" is only called once for each distinct key, with the position (in the flattened array) of the first item with that key, and the strings are returned in an object array of the same shape as "keys".
+def format_unique(keys, format_item):
+    _, first, inverse = numpy.unique(keys, return_index=True, return_inverse=True)
+    table = numpy.empty(len(first), dtype=object)
+    table[:] = [format_item(position) for position in first.tolist()]
+    return table[inverse.reshape(numpy.shape(keys))]
+
+
+# Function for working out a key for each number in an array, where numbers with the same key are formatted the same way by "engine.format_number".
+# Whole numbers have odd keys and other numbers have even keys (so "3" and "3.00" are different), and numbers whose 2 decimal place rounding can't be worked out exactly from the array (close to halfway, or rounding to "-0.00") are marked as False in the returned "exact" mask.
+def number_keys(values):
+    scaled = values * 100
+    whole = values == numpy.floor(values)
+    exact = whole | ((numpy.abs(scaled - numpy.floor(scaled) - 0.5) > 1e-6) & ~((values < 0) & (values > -0.005)))
+    return numpy.rint(scaled).astype(numpy.int64) * 2 + whole, exact
+
+
+# Function for formatting an array of numbers the same way as "engine.format_number", returning an object array of strings of the same shape.
+def format_numbers(values, unit=""):
+    keys, exact = number_keys(values)
+    exact_values = values[exact]
+    formatted = numpy.empty(values.shape, dtype=object)
+    formatted[exact] = format_unique(keys[exact], lambda position: format_number(exact_values[position].item(), unit))
+    if not exact.all():
+        formatted[~exact] = [format_number(value, unit) for value in values[~exact].tolist()]  # Format the few numbers that are close to halfway individually.
+    return formatted
+
+
+# Function for creating 3 fake answers for each answer from offsets drawn by "draw_offsets" (called with the random number generator and an array of answers, returning a row of 3 offsets for each answer).
+# Rows where two formatted fake answers match each other or the formatted answer (e.g. decimals that are the same to 2 decimal places) are drawn again, so every question ends up with 3 different fake answers. The keys of the formatted numbers are compared, so no strings are needed to find these rows.
+def unique_fakes(rng, answers, draw_offsets, unit=""):
+    fakes = answers[:, None] + draw_offsets(rng, answers)
+    while True:
+        keys, exact = number_keys(numpy.column_stack((answers, fakes)))
+        retry = repeated_rows(keys)
+        for row in numpy.flatnonzero(~exact.all(axis=1) & ~retry).tolist():  # Compare the strings of rows with numbers that couldn't be given an exact key.
+            retry[row] = len({format_number(value, unit) for value in [answers[row].item()] + fakes[row].tolist()}) != 4
+        rows = numpy.flatnonzero(retry)
+        if len(rows) == 0:
+            return format_numbers(fakes, unit)
+        fakes[rows] = answers[rows, None] + draw_offsets(rng, answers[rows])
+
+
+# Function for drawing the offsets of fake measurements, which are between 1 and 6 (whole numbers for whole number answers, otherwise decimals), matching "engine.fake_measurements".
+def measurement_offsets(rng, answers):
+    offsets = numpy.empty((len(answers), 3))
+    whole = answers == numpy.floor(answers)
+    offsets[whole] = distinct_indices(rng, int(whole.sum()), 6) + 1
+    offsets[~whole] = rng.uniform(1, 6, (int((~whole).sum()), 3))
+    return offsets
+
+
+# Function for drawing the offsets of fake one step equation answers, which are between -8 and 8 excluding 0 for whole number answers, or between -6 and 6 excluding -1 to 1 for decimal answers.
+def equation_offsets(rng, answers):
+    offsets = numpy.empty((len(answers), 3))
+    whole = answers == numpy.floor(answers)
+    indices = distinct_indices(rng, int(whole.sum()), 16)  # Positions in the 16 possible offsets, -8 to -1 and 1 to 8.
+    offsets[whole] = numpy.where(indices < 8, indices - 8, indices - 7)
+    decimal_count = int((~whole).sum())
+    offsets[~whole] = random_signs(rng, (decimal_count, 3)) * rng.uniform(1, 6, (decimal_count, 3))
+    return offsets
+
+
+# Function for converting positions in the 18 possible term offsets (-10 to -2 and 2 to 10) into the offsets, as used by the like terms and binomial expansion fake answers.
+def term_offsets(indices):
+    return numpy.where(indices < 9, indices - 10, indices - 7)
+
+
+# Function for drawing the bottom side of a triangle, which is between 1.1x and 1.1x + 3 of the left side (see "engine.easy_trigonometry").
+def bottom_sides(rng, left_sides):
+    min_num2 = numpy.ceil(left_sides*1.1).astype(numpy.int64)
+    return rng.integers(min_num2, min_num2+3, endpoint=True)
+
+
+# Function for formatting an array of side lengths in centimetres (e.g. "12 cm").
+def format_sides(sides):
+    return format_unique(sides, lambda position: f"{sides[position]} cm").tolist()
+
+
+# Function for generating "n" easy trigonometry questions (area of a right-angled triangle).
+def bulk_easy_trigonometry(rng, n):
+    number1 = rng.integers(2, 12, n, endpoint=True)
+    number2 = bottom_sides(rng, number1)
+    answers = (number1*number2)/2
+    fake_answers = unique_fakes(rng, answers, measurement_offsets, " cm").tolist()
+    return [["Trigonometry", "Area of Triangles", ["Find the area", "of the triangle:"], [None, left, bottom, None], formatted_answer, fakes]
+            for left, bottom, formatted_answer, fakes in zip(format_sides(number1), format_sides(number2), format_numbers(answers, " cm").tolist(), fake_answers)]
+
+
+# Function for formatting like terms answers (e.g. "5x", "x" or "-x"), where a value of 0 is formatted as "zero" if it is given (the fake answers use "0"), otherwise with the letter (e.g. "0x").
+def format_like_terms(values, letters, zero=None):
+    keys = values * len(LETTERS) + letters
+    flat_values, flat_letters = values.ravel(), letters.ravel()
+    def format_item(position):
+        value, letter = flat_values[position], LETTERS[flat_letters[position]]
+        return f"{letter}" if value == 1 else f"-{letter}" if value == -1 else zero if value == 0 and zero != None else f"{value}{letter}"
+    return format_unique(keys, format_item).tolist()
+
+
+# Function for generating "n" easy algebra questions (collecting like terms).
+def bulk_easy_algebra(rng, n):
+    letters = rng.integers(0, len(LETTERS), n)
+    question_types = rng.integers(0, 1, n, endpoint=True)
+    numbers = rng.integers(1, 12, (n, 3), endpoint=True)
+    answers = numpy.where(question_types == 0, numbers[:, 0] - numbers[:, 1] - numbers[:, 2], numbers.sum(axis=1))
+    fakes = answers[:, None] + term_offsets(distinct_indices(rng, n, 18))
+
+    def format_question(position):
+        letter = LETTERS[letters[position]]
+        sign = " - " if question_types[position] == 0 else " + "
+        number1, number2, number3 = numbers[position].tolist()
+        return f"{number1 if number1 != 1 else ''}{letter}{sign}{number2 if number2 != 1 else ''}{letter}{sign}{number3 if number3 != 1 else ''}{letter} = ?"  # If any numbers are 1 then only include the letter beside those numbers.
+    questions = format_unique(((question_types * 13 + numbers[:, 0]) * 13 + numbers[:, 1]) * 13 * 13 * len(LETTERS) + numbers[:, 2] * len(LETTERS) + letters, format_question).tolist()
+
+    return [["Algebra", "Like Terms", "Simplify the following:", question, formatted_answer, fake_answers]
+            for question, formatted_answer, fake_answers in zip(questions, format_like_terms(answers, letters), format_like_terms(fakes, numpy.repeat(letters[:, None], 3, axis=1), "0"))]
+
+
+# Function for generating "n" medium trigonometry questions (finding a side with Pythagorean theorem).
+def bulk_medium_trigonometry(rng, n):
+    question_types = rng.integers(0, 2, n, endpoint=True)  # Determines which side of the triangle is unknown.
+    number1 = rng.integers(2, 12, n, endpoint=True)
+    number2 = bottom_sides(rng, number1)
+    answers = numpy.where(question_types == 0, numpy.sqrt(number1**2 + number2**2), numpy.sqrt(number2**2 - number1**2))
+    fake_answers = unique_fakes(rng, answers, measurement_offsets, " cm").tolist()
+
+    questions = []
+    for question_type, side1, side2, formatted_answer, fakes in zip(question_types.tolist(), format_sides(number1), format_sides(number2), format_numbers(answers, " cm").tolist(), fake_answers):
+        if question_type == 0:
+            side, question = "hypotenuse", ["x", side1, side2, None]
+        elif question_type == 1:
+            side, question = "adjacent", [side2, side1, "x", None]
+        else:
+            side, question = "opposite", [side2, "x", side1, None]
+        questions.append(["Trigonometry", "Pythagorean\nTheorem", ["Find the length", f"of the {side}:"], question, formatted_answer, fakes])
+    return questions
+
+
+# Function for generating "n" medium algebra questions (one step equations).
+def bulk_medium_algebra(rng, n):
+    letters = rng.integers(0, len(LETTERS), n)
+    question_types = rng.integers(0, 3, n, endpoint=True)
+    number1 = rng.integers(1, numpy.array([20, 20, 10, 12])[question_types], endpoint=True)
+    number2 = rng.integers(numpy.where(question_types == 2, number1, 1), numpy.choose(question_types, [50, 50, number1+10, 12]), endpoint=True)  # For "2a = 4" questions, the second number is at least the first number.
+    answers = numpy.choose(question_types, [number2+number1, number2-number1, number2/number1, number2*number1]).astype(float)
+    fake_answers = unique_fakes(rng, answers, equation_offsets).tolist()
+
+    def format_question(position):
+        letter, first, second = LETTERS[letters[position]], number1[position], number2[position]
+        return [f"{letter} - {first} = {second}", f"{letter} + {first} = {second}", f"{first}{letter} = {second}", f"{letter} / {first} = {second}"][question_types[position]]
+    questions = format_unique(((question_types * 21 + number1) * 51 + number2) * len(LETTERS) + letters, format_question).tolist()
+
+    return [["Algebra", "One Step Equations", f"Solve for {LETTERS[letter]}:", question, formatted_answer, fakes]
+            for letter, question, formatted_answer, fakes in zip(letters.tolist(), questions, format_numbers(answers).tolist(), fake_answers)]
+
+
+# Function for generating "n" hard trigonometry questions (finding a side with the trigonometric ratios, using a 40 degree angle).
+def bulk_hard_trigonometry(rng, n):
+    question_types = rng.integers(0, 2, n, endpoint=True)  # Determines which side of the triangle is unknown.
+    number1 = numpy.where(question_types == 0, rng.integers(6, 24, n, endpoint=True), rng.integers(4, 16, n, endpoint=True))  # The hypotenuse has a higher range since it is always the longest side.
+    answers = numpy.choose(question_types, [number1 * SIN_40, number1 / COS_40, number1 / TAN_40])
+    fake_answers = unique_fakes(rng, answers, measurement_offsets, " cm").tolist()
+
+    questions = []
+    for question_type, side_length, formatted_answer, fakes in zip(question_types.tolist(), format_sides(number1), format_numbers(answers, " cm").tolist(), fake_answers):
+        if question_type == 0:
+            side, question = "opposite", [side_length, "x", "", "40°"]
+        elif question_type == 1:
+            side, question = "hypotenuse", ["x", "", side_length, "40°"]
+        else:
+            side, question = "adjacent", ["", side_length, "x", "40°"]
+        questions.append(["Trigonometry", "Trigonometric\nRatios", ["Find the length", f"of the {side}:"], question, formatted_answer, fakes])
+    return questions
+
+
+# Function for generating "n" hard algebra questions (binomial expansion).
+def bulk_hard_algebra(rng, n):
+    letters = rng.integers(0, len(LETTERS), n)
+    number1 = random_signs(rng, n) * rng.integers(1, 12, n, endpoint=True)  # Random numbers between -12 and 12 (excluding 0).
+    number2 = random_signs(rng, n) * rng.integers(1, 12, n, endpoint=True)
+    pairs = distinct_indices(rng, n, 18 * 18)  # Each fake answer changes both terms, so 3 different pairs of offsets are needed.
+    fake1 = (number1 + number2)[:, None] + term_offsets(pairs // 18)
+    fake2 = (number1 * number2)[:, None] + term_offsets(pairs % 18)
+    fake_letters = numpy.repeat(letters[:, None], 3, axis=1)
+
+    def format_question(position):
+        letter, first, second = LETTERS[letters[position]], number1[position].item(), number2[position].item()
+        return f"({letter}{format_signed_constant(first)})({letter}{format_signed_constant(second)}) = ?"
+    def format_answer(position):
+        letter, first, second = LETTERS[letters[position]], number1[position].item(), number2[position].item()
+        return f"{letter}²{format_signed_term(first + second, letter)}{format_signed_constant(first * second)}"
+    def format_fake(position):
+        letter, term, constant = LETTERS[fake_letters.flat[position]], fake1.flat[position].item(), fake2.flat[position].item()
+        return f"{letter}²{format_signed_term(term, letter)}{format_signed_constant(constant) if constant != 0 else ''}"
+    question_keys = ((number1 + 12) * 25 + number2 + 12) * len(LETTERS) + letters
+    fake_keys = ((fake1 + 10) * 200 + fake2 + 160) * len(LETTERS) + fake_letters  # Fake terms are between -34 and 34, and fake constants between -154 and 154.
+
+    return [["Algebra", "Binomial Expansion", "Expand the following:", question, formatted_answer, fake_answers]
+            for question, formatted_answer, fake_answers in zip(format_unique(question_keys, format_question).tolist(), format_unique(question_keys, format_answer).tolist(), format_unique(fake_keys, format_fake).tolist())]
+
+
+# Bulk question generators for each difficulty and topic.
+BULK_GENERATORS = {
+    ("Easy", "Trigonometry"): bulk_easy_trigonometry,
+    ("Easy", "Algebra"): bulk_easy_algebra,
+    ("Medium", "Trigonometry"): bulk_medium_trigonometry,
+    ("Medium", "Algebra"): bulk_medium_algebra,
+    ("Hard", "Trigonometry"): bulk_hard_trigonometry,
+    ("Hard", "Algebra"): bulk_hard_algebra,
+}
+
+
+# Function for generating "n" questions of the given difficulty at once, with the topic of each question chosen at random from "topics", in the same layout as "engine.generate".
+# The questions follow the same rules and formatting as "engine.generate", but use NumPy's random number generator, so a seed doesn't generate the same questions as it does with "engine.generate".
+# Unlike "engine.generate", questions can be repeated, since a practice pack can have more questions than there are different questions (see "engine.QUESTION_COUNTS").
+def generate_bulk(difficulty, topics, n, seed=None):
+    require_numpy()
+    rng = numpy.random.default_rng(seed)
+    topics = ordered_topics(topics)
+    try:
+        generators = [BULK_GENERATORS[(difficulty, topic)] for topic in topics]
+    except KeyError:
+        raise ValueError(f"No questions can be generated for the {difficulty!r} difficulty with the topics {topics!r}")
+    if len(generators) == 1:
+        return generators[0](rng, n)
+
+    choices = rng.integers(0, len(generators), n)
+    questions = [None] * n
+    for index, generator in enumerate(generators):
+        positions = numpy.flatnonzero(choices == index)
+        for position, question in zip(positions.tolist(), generator(rng, len(positions))):
+            questions[position] = question
+    return questions
@@ -0,0 +1,113 @@
+# Date Created: 17/10/2026
+# Purpose: Change detection for the QWhizz Math scoreboard files, so that the scoreboard is only reloaded when its files have changed on disk.
+
+import hashlib, threading
+from .journal import file_stat
+
+
+class ScoreboardCache:
+    # Constructor for the "ScoreboardCache" class, which stores a function returning the paths of the files to watch (e.g. the snapshot and journal of the scoreboard store).
+    # The signature of the files is only recorded after the "users" list has been loaded from (or saved to) them, so a matching signature means the "users" list in memory is up to date.
+    def __init__(self, paths_function):
+        self.paths_function = paths_function  # Function returning the list of file paths to watch.
+        self.stats = None                     # Modification time and size of each watched file when the signature was recorded.
+        self.digests = None                   # SHA-1 digest of the contents of each watched file when the signature was recorded, with None for files that didn't exist.
+        self.digest = None                    # SHA-1 digest combining the digests of every watched file, which changes if any of them change.
+        self.hits = 0                         # Number of times the scoreboard didn't need to be reloaded.
+        self.misses = 0                       # Number of times the scoreboard had to be reloaded.
+        self.lock = threading.Lock()          # Lock to stop the signature being recorded from two threads at the same time (e.g. after a background compaction).
+
+
+    # Function for getting the modification time (in nanoseconds) and size of each watched file, using None for files that don't exist.
+    def read_stats(self):
+        return [file_stat(path) for path in self.paths_function()]
+
+
+    # Function for getting the SHA-1 hex digest of the contents of a file, or None if it doesn't exist.
+    def file_digest(self, path):
+        digest = hashlib.sha1()
+        try:
+            with open(path, "rb") as file:
+                for chunk in iter(lambda: file.read(1048576), b""):  # Read the file in 1 MB chunks, so that large files aren't held in memory.
+                    digest.update(chunk)
+        except FileNotFoundError:
+            return None
+        return digest.hexdigest()
+
+
+    # Function for combining the digests of the watched files into one digest, which changes if any of the files change (including a file being removed).
+    def combine(self, paths, digests):
+        combined = hashlib.sha1()
+        for path, digest in zip(paths, digests):
+            combined.update(path.encode("utf-8"))
+            combined.update(digest.encode("ascii") if digest != None else b"\0")  # Mark missing files, so that a file being removed changes the digest.
+        return combined.hexdigest()
+
+
+    # Function for getting the modification time, size and digest of each watched file, as lists in the order of the paths.
+    # "known" maps paths to signatures of (modification time and size, hex digest) recorded by whatever last read or wrote the files (e.g. "ScoreboardJournal.file_signatures"). A file is only read if it has no known signature or its modification time or size no longer match it.
+    # "previous" works the same way for the signatures recorded by the cache itself, as lists of stats and digests.
+    def read_signatures(self, known=None, previous=None):
+        paths = self.paths_function()
+        known = dict(known) if known != None else {}
+        if previous != None:
+            for path, stat, digest in zip(paths, *previous):
+                known.setdefault(path, (stat, digest))
+        stats, digests = [], []
+        for path in paths:
+            stat = file_stat(path)  # Get the modification time and size before reading, so that a change made while the file is read isn't missed.
+            if path in known and known[path][0] == stat:
+                digest = known[path][1]
+            else:
+                digest = self.file_digest(path) if stat != None else None
+            stats.append(stat)
+            digests.append(digest)
+        return paths, stats, digests
+
+
+    # Function for checking if the watched files are unchanged since the signature was recorded, counting a hit or a miss.
+    # If the modification time and size match, the files are treated as unchanged without reading them. Otherwise only the files that differ are hashed, so that a file that was only touched (or rewritten with the same contents) still counts as unchanged.
+    def is_current(self):
+        with self.lock:
+            if self.stats != None:
+                stats = self.read_stats()
+                if stats == self.stats:
+                    self.hits += 1
+                    return True
+                paths, stats, digests = self.read_signatures(previous=(self.stats, self.digests))
+                if digests == self.digests:
+                    self.stats = stats
+                    self.hits += 1
+                    return True
+            self.stats = None  # Forget the signature so that it is only recorded again once the scoreboard has been reloaded.
+            self.digests = None
+            self.digest = None
+            self.misses += 1
+            return False
+
+
+    # Method for recording the signature of the watched files after the "users" list has been loaded from or saved to them.
+    # "known" holds the signatures of the files as the scoreboard store last read or wrote them, so that the files don't have to be read again (see "read_signatures").
+    def update(self, known=None):
+        with self.lock:
+            paths, self.stats, self.digests = self.read_signatures(known)
+            self.digest = self.combine(paths, self.digests)
+
+
+    # Method for recording the signature again after the scoreboard store has changed its files (e.g. after saving or compacting), but only if the "users" list matched the files beforehand.
+    def refresh(self, known=None):
+        if self.stats != None:
+            self.update(known)
+
+
+    # Method for forgetting the signature, so that the scoreboard is reloaded the next time it is needed (e.g. after an error while saving).
+    def clear(self):
+        with self.lock:
+            self.stats = None
+            self.digests = None
+            self.digest = None
+
+
+    # Function for getting the number of cache hits and misses, so that the effect of the cache can be checked.
+    def counters(self):
+        return {"hits": self.hits, "misses": self.misses}
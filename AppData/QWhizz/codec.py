@@ -0,0 +1,278 @@
+# Date Created: 17/10/2026
+# Purpose: Compact binary encoding for QWhizz Math quiz saves, which decodes back to the same list layout used by the "review_quiz" method. Quizzes generated from a seed are stored as their recipe instead of their questions.
+
+import array, json, re, struct, sys
+from .engine import generate_from_recipe, recipe_engines
+from .question import question_to_list
+
+MAGIC = b"QWS1"  # Bytes at the start of every encoded quiz save, used to recognise the format (and its version). The tables below are part of the format, so changing them needs a new version.
+RECIPE_MAGIC = b"QWR1"  # Bytes at the start of quiz saves stored as the recipe of their questions and the user's answers, rather than the questions themselves.
+
+# Known question types, stored as a small number instead of repeating the topic and title of every question. New types must only ever be added to the end of the list, so that older quiz saves still decode the same way.
+QUESTION_TYPES = [
+    None,  # Type 0 is used for questions that aren't in this list, which store their topic and title as values.
+    ("Trigonometry", "Area of Triangles"),
+    ("Trigonometry", "Pythagorean\nTheorem"),
+    ("Trigonometry", "Trigonometric\nRatios"),
+    ("Algebra", "Like Terms"),
+    ("Algebra", "One Step Equations"),
+    ("Algebra", "Binomial Expansion"),
+]
+QUESTION_TYPE_IDS = {question_type: index for index, question_type in enumerate(QUESTION_TYPES) if question_type != None}
+
+# Strings used by most quiz saves, which are part of every string table so that they don't need to be stored in each file. New strings must only ever be added to the end of the list.
+LETTERS = ["x", "y", "z", "a", "b", "c", "m", "n"]
+STATIC_STRINGS = ["", " cm", "°", "Find the area", "of the triangle:", "Find the length", "of the hypotenuse:", "of the adjacent:", "of the opposite:",
+                  "Simplify the following:", "Expand the following:"] + LETTERS + [f"Solve for {letter}:" for letter in LETTERS] + [f"-{letter}" for letter in LETTERS]
+
+# Question shapes used by most quiz saves, written as "question type:shape", where each value is 0 and lists and None are kept (e.g. the shape of ["a", None, ["b"]] is [0,null,[0]]).
+STATIC_SHAPES = ["1:[[0,0],[null,0,0,null],0,[0,0,0],0]", "2:[[0,0],[0,0,0,null],0,[0,0,0],0]", "3:[[0,0],[0,0,0,0],0,[0,0,0],0]",
+                 "4:[0,0,0,[0,0,0],0]", "5:[0,0,0,[0,0,0],0]", "6:[0,0,0,[0,0,0],0]"]
+
+# Kinds of packed numbers.
+NUMBER_INTEGER, NUMBER_DECIMAL, NUMBER_NEGATIVE_DECIMAL = range(3)
+
+INTEGER_TEXT = re.compile(r"(-?(?:0|[1-9][0-9]{0,8}))(\D.*)?", re.DOTALL)            # Matches numbers such as "12", "-4" or "12 cm" (with the unit or letter after the number).
+DECIMAL_TEXT = re.compile(r"(-?)(0|[1-9][0-9]{0,6})\.([0-9]{2})(\D.*)?", re.DOTALL)  # Matches numbers with 2 decimal places such as "7.25" or "10.39 cm".
+
+builder_cache = {}  # Builder functions for each question shape, shared between quiz saves since most quiz saves use the same few shapes.
+number_cache = {}   # Text of each packed number with a static suffix, shared between quiz saves since most numbers (e.g. "12 cm") appear in many quiz saves.
+
+
+class SeededQuizSave(list):
+    # Constructor for the "SeededQuizSave" class, which is a list of saved questions that also stores the recipe the questions were generated from (see "engine.make_recipe"), so that they can be saved as the recipe.
+    def __init__(self, questions=(), recipe=None):
+        super().__init__(questions)
+        self.recipe = recipe
+
+
+# Function for encoding a quiz save (a list of questions, each being [topic, title, statement, question, answer, fake answers, user answer] or an "AnsweredQuestion") into bytes.
+# If the quiz save has a recipe, only the recipe and the position of each user answer are stored. Otherwise, the questions are stored as described below.
+# Every distinct value is stored once in a value table (strings in a string table, and numbers written as text such as "12 cm" packed as integers). Each question is stored as its shape followed by the positions of its values in the table.
+def encode_quiz_save(quiz_save, recipe=None):
+    if recipe == None:
+        recipe = getattr(quiz_save, "recipe", None)
+    quiz_save = [question_to_list(question) for question in quiz_save]
+    if recipe != None:
+        data = encode_recipe_quiz_save(quiz_save, recipe)
+        if data != None:
+            return data
+
+    strings = {string: index for index, string in enumerate(STATIC_STRINGS)}  # Interned strings, mapping each string to its position in the string table.
+    numbers, constants = {}, {}          # Packed numbers and other values (e.g. integers or floats), each mapping the value to its position in its table.
+    shapes = {shape: index for index, shape in enumerate(STATIC_SHAPES)}     # Question shapes, mapping each shape to its position in the shape table.
+    stream = []                          # Shape positions and value references of every question, in order.
+    for question in quiz_save:
+        if not isinstance(question, list):
+            raise TypeError(f"Cannot encode a question of type {type(question).__name__}")
+        question_type = QUESTION_TYPE_IDS.get((question[0], question[1])) if len(question) >= 2 and isinstance(question[0], str) and isinstance(question[1], str) else None
+        values = []
+        node = shape_of(question[2:] if question_type != None else question, values, strings, numbers, constants)
+        shape = f"{question_type or 0}:{json.dumps(node, separators=(',', ':'))}"
+        stream.append(("shape", shapes.setdefault(shape, len(shapes))))
+        stream.extend(values)
+
+    # Work out the position of every value in the combined value table (strings, then numbers, then constants).
+    offsets = {"shape": 0, "string": 0, "number": len(strings), "constant": len(strings) + len(numbers)}
+    references = array.array(smallest_typecode([offsets[kind] + index for kind, index in stream], "BHI"), [offsets[kind] + index for kind, index in stream])
+    number_values = array.array(smallest_typecode([number for _, number, _ in numbers], "bhi"), [number for _, number, _ in numbers])
+    number_formats = array.array(smallest_typecode([suffix * 3 + kind for kind, _, suffix in numbers], "BHI"), [suffix * 3 + kind for kind, _, suffix in numbers])  # The kind and suffix of each number, combined into one integer.
+
+    header = json.dumps([len(quiz_save), list(strings)[len(STATIC_STRINGS):], list(shapes)[len(STATIC_SHAPES):], [value for _, value in constants],
+                         len(numbers), number_values.typecode + number_formats.typecode + references.typecode], ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return MAGIC + struct.pack("<I", len(header)) + header + b"".join(little_endian(data).tobytes() for data in (number_values, number_formats, references))
+
+
+# Function for encoding a quiz save as its recipe followed by one byte for each question, holding the position of the user answer in [answer] + fake answers.
+# The recipe is trusted to generate the same questions, since it is only attached to the questions "make_recipe" was made for. Only the version of the generators and the number of questions are checked, and None is returned if they don't fit (so that the questions are stored instead).
+def encode_recipe_quiz_save(quiz_save, recipe):
+    if not isinstance(recipe, (list, tuple)) or len(recipe) != 5 or recipe[0] not in recipe_engines or recipe[4] != len(quiz_save):
+        return None
+    choices = bytearray()
+    for question in quiz_save:
+        if not isinstance(question, list) or len(question) != 7 or not isinstance(question[5], list):
+            return None
+        options = [question[4]] + question[5]
+        if question[6] not in options or len(options) > 256:
+            return None
+        choices.append(options.index(question[6]))
+    header = json.dumps(list(recipe), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return RECIPE_MAGIC + struct.pack("<I", len(header)) + header + bytes(choices)
+
+
+# Function for decoding a quiz save stored as its recipe, generating its questions again and adding the user answer to each one.
+def decode_recipe_quiz_save(data):
+    try:
+        header_length = struct.unpack_from("<I", data, len(RECIPE_MAGIC))[0]
+        position = len(RECIPE_MAGIC) + 4
+        recipe = json.loads(data[position:position + header_length].decode("utf-8"))
+        choices = data[position + header_length:]
+    except (struct.error, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid encoded quiz save ({e})")
+    questions = generate_from_recipe(recipe)
+    if len(choices) != len(questions):
+        raise ValueError("The number of user answers doesn't match the number of questions")
+    quiz_save = SeededQuizSave(recipe=recipe)
+    for question, choice in zip(questions, choices):
+        options = [question[4]] + question[5]
+        if choice >= len(options):
+            raise ValueError("Invalid user answer position")
+        quiz_save.append(question + [options[choice]])
+    return quiz_save
+
+
+# Function for describing the shape of a value (lists stay as lists, None stays as None, and every other value becomes 0), adding a reference to each value to the "values" list.
+def shape_of(value, values, strings, numbers, constants):
+    if value is None:
+        return None
+    if isinstance(value, (list, tuple)):
+        return [shape_of(item, values, strings, numbers, constants) for item in value]
+    if isinstance(value, str):
+        number = pack_number(value, strings) if value not in strings else None  # Strings already in the string table (e.g. "" or "x") don't need packing.
+        if number != None:
+            values.append(("number", numbers.setdefault(number, len(numbers))))
+        else:
+            values.append(("string", strings.setdefault(value, len(strings))))
+    elif isinstance(value, (bool, int, float)):
+        values.append(("constant", constants.setdefault((type(value).__name__, value), len(constants))))
+    else:
+        raise TypeError(f"Cannot encode a value of type {type(value).__name__}")
+    return 0
+
+
+# Function for packing a number written as text (e.g. "12", "12 cm" or "-7.25") into a tuple of (kind, integer, suffix position), returning None if the text isn't a number that decodes back to exactly the same text.
+def pack_number(text, strings):
+    match = DECIMAL_TEXT.fullmatch(text)
+    if match != None:
+        hundredths = int(match.group(2)) * 100 + int(match.group(3))
+        return (NUMBER_NEGATIVE_DECIMAL if match.group(1) == "-" else NUMBER_DECIMAL, hundredths, strings.setdefault(match.group(4) or "", len(strings)))  # The sign is stored by the kind, since "-0.50" has to keep its negative sign.
+    match = INTEGER_TEXT.fullmatch(text)
+    if match != None and match.group(1) != "-0":
+        return (NUMBER_INTEGER, int(match.group(1)), strings.setdefault(match.group(2) or "", len(strings)))
+    return None
+
+
+# Function for choosing the smallest array type code (from the given signed or unsigned codes, smallest first) that can hold every number in the list.
+def smallest_typecode(numbers, typecodes):
+    lowest, highest = min(numbers, default=0), max(numbers, default=0)
+    for typecode in typecodes:
+        bits = array.array(typecode).itemsize * 8
+        if typecode.islower() and -(1 << (bits - 1)) <= lowest and highest < (1 << (bits - 1)):
+            return typecode
+        if typecode.isupper() and 0 <= lowest and highest < (1 << bits):
+            return typecode
+    raise OverflowError("Number too large to encode")
+
+
+# Function for converting an array to or from little-endian byte order, which is the order used in encoded quiz saves.
+def little_endian(data):
+    if sys.byteorder == "big":
+        data.byteswap()
+    return data
+
+
+# Function for decoding bytes created by "encode_quiz_save" back into the list of questions, raising a ValueError if the data is invalid.
+def decode_quiz_save(data):
+    if data[:len(RECIPE_MAGIC)] == RECIPE_MAGIC:
+        return decode_recipe_quiz_save(data)
+    if data[:len(MAGIC)] != MAGIC:
+        raise ValueError("Not an encoded quiz save")
+    try:
+        header_length = struct.unpack_from("<I", data, len(MAGIC))[0]
+        position = len(MAGIC) + 4
+        question_count, extra_strings, extra_shapes, constants, number_count, typecodes = json.loads(data[position:position + header_length].decode("utf-8"))
+        position += header_length
+
+        # Read the arrays of number values, number formats, and references.
+        arrays = []
+        for typecode, length in zip(typecodes, (number_count, number_count, None)):
+            items = array.array(typecode)
+            size = len(data) - position if length == None else length * items.itemsize
+            items.frombytes(data[position:position + size])
+            arrays.append(little_endian(items))
+            position += size
+        number_values, number_formats, references = arrays
+        if len(number_values) != number_count or len(number_formats) != number_count:
+            raise ValueError("The number table is incomplete")
+
+        # Build the value table, unpacking each number only once however many times it is used.
+        strings = STATIC_STRINGS + extra_strings
+        values = strings + [number_cache[key] if key in number_cache else unpack_number(key, strings) for key in zip(number_values, number_formats)] + constants
+
+        builders = [shape_builder(shape) for shape in STATIC_SHAPES + extra_shapes]
+        quiz_save = []
+        position = 0
+        for _ in range(question_count):
+            build, size = builders[references[position]]
+            items = list(map(values.__getitem__, references[position + 1:position + 1 + size]))  # Look up every value of the question in one pass.
+            if len(items) != size:
+                raise ValueError("The references of a question are incomplete")
+            quiz_save.append(build(items, 0))
+            position += size + 1
+    except (IndexError, TypeError, struct.error, UnicodeDecodeError, RecursionError) as e:  # A header nested too deeply raises a RecursionError.
+        raise ValueError(f"Invalid encoded quiz save ({e})")
+    if position != len(references):
+        raise ValueError("Unexpected data after the encoded quiz save")
+    return quiz_save
+
+
+# Function for unpacking a number into its text from a tuple of (integer, format), where the format combines the kind of number and the position of its suffix.
+# Numbers with a suffix from the static string table (e.g. " cm") are the same in every quiz save, so their text is cached and shared.
+def unpack_number(key, strings):
+    number, number_format = key
+    suffix = strings[number_format // 3]
+    if number_format % 3 == NUMBER_INTEGER:
+        text = f"{number}{suffix}"
+    else:
+        text = f"{'-' if number_format % 3 == NUMBER_NEGATIVE_DECIMAL else ''}{number // 100}.{number % 100:02d}{suffix}"
+    if number_format // 3 < len(STATIC_STRINGS):
+        if len(number_cache) >= 65536:
+            number_cache.clear()  # Stop the cache growing without limit.
+        number_cache[key] = text
+    return text
+
+
+# Function for getting the builder function of a question shape, which creates the question list from the value references, returning a tuple of (builder, number of values).
+# The builder is made by walking the parsed shape, so the data in the file is only ever read as a shape and never run as code.
+def shape_builder(shape):
+    if shape in builder_cache:
+        return builder_cache[shape]
+    question_type, _, node = shape.partition(":")
+    if not question_type.isdigit() or not 0 <= int(question_type) < len(QUESTION_TYPES):
+        raise ValueError(f"Unknown question type {question_type!r}")
+    try:
+        node = json.loads(node)
+        counter = [0]
+        build = node_builder(node, counter)
+    except RecursionError:
+        raise ValueError("Question shape is nested too deeply")
+    if int(question_type) != 0:
+        if not isinstance(node, list):
+            raise ValueError("Invalid question shape")
+        prefix = list(QUESTION_TYPES[int(question_type)])  # Add the topic and title of the question type to the start of the list.
+        build_items = build
+        build = lambda items, position: prefix + build_items(items, position)
+    builder = (build, counter[0])
+    if len(builder_cache) >= 1024:
+        builder_cache.clear()  # Stop the cache growing without limit if many unusual shapes are decoded.
+    builder_cache[shape] = builder
+    return builder
+
+
+# Function for creating the function that builds a value of the given shape from the list of values referenced by the quiz save, numbering each value it uses with the counter.
+# Lists that only hold values (the most common case) are built by slicing the list of values rather than building each value separately.
+def node_builder(node, counter):
+    if node is None:
+        return lambda items, position: None
+    if isinstance(node, int) and not isinstance(node, bool) and node == 0:
+        offset = counter[0]
+        counter[0] += 1
+        return lambda items, position: items[position + offset]
+    if not isinstance(node, list):
+        raise ValueError("Invalid question shape")
+    if all(isinstance(item, int) and not isinstance(item, bool) and item == 0 for item in node):
+        start, end = counter[0], counter[0] + len(node)
+        counter[0] = end
+        return lambda items, position: items[position + start:position + end]
+    builders = [node_builder(item, counter) for item in node]
+    return lambda items, position: [build(items, position) for build in builders]
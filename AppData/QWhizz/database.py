@@ -0,0 +1,254 @@
+# Date Created: 17/10/2026
+# Purpose: Optional SQLite storage for the QWhizz Math scoreboard, with indexes for looking up scores by reference number or by username and difficulty.
+
+import bisect, json, os, sqlite3, threading
+from .journal import ScoreboardJournal, find_user, find_ref
+from .codec import encode_quiz_save, decode_quiz_save
+
+
+class ScoreboardDatabase:
+    # Constructor for the "ScoreboardDatabase" class, which stores the database path and the path of the JSON scoreboard to import from if the database doesn't exist yet.
+    # The class provides the same "load", "record_changes", and "reset" methods as "ScoreboardJournal", so the program can use either one.
+    def __init__(self, database_path, import_path=None):
+        self.path = database_path        # Path of the SQLite database file (e.g. "AppData/scoreboard.db").
+        self.import_path = import_path   # Path of the JSON scoreboard to import from on first use (e.g. "AppData/scoreboard.json").
+        self.connection = None           # Connection to the database, opened when the scoreboard is first loaded.
+        self.lock = threading.Lock()     # Lock to stop two threads using the connection at the same time.
+        self.compaction_callback = None  # Kept for compatibility with "ScoreboardJournal", since the database is never compacted.
+        self.positions = None            # Sorted "position" values of the rows, in the order of the "users" list, so that the row at an index is found without a query. Loaded when first needed.
+
+
+    # Function for checking if the scoreboard exists, which is True if either the database or the JSON scoreboard to import from exists.
+    def exists(self):
+        return os.path.exists(self.path) or (self.import_path != None and os.path.exists(self.import_path))
+
+
+    # Function for getting the paths of the files that hold the scoreboard, used to detect if the scoreboard has changed on disk.
+    def data_paths(self):
+        return [self.path, self.path + "-journal", self.path + "-wal"]
+
+
+    # Function kept for compatibility with "ScoreboardJournal". SQLite writes the database file itself, so no signatures are known and the files are read when their signature is needed.
+    def file_signatures(self):
+        return {}
+
+
+    # Method for opening the database connection and creating the tables and indexes if they don't exist.
+    # "position" stores the order of the users in the "users" list. The positions are sparse (a reinserted user gets a position between its neighbours), so that a change only writes one row rather than shifting every later row.
+    # "username_key" stores the lowercase username so that case-insensitive lookups can use the index.
+    # The saved questions of each quiz are kept in the separate "quiz_saves" table, so that loading the scoreboard doesn't read them. The "quiz_save" column of "scores" is only kept so that older databases still open.
+    def connect(self):
+        if self.connection != None:
+            return
+        self.connection = sqlite3.connect(self.path, check_same_thread=False)  # Allow the connection to be used from other threads, since access is guarded by the lock.
+        self.connection.executescript("""
+            CREATE TABLE IF NOT EXISTS scores (
+                position INTEGER NOT NULL,
+                ref_number INTEGER NOT NULL,
+                username TEXT NOT NULL,
+                username_key TEXT NOT NULL,
+                difficulty TEXT NOT NULL,
+                questions INTEGER,
+                time TEXT,
+                score TEXT,
+                quiz_save TEXT
+            );
+            CREATE INDEX IF NOT EXISTS scores_position ON scores (position);
+            CREATE INDEX IF NOT EXISTS scores_ref_number ON scores (ref_number);
+            CREATE INDEX IF NOT EXISTS scores_username_difficulty ON scores (username_key, difficulty);
+            CREATE TABLE IF NOT EXISTS quiz_saves (
+                ref_number INTEGER PRIMARY KEY,
+                payload BLOB NOT NULL
+            );
+        """)
+        with self.connection:  # Move the saved questions of an older database into the "quiz_saves" table.
+            self.connection.execute("INSERT OR REPLACE INTO quiz_saves SELECT ref_number, quiz_save FROM scores WHERE quiz_save IS NOT NULL")
+            self.connection.execute("UPDATE scores SET quiz_save = NULL WHERE quiz_save IS NOT NULL")
+
+
+    # Function for loading every user from the database in their saved order. If the database doesn't exist yet, the JSON scoreboard is imported first.
+    def load(self):
+        first_use = not os.path.exists(self.path)
+        with self.lock:
+            self.connect()
+        if first_use and self.import_path != None and os.path.exists(self.import_path):
+            try:
+                self.import_json(self.import_path)
+            except Exception:
+                # Remove the partly created database so that the import is tried again next time, then let the caller handle the error.
+                self.connection.close()
+                self.connection = None
+                os.remove(self.path)
+                raise
+        with self.lock:
+            rows = self.connection.execute("SELECT position, ref_number, username, difficulty, questions, time, score FROM scores ORDER BY position").fetchall()
+            self.positions = [row[0] for row in rows]
+        return [list(row[1:]) for row in rows]
+
+
+    # Function for loading the scoreboard in chunks, yielding a tuple of (list of users, fraction of the scoreboard loaded so far) for each chunk, like "ScoreboardJournal.iter_load".
+    # The query only reads the summary columns, so the rows are read in one go and only split into chunks so that the scoreboard is shown the same way for both stores.
+    def iter_load(self, chunk_size=500):
+        data = self.load()
+        for start in range(0, len(data), chunk_size):
+            yield data[start:start + chunk_size], min(start + chunk_size, len(data)) / len(data)
+
+
+    # Method for importing the users from a JSON scoreboard (including any journaled changes and saved questions) into the database, replacing its current contents.
+    def import_json(self, json_path):
+        journal = ScoreboardJournal(json_path)
+        data = journal.load()
+        if not isinstance(data, list):  # Check if the loaded data is a list.
+            raise json.JSONDecodeError("Expected a list", doc=str(data), pos=0)  # Raise an error if the imported scoreboard data is not a list, simulating a JSON decode error.
+        for user in data:
+            if isinstance(user, list) and len(user) == 6:
+                try:
+                    self.save_quiz_save(user[0], journal.load_quiz_save(user[0]))
+                except (OSError, ValueError):
+                    continue  # The quiz save is missing or unreadable, which is reported when the quiz is reviewed.
+        self.reset(data)
+
+
+    # Function for creating the row values to insert for a user at the given position.
+    def row_values(self, position, user):
+        return (position, user[0], user[1], str(user[1]).lower(), user[2], user[3], user[4], user[5], None)
+
+
+    # Function for loading the positions of the rows if they haven't been loaded yet. Must be called while holding the lock.
+    def load_positions(self):
+        if self.positions == None:
+            self.positions = [row[0] for row in self.connection.execute("SELECT position FROM scores ORDER BY position")]
+        return self.positions
+
+
+    # Method for giving the rows evenly spaced whole-number positions again, used when there is no room left between two positions for a reinserted user. Must be called while holding the lock.
+    def renumber_positions(self):
+        rows = self.connection.execute("SELECT rowid FROM scores ORDER BY position").fetchall()
+        self.connection.executemany("UPDATE scores SET position = ? WHERE rowid = ?", [(position, row[0]) for position, row in enumerate(rows)])
+        self.positions = list(range(len(rows)))
+
+
+    # Function for getting the position for a user inserted at the given index, which is between the positions of the users before and after it. Must be called while holding the lock.
+    def insert_position(self, index):
+        positions = self.load_positions()
+        before = positions[index - 1] if index > 0 else None
+        after = positions[index] if index < len(positions) else None
+        if after == None:
+            return before + 1 if before != None else 0
+        if before == None:
+            return after - 1
+        position = (before + after) / 2
+        if before < position < after:
+            return position
+        self.renumber_positions()  # The positions are too close together to split, which only happens after many users are reinserted at the same place.
+        return self.insert_position(index)
+
+
+    # Method for applying a list of changes to the database in a single transaction. Each change is a tuple of (operation, index, user), using the same operations as the scoreboard journal.
+    # Each change writes only the row it affects, finding the row at an index from the loaded positions. A change with an index outside the scoreboard raises a ValueError and rolls back every change, since it was made to a different list of users (like a journal record that doesn't fit, see "ScoreboardJournal.apply").
+    def record_changes(self, changes, users):
+        if not changes:
+            return
+        with self.lock:
+            self.connect()
+            self.positions = list(self.load_positions())  # Update a copy, so that a failed transaction can't leave the positions half changed.
+            try:
+                with self.connection:  # Use the connection as a context manager so that the changes are committed together, or rolled back if any of them fail.
+                    for operation, index, user in changes:
+                        if operation == "append":
+                            position = self.positions[-1] + 1 if self.positions else 0
+                            self.connection.execute("INSERT INTO scores VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", self.row_values(position, user))
+                            self.positions.append(position)
+                        elif operation in ("insert", "replace", "delete") and not (isinstance(index, int) and 0 <= index < len(self.positions) + (operation == "insert")):
+                            raise ValueError(f"The scoreboard change doesn't fit the database ({operation} at position {index} of {len(self.positions)} scores)")
+                        elif operation == "insert":
+                            position = self.insert_position(index)
+                            self.connection.execute("INSERT INTO scores VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", self.row_values(position, user))
+                            self.positions.insert(index, position)
+                        elif operation == "replace":
+                            self.connection.execute("UPDATE scores SET ref_number = ?, username = ?, username_key = ?, difficulty = ?, questions = ?, time = ?, score = ? WHERE position = ?", self.row_values(self.positions[index], user)[1:8] + (self.positions[index],))
+                        elif operation == "delete":
+                            self.connection.execute("DELETE FROM scores WHERE position = ?", (self.positions[index],))
+                            del self.positions[index]
+                        elif operation == "clear":
+                            self.connection.execute("DELETE FROM scores")
+                            self.positions = []
+            except Exception:
+                self.positions = None  # Load the positions again from the database next time, since the changes were rolled back.
+                raise
+
+
+    # Method for replacing the contents of the database with the given users.
+    def reset(self, users):
+        with self.lock:
+            self.connect()
+            with self.connection:
+                self.connection.execute("DELETE FROM scores")
+                self.connection.executemany("INSERT INTO scores VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", [self.row_values(position, user) for position, user in enumerate(users)])
+            self.positions = list(range(len(users)))
+
+
+    # Function for loading the saved questions of the quiz with the given reference number, raising a KeyError if there aren't any.
+    def load_quiz_save(self, ref_number):
+        with self.lock:
+            self.connect()
+            row = self.connection.execute("SELECT payload FROM quiz_saves WHERE ref_number = ?", (ref_number,)).fetchone()
+        if row == None:
+            raise KeyError(f"No saved questions for reference number {ref_number}")
+        return decode_quiz_save(row[0]) if isinstance(row[0], bytes) else json.loads(row[0])  # Quiz saves moved from an older database are still stored as JSON text.
+
+
+    # Method for saving the questions of the quiz with the given reference number, replacing any older quiz saved with the same reference number.
+    def save_quiz_save(self, ref_number, quiz_save):
+        with self.lock:
+            self.connect()
+            with self.connection:
+                self.connection.execute("INSERT OR REPLACE INTO quiz_saves VALUES (?, ?)", (ref_number, encode_quiz_save(quiz_save)))
+
+
+    # Method for removing the saved questions of quizzes that are no longer on the scoreboard. This is only done when the program starts, since deleted scores can be restored until then.
+    def remove_orphan_quiz_saves(self, users):
+        with self.lock:
+            self.connect()
+            with self.connection:
+                self.connection.execute("DELETE FROM quiz_saves WHERE ref_number NOT IN (SELECT ref_number FROM scores)")
+
+
+    # Method kept for compatibility with "ScoreboardJournal", since the database has no background work to wait for.
+    def wait(self):
+        return
+
+
+    # Function for getting the index in the "users" list of the row with the given position, by a binary search of the loaded positions. Must be called while holding the lock.
+    def position_index(self, position):
+        positions = self.load_positions()
+        index = bisect.bisect_left(positions, position)
+        return index if index < len(positions) and positions[index] == position else None
+
+
+    # Function for finding the index of a user's score with the given username (case insensitive) and difficulty, using the (username_key, difficulty) index.
+    # The index is checked against the "users" list, which can be ahead of the database (e.g. while a change is waiting to be written, after a failed write, or in temporary storage mode). The list is scanned if the database has no matching row or the row is at a different index.
+    def find_user(self, users, username, difficulty):
+        with self.lock:
+            self.connect()
+            row = self.connection.execute("SELECT position FROM scores WHERE username_key = ? AND difficulty = ? ORDER BY position LIMIT 1", (username.lower(), difficulty)).fetchone()
+            index = self.position_index(row[0]) if row != None else None
+        if index != None and index < len(users) and users[index][1].lower() == username.lower() and users[index][2] == difficulty:
+            return index
+        return find_user(users, username, difficulty)
+
+
+    # Function for finding the index of the score with the given reference number, using the ref_number index. The "users" list is scanned if the database has no matching row or the row is at a different index (see "find_user").
+    def find_ref(self, users, ref_number):
+        try:
+            ref_number = int(ref_number)  # Reference numbers from the Treeview selection are passed as strings.
+        except (TypeError, ValueError):
+            return None
+        with self.lock:
+            self.connect()
+            row = self.connection.execute("SELECT position FROM scores WHERE ref_number = ? LIMIT 1", (ref_number,)).fetchone()
+            index = self.position_index(row[0]) if row != None else None
+        if index != None and index < len(users) and str(users[index][0]) == str(ref_number):
+            return index
+        return find_ref(users, ref_number)
+
@@ -0,0 +1,85 @@
+# Date Created: 17/10/2026
+# Purpose: Cached rendering of the diagrams shown with QWhizz Math questions (e.g. the right-angled triangle of trigonometry questions), so that each diagram is only drawn once.
+# Like "assets", this module needs Pillow, so it isn't imported by "__init__".
+
+import math
+from PIL import Image, ImageDraw
+
+DIAGRAMS = {}  # Functions for drawing each kind of diagram, mapping the name of each kind to its function (see "register_diagram").
+
+
+# Function for registering a function that draws a kind of diagram. The function is called with the scaling factor and the parameters of the diagram, and returns the image at its size multiplied by the scaling factor.
+def register_diagram(kind, draw):
+    DIAGRAMS[kind] = draw
+    return draw
+
+
+# Function for drawing a right-angled triangle with white lines on a transparent background, with a small square marking the right angle.
+# "points" are the right-angled corner followed by the other two corners, at a scaling factor of 1 with (0, 0) at the top left, so the triangle can be drawn in any orientation.
+def draw_right_triangle(scale=1, size=(200, 160), points=((65, 120), (65, 20), (190, 120)), square_size=15, colour="white", line_width=3):
+    image = Image.new("RGBA", (round(size[0] * scale), round(size[1] * scale)), (0, 0, 0, 0))  # "RGBA" for RBG with transparency (A for alpha - transparency level), using (0 (Red), 0 (Green), 0 (Blue), 0 (Alpha)) for transparent background colour.
+    draw = ImageDraw.Draw(image)
+    corner, end1, end2 = [(x * scale, y * scale) for x, y in points]
+    width = max(1, round(line_width * scale))
+
+    # Draw triangle using lines.
+    draw.line([corner, end1], fill=colour, width=width)
+    draw.line([end2, corner], fill=colour, width=width)
+    draw.line([end1, end2], fill=colour, width=width)
+
+    # Draw the two inner sides of the right-angle square, which tucks into the right-angled corner along both sides.
+    side1 = unit_vector(corner, end1, square_size * scale)
+    side2 = unit_vector(corner, end2, square_size * scale)
+    square_points = [
+        (corner[0] + side1[0], corner[1] + side1[1]),                        # Move along the first side from the right-angled corner.
+        (corner[0] + side1[0] + side2[0], corner[1] + side1[1] + side2[1]),  # Move diagonally to the inner corner of the square.
+        (corner[0] + side2[0], corner[1] + side2[1]),                        # Move back to the second side.
+    ]
+    draw.line([square_points[0], square_points[1]], fill=colour, width=width)
+    draw.line([square_points[1], square_points[2]], fill=colour, width=width)
+    return image
+
+
+# Function for getting the vector of the given length pointing from one point towards another.
+def unit_vector(start, end, length):
+    dx, dy = end[0] - start[0], end[1] - start[1]
+    distance = math.hypot(dx, dy)
+    return (dx * length / distance, dy * length / distance)
+
+
+register_diagram("Right Triangle", draw_right_triangle)
+
+
+class DiagramCache:
+    # Constructor for the "DiagramCache" class, which stores the function used to create the images shown in the window.
+    # "ctk_image" works like "CTk.CTkImage" (which it usually is), and is only called on the thread running the window.
+    def __init__(self, ctk_image=None):
+        self.ctk_image = ctk_image
+        self.images = {}      # Drawn diagrams, mapping each (kind, scaling factor, parameters) to its PIL image.
+        self.ctk_images = {}  # CTk images of the drawn diagrams, with the same keys.
+
+
+    # Function for getting the key a diagram is cached with. The parameters are sorted by name, so that the order they are given in doesn't matter.
+    @staticmethod
+    def diagram_key(kind, scale, parameters):
+        return (kind, scale, tuple(sorted(parameters.items())))
+
+
+    # Function for getting the image of a diagram drawn at the given scaling factor, drawing it the first time it is needed.
+    def image(self, kind, scale=1, **parameters):
+        key = self.diagram_key(kind, scale, parameters)
+        image = self.images.get(key)
+        if image == None:
+            image = self.images[key] = DIAGRAMS[kind](scale, **parameters)
+        return image
+
+
+    # Function for getting the CTk image of a diagram for widgets with the given scaling factor, creating it the first time it is needed.
+    # The diagram is drawn at the scaled size so that its lines stay sharp, and the CTk image is given the unscaled size, which CTk scales back up to the drawn size.
+    def ctk(self, kind, scale=1, **parameters):
+        key = self.diagram_key(kind, scale, parameters)
+        image = self.ctk_images.get(key)
+        if image == None:
+            drawn = self.image(kind, scale, **parameters)
+            image = self.ctk_images[key] = self.ctk_image(drawn, size=(round(drawn.width / scale), round(drawn.height / scale)))
+        return image
@@ -0,0 +1,524 @@
+# Date Created: 17/10/2026
+# Purpose: Question generation for QWhizz Math, which doesn't depend on the GUI so that quizzes can be generated without a Tk window (e.g. for worksheets and load tests).
+
+import math, random
+
+GENERATOR_VERSION = 4  # Version of the question generators. This must be increased whenever a change means the same seed generates different questions, and the engine of the older version added to "recipe_engines".
+
+TOPICS = []  # Names of the registered question topics (see "register_topic"), in the order used when a topic is chosen at random.
+DIFFICULTIES = ["Easy", "Medium", "Hard"]
+LETTERS = ["x", "y", "z", "a", "b", "c", "m", "n"]
+
+MEASUREMENT_OFFSETS = [1, 2, 3, 4, 5, 6]                                     # Offsets of fake measurements for whole number answers.
+EQUATION_OFFSETS = [-8, -7, -6, -5, -4, -3, -2, -1, 1, 2, 3, 4, 5, 6, 7, 8]  # Offsets of fake one step equation answers for whole number answers.
+TERM_OFFSETS = [-10, -9, -8, -7, -6, -5, -4, -3, -2, 2, 3, 4, 5, 6, 7, 8, 9, 10]  # Offsets of fake like terms and binomial expansion answers.
+
+
+# Function for formatting a number as a whole number if it is one, otherwise to 2 decimal places, followed by the unit (if any).
+def format_number(number, unit=""):
+    return f"{str(int(number)) if number == int(number) else '{:.2f}'.format(number)}{unit}"
+
+
+# Function for formatting a term with its sign for use after another term (e.g. " + 3x", " - x", or "" if the coefficient is 0).
+# If the coefficient is 1 or -1, only the letter is used (this follows algebra rules where "1x" is the same as "x" and "-1x" is the same as "-x").
+def format_signed_term(coefficient, letter):
+    if coefficient == 0:
+        return ""
+    if coefficient == -1:
+        return f" - {letter}"
+    if coefficient == 1:
+        return f" + {letter}"
+    return f" + {coefficient}{letter}" if coefficient > 0 else f" - {-coefficient}{letter}"
+
+
+# Function for formatting a constant with its sign for use after another term (e.g. " + 6" or " - 6").
+def format_signed_constant(constant):
+    return f" + {constant}" if constant >= 0 else f" - {-constant}"
+
+
+# Function for formatting a fake like terms answer, which follows the same rules as the answer, except that 0 is shown without the letter.
+def format_like_term_fake(fake, letter):
+    return f"{letter}" if fake == 1 else f"-{letter}" if fake == -1 else f"{fake}" if fake == 0 else f"{fake}{letter}"
+
+
+# Function for formatting a fake binomial expansion answer, leaving out the constant if it is 0.
+def format_binomial_fake(section1, fake1, fake2, letter):
+    return f"{section1}{format_signed_term(fake1, letter)}{format_signed_constant(fake2) if fake2 != 0 else ''}"
+
+
+class SampledDistractors:
+    # The "SampledDistractors" class generates the 3 fake answers of each question by sampling 3 different offsets without replacement, so each question takes a fixed number of random draws.
+    # Every offset formats to a different fake answer that isn't the answer, so no fake answer ever has to be drawn again.
+
+    # Constructor for the "SampledDistractors" class. If "skip_whole" is True, fake decimal answers that would be a whole number (e.g. "9.00") are left out, which is how versions 2 and 3 of the generators worked.
+    def __init__(self, skip_whole=False):
+        self.decimal_fakes = skipping_decimal_fakes if skip_whole == True else decimal_fakes
+
+
+    # Function for generating 3 fake measurements between 1 and 6 above the answer (whole numbers for whole number answers, otherwise to 2 decimal places).
+    def measurements(self, rng, answer, formatted_answer, unit):
+        if answer == int(answer):
+            return [format_number(answer + MEASUREMENT_OFFSETS[index], unit) for index in sample_indices(rng, len(MEASUREMENT_OFFSETS), 3)]
+        return self.decimal_fakes(rng, formatted_answer, (1,), unit)
+
+
+    # Function for generating 3 fake like terms answers between 2 and 10 above or below the answer.
+    def like_terms(self, rng, answer, formatted_answer, letter):
+        return [format_like_term_fake(answer + TERM_OFFSETS[index], letter) for index in sample_indices(rng, len(TERM_OFFSETS), 3)]
+
+
+    # Function for generating 3 fake one step equation answers between 1 and 8 above or below a whole number answer, or between 1 and 6 above or below a decimal answer.
+    def equation(self, rng, answer, formatted_answer):
+        if answer == int(answer):
+            return [format_number(answer + EQUATION_OFFSETS[index]) for index in sample_indices(rng, len(EQUATION_OFFSETS), 3)]
+        return self.decimal_fakes(rng, formatted_answer, (-1, 1), "")
+
+
+    # Function for generating 3 fake binomial expansion answers, each changing both the letter term and the constant by between 2 and 10.
+    # The 3 pairs of offsets are sampled from every possible pair, so each fake answer is different even if two of them share an offset.
+    def binomial(self, rng, section1, section2, section3, letter, formatted_answer):
+        return [format_binomial_fake(section1, section2 + TERM_OFFSETS[pair // len(TERM_OFFSETS)], section3 + TERM_OFFSETS[pair % len(TERM_OFFSETS)], letter)
+                for pair in sample_indices(rng, len(TERM_OFFSETS)**2, 3)]
+
+
+# Function for choosing "k" different positions from 0 to "population" - 1 using Floyd's algorithm, where every set of positions is equally likely (the order doesn't matter, since the answer buttons are shuffled).
+# Exactly "k" numbers are drawn, and a position that is already chosen is replaced by the newest position in the range, so nothing is ever drawn again.
+def sample_indices(rng, population, k):
+    chosen = []
+    for top in range(population - k, population):
+        index = rng.randrange(top + 1)
+        chosen.append(top if index in chosen else index)
+    return chosen
+
+
+# Function for generating 3 fake decimal answers between 1 and 6 away from a decimal answer (in the direction of each of the "signs"), to 2 decimal places, with the same spread as the rejection loops of "RejectionDistractors".
+# The offsets are chosen in hundredths from the answer as it is shown, so different offsets always give different fake answers. Like the rejection loops, a fake answer can end in ".00" (e.g. "9.00").
+# The 3 positions are chosen with Floyd's algorithm like "sample_indices", but written out and drawn with "rng.random", which is quicker than "rng.randrange".
+def decimal_fakes(rng, formatted_answer, signs, unit):
+    hundredths = int(formatted_answer[:len(formatted_answer) - len(unit)].replace(".", ""))  # The answer in hundredths as it is shown, e.g. 794 for "7.94 cm".
+    random = rng.random
+    top = len(signs) * 501 - 3  # For each sign, the 501 offsets from 1.00 to 6.00.
+    first = int(random() * (top + 1))
+    second = int(random() * (top + 2))
+    if second == first:
+        second = top + 1
+    third = int(random() * (top + 3))
+    if third == first or third == second:
+        third = top + 2
+    return [f"{(hundredths + signs[index // 501] * (100 + index % 501)) / 100:.2f}{unit}" for index in (first, second, third)]  # Rounding the fake answer in hundredths back to 2 decimal places always gives back the same hundredths.
+
+
+# Function for generating 3 fake decimal answers between 1 and 5.99 away from a decimal answer (in the direction of each of the "signs"), to 2 decimal places, leaving out offsets that would give a whole number (e.g. "9.00").
+# This is how versions 2 and 3 of the generators chose fake decimal answers, and is kept so that quizzes saved as their recipes still generate the same questions.
+def skipping_decimal_fakes(rng, formatted_answer, signs, unit):
+    hundredths = int(formatted_answer[:len(formatted_answer) - len(unit)].replace(".", ""))  # The answer in hundredths as it is shown, e.g. 794 for "7.94 cm".
+    fake_answers = []
+    for choice in sample_indices(rng, len(signs) * 495, 3):  # For each sign, 495 of the 500 offsets from 1.00 to 5.99 don't give a whole number.
+        sign = signs[choice // 495]
+        position, skipped = choice % 495, (-sign * hundredths) % 100  # Every 100th offset (starting at 1.00 + "skipped" hundredths) gives a whole number, so skip past them.
+        offset = 100 + (position if position < skipped else position + 1 + (position - skipped) // 99)
+        fake = hundredths + sign * offset
+        fake_answers.append(f"{'-' if fake < 0 else ''}{abs(fake) // 100}.{abs(fake) % 100:02d}{unit}")  # The same text as "format_number" gives for the fake answer, without converting it to a decimal number.
+    return fake_answers
+
+
+class RejectionDistractors:
+    # The "RejectionDistractors" class generates fake answers one at a time, drawing again whenever a fake answer matches the answer or an earlier fake answer. This is how version 1 of the generators worked.
+    # It is kept so that quizzes saved as version 1 recipes still generate the same questions, and so that the benchmarks can compare it with "SampledDistractors".
+
+    # Constructor for the "RejectionDistractors" class, which counts the fake answers drawn (including the ones drawn again).
+    def __init__(self):
+        self.draws = 0
+
+
+    # Function for generating 3 fake measurements, adding a random offset between 1 and 6 (a whole number offset if the answer is a whole number, otherwise a decimal offset).
+    def measurements(self, rng, answer, formatted_answer, unit):
+        fake_answers = []
+        while len(fake_answers) < 3:  # Generate 3 fake answers for each question.
+            self.draws += 1
+            offset = rng.randint(1, 6) if answer == int(answer) else rng.uniform(1, 6)
+            formatted_fake = format_number(answer + offset, unit)
+            if formatted_fake != formatted_answer and formatted_fake not in fake_answers:  # Check if the formatted fake answer is different from the correct answer and not already in the list of fake answers.
+                fake_answers.append(formatted_fake)
+        return fake_answers
+
+
+    # Function for generating 3 fake like terms answers, adding a random offset between -10 and 10 (excluding -1 to 1).
+    def like_terms(self, rng, answer, formatted_answer, letter):
+        fake_answers = []
+        while len(fake_answers) < 3:
+            self.draws += 1
+            formatted_fake = format_like_term_fake(answer + rng.choice([-1, 1]) * rng.randint(2, 10), letter)
+            if formatted_fake != formatted_answer and formatted_fake not in fake_answers:
+                fake_answers.append(formatted_fake)
+        return fake_answers
+
+
+    # Function for generating 3 fake one step equation answers, adding a whole number offset between -8 and 8 (excluding 0) or a decimal offset between -6 and 6 (excluding -1 to 1).
+    def equation(self, rng, answer, formatted_answer):
+        fake_answers = []
+        while len(fake_answers) < 3:
+            self.draws += 1
+            if answer == int(answer):
+                offset = rng.choice([-1, 1]) * rng.randint(1, 8)
+            else:
+                offset = rng.choice([-1, 1]) * rng.uniform(1, 6)
+            formatted_fake = format_number(answer + offset)
+            if formatted_fake != formatted_answer and formatted_fake not in fake_answers:
+                fake_answers.append(formatted_fake)
+        return fake_answers
+
+
+    # Function for generating 3 fake binomial expansion answers, adding a random offset between -10 and 10 (excluding -1 to 1) to both the letter term and the constant.
+    def binomial(self, rng, section1, section2, section3, letter, formatted_answer):
+        fake_answers = []
+        while len(fake_answers) < 3:
+            self.draws += 1
+            fake1 = section2 + rng.choice([-1, 1]) * rng.randint(2, 10)
+            fake2 = section3 + rng.choice([-1, 1]) * rng.randint(2, 10)
+            complete_fake = format_binomial_fake(section1, fake1, fake2, letter)
+            if complete_fake != formatted_answer and complete_fake not in fake_answers:
+                fake_answers.append(complete_fake)
+        return fake_answers
+
+
+# Fake answer generators used by the question engines (the sampled ones for new quizzes).
+sampled_distractors = SampledDistractors()
+skipping_distractors = SampledDistractors(skip_whole=True)  # Used by versions 2 and 3 of the generators.
+
+
+# Function for generating an easy trigonometry question (area of a right-angled triangle).
+def easy_trigonometry(rng, distractors=sampled_distractors):
+    number1 = rng.randint(2, 12)                 # Left side of the triangle (opposite).
+    min_num2 = math.ceil(number1*1.1)            # Ensure the bottom side (adjacent) is larger than the left side (opposite) by at least 1.1x.
+    number2 = rng.randint(min_num2, min_num2+3)  # Bottom side of the triangle (adjacent).
+    # Question list order is [hypotenuse (not used - set to None), left side, bottom side, angle (not used - set to None)].
+    question = [None, f"{number1} cm", f"{number2} cm", None]
+    answer = (number1*number2)/2
+    formatted_answer = format_number(answer, " cm")
+    return ["Trigonometry", "Area of Triangles", ["Find the area", "of the triangle:"], question, formatted_answer, distractors.measurements(rng, answer, formatted_answer, " cm")]
+
+
+# Function for generating an easy algebra question (collecting like terms, e.g. 2x + 4x + 6x = ?).
+def easy_algebra(rng, distractors=sampled_distractors):
+    letter = rng.choice(LETTERS)
+    question_type = rng.randint(0, 1)
+    number1 = rng.randint(1, 12)
+    number2 = rng.randint(1, 12)
+    number3 = rng.randint(1, 12)
+    sign = " - " if question_type == 0 else " + "
+    question = f"{number1 if number1 != 1 else ''}{letter}{sign}{number2 if number2 != 1 else ''}{letter}{sign}{number3 if number3 != 1 else ''}{letter} = ?"  # If any numbers are 1 then only include the letter beside those numbers.
+    answer = number1-number2-number3 if question_type == 0 else number1+number2+number3
+
+    # For instances where the answer is 1 or -1, use just the letter as the answer (this follows algebra rules where "1x" is the same as "x" and "-1x" is the same as "-x").
+    formatted_answer = f"{letter}" if answer == 1 else f"-{letter}" if answer == -1 else f"{answer}{letter}"
+    return ["Algebra", "Like Terms", "Simplify the following:", question, formatted_answer, distractors.like_terms(rng, answer, formatted_answer, letter)]
+
+
+# Function for generating a medium trigonometry question (finding a side with Pythagorean theorem).
+def medium_trigonometry(rng, distractors=sampled_distractors):
+    letter = "x"
+    question_type = rng.randint(0, 2)  # Determines which side of the triangle is unknown.
+    side = "hypotenuse" if question_type == 0 else "adjacent" if question_type == 1 else "opposite"
+    number1 = rng.randint(2, 12)
+    min_num2 = math.ceil(number1*1.1)  # Ensure the second side is larger than the first by at least 1.1x.
+    number2 = rng.randint(min_num2, min_num2+3)
+    # Question list order is [hypotenuse, left side, bottom side, angle (not used - set to None)].
+    if question_type == 0:    # The hypotenuse is unknown.
+        question = [letter, f"{number1} cm", f"{number2} cm", None]
+        answer = math.sqrt(number1**2 + number2**2)
+    elif question_type == 1:  # The bottom side (adjacent) is unknown.
+        question = [f"{number2} cm", f"{number1} cm", letter, None]
+        answer = math.sqrt(number2**2 - number1**2)
+    else:                     # The left side (opposite) is unknown.
+        question = [f"{number2} cm", letter, f"{number1} cm", None]
+        answer = math.sqrt(number2**2 - number1**2)
+    formatted_answer = format_number(answer, " cm")
+    return ["Trigonometry", "Pythagorean\nTheorem", ["Find the length", f"of the {side}:"], question, formatted_answer, distractors.measurements(rng, answer, formatted_answer, " cm")]
+
+
+# Function for generating a medium algebra question (one step equations, e.g. a + 2 = 4).
+def medium_algebra(rng, distractors=sampled_distractors):
+    letter = rng.choice(LETTERS)
+    question_type = rng.randint(0, 3)
+    if question_type == 0:    # e.g. a - 2 = 4 >> a = 6.
+        number1 = rng.randint(1, 20)
+        number2 = rng.randint(1, 50)
+        question = f"{letter} - {number1} = {number2}"
+        answer = number2+number1
+    elif question_type == 1:  # e.g. a + 2 = 4 >> a = 2.
+        number1 = rng.randint(1, 20)
+        number2 = rng.randint(1, 50)
+        question = f"{letter} + {number1} = {number2}"
+        answer = number2-number1
+    elif question_type == 2:  # e.g. 2a = 4 >> a = 2.
+        number1 = rng.randint(1, 10)                # A lower number helps maintain easiness, since division is involved.
+        number2 = rng.randint(number1, number1+10)  # Ensure that the second number is at least the first number.
+        question = f"{number1}{letter} = {number2}"
+        answer = number2/number1
+    else:                     # e.g. a / 2 = 4 >> a = 8.
+        number1 = rng.randint(1, 12)
+        number2 = rng.randint(1, 12)
+        question = f"{letter} / {number1} = {number2}"
+        answer = number2*number1
+    formatted_answer = format_number(answer)
+    return ["Algebra", "One Step Equations", f"Solve for {letter}:", question, formatted_answer, distractors.equation(rng, answer, formatted_answer)]
+
+
+# Function for generating a hard trigonometry question (finding a side with the trigonometric ratios, using a 40 degree angle).
+def hard_trigonometry(rng, distractors=sampled_distractors):
+    letter = "x"
+    angle_rad = math.radians(40)
+    formatted_angle = "40°"
+    question_type = rng.randint(0, 2)  # Determines which side of the triangle is unknown.
+    side = "opposite" if question_type == 0 else "hypotenuse" if question_type == 1 else "adjacent"
+    # Question list order is [hypotenuse, left side, bottom side, angle].
+    if question_type == 0:    # The hypotenuse is known, and the left side (opposite) is unknown.
+        number1 = rng.randint(6, 24)  # The hypotenuse has a higher range since it is always the longest side.
+        question = [f"{number1} cm", letter, "", formatted_angle]
+        answer = number1 * math.sin(angle_rad)
+    elif question_type == 1:  # The bottom side (adjacent) is known, and the hypotenuse is unknown.
+        number1 = rng.randint(4, 16)
+        question = [letter, "", f"{number1} cm", formatted_angle]
+        answer = number1 / math.cos(angle_rad)
+    else:                     # The left side (opposite) is known, and the bottom side (adjacent) is unknown.
+        number1 = rng.randint(4, 16)
+        question = ["", f"{number1} cm", letter, formatted_angle]
+        answer = number1 / math.tan(angle_rad)
+    formatted_answer = format_number(answer, " cm")
+    return ["Trigonometry", "Trigonometric\nRatios", ["Find the length", f"of the {side}:"], question, formatted_answer, distractors.measurements(rng, answer, formatted_answer, " cm")]
+
+
+# Function for generating a hard algebra question (binomial expansion, e.g. (x - 3)(x + 2) = ?).
+def hard_algebra(rng, distractors=sampled_distractors):
+    letter = rng.choice(LETTERS)
+    number1 = rng.choice([-1, 1]) * rng.randint(1, 12)  # Random number between -12 and 12 (excluding 0).
+    number2 = rng.choice([-1, 1]) * rng.randint(1, 12)
+    question = f"({letter}{format_signed_constant(number1)})({letter}{format_signed_constant(number2)}) = ?"
+
+    section1 = f"{letter}²"  # Square the letter using the Unicode character for superscript 2.
+    section2 = number2 + number1  # Combine the like terms, e.g. 2x + 3x = 5x.
+    section3 = number1 * number2  # Multiply the last terms, e.g. 2 * 3 = 6.
+    formatted_answer = f"{section1}{format_signed_term(section2, letter)}{format_signed_constant(section3)}"
+    return ["Algebra", "Binomial Expansion", "Expand the following:", question, formatted_answer, distractors.binomial(rng, section1, section2, section3, letter, formatted_answer)]
+
+
+# Question generators for each difficulty and topic, filled in by "register_topic".
+GENERATORS = {}
+
+# Number of different questions each generator can generate, filled in by "register_topic". A quiz can't have more questions than this without repeating one.
+QUESTION_COUNTS = {}
+
+# Registered question topics, mapping the name of each topic to its "Topic".
+TOPIC_REGISTRY = {}
+
+
+class Topic:
+    # Constructor for the "Topic" class, which describes a family of questions so that it can be added to quizzes without changing the question engine or the window.
+    # "generators" maps each difficulty to its question generator, and "question_counts" maps each difficulty to the number of different questions its generator can generate (if it is known).
+    # "settings_key" is the key of the setting that enables the topic (e.g. "enable_algebra"), and "renderer" is the layout the window shows its questions with: "Triangle" for a right-angled triangle with labelled sides (where the statement is 2 lines and the question is [hypotenuse, left side, bottom side, angle]), or "Text" for a statement and question written as text.
+    # "weight" is how many times more often the topic is chosen than a topic with a weight of 1, when both are enabled.
+    def __init__(self, name, generators, question_counts=None, settings_key=None, renderer="Text", weight=1):
+        self.name = name
+        self.generators = dict(generators)
+        self.question_counts = dict(question_counts or {})
+        self.settings_key = f"enable_{name.lower()}" if settings_key == None else settings_key
+        self.renderer = renderer
+        self.weight = weight
+
+
+# Function for registering a question topic, so that its questions can be generated and it can be enabled from the settings menu. New topics are added after the existing ones, so that the same seed still generates the same questions for the existing topics.
+def register_topic(topic):
+    if topic.name in TOPIC_REGISTRY:
+        raise ValueError(f"The {topic.name!r} topic is already registered")
+    if not isinstance(topic.weight, int) or topic.weight < 1:
+        raise ValueError(f"The weight of the {topic.name!r} topic must be a whole number of at least 1")
+    TOPIC_REGISTRY[topic.name] = topic
+    TOPICS.append(topic.name)
+    for difficulty, generator in topic.generators.items():
+        GENERATORS[(difficulty, topic.name)] = generator
+        if difficulty in topic.question_counts:
+            QUESTION_COUNTS[(difficulty, topic.name)] = topic.question_counts[difficulty]
+    return topic
+
+
+register_topic(Topic("Trigonometry", {"Easy": easy_trigonometry, "Medium": medium_trigonometry, "Hard": hard_trigonometry}, {
+    "Easy": 11*4,          # 11 left sides, each with 4 bottom sides.
+    "Medium": 3 * 11*4,    # 3 unknown sides, each with the triangles of the easy questions.
+    "Hard": 19 + 13 + 13,  # Hypotenuses from 6 to 24, and bottom and left sides from 4 to 16.
+}, renderer="Triangle"))
+
+register_topic(Topic("Algebra", {"Easy": easy_algebra, "Medium": medium_algebra, "Hard": hard_algebra}, {
+    "Easy": len(LETTERS) * 2 * 12**3,                     # Each letter, both signs, and 3 numbers from 1 to 12.
+    "Medium": len(LETTERS) * (2*20*50 + 10*11 + 12*12),  # Each letter with the subtraction, addition, multiplication, and division equations.
+    "Hard": len(LETTERS) * 24 * 24,                       # Each letter, with 2 numbers from -12 to 12 (excluding 0).
+}))
+
+MAX_REPEATS = 1000  # Number of repeated questions in a row after which a generator is treated as having run out of questions, so that a generator whose number of different questions isn't known (or is wrong) can't repeat forever.
+
+
+# Function for getting the fingerprint of a question, which is the same for two questions only if they ask the same thing (the fake answers and their order aren't included).
+def question_fingerprint(question):
+    _, title, statement, text = question[:4]
+    return (title, tuple(statement) if isinstance(statement, list) else statement, tuple(text) if isinstance(text, list) else text)
+
+
+class QuestionEngine:
+    # Constructor for the "QuestionEngine" class, which stores the question generators to use for each difficulty and topic, and the fake answer generators they use.
+    # If "generators" is None, the generators of the registered topics are used, including topics registered after the engine is created.
+    # If "unique" is True, no question is repeated within a quiz. "question_counts" gives the number of different questions each generator can generate (see "QUESTION_COUNTS"), and is only needed for generators that aren't registered.
+    def __init__(self, generators=None, distractors=None, unique=True, question_counts=None):
+        self.generators = GENERATORS if generators == None else dict(generators)
+        self.distractors = sampled_distractors if distractors == None else distractors
+        self.unique = unique
+        self.question_counts = dict(question_counts or {})
+        self.tables = {}  # Generation tables for each list of question families and their weights (see "family_table").
+
+
+    # Function for generating a quiz of "n" questions of the given difficulty, with the topic of each question chosen at random from "topics".
+    # Each question is a list of [topic, title, statement, question, answer, fake answers]. The same seed always generates the same questions (for the same GENERATOR_VERSION), and a seed of None generates different questions each time.
+    def generate(self, difficulty, topics, n, seed=None):
+        rng = random.Random(seed)
+        return self.generate_with(rng, difficulty, topics, n)
+
+
+    # Function for generating many quizzes at once from a single seed, which is quicker than creating a random number generator for each quiz.
+    def generate_batch(self, difficulty, topics, n, count, seed=None):
+        rng = random.Random(seed)
+        return [self.generate_with(rng, difficulty, topics, n) for _ in range(count)]
+
+
+    # Function for generating "n" questions from a list of question families, each being (difficulty, topic), with the family of each question chosen at random in proportion to "weights" (or the weights of the topics if "weights" is None).
+    # Used for quizzes that mix difficulties, such as adaptive quizzes.
+    def generate_families(self, families, n, seed=None, weights=None):
+        rng = random.Random(seed)
+        return self.generate_from_table(rng, self.family_table(families, weights), n)
+
+
+    # Function for getting the generation table for a difficulty and list of topics (see "family_table").
+    def generation_table(self, difficulty, topics):
+        try:
+            return self.family_table([(difficulty, topic) for topic in topics])
+        except ValueError:
+            raise ValueError(f"No questions can be generated for the {difficulty!r} difficulty with the topics {topics!r}")
+
+
+    # Function for getting the generation table for a list of question families, which is worked out once and then reused, so that choosing the generator of each question takes the same time however many families there are.
+    # The table is (generators, the number of different questions each generator can generate, and the positions of the generators with each one repeated by its weight), so that a position chosen at random from the last list chooses each family in proportion to its weight.
+    def family_table(self, families, weights=None):
+        key = (tuple(families), None if weights == None else tuple(weights))
+        table = self.tables.get(key)
+        if table == None:
+            generators, counts, choices = [], [], []
+            for position, (difficulty, topic) in enumerate(families):
+                generator = self.generators.get((difficulty, topic))
+                if generator == None:
+                    raise ValueError(f"No questions can be generated for the {difficulty!r} difficulty of the {topic!r} topic")
+                count = self.question_counts.get((difficulty, topic))
+                if count == None and generator is GENERATORS.get((difficulty, topic)):
+                    count = QUESTION_COUNTS.get((difficulty, topic))  # Only the counts of the registered generators are known.
+                weight = weights[position] if weights != None else TOPIC_REGISTRY[topic].weight if topic in TOPIC_REGISTRY else 1
+                choices.extend([len(generators)] * weight)
+                generators.append(generator)
+                counts.append(count)
+            if not choices:
+                raise ValueError("No questions can be generated without a question family")
+            table = self.tables[key] = (generators, counts, choices)
+        return table
+
+
+    # Function for getting the number of different questions that can be generated from a list of question families (the most questions a quiz can have), or None if there is no limit or it isn't known for every family.
+    def question_limit(self, families):
+        try:
+            _, counts, _ = self.family_table(families)
+        except ValueError:
+            return 0
+        if self.unique == False or None in counts:
+            return None
+        return sum(counts)
+
+
+    # Function for generating "n" questions using the given random number generator.
+    def generate_with(self, rng, difficulty, topics, n):
+        return self.generate_from_table(rng, self.generation_table(difficulty, ordered_topics(topics)), n)
+
+
+    # Function for generating "n" questions from a generation table (see "family_table") using the given random number generator.
+    def generate_from_table(self, rng, table, n):
+        generators, counts, choices = table
+        distractors = self.distractors
+        if self.unique == False:
+            if len(generators) == 1:
+                generator = generators[0]
+                return [generator(rng, distractors) for _ in range(n)]
+            return [generators[rng.choice(choices)](rng, distractors) for _ in range(n)]
+
+        if None not in counts and n > sum(counts):
+            raise ValueError(f"Only {sum(counts)} different questions can be generated from these question families, but {n} were requested")
+        return unique_questions(rng, generators, counts, choices, n, distractors)
+
+
+# Function for generating "n" questions with no question repeated, with the generator of each question chosen at random from "generators" by its positions in "choices" (see "QuestionEngine.generation_table").
+# The fingerprint of each question is kept in a set, and questions that have already been generated are generated again. "counts" gives the number of different questions each generator can generate (or None if it isn't known), so that a generator stops being chosen once it has run out of questions.
+# The random numbers are drawn in the same order as when questions can repeat, so a quiz without repeated questions is the same either way.
+def unique_questions(rng, generators, counts, choices, n, distractors):
+    fingerprints = set()
+    remaining = list(counts)  # Number of different questions each generator has left.
+    choices = list(choices)   # Positions of the generators that have questions left.
+    questions = []
+    repeats = 0
+    while len(questions) < n:
+        if not choices:
+            raise ValueError(f"Only {len(questions)} different questions could be generated, but {n} were requested")
+        index = choices[0] if len(generators) == 1 else rng.choice(choices)
+        question = generators[index](rng, distractors)
+        fingerprint = question_fingerprint(question)
+        if fingerprint in fingerprints:
+            repeats += 1
+            if repeats >= MAX_REPEATS:
+                choices = [choice for choice in choices if choice != index]  # Assume that the generator has run out of questions (e.g. its number of different questions isn't known or is wrong).
+                repeats = 0
+            continue
+        repeats = 0
+        fingerprints.add(fingerprint)
+        questions.append(question)
+        if remaining[index] != None:
+            remaining[index] -= 1
+            if remaining[index] == 0:
+                choices = [choice for choice in choices if choice != index]
+    return questions
+
+
+# Function for getting the topics to generate questions from, kept in a fixed order so that a seed always chooses the same topics. If no topics are given, every topic is used.
+def ordered_topics(topics):
+    return [topic for topic in TOPICS if topic in topics] or list(TOPICS)
+
+
+# Question engine with the standard generators, used by the "generate" function.
+default_engine = QuestionEngine()
+
+
+# Question engines for each version of the generators that recipes can be generated from. Version 1 drew fake answers until they were all different, versions 1 and 2 could repeat questions, and versions 2 and 3 left whole numbers out of fake decimal answers.
+recipe_engines = {1: QuestionEngine(distractors=RejectionDistractors(), unique=False), 2: QuestionEngine(distractors=skipping_distractors, unique=False), 3: QuestionEngine(distractors=skipping_distractors), GENERATOR_VERSION: default_engine}
+
+
+# Function for generating a quiz with the standard generators (see "QuestionEngine.generate").
+def generate(difficulty, topics, n, seed=None):
+    return default_engine.generate(difficulty, topics, n, seed)
+
+
+# Function for creating the recipe of a quiz, which is everything needed to generate its questions again with "generate_from_recipe": [generator version, seed, difficulty, topics, number of questions].
+def make_recipe(difficulty, topics, n, seed):
+    return [GENERATOR_VERSION, seed, difficulty, ordered_topics(topics), n]
+
+
+# Function for generating the questions of a quiz again from its recipe with the standard generators, raising a ValueError if the recipe is invalid or was made by an unknown version of the generators.
+def generate_from_recipe(recipe):
+    if not isinstance(recipe, (list, tuple)) or len(recipe) != 5:
+        raise ValueError("Invalid quiz recipe")
+    version, seed, difficulty, topics, n = recipe
+    if version not in recipe_engines:
+        raise ValueError(f"The quiz was generated by version {version} of the question generators, but this program only supports versions {', '.join(str(version) for version in recipe_engines)}")
+    if not isinstance(seed, int) or not isinstance(topics, list) or not isinstance(n, int) or n < 0:
+        raise ValueError("Invalid quiz recipe")
+    return recipe_engines[version].generate(difficulty, topics, n, seed)
@@ -0,0 +1,245 @@
+# Date Created: 17/10/2026
+# Purpose: Benchmarks and regression checks for the QWhizz Math question generators. Run with "python -m AppData.QWhizz.generation_benchmarks" from the program folder.
+# Add "--update-baseline" to save the current generators as the baseline that later runs are checked against (only do this once a change to the questions is intended).
+
+import hashlib, json, math, os, random, re, sys, tracemalloc
+from collections import Counter
+from .benchmarks import best_time
+from .engine import GENERATOR_VERSION, GENERATORS, QUESTION_COUNTS, DIFFICULTIES, TOPICS, QuestionEngine, RejectionDistractors, sampled_distractors, recipe_engines, generate_from_recipe
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "generation_baseline.json")  # Path of the baseline that the checks compare the generators against.
+SAMPLE_AMOUNT = 20000  # Number of questions generated from each question family for the checks.
+SAMPLE_SEED = 1        # Seed of the questions generated for the checks, which must match the baseline's for the questions to be compared exactly.
+CRITICAL_Z = 3.29      # Number of standard errors a difference must be larger than to fail a check (there is a 0.1% chance of a check failing by chance when only the random numbers have changed).
+MIN_CATEGORY = 10      # Smallest number of questions in a category (e.g. a title) for it to be compared on its own. Smaller categories are compared together.
+NUMBER_PATTERN = re.compile(r"\d+\.\d+|\d+")
+
+
+# Function for getting the name of a question family, as used in the baseline (e.g. "Easy|Algebra").
+def family_name(family):
+    return f"{family[0]}|{family[1]}"
+
+
+# Function for getting the format of an answer, with each whole number replaced by "#" and each decimal number by "#.#" (e.g. "x² - #x + #" or "#.# cm"), so that answers can be compared by how they are written.
+def answer_format(answer):
+    return NUMBER_PATTERN.sub(lambda match: "#.#" if "." in match.group() else "#", answer)
+
+
+# Function for getting the value of an answer, as the first number in it (including its sign), or 0 if it has no numbers (e.g. "x²").
+def answer_value(answer):
+    match = re.search(r"-?(?:\d+\.\d+|\d+)", answer)
+    return float(match.group()) if match else 0.0
+
+
+# Function for getting the SHA-256 digest of a list of questions, which only matches if every question is exactly the same.
+def questions_digest(questions):
+    return hashlib.sha256(json.dumps(questions, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+# Function for generating "question_amount" questions from the generator of a question family, seeded by the family name so that registering a new topic doesn't change the questions of the others.
+def family_sample(family, question_amount=SAMPLE_AMOUNT, seed=SAMPLE_SEED, distractors=sampled_distractors):
+    generator = GENERATORS[family]
+    rng = random.Random(f"{seed}|{family_name(family)}")
+    return [generator(rng, distractors) for _ in range(question_amount)]
+
+
+# Function for summarising a sample of questions: their digest, how often each title, answer format and fake answer format appears, the mean and standard deviation of the answer values, and the number of questions whose fake answers break the rules (fewer than 3, repeated, or the same as the answer).
+def summarise_sample(questions):
+    values = [answer_value(question[4]) for question in questions]
+    mean = sum(values) / len(values)
+    return {
+        "digest": questions_digest(questions),
+        "questions": len(questions),
+        "titles": dict(Counter(question[1] for question in questions)),
+        "answer_formats": dict(Counter(answer_format(question[4]) for question in questions)),
+        "fake_formats": dict(Counter(answer_format(fake) for question in questions for fake in question[5])),
+        "answer_mean": mean,
+        "answer_sd": math.sqrt(sum((value - mean) ** 2 for value in values) / len(values)),
+        "invalid_fakes": sum(1 for question in questions if len(question[5]) != 3 or len(set(question[5])) != 3 or question[4] in question[5]),
+    }
+
+
+# Function for generating quizzes from the recipes of every generator version, difficulty and topic, returning the digest of each version's quizzes. Quizzes saved as recipes can only be reviewed if these never change.
+def recipe_digests(seeds=range(20), question_amount=20):
+    digests = {}
+    for version in sorted(recipe_engines):
+        quizzes = [generate_from_recipe([version, seed, difficulty, topics, question_amount]) for difficulty in DIFFICULTIES for topics in [[topic] for topic in TOPICS] + [list(TOPICS)] for seed in seeds]
+        digests[str(version)] = questions_digest(quizzes)
+    return digests
+
+
+# Function for summarising every question family and the recipes of every generator version, in the layout of the baseline file.
+def generation_summary(question_amount=SAMPLE_AMOUNT, seed=SAMPLE_SEED):
+    return {
+        "generator_version": GENERATOR_VERSION,
+        "seed": seed,
+        "families": {family_name(family): summarise_sample(family_sample(family, question_amount, seed)) for family in GENERATORS},
+        "recipes": recipe_digests(),
+    }
+
+
+# Function for testing whether two sets of category counts (e.g. the titles of the baseline and current questions) come from the same distribution, with a chi-squared test of homogeneity.
+# Returns the names of any categories found in only one of them and whether the test passed. Categories with fewer than MIN_CATEGORY questions between them are tested as one category.
+def compare_counts(expected, observed):
+    total_expected, total_observed = sum(expected.values()), sum(observed.values())
+    if total_expected == 0 or total_observed == 0:
+        return [], total_expected == total_observed
+    new_categories = sorted(set(observed) - set(expected)) + sorted(set(expected) - set(observed))
+    rows, small = [], [0, 0]
+    for category in set(expected) | set(observed):
+        counts = [expected.get(category, 0), observed.get(category, 0)]
+        if sum(counts) < MIN_CATEGORY:
+            small = [small[0] + counts[0], small[1] + counts[1]]
+        else:
+            rows.append(counts)
+    if sum(small) > 0:
+        rows.append(small)
+    if len(rows) < 2:
+        return new_categories, True
+    statistic = 0.0
+    for counts in rows:
+        category_total = sum(counts)
+        for count, total in zip(counts, (total_expected, total_observed)):
+            expectation = category_total * total / (total_expected + total_observed)
+            statistic += (count - expectation) ** 2 / expectation
+    return new_categories, statistic <= chi_squared_critical(len(rows) - 1)
+
+
+# Function for getting the value a chi-squared statistic with "degrees" degrees of freedom is only larger than by chance with the probability of CRITICAL_Z (using the Wilson-Hilferty approximation, so that no statistics package is needed).
+def chi_squared_critical(degrees):
+    spread = 2 / (9 * degrees)
+    return degrees * (1 - spread + CRITICAL_Z * math.sqrt(spread)) ** 3
+
+
+# Function for checking the current generators against the baseline summary, returning a list of the problems found (an empty list if they match).
+# If the generator version hasn't changed, the questions must be exactly the same, since quizzes are saved as recipes. If it has, the questions can differ, but the titles, answer formats and answer values must still have the same distributions.
+def check_generation(baseline, current):
+    problems = []
+    same_version = baseline["generator_version"] == current["generator_version"] and baseline["seed"] == current["seed"]
+    for version, digest in baseline["recipes"].items():
+        if current["recipes"].get(version) != digest:
+            problems.append(f"Recipes of generator version {version} no longer generate the same questions")
+    for name, expected in baseline["families"].items():
+        observed = current["families"].get(name)
+        if observed == None:
+            problems.append(f"{name}: question family is no longer registered")
+            continue
+        if same_version and observed["digest"] != expected["digest"]:
+            problems.append(f"{name}: the same seed generates different questions, so GENERATOR_VERSION must be increased")
+        if observed["invalid_fakes"] > 0:
+            problems.append(f"{name}: {observed['invalid_fakes']} questions have fake answers that are repeated or the same as the answer")
+        for key, description in (("titles", "titles"), ("answer_formats", "answer formats"), ("fake_formats", "fake answer formats")):
+            new_categories, passed = compare_counts(expected[key], observed[key])
+            if new_categories:
+                problems.append(f"{name}: {description} found in only one of the baseline and current questions: {', '.join(map(repr, new_categories[:5]))}")
+            elif passed == False:
+                problems.append(f"{name}: the distribution of {description} has changed")
+        standard_error = math.sqrt((expected["answer_sd"] ** 2 / expected["questions"]) + (observed["answer_sd"] ** 2 / observed["questions"]))
+        if abs(observed["answer_mean"] - expected["answer_mean"]) > CRITICAL_Z * standard_error + 1e-9:
+            problems.append(f"{name}: the mean answer has changed from {expected['answer_mean']:.3f} to {observed['answer_mean']:.3f}")
+    return problems
+
+
+# Function for timing each question generator, returning the number of questions generated per second for each question family.
+def benchmark_family_throughput(question_amount=20000, seed=SAMPLE_SEED):
+    results = []
+    for family in GENERATORS:
+        seconds = best_time(lambda: family_sample(family, question_amount, seed), repeats=3)
+        results.append({"family": family_name(family), "questions_per_second": question_amount / seconds})
+    return results
+
+
+# Function for timing the question engine generating whole quizzes for each difficulty (with every topic and no repeated questions), returning the quizzes per second and the number of repeated questions generated again per quiz.
+def benchmark_quiz_throughput(quiz_amount=2000, question_amount=35, seed=SAMPLE_SEED):
+    results = []
+    for difficulty in DIFFICULTIES:
+        calls = Counter()
+        def counted(family, generator):
+            def count_calls(rng, distractors):
+                calls[family] += 1
+                return generator(rng, distractors)
+            return count_calls
+        counting_engine = QuestionEngine({family: counted(family, generator) for family, generator in GENERATORS.items()}, question_counts=QUESTION_COUNTS)  # Wrapped generators aren't the registered ones, so their counts are given.
+        counting_engine.generate_batch(difficulty, TOPICS, question_amount, quiz_amount, seed)
+        engine = QuestionEngine()
+        seconds = best_time(lambda: engine.generate_batch(difficulty, TOPICS, question_amount, quiz_amount, seed), repeats=3)
+        results.append({"difficulty": difficulty, "quizzes_per_second": quiz_amount / seconds, "redraws_per_quiz": (sum(calls.values()) - quiz_amount * question_amount) / quiz_amount})
+    return results
+
+
+# Function for counting the fake answers drawn again for each question family, by the rejection loops of version 1 of the generators ("RejectionDistractors") and by the sampling used now (which never draws again).
+def benchmark_distractor_retries(question_amount=SAMPLE_AMOUNT, seed=SAMPLE_SEED):
+    results = []
+    for family in GENERATORS:
+        rejection = RejectionDistractors()
+        retries = []
+        generator = GENERATORS[family]
+        rng = random.Random(f"{seed}|{family_name(family)}")
+        for _ in range(question_amount):
+            before = rejection.draws
+            generator(rng, rejection)
+            retries.append(rejection.draws - before - 3)  # Each question needs 3 fake answers, so any other draws were retries.
+        results.append({"family": family_name(family), "mean_retries": sum(retries) / question_amount, "max_retries": max(retries), "sampled_retries": 0})
+    return results
+
+
+# Function for measuring the memory used by 1,000 generated questions of each question family, including every string and list inside them.
+def benchmark_generation_memory(question_amount=1000, seed=SAMPLE_SEED):
+    results = []
+    for family in GENERATORS:
+        tracemalloc.start()
+        questions = family_sample(family, question_amount, seed)
+        used = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del questions
+        results.append({"family": family_name(family), "bytes_per_1000": used * 1000 / question_amount})
+    return results
+
+
+# Function for loading the baseline summary, returning None if it hasn't been saved yet.
+def load_baseline(path=BASELINE_PATH):
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return None
+
+
+# Procedure for saving a summary as the baseline.
+def save_baseline(summary, path=BASELINE_PATH):
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(summary, file, indent=4, ensure_ascii=False, sort_keys=True)
+        file.write("\n")
+
+
+# Run the benchmarks and checks only if the module is being run directly, exiting with an error code if the checks fail.
+if __name__ == "__main__":
+    print(f"Questions generated per second ({SAMPLE_AMOUNT:,} questions per family):")
+    for result in benchmark_family_throughput():
+        print(f"  {result['family']:<20} {result['questions_per_second']:>12,.0f}")
+    print("Quizzes generated per second (2,000 quizzes of 35 questions with every topic):")
+    for result in benchmark_quiz_throughput():
+        print(f"  {result['difficulty']:<20} {result['quizzes_per_second']:>12,.0f}   {result['redraws_per_quiz']:.2f} repeated questions generated again per quiz")
+    print(f"Fake answers drawn again per question ({SAMPLE_AMOUNT:,} questions per family):")
+    for result in benchmark_distractor_retries():
+        print(f"  {result['family']:<20} rejection: {result['mean_retries']:.3f} mean, {result['max_retries']} worst   sampled: {result['sampled_retries']}")
+    print("Memory of 1,000 generated questions:")
+    for result in benchmark_generation_memory():
+        print(f"  {result['family']:<20} {result['bytes_per_1000'] / 1024:>10,.1f} KiB")
+
+    summary = generation_summary()
+    if "--update-baseline" in sys.argv[1:]:
+        save_baseline(summary)
+        print(f"Saved the baseline to {BASELINE_PATH}")
+        sys.exit(0)
+    baseline = load_baseline()
+    if baseline == None:
+        print(f"No baseline found at {BASELINE_PATH}. Run with --update-baseline to save one.")
+        sys.exit(1)
+    problems = check_generation(baseline, summary)
+    print("Generation checks against the baseline:")
+    for problem in problems:
+        print(f"  FAILED: {problem}")
+    if problems:
+        sys.exit(1)
+    print(f"  Passed ({len(summary['families'])} question families and {len(summary['recipes'])} generator versions match)")
@@ -0,0 +1,388 @@
+# Date Created: 17/10/2026
+# Purpose: Append-only journaled storage for the QWhizz Math scoreboard, so that saving a score doesn't rewrite the whole scoreboard file.
+
+import json, os, hashlib, threading
+from .codec import encode_quiz_save, decode_quiz_save
+from .loader import iter_json_array, DigestReader
+
+
+class ScoreboardJournal:
+    # Constructor for the "ScoreboardJournal" class, which stores the snapshot file path and derives the journal and checkpoint file paths from it.
+    # The snapshot keeps the original "scoreboard.json" layout, while every change made since the snapshot was written is appended to the journal as one small JSON record per line.
+    def __init__(self, snapshot_path, compact_threshold=200):
+        self.snapshot_path = snapshot_path                                   # Path of the snapshot file (e.g. "AppData/scoreboard.json").
+        self.path = snapshot_path                                            # Path of the main scoreboard file, which is the snapshot for the journaled store.
+        self.journal_path = os.path.splitext(snapshot_path)[0] + ".journal"  # Path of the journal file that new change records are appended to.
+        self.rotated_path = self.journal_path + ".old"                       # Path that the journal is moved to while a compaction is folding it into the snapshot.
+        self.checkpoint_path = self.journal_path + ".checkpoint"             # Path of the checkpoint file, which records the last change already folded into the snapshot.
+        self.quiz_save_dir = os.path.join(os.path.dirname(snapshot_path), "QuizSaves")  # Path of the folder that stores the saved questions of each quiz, with one file per reference number.
+        self.compact_threshold = compact_threshold                           # Number of journal records to allow before the journal is compacted into a new snapshot.
+        self.seq = 0                      # Sequence number of the last recorded change, used to order records and skip ones already folded into the snapshot.
+        self.pending_records = 0          # Number of records written since the last compaction.
+        self.compaction_thread = None     # Background thread of the running compaction (if any).
+        self.compaction_error = None      # Last error raised by a background compaction, kept so it can be inspected (the journal stays intact if a compaction fails).
+        self.compaction_callback = None   # Function to call after a background compaction has finished writing the new snapshot (if any).
+        self.lock = threading.Lock()      # Lock to stop records being appended while the journal is being rotated.
+        self.signatures = {}              # Signature of each scoreboard file as last read or written by the store, mapping its path to a tuple of (modification time and size, SHA-1 digest of its contents), with None for a file that doesn't exist.
+        self.signature_lock = threading.Lock()  # Lock to stop the signatures being changed from two threads at the same time (e.g. by a save and a background compaction).
+
+
+    # Function for checking if the scoreboard snapshot exists.
+    def exists(self):
+        return os.path.exists(self.snapshot_path)
+
+
+    # Function for getting the paths of the files that hold the scoreboard, used to detect if the scoreboard has changed on disk.
+    def data_paths(self):
+        return [self.snapshot_path, self.journal_path, self.rotated_path]
+
+
+    # Function for getting the signature of each scoreboard file as last read or written by the store, as a dictionary mapping its path to a tuple of (modification time and size, SHA-1 hex digest), with None for a file that doesn't exist.
+    # The digests come from the bytes the store already read or wrote, so that the files don't have to be read again to check if they have changed.
+    def file_signatures(self):
+        with self.signature_lock:
+            return {path: (stat, digest.hexdigest() if digest != None else None) for path, (stat, digest) in self.signatures.items()}
+
+
+    # Method for recording the signature of a file that the store has just read or written, given the modification time and size of the file when it was read (or None to read them now) and the SHA-1 digest of its contents (or None if the file doesn't exist).
+    def track(self, path, digest, stat=None):
+        with self.signature_lock:
+            self.signatures[path] = (stat if stat != None else file_stat(path), digest)
+
+
+    # Method for forgetting the signature of a file whose contents the store doesn't know (e.g. after a failed write), so that the file is read if its signature is needed.
+    def forget(self, path):
+        with self.signature_lock:
+            self.signatures.pop(path, None)
+
+
+    # Function for loading the scoreboard by reading the last snapshot and replaying the journal records on top of it.
+    # JSON and IO errors are raised to the caller so that the existing error control in the program can handle them.
+    def load(self):
+        stat = file_stat(self.snapshot_path)  # Get the modification time and size before reading, so that a change made while the file is read isn't missed.
+        with open(self.snapshot_path, "rb") as file:  # Open the snapshot file in binary read mode ("rb") so that the digest matches the bytes written by "write_snapshot".
+            raw = file.read()
+        digest = hashlib.sha1(raw)
+        self.track(self.snapshot_path, digest, stat)
+        data = json.loads(raw)
+        if not isinstance(data, list):  # Leave invalid data untouched so the caller can report it.
+            return data
+
+        base_seq = self.read_checkpoint(digest.hexdigest())  # Only skip records if the checkpoint belongs to this exact snapshot.
+        records = self.read_records(self.rotated_path) + self.read_records(self.journal_path)
+        records.sort(key=lambda record: record["seq"])  # Sort by sequence number, since records may be split between the rotated and current journal files.
+
+        replayed = 0
+        for record in records:
+            if record["seq"] > base_seq:  # Records at or below the checkpoint sequence number are already part of the snapshot.
+                self.apply(data, record)
+                replayed += 1
+        self.seq = max([base_seq] + [record["seq"] for record in records])
+        split = split_quiz_saves(data, self.save_quiz_save)  # Move the saved questions of any entries from an older scoreboard file into their own files.
+
+        # Fold any replayed records into a fresh snapshot so the journal starts empty for this session.
+        if replayed > 0 or split or os.path.exists(self.rotated_path):
+            try:
+                self.reset(data)
+            except OSError:
+                self.pending_records = replayed  # If the snapshot cannot be written, keep the journal so that no changes are lost.
+        return data
+
+
+    # Function for loading the scoreboard in chunks, yielding a tuple of (list of users, fraction of the scoreboard loaded so far) for each chunk, so that the first scores can be shown before the whole file has been read.
+    # The snapshot is read a block at a time. If the journal holds changes, they can move users anywhere in the list, so the scoreboard is loaded with "load" first and then yielded in chunks.
+    def iter_load(self, chunk_size=500):
+        if any(os.path.exists(path) and os.path.getsize(path) > 0 for path in (self.journal_path, self.rotated_path)):
+            data = self.load()
+            if not isinstance(data, list):
+                raise json.JSONDecodeError("Expected a list", str(data), 0)
+            for start in range(0, len(data), chunk_size):
+                yield data[start:start + chunk_size], min(start + chunk_size, len(data)) / len(data)
+            return
+
+        stat = file_stat(self.snapshot_path)
+        total_size = max(os.path.getsize(self.snapshot_path), 1)
+        data, chunk, split = [], [], False
+        digest = hashlib.sha1()
+        with open(self.snapshot_path, "rb") as snapshot_file:
+            file = DigestReader(snapshot_file, digest)  # Add each block read to the digest, so that the checkpoint can be checked without reading the file twice.
+            for user in iter_json_array(file):
+                chunk.append(user)
+                if len(chunk) >= chunk_size:
+                    split = split_quiz_saves(chunk, self.save_quiz_save) or split  # Move the saved questions of any entries from an older scoreboard file into their own files.
+                    data.extend(chunk)
+                    yield chunk, min(file.tell() / total_size, 1.0)
+                    chunk = []
+        split = split_quiz_saves(chunk, self.save_quiz_save) or split
+        data.extend(chunk)
+        self.seq = self.read_checkpoint(digest.hexdigest())  # Continue numbering changes from the checkpoint, so that new records aren't skipped as already being part of the snapshot.
+        self.track(self.snapshot_path, digest, stat)
+        for path in (self.journal_path, self.rotated_path):
+            self.read_records(path)  # Record the signatures of the empty (or missing) journals.
+        if split:
+            try:
+                self.reset(data)
+            except OSError:
+                pass  # The saved questions are already in their own files, so the snapshot is written again the next time the scoreboard changes.
+        yield chunk, 1.0
+
+
+    # Function for reading every valid record from a journal file, skipping any partially written line left behind by an interrupted write.
+    # The lines are read as bytes and added to a digest, so that the signature of the journal is recorded without reading it again.
+    def read_records(self, path):
+        records = []
+        stat = file_stat(path)
+        if stat == None:
+            self.track(path, None, stat)
+            return records
+        digest = hashlib.sha1()
+        with open(path, "rb") as file:
+            for line in file:
+                digest.update(line)
+                try:
+                    records.append(json.loads(line))
+                except ValueError:  # Includes JSON errors and lines that aren't valid UTF-8.
+                    continue
+        self.track(path, digest, stat)
+        return records
+
+
+    # Function for reading the sequence number from the checkpoint file, returning 0 if the checkpoint doesn't belong to the snapshot with the given digest.
+    def read_checkpoint(self, digest):
+        try:
+            with open(self.checkpoint_path, "r") as file:
+                checkpoint = json.load(file)
+            return checkpoint["seq"] if checkpoint.get("digest") == digest else 0
+        except (OSError, ValueError, KeyError, AttributeError):
+            return 0
+
+
+    # Method for applying a single journal record to the list of users.
+    # A record that doesn't fit the snapshot (e.g. if the snapshot was edited by hand) means that the records were written for a different list of users, so a JSONDecodeError is raised for the program's error control to report, rather than the record being skipped or the rest being applied to the wrong scores.
+    def apply(self, users, record):
+        operation, index, user = record["op"], record.get("index"), record.get("user")
+        if operation in ("insert", "replace", "delete"):
+            limit = len(users) + 1 if operation == "insert" else len(users)  # A score can be inserted after the last score.
+            if not isinstance(index, int) or isinstance(index, bool) or not 0 <= index < limit:
+                raise json.JSONDecodeError(f"Journal record {record.get('seq')} doesn't fit the scoreboard ({operation} at position {index} of {len(users)} scores)", json.dumps(record), 0)
+        if operation == "append": users.append(user)
+        elif operation == "insert": users.insert(index, user)
+        elif operation == "replace": users[index] = user
+        elif operation == "delete": del users[index]
+        elif operation == "clear": users.clear()
+        else:
+            raise json.JSONDecodeError(f"Journal record {record.get('seq')} has an unknown operation ({operation!r})", json.dumps(record), 0)
+
+
+    # Method for appending a list of changes to the journal. Each change is a tuple of (operation, index, user), where the operation is "append", "insert", "replace", "delete" or "clear".
+    # The cost of a save only depends on the size of the changes, since the rest of the scoreboard is not rewritten.
+    def record_changes(self, changes, users):
+        if not changes:
+            return
+        with self.lock:
+            lines = []
+            for operation, index, user in changes:
+                self.seq += 1
+                lines.append(json.dumps({"seq": self.seq, "op": operation, "index": index, "user": user}))
+            data = ("\n".join(lines) + "\n").encode("utf-8")
+            try:
+                with open(self.journal_path, "ab") as file:  # Open the journal in binary append mode ("ab"), creating it if it doesn't exist.
+                    file.write(data)
+                    file.flush()
+                    os.fsync(file.fileno())  # Make sure the records are on disk before the save is reported as successful.
+            except OSError:
+                self.forget(self.journal_path)  # The records may have been partly written.
+                raise
+            self.extend_signature(self.journal_path, data)
+            self.pending_records += len(lines)
+            compaction_due = self.pending_records >= self.compact_threshold
+        if compaction_due:
+            self.compact(users)
+
+
+    # Method for updating the signature of a file after the given bytes were appended to it, by adding them to the digest of its previous contents rather than reading the whole file again.
+    # The signature is forgotten if the previous contents of the file aren't known.
+    def extend_signature(self, path, data):
+        with self.signature_lock:
+            if path not in self.signatures:
+                return
+            digest = self.signatures[path][1]
+            digest = digest.copy() if digest != None else hashlib.sha1()  # A file that didn't exist starts empty.
+            digest.update(data)
+            self.signatures[path] = (file_stat(path), digest)
+
+
+    # Method for starting a background compaction, which folds the journal into a new snapshot of the given users.
+    def compact(self, users):
+        with self.lock:
+            if self.compaction_thread != None and self.compaction_thread.is_alive():
+                return  # Only run one compaction at a time. Records keep being appended to the journal in the meantime.
+            self.rotate()
+            snapshot = list(users)  # Take a shallow copy of the users list so that later changes in the program don't affect the snapshot being written.
+            seq = self.seq
+            self.pending_records = 0
+            self.compaction_thread = threading.Thread(target=self.background_compaction, args=(snapshot, seq), daemon=True)
+            self.compaction_thread.start()
+
+
+    # Method for moving the current journal aside so that new records go into a fresh journal while the compaction runs. Must be called while holding the lock.
+    def rotate(self):
+        if not os.path.exists(self.journal_path):
+            return
+        if os.path.exists(self.rotated_path):  # A previous compaction failed, so add the current records to the rotated journal rather than replacing it.
+            with open(self.journal_path, "rb") as source, open(self.rotated_path, "ab") as destination:
+                data = source.read()
+                destination.write(data)
+            self.extend_signature(self.rotated_path, data)
+            os.remove(self.journal_path)
+        else:
+            os.replace(self.journal_path, self.rotated_path)
+            with self.signature_lock:
+                signature = self.signatures.pop(self.journal_path, None)
+            if signature != None:
+                self.track(self.rotated_path, signature[1])  # The rotated journal has the contents the journal had.
+            else:
+                self.forget(self.rotated_path)
+        self.track(self.journal_path, None)
+
+
+    # Method for running a compaction on the background thread, storing any error rather than raising it, since the journal still holds every change if the compaction fails.
+    def background_compaction(self, snapshot, seq):
+        try:
+            self.write_snapshot(snapshot, seq)
+            if os.path.exists(self.rotated_path):
+                os.remove(self.rotated_path)
+            self.track(self.rotated_path, None)
+            self.compaction_error = None
+        except Exception as e:
+            self.compaction_error = e
+            return
+        if self.compaction_callback != None:
+            self.compaction_callback()
+
+
+    # Method for writing a snapshot of the users and its checkpoint.
+    # The checkpoint is written first, so that if the program stops before the snapshot is replaced, the checkpoint won't match the old snapshot and every record will be replayed.
+    def write_snapshot(self, snapshot, seq):
+        data = json.dumps(snapshot, indent=4).encode("utf-8")
+        digest = hashlib.sha1(data)
+        temporary_path = self.snapshot_path + ".tmp"
+        with open(self.checkpoint_path + ".tmp", "w") as file:
+            json.dump({"seq": seq, "digest": digest.hexdigest()}, file)
+        os.replace(self.checkpoint_path + ".tmp", self.checkpoint_path)
+        with open(temporary_path, "wb") as file:  # Write to a temporary file first, so that the snapshot is never left half-written.
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_path, self.snapshot_path)
+        self.track(self.snapshot_path, digest)
+
+
+    # Method for waiting until any running compaction has finished.
+    def wait(self):
+        if self.compaction_thread != None:
+            self.compaction_thread.join()
+
+
+    # Method for synchronously replacing the snapshot with the given users and clearing the journal (used when the file is created, replaced, or repaired).
+    def reset(self, users):
+        self.wait()  # Wait for any running compaction so that it cannot overwrite the new snapshot with older data.
+        with self.lock:
+            self.write_snapshot(list(users), self.seq)
+            for path in (self.journal_path, self.rotated_path):
+                if os.path.exists(path):
+                    os.remove(path)
+                self.track(path, None)
+            self.pending_records = 0
+
+
+    # Function for getting the path of the file storing the saved questions of the quiz with the given reference number, using the compact ".qws" format (or ".json" for quiz saves from older versions).
+    def quiz_save_path(self, ref_number, extension=".qws"):
+        return os.path.join(self.quiz_save_dir, f"{ref_number}{extension}")
+
+
+    # Function for loading the saved questions of the quiz with the given reference number. Only the quiz being reviewed is read, rather than every quiz on the scoreboard.
+    def load_quiz_save(self, ref_number):
+        try:
+            with open(self.quiz_save_path(ref_number), "rb") as file:
+                return decode_quiz_save(file.read())
+        except FileNotFoundError:
+            with open(self.quiz_save_path(ref_number, ".json"), "r") as file:  # Fall back to a quiz save written as JSON by an older version.
+                return json.load(file)
+
+
+    # Method for saving the questions of the quiz with the given reference number, replacing any older quiz saved with the same reference number.
+    def save_quiz_save(self, ref_number, quiz_save):
+        os.makedirs(self.quiz_save_dir, exist_ok=True)
+        temporary_path = self.quiz_save_path(ref_number) + ".tmp"
+        with open(temporary_path, "wb") as file:  # Write to a temporary file first, so that a quiz save is never left half-written.
+            file.write(encode_quiz_save(quiz_save))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_path, self.quiz_save_path(ref_number))
+        if os.path.exists(self.quiz_save_path(ref_number, ".json")):
+            os.remove(self.quiz_save_path(ref_number, ".json"))  # Remove an older JSON quiz save with the same reference number, so that it can't be loaded instead.
+
+
+    # Method for removing the saved questions of quizzes that are no longer on the scoreboard.
+    # This is only done when the program starts, since the saved questions of deleted scores are needed if the deletion is undone.
+    def remove_orphan_quiz_saves(self, users):
+        if not os.path.isdir(self.quiz_save_dir):
+            return
+        ref_numbers = {str(user[0]) for user in users}
+        for file_name in os.listdir(self.quiz_save_dir):
+            if file_name.split(".")[0] not in ref_numbers:
+                os.remove(os.path.join(self.quiz_save_dir, file_name))
+
+
+    # Function for finding the index of a user's score with the given username and difficulty. The journaled store has no index, so the "users" list is scanned.
+    def find_user(self, users, username, difficulty):
+        return find_user(users, username, difficulty)
+
+
+    # Function for finding the index of the score with the given reference number by scanning the "users" list.
+    def find_ref(self, users, ref_number):
+        return find_ref(users, ref_number)
+
+
+
+# Function for getting the modification time (in nanoseconds) and size of a file, or None if it doesn't exist.
+def file_stat(path):
+    try:
+        result = os.stat(path)
+    except OSError:
+        return None
+    return (result.st_mtime_ns, result.st_size)
+
+
+# Function for finding the index of a user's score with the given username (case insensitive) and difficulty by scanning the "users" list, returning None if there isn't one.
+def find_user(users, username, difficulty):
+    for index, user in enumerate(users):
+        if user[1].lower() == username.lower() and user[2] == difficulty:  # Use ".lower()" to ignore case sensitivity when comparing the existing usernames with the entered username by making them both lowercase.
+            return index
+    return None
+
+
+# Function for finding the index of the score with the given reference number by scanning the "users" list, returning None if there isn't one.
+def find_ref(users, ref_number):
+    for index, user in enumerate(users):
+        if str(user[0]) == str(ref_number):
+            return index
+    return None
+
+
+# Function for moving the saved questions (7th element) of entries from an older scoreboard file into the quiz save store, leaving only the 6 summary elements in the "users" list.
+# Entries whose number of saved questions doesn't match their number of questions are left unchanged, so that the program can report them as invalid. Returns True if any entries were changed.
+def split_quiz_saves(users, save_quiz_save):
+    split = False
+    for index, user in enumerate(users):
+        if isinstance(user, list) and len(user) == 7 and isinstance(user[6], list):
+            try:
+                valid = len(user[6]) == int(user[3])
+            except (TypeError, ValueError):
+                valid = False
+            if valid == True:
+                save_quiz_save(user[0], user[6])
+                users[index] = user[:6]
+                split = True
+    return split
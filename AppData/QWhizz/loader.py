@@ -0,0 +1,89 @@
+# Date Created: 17/10/2026
+# Purpose: Incremental reading of large QWhizz Math scoreboard files, so that the first scores can be shown before the whole file has been read.
+
+import codecs, json
+
+WHITESPACE = " \t\n\r"
+
+
+class DigestReader:
+    # Constructor for the "DigestReader" class, which wraps a binary file so that every block read from it is also added to a digest (e.g. "hashlib.sha1()").
+    def __init__(self, file, digest):
+        self.file = file
+        self.digest = digest
+
+
+    # Function for reading a block from the file and adding it to the digest.
+    def read(self, size=-1):
+        block = self.file.read(size)
+        self.digest.update(block)
+        return block
+
+
+    # Function for getting the position in the file, used to report how much of the file has been read.
+    def tell(self):
+        return self.file.tell()
+
+
+# Function for reading the items of a JSON array from a binary file one at a time, reading "block_size" bytes at a time so that the whole file is never held as one string.
+# Raises a JSONDecodeError if the file isn't a JSON array (e.g. "Expected a list" for a dictionary) or is incorrectly formatted, like "json.load" would.
+def iter_json_array(file, block_size=1 << 16):
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder("utf-8-sig")()  # Decode the UTF-8 bytes in pieces, without splitting characters that cross a block boundary (and skipping a byte order mark if there is one).
+    buffer, position, end_of_file = "", 0, False
+    state = "start"  # What is expected next: "start" (the opening bracket), "first" (the first item or closing bracket), "value" (an item), "separator" (a comma or closing bracket), or "end" (only whitespace).
+
+    while True:
+        while position < len(buffer) and buffer[position] in WHITESPACE:
+            position += 1
+        item = None
+        if position < len(buffer) and state in ("first", "value") and buffer[position] != "]":
+            item = try_decode(decoder, buffer, position, end_of_file)
+        if position >= len(buffer) or (item == None and state in ("first", "value") and buffer[position] != "]"):
+            if end_of_file:
+                if state == "end":
+                    return
+                if position < len(buffer):
+                    decoder.raw_decode(buffer, position)  # Raise the error of the item that couldn't be decoded.
+                raise json.JSONDecodeError("Expecting value" if state != "separator" else "Expecting ',' delimiter", buffer, position)
+            # Read another block, dropping the part of the buffer that has already been read.
+            block = file.read(block_size)
+            end_of_file = not block
+            buffer = buffer[position:] + text_decoder.decode(block, final=end_of_file)
+            position = 0
+            continue
+        character = buffer[position]
+
+        if state == "start":
+            if character != "[":
+                raise json.JSONDecodeError("Expected a list", buffer, position)
+            position += 1
+            state = "first"
+        elif state in ("first", "value") and item == None:  # A closing bracket ("]"), which is only valid straight after the opening bracket.
+            if state == "value":
+                raise json.JSONDecodeError("Expecting value", buffer, position)
+            position += 1
+            state = "end"
+        elif state in ("first", "value"):
+            value, position = item
+            state = "separator"
+            yield value
+        elif state == "separator":
+            if character not in ",]":
+                raise json.JSONDecodeError("Expecting ',' delimiter", buffer, position)
+            position += 1
+            state = "value" if character == "," else "end"
+        else:
+            raise json.JSONDecodeError("Extra data", buffer, position)
+
+
+# Function for decoding the JSON value at the position in the buffer, returning a tuple of (value, end position), or None if the value may continue past the end of the buffer.
+# Until the end of the file is reached, a value is only accepted if it is followed by whitespace, a comma, or a closing bracket (as every item in an array is), so that a number cut off at the end of a block (e.g. "12" of "123" or "-7.5" of "-7.5e3") isn't read early.
+def try_decode(decoder, buffer, position, end_of_file):
+    try:
+        value, end = decoder.raw_decode(buffer, position)
+    except json.JSONDecodeError:
+        return None
+    if end_of_file == False and (end >= len(buffer) or buffer[end] not in WHITESPACE + ",]"):
+        return None
+    return value, end
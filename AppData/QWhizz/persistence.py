@@ -0,0 +1,76 @@
+# Date Created: 17/10/2026
+# Purpose: Background writing for QWhizz Math, so that saving the scoreboard and settings doesn't freeze the window on a slow disk.
+
+import queue, threading
+
+
+class WriteBehindWorker:
+    # Constructor for the "WriteBehindWorker" class, which starts the background thread that runs the submitted writes in order.
+    # Writes are submitted with a key (e.g. "scoreboard" or "settings"). If a write with the same key is still waiting, the two are combined into one write, so that quick changes to the same file only write it once.
+    def __init__(self, max_pending=64):
+        self.max_pending = max_pending      # Largest number of writes that can be waiting at once. Submitting more waits until one has finished.
+        self.pending = {}                   # Writes waiting to run, mapping each key to its [write function, data, error handler]. Dictionaries keep their insertion order, so the writes run in the order they were first submitted.
+        self.running = 0                    # Number of writes currently running (0 or 1).
+        self.errors = queue.Queue()         # Errors raised by writes, as (error handler, error) tuples, to be reported on the thread running the window.
+        self.condition = threading.Condition()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+
+    # Method for submitting a write. "write" is called on the background thread with "data". If a write with the same key is waiting, "combine" is called with the waiting data and the new data to get the data for a single write (if "combine" is None, the new data replaces the waiting data).
+    # "on_error" is called with the error if the write fails, but only from "report_errors", so that it runs on the thread that calls "report_errors" (the thread running the window).
+    def submit(self, key, write, data, combine=None, on_error=None):
+        with self.condition:
+            if key in self.pending:
+                waiting = self.pending[key]
+                waiting[1] = combine(waiting[1], data) if combine != None else data
+                waiting[0], waiting[2] = write, on_error
+                return
+            while len(self.pending) >= self.max_pending:
+                self.condition.wait()  # Wait until there is room in the queue, so that a stalled disk can't use up the memory.
+            self.pending[key] = [write, data, on_error]
+            self.condition.notify_all()
+
+
+    # Method for running the waiting writes on the background thread, one at a time.
+    def run(self):
+        while True:
+            with self.condition:
+                while not self.pending:
+                    self.condition.wait()
+                key = next(iter(self.pending))
+                write, data, on_error = self.pending.pop(key)
+                self.running += 1
+                self.condition.notify_all()
+            try:
+                write(data)
+            except Exception as e:
+                self.errors.put((on_error, e))
+            finally:
+                with self.condition:
+                    self.running -= 1
+                    self.condition.notify_all()
+
+
+    # Method for waiting until every submitted write has finished, returning False if the timeout (in seconds) ran out first.
+    # Used when the files need to be up to date, such as before reloading the scoreboard, printing, or closing the program.
+    def flush(self, timeout=None):
+        with self.condition:
+            return self.condition.wait_for(lambda: not self.pending and self.running == 0, timeout)
+
+
+    # Function for checking if there are any writes waiting or running.
+    def busy(self):
+        with self.condition:
+            return bool(self.pending) or self.running > 0
+
+
+    # Method for calling the error handler of each failed write. This should be called regularly from the thread running the window (e.g. with "after"), since the error handlers show message boxes.
+    def report_errors(self):
+        while True:
+            try:
+                on_error, error = self.errors.get_nowait()
+            except queue.Empty:
+                return
+            if on_error != None:
+                on_error(error)
@@ -0,0 +1,83 @@
+# Date Created: 17/10/2026
+# Purpose: Background generation of the next quiz for QWhizz Math, so that a new quiz can start straight away instead of being generated when the user starts it.
+
+import os, random, threading
+from .engine import ordered_topics
+
+
+class QuizPrefetcher:
+    # Constructor for the "QuizPrefetcher" class, which starts the background thread that generates the next quiz with the given question engine.
+    # Only one quiz is generated ahead, for the settings of the last request. Requesting different settings discards the quiz generated for the old settings, so a quiz is never started with settings that are out of date.
+    def __init__(self, engine):
+        self.engine = engine
+        self.settings = None                # Settings of the quiz to generate ahead, as (difficulty, topics, number of questions), or None if no quiz should be generated.
+        self.ready = None                   # Quiz generated ahead, as (settings, seed, questions), or None if it hasn't been generated yet.
+        self.seeds = random.Random(os.urandom(16))  # Random number generator for the seeds of the quizzes, only used on the background thread.
+        self.condition = threading.Condition()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+
+    # Function for getting the settings of a quiz in the form they are compared in, with the topics in a fixed order (see "ordered_topics").
+    @staticmethod
+    def quiz_settings(difficulty, topics, n):
+        return (difficulty, tuple(ordered_topics(topics)), n)
+
+
+    # Method for requesting that a quiz with the given settings is generated ahead. Called whenever the difficulty, number of questions, or question topics change.
+    def request(self, difficulty, topics, n):
+        settings = self.quiz_settings(difficulty, topics, n)
+        with self.condition:
+            if settings == self.settings:
+                return
+            self.settings = settings
+            if self.ready != None and self.ready[0] != settings:
+                self.ready = None  # Discard the quiz generated for the old settings.
+            self.condition.notify_all()
+
+
+    # Method for stopping the generation of quizzes ahead, discarding any quiz that has been generated.
+    def cancel(self):
+        with self.condition:
+            self.settings = None
+            self.ready = None
+            self.condition.notify_all()
+
+
+    # Function for taking the quiz generated ahead for the given settings, returning (seed, questions), or None if there isn't one (in which case the quiz should be generated straight away).
+    # If the quiz is still being generated, this waits for it for up to "timeout" seconds. Once it is taken, the next quiz with the same settings is generated ahead.
+    def take(self, difficulty, topics, n, timeout=0.5):
+        settings = self.quiz_settings(difficulty, topics, n)
+        with self.condition:
+            if settings != self.settings:
+                return None
+            self.condition.wait_for(lambda: self.ready != None or self.settings != settings, timeout)
+            if self.ready == None or self.ready[0] != settings:
+                return None
+            _, seed, questions = self.ready
+            self.ready = None
+            self.condition.notify_all()
+            return seed, questions
+
+
+    # Method for generating the quizzes on the background thread, one at a time.
+    def run(self):
+        while True:
+            with self.condition:
+                self.condition.wait_for(lambda: self.settings != None and self.ready == None)
+                settings = self.settings
+            seed = self.seeds.getrandbits(64)
+            difficulty, topics, n = settings
+            try:
+                questions = self.engine.generate(difficulty, list(topics), n, seed)
+            except Exception:
+                # Stop generating ahead for settings that questions can't be generated for, so that the error is raised on the thread running the window when the quiz is generated there instead.
+                with self.condition:
+                    if self.settings == settings:
+                        self.settings = None
+                        self.condition.notify_all()
+                continue
+            with self.condition:
+                if self.settings == settings:  # Keep the quiz only if the settings haven't changed while it was being generated.
+                    self.ready = (settings, seed, questions)
+                    self.condition.notify_all()
@@ -0,0 +1,65 @@
+# Date Created: 17/10/2026
+# Purpose: Navigation instrumentation for QWhizz Math, which measures how long each change of page takes and how many widgets it creates.
+
+import time
+
+
+class NavigationProfiler:
+    # Constructor for the "NavigationProfiler" class, which stores the functions used to measure each navigation.
+    # "list_widgets" returns the names of every widget in the window, "settle" (if given) finishes any layout waiting to be done so that it is included in the time, and "report" (if given) is called with each measurement (e.g. to print it).
+    def __init__(self, list_widgets, settle=None, report=None, clock=time.perf_counter):
+        self.list_widgets = list_widgets
+        self.settle = settle
+        self.report = report
+        self.clock = clock
+        self.navigations = []  # Measurements of each navigation, as dictionaries of the page, whether it was the first visit, the time taken in seconds, and the number of widgets created and destroyed.
+        self.visited = set()   # Names of the pages that have been navigated to.
+
+
+    # Function for running a navigation to a page and measuring it, returning whatever the navigation returns.
+    def measure(self, page, navigate):
+        before = set(self.list_widgets())
+        start = self.clock()
+        try:
+            return navigate()
+        finally:
+            if self.settle != None:
+                self.settle()
+            seconds = self.clock() - start
+            after = set(self.list_widgets())
+            measurement = {"page": page, "first_visit": page not in self.visited, "seconds": seconds, "widgets_created": len(after - before), "widgets_destroyed": len(before - after)}
+            self.visited.add(page)
+            self.navigations.append(measurement)
+            if self.report != None:
+                self.report(measurement)
+
+
+    # Function for summarising the navigations to each page, separating the first visit (when the page is built) from the later visits (when it is only refreshed).
+    # Returns a list of dictionaries of the page, the number of later visits, and the mean time in seconds and widgets created of the first and later visits.
+    def summary(self):
+        results = []
+        for page in sorted({measurement["page"] for measurement in self.navigations}):
+            measurements = [measurement for measurement in self.navigations if measurement["page"] == page]
+            first = [measurement for measurement in measurements if measurement["first_visit"] == True]
+            later = [measurement for measurement in measurements if measurement["first_visit"] == False]
+            results.append({
+                "page": page,
+                "visits": len(later),
+                "first_seconds": mean(measurement["seconds"] for measurement in first),
+                "first_widgets_created": mean(measurement["widgets_created"] for measurement in first),
+                "later_seconds": mean(measurement["seconds"] for measurement in later),
+                "later_widgets_created": mean(measurement["widgets_created"] for measurement in later),
+            })
+        return results
+
+
+# Function for getting the mean of some numbers, or None if there aren't any.
+def mean(numbers):
+    numbers = list(numbers)
+    return sum(numbers) / len(numbers) if numbers else None
+
+
+# Function for formatting a navigation measurement as a line of text (e.g. for printing to the console).
+def format_measurement(measurement):
+    visit = "first visit" if measurement["first_visit"] == True else "later visit"
+    return f"{measurement['page']} ({visit}): {measurement['seconds'] * 1000:.1f} ms, {measurement['widgets_created']} widgets created, {measurement['widgets_destroyed']} destroyed"
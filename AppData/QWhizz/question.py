@@ -0,0 +1,67 @@
+# Date Created: 17/10/2026
+# Purpose: Compact records for the questions of a QWhizz Math quiz, which use less memory than the lists the questions are generated and saved as.
+
+class Question:
+    # Constructor for the "Question" class, which stores the details of one question. The statement and question are strings for algebra questions, and lists for trigonometry questions (see "engine").
+    __slots__ = ("topic", "title", "statement", "question", "answer", "fake_answers")
+
+    def __init__(self, topic, title, statement, question, answer, fake_answers):
+        self.topic = topic
+        self.title = title
+        self.statement = statement
+        self.question = question
+        self.answer = answer
+        self.fake_answers = fake_answers
+
+
+    # Function for creating a question from the list layout used by the question generators and quiz saves ([topic, title, statement, question, answer, fake answers], with the user answer after it in quiz saves, which is ignored).
+    @classmethod
+    def from_list(cls, values):
+        return cls(*values[:6])
+
+
+    # Function for getting the question in the list layout used by the question generators and quiz saves.
+    def to_list(self):
+        return [self.topic, self.title, self.statement, self.question, self.answer, self.fake_answers]
+
+
+    # Function for getting the answer and fake answers of the question, in that order.
+    def answer_choices(self):
+        return [self.answer] + self.fake_answers
+
+
+class AnsweredQuestion:
+    # Constructor for the "AnsweredQuestion" class, which stores the answer the user chose for a question. The question itself isn't copied, and its details can be read from this record (e.g. "answered_question.title").
+    __slots__ = ("details", "user_answer")
+
+    def __init__(self, details, user_answer):
+        self.details = details.details if isinstance(details, AnsweredQuestion) else details  # Keep a reference to the question itself when answering a question that was already answered (e.g. retrying a reviewed quiz).
+        self.user_answer = user_answer
+
+
+    # Function for reading the details of the question, which is only called for attributes that this record doesn't have.
+    def __getattr__(self, name):
+        if name == "details":
+            raise AttributeError(name)  # Prevent endless recursion before "details" is set (e.g. when copying).
+        return getattr(self.details, name)
+
+
+    # Function for creating an answered question from the list layout used by quiz saves ([topic, title, statement, question, answer, fake answers, user answer]).
+    @classmethod
+    def from_list(cls, values):
+        return cls(Question.from_list(values), values[6])
+
+
+    # Function for getting the answered question in the list layout used by quiz saves.
+    def to_list(self):
+        return self.details.to_list() + [self.user_answer]
+
+
+    # Function for getting the answer and fake answers of the question, in that order.
+    def answer_choices(self):
+        return self.details.answer_choices()
+
+
+# Function for converting a question record (or a list, which is returned unchanged) into the list layout used by the question generators and quiz saves.
+def question_to_list(question):
+    return question.to_list() if isinstance(question, (Question, AnsweredQuestion)) else question
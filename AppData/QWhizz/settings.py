@@ -0,0 +1,70 @@
+# Date Created: 17/10/2026
+# Purpose: Settings storage for QWhizz Math, which holds the settings in memory and writes them to "settings.json" only once changes have stopped.
+
+import json, os
+
+
+class SettingsManager:
+    # Constructor for the "SettingsManager" class, which stores the path of the settings file and the functions used to delay writes.
+    # "schedule" and "cancel" work like the "after" and "after_cancel" methods of a Tkinter window (which they usually are), so that the delayed write runs on the thread running the window.
+    def __init__(self, settings_path, schedule, cancel, delay=500):
+        self.settings_path = settings_path  # Path of the settings JSON file (e.g. "AppData/settings.json").
+        self.schedule = schedule            # Function for calling a function after a delay in milliseconds, returning an ID that can be cancelled.
+        self.cancel = cancel                # Function for cancelling a delayed call using its ID.
+        self.delay = delay                  # Time in milliseconds to wait after the last change before the settings are written, so that several quick changes are written once.
+        self.saved = None                   # Settings last loaded from or written to the file, used to skip writing settings that haven't changed.
+        self.pending = None                 # Settings waiting to be written once the delay has passed.
+        self.timer = None                   # ID of the delayed write, or None if no write is waiting.
+        self.on_flush = self.write          # Function called with the settings when they need to be written (this can be replaced, e.g. to write them on a background thread).
+
+
+    # Method for recording the settings that were loaded from the file, so that they aren't written back unless they change.
+    def loaded(self, settings):
+        self.saved = dict(settings)
+
+
+    # Method for requesting that the settings are written, restarting the delay so that only the last of several quick changes is written.
+    def request(self, settings):
+        self.pending = dict(settings)
+        if self.timer != None:
+            self.cancel(self.timer)
+        self.timer = self.schedule(self.delay, self.flush)
+
+
+    # Method for writing the waiting settings straight away (e.g. when the delay has passed or the program is closing), skipping the write if they match the saved settings.
+    def flush(self):
+        if self.timer != None:
+            self.cancel(self.timer)
+            self.timer = None
+        settings, self.pending = self.pending, None
+        if settings == None or settings == self.saved:
+            return
+        self.saved = settings
+        self.on_flush(settings)
+
+
+    # Method for writing the settings straight away on the calling thread, replacing any settings waiting to be written. Errors are raised to the caller.
+    def save_now(self, settings):
+        if self.timer != None:
+            self.cancel(self.timer)
+            self.timer = None
+        self.pending = None
+        if settings == self.saved:
+            return
+        self.write(settings)
+        self.saved = dict(settings)
+
+
+    # Method for forgetting the saved settings (e.g. after a failed write), so that the next request writes the settings even if they haven't changed.
+    def forget(self):
+        self.saved = None
+
+
+    # Method for writing the settings to a temporary file first and then replacing the settings file, so that the settings file is never left half-written.
+    def write(self, settings):
+        temporary_path = self.settings_path + ".tmp"
+        with open(temporary_path, "w") as file:
+            json.dump(settings, file, indent=4)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_path, self.settings_path)
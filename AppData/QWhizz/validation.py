@@ -0,0 +1,66 @@
+# Date Created: 17/10/2026
+# Purpose: Validation of the QWhizz Math scoreboard entries, remembering the digest of the last scoreboard that was valid so that unchanged files aren't checked again.
+
+import json, os, threading
+
+ENTRY_LENGTH = 6  # Number of elements in a valid entry: reference number, username, difficulty, questions, time, and score (the saved questions are stored separately).
+
+
+# Function for checking every entry of the "users" list in a single pass, returning a list of (index, message) tuples describing each invalid entry.
+def find_invalid_entries(users):
+    problems = []
+    for index, details in enumerate(users):
+        if not isinstance(details, list):
+            problems.append((index, f"Entry #{index+1} is invalid (expected a list of {ENTRY_LENGTH} elements, got {type(details).__name__})."))
+        elif len(details) == 7:  # Entries with 7 elements are from an older scoreboard file whose saved questions couldn't be moved to the quiz save store, because their number of saved questions didn't match the number of questions.
+            problems.append((index, f"Entry #{index+1} has an invalid list of saved questions (expected {details[3]} questions, got {len(details[6]) if isinstance(details[6], list) else 0})."))
+        elif len(details) != ENTRY_LENGTH:
+            problems.append((index, f"Entry #{index+1} is invalid (expected {ENTRY_LENGTH} elements, got {len(details)})."))
+    return problems
+
+
+# Function for removing the invalid entries found by "find_invalid_entries" from the "users" list, returning a new list in a single pass.
+def remove_invalid_entries(users, problems):
+    invalid = {index for index, _ in problems}
+    return [details for index, details in enumerate(users) if index not in invalid]
+
+
+class ValidationRecord:
+    # Constructor for the "ValidationRecord" class, which stores the path of the file recording the digest of the last scoreboard found to be valid.
+    def __init__(self, record_path):
+        self.record_path = record_path  # Path of the JSON file storing the digest (e.g. "AppData/validation.json").
+        self.digest = None              # Digest of the scoreboard files the last time every entry was valid, or None if not known.
+        self.skipped = 0                # Number of times validation was skipped because the scoreboard hadn't changed.
+        self.lock = threading.Lock()    # Lock to stop the record being written from two threads at the same time (e.g. after saving and after a background compaction).
+
+
+    # Method for loading the recorded digest, forgetting it if the file is missing or invalid.
+    def load(self):
+        try:
+            with open(self.record_path, "r") as file:
+                self.digest = json.load(file)["digest"]
+        except (OSError, ValueError, KeyError, TypeError):
+            self.digest = None
+
+
+    # Function for checking if the scoreboard files with the given digest have already been validated, counting the skipped validation if they have.
+    def matches(self, digest):
+        if digest != None and digest == self.digest:
+            self.skipped += 1
+            return True
+        return False
+
+
+    # Method for recording the digest of scoreboard files that only hold valid entries. The record is only used to skip work, so it is fine if it can't be written.
+    def record(self, digest):
+        with self.lock:
+            if digest == None or digest == self.digest:
+                return
+            self.digest = digest
+            temporary_path = self.record_path + ".tmp"
+            try:
+                with open(temporary_path, "w") as file:
+                    json.dump({"digest": digest}, file)
+                os.replace(temporary_path, self.record_path)
+            except OSError:
+                pass
@@ -0,0 +1,127 @@
+# Date Created: 17/10/2026
+# Purpose: Virtual list of scoreboard rows for QWhizz Math, which keeps every row in a list but only a window of them (the visible rows plus a buffer on each side) in the Treeview, so that large scoreboards open and scroll as quickly as small ones.
+# The selection is kept by reference number, so that selected rows stay selected after they are scrolled out of the window.
+
+
+class VirtualRows:
+    # Constructor for the "VirtualRows" class, which stores the number of rows the Treeview shows at once and the number of extra rows kept above and below them.
+    def __init__(self, visible, buffer):
+        self.visible = visible  # Number of rows the Treeview shows at once (its height).
+        self.buffer = buffer    # Number of extra rows kept in the Treeview above and below the visible rows, so that scrolling a few rows doesn't refill it.
+        self.clear()
+
+
+    # Method for removing every row and clearing the selection (e.g. when the scoreboard is loaded again).
+    def clear(self):
+        self.rows = []       # Values of every row, in the order they are shown.
+        self.start = 0       # Index of the first row in the Treeview.
+        self.end = 0         # Index after the last row in the Treeview.
+        self.top = 0         # Index of the first visible row.
+        self.selected = {}   # Selected rows, mapping the reference number of each row (as a string) to its index.
+        self.anchor = None   # Index of the last row clicked, which a Shift+click selects from.
+
+
+    def __len__(self):
+        return len(self.rows)
+
+
+    # Function for getting the largest number of rows kept in the Treeview.
+    def window_size(self):
+        return self.visible + 2 * self.buffer
+
+
+    # Function for adding rows to the end of the list, returning the range of indices that should be added to the Treeview (empty if the window is already full or doesn't reach the end of the list).
+    def extend(self, rows):
+        reaches_end = self.end == len(self.rows)
+        self.rows.extend(rows)
+        if reaches_end == False:
+            return range(0)
+        new_end = min(len(self.rows), self.start + self.window_size())
+        added = range(self.end, new_end)
+        self.end = new_end
+        return added
+
+
+    # Function for limiting the index of the first visible row to the rows that exist, so that the last rows are shown at the bottom of the Treeview rather than above empty space.
+    def clamp_top(self, top):
+        return max(0, min(top, len(self.rows) - self.visible))
+
+
+    # Function for getting the index of the first visible row from the position of the scrollbar (0 at the top and 1 at the bottom).
+    def top_from_fraction(self, fraction):
+        return self.clamp_top(round(fraction * len(self.rows)))
+
+
+    # Function for getting the index of the first visible row from the scroll position of the Treeview, which only holds the rows in the window.
+    def top_from_view(self, first):
+        return self.start + round(first * (self.end - self.start))
+
+
+    # Function for getting the position of the scrollbar (first and last visible fraction of every row) when the given row is the first visible row.
+    def fractions(self, top):
+        if self.rows == []:
+            return (0.0, 1.0)
+        return (top / len(self.rows), min(len(self.rows), top + self.visible) / len(self.rows))
+
+
+    # Function for getting the scroll position of the Treeview that shows the given row as the first visible row.
+    def view_fraction(self, top):
+        if self.end == self.start:
+            return 0.0
+        return (top - self.start) / (self.end - self.start)
+
+
+    # Function for checking whether the window needs to be refilled to show the given first visible row, which is when the visible rows are within half a buffer of an edge of the window that isn't an end of the list.
+    def needs_refill(self, top):
+        margin = self.buffer // 2
+        if top < self.start or top + self.visible > self.end:
+            return True
+        return (top - self.start < margin and self.start > 0) or (self.end - (top + self.visible) < margin and self.end < len(self.rows))
+
+
+    # Function for moving the window so that the given first visible row has a buffer of rows on each side, returning the range of indices that should be shown in the Treeview.
+    def move_window(self, top):
+        top = self.clamp_top(top)
+        self.start = max(0, top - self.buffer)
+        self.end = min(len(self.rows), self.start + self.window_size())
+        self.start = max(0, self.end - self.window_size())  # Keep the window full at the end of the list.
+        self.top = top
+        return range(self.start, self.end)
+
+
+    # Function for getting the indices of the selected rows that are in the window, so that they can be selected in the Treeview.
+    def selected_in_window(self):
+        return [index for index in self.selected.values() if self.start <= index < self.end]
+
+
+    # Method for updating the selection from the rows selected in the Treeview (e.g. after selecting rows with the keyboard). Rows outside the window keep their selection.
+    def sync_window(self, indices):
+        indices = set(indices)
+        for index in range(self.start, self.end):
+            ref = str(self.rows[index][0])
+            if index in indices:
+                self.selected[ref] = index
+            else:
+                self.selected.pop(ref, None)
+
+
+    # Method for updating the selection when a row is clicked, like the "extended" selection mode of the Treeview. A click selects only the clicked row, Ctrl+click adds or removes the row, and Shift+click selects every row from the last row clicked.
+    def click(self, index, toggle=False, extend=False):
+        if extend == True and self.anchor != None:
+            first, last = sorted((self.anchor, index))
+            self.selected = {str(self.rows[row][0]): row for row in range(first, last + 1)}
+            return
+        ref = str(self.rows[index][0])
+        if toggle == True:
+            if ref in self.selected:
+                del self.selected[ref]
+            else:
+                self.selected[ref] = index
+        else:
+            self.selected = {ref: index}
+        self.anchor = index
+
+
+    # Function for getting the reference numbers of the selected rows, in the order they are shown.
+    def selected_refs(self):
+        return [ref for ref, index in sorted(self.selected.items(), key=lambda item: item[1])]
@@ -18,12 +18,17 @@ from tkinter import *
 from tkinter import ttk, messagebox, filedialog, font
 import customtkinter as CTk
 from AppData.CTkScrollableDropdown import *
-from PIL import Image, ImageTk, ImageDraw
+from PIL import ImageTk
 from AppData.fpdf import FPDF
 from AppData.fpdf.enums import TableCellFillMode
 from AppData.fpdf.fonts import FontFace
+from AppData.QWhizz import ScoreboardJournal, ScoreboardDatabase, ScoreboardCache, RefAllocator, WriteBehindWorker, SettingsManager, ValidationRecord, find_invalid_entries, remove_invalid_entries, QuestionEngine, make_recipe, SeededQuizSave, QuizPrefetcher, Question, AnsweredQuestion, TOPIC_REGISTRY, AccuracyStats, ADAPTIVE, NavigationProfiler, format_measurement, VirtualRows
+from AppData.QWhizz.assets import ImageAssets      # Imported separately, since they need Pillow (the rest of the package doesn't).
+from AppData.QWhizz.diagrams import DiagramCache
 from datetime import datetime
-import json, time, random, os, platform, subprocess, math
+import json, time, random, os, platform, subprocess
+
+SCOREBOARD_BACKEND = "Journal"  # Set the storage used for the scoreboard. "Journal" uses the JSON file with a journal of changes, and "SQLite" uses an indexed SQLite database (which imports the JSON scoreboard the first time it is used).
 
 class PDF(FPDF):
     def __init__(self):
@@ -103,15 +108,17 @@ class Tools:
         self.quiz = quiz_instance               # Store a reference to the "Quiz" class instance.
         self.home = homepage_instance           # Store a reference to the "Home" class instance.
         self.button_pressed = False             # Flag variable to store whether a button is currently being pressed.
+        self.stream = None                      # State of the scoreboard load in progress (if any), holding the generator of chunks, the entries loaded so far, and the functions to call with them.
+        self.stream_after = None                # ID of the "after" call that loads the next chunk of the scoreboard.
+        self.pages = {}                         # Frame of each page that has been built, mapping the name of each page to its frame (see "show_page").
+        self.current_page = None                # Name of the page currently shown.
 
 
     # Method for clearing all widgets or clearing specified widgets (column, row).
     def clear_widget(self, procedure, all_widgets, element, column, row, command):
         if command != None: command()  # Go to the specified procedure from passed command if it is specified.
         if all_widgets == True and element == None:
-            # Clear all page content.
-            for widget in main_window.winfo_children():
-                widget.destroy()
+            # Pages are kept once they have been built (see "show_page"), so going to the specified procedure hides the current page rather than destroying all page content.
             if procedure != None: procedure()  # Go to the specified procedure from button command if it is specified.
         
         elif all_widgets == True and element != None:
@@ -127,6 +134,58 @@ class Tools:
             if procedure != None: procedure()  # Go to the specified procedure from button command if it is specified.
 
 
+    # Method for showing a page, building it inside its own frame the first time it is shown and only refreshing its details after that.
+    # The frame of the previous page is hidden with "grid_remove" rather than destroyed, so its widgets, menu bar, and images are kept for the next time it is shown.
+    def show_page(self, name, build, refresh):
+        if navigation_profiler != None:
+            navigation_profiler.measure(name, lambda: self.change_page(name, build, refresh))  # Measure how long the page takes to show and how many widgets it creates.
+        else:
+            self.change_page(name, build, refresh)
+
+
+    # Method for hiding the current page and showing the specified page (see "show_page").
+    def change_page(self, name, build, refresh):
+        if self.current_page != None and self.current_page != name:
+            self.pages[self.current_page].grid_remove()  # Hide the previous page, remembering its grid options so that it can be shown again.
+        page_frame = self.pages.get(name)
+        if page_frame == None:
+            page_frame = self.pages[name] = Frame(main_window, bg=MAIN_WINDOW_BG)
+            page_frame.grid(column=0, row=0, sticky=NSEW)
+            build(page_frame)
+        elif self.current_page != name:
+            page_frame.grid()
+        self.current_page = name
+        refresh()
+
+
+    # Function for getting the names of every widget inside the specified widget (or the main window), used to count the widgets created by each navigation.
+    def widget_names(self, widget=None):
+        names = []
+        for child in (main_window if widget == None else widget).winfo_children():
+            names.append(str(child))
+            names.extend(self.widget_names(child))
+        return names
+
+
+    # Procedure for creating the banner images on the left and right of a page (columns 0 and 2 of the page frame).
+    def create_banners(self, page_frame):
+        # Banner creation (left side).
+        lbanner_canvas = Canvas(page_frame, bg=MAIN_WINDOW_BG, bd=0, highlightthickness=0)  # Create a canvas for the banner image.
+        lbanner_canvas.grid(column=0, row=0, sticky=EW, padx=(20, 0), pady=27)
+        lbanner = image_assets.photo("lbanner.png")
+        lbanner_canvas.configure(width=lbanner.width()+2, height=lbanner.height())  # Add 2 pixels to width to prevent image clipping on the right of image.
+        lbanner_canvas.create_image(lbanner.width() / 2, lbanner.height() / 2, anchor=CENTER, image=lbanner)  # Add the image to the canvas by calculating the x and y coordinates for centre position.
+        lbanner_canvas.image = lbanner
+
+        # Banner creation (right side).
+        rbanner_canvas = Canvas(page_frame, bg=MAIN_WINDOW_BG, bd=0, highlightthickness=0)  # Create a canvas for the banner image.
+        rbanner_canvas.grid(column=2, row=0, sticky=EW, padx=(0, 20), pady=27)
+        rbanner = image_assets.photo("rbanner.png")
+        rbanner_canvas.configure(width=rbanner.width()+2, height=rbanner.height())  # Add 2 pixels to width to prevent image clipping on the left of image.
+        rbanner_canvas.create_image(rbanner.width() / 2, rbanner.height() / 2, anchor=CENTER, image=rbanner)  # Add the image to the canvas by calculating the x and y coordinates for centre position.
+        rbanner_canvas.image = rbanner
+
+
     # Method for handling mouse button 1 release events.
     def on_mbtn1_release(self, origin, element):
         if origin == "Scoreboard":
@@ -170,7 +229,10 @@ class Tools:
             button.configure(fg_color=BUTTON_FG, width=sizes[0], height=sizes[1], font=(DEFAULT_FONT, sizes[2], "bold")) if sizes != None else button.configure(fg_color=BUTTON_FG)
         
         button.unbind("<ButtonRelease-1>")
+        page = self.current_page
         if command != None: command()
+        if self.current_page != page and button.winfo_exists():
+            button.configure(fg_color=BUTTON_FG)  # Change the button colour back to its original colour if the command changed the page, since the button is kept (hidden) and the cursor won't be over it when the page is next shown.
         return
 
 
@@ -189,7 +251,7 @@ class Tools:
 
     # Method for handling errors and preventing repeated code.
     def error_control(self, file_name, file_dir, file_data, control):
-        global users, settings, timer, enable_trigonometry, enable_algebra, deletion_history_states
+        global users, settings, timer, deletion_history_states
         
         # Temporary storage mode.
         if control == "Temporary":
@@ -197,8 +259,8 @@ class Tools:
             elif file_data == "settings":
                 settings = default_settings  # If the "file_data" variable is set to "settings", make "settings" store the default settings.
                 timer.set(settings.get("enable_timer"))                               # Set the timer to the value stored in the "default_settings" dictionary.
-                enable_trigonometry.set(settings.get("enable_trigonometry"))          # Set "enable_trigonometry" to the value stored in the "default_settings" dictionary.
-                enable_algebra.set(settings.get("enable_algebra"))                    # Set "enable_algebra" to the value stored in the "default_settings" dictionary.
+                for topic, enabled in enabled_topics.items():
+                    enabled.set(settings.get(TOPIC_REGISTRY[topic].settings_key))     # Enable or disable each question topic with the value stored in the "default_settings" dictionary.
                 deletion_history_states.set(settings.get("deletion_history_states"))  # Set the deletion history states to the value stored in the "default_settings" dictionary.
         return  # Exit the function after handling the error control for temporary storage mode.
 
@@ -228,19 +290,28 @@ class Tools:
     
     # Procedure for loading the "users" and "settings" lists from the JSON files.
     def load_details(self, file_name, file_dir, file_data):
-            global data_loaded, users, settings, timer, enable_trigonometry, enable_algebra, deletion_history_states
+            global data_loaded, users, settings, timer, deletion_history_states
             self.loading_status = [None, None]  # Variable list to indicate if the file needs to be replaced, so that repeated file replacement code isn't used.
+            settings_manager.flush()            # Write any settings waiting for the settings menu changes to stop.
+            persistence_worker.flush()          # Wait for any queued writes to finish, so that the files are complete before they are checked or read.
 
-            # Check if the JSON file exists. If not, create it.
-            if not os.path.exists(file_dir):   
+            # Skip reloading the scoreboard if its files haven't changed since the "users" list was last loaded from or saved to them.
+            if file_data == "users" and scoreboard_cache.is_current() == True:
+                data_loaded = True
+                return
+
+            # Check if the JSON file exists (or for the scoreboard, if the scoreboard store's file exists). If not, create it.
+            if not (scoreboard_store.exists() if file_data == "users" else os.path.exists(file_dir)):   
                 response1 = messagebox.askyesno("File Not Found", f"The {file_name} file cannot be found. Do you want to create a new one?")
                 if response1 == True:  # If the user chooses to create a new file, proceed.
                     try:
                         # Create a new JSON file with an empty list.
-                        with open(file_dir, "w") as file:   # Create a new JSON file with an empty list if the file doesn't already exist.
-                            if file_data == "users": json.dump([], file)                               # Write an empty list to the new JSON file.
-                            elif file_data == "settings": json.dump(default_settings, file, indent=4)  # Write an empty list to the new JSON file.
-                            file.close()    # Close the file after writing to it.
+                        if file_data == "users":
+                            scoreboard_store.reset([])  # Write an empty list to the new JSON file and clear any journal left behind by the old file.
+                        elif file_data == "settings":
+                            with open(file_dir, "w") as file:   # Create a new JSON file with the default settings if the file doesn't already exist.
+                                json.dump(default_settings, file, indent=4)  # Write the default settings to the new JSON file.
+                                file.close()    # Close the file after writing to it.
                         self.error_control(file_name, file_dir, file_data, "Temporary")  # Call the error control function to handle temporary storage mode, which will clear the "users" list and add the default values to the "settings" dictionary.
                         data_loaded = True  # Set the "data_loaded" variable to True, so that the program doesn't reload data again from the JSON file before it is accessed.
 
@@ -266,8 +337,11 @@ class Tools:
 
             # If the JSON file exists, try to load the data from it, and if the file isn't in JSON format, it will raise a JSONDecodeError. If there are any other errors, such as the file being inaccessible, it will raise an IOError.
             try:
-                with open(file_dir, "r") as file:  # Open the JSON file in read mode ("r").
-                    data = json.load(file)         # Load the details from the JSON file into the "users" list.
+                if file_data == "users":
+                    data = scoreboard_store.load()  # Load the last scoreboard snapshot and replay the journal of changes saved since it was written.
+                else:
+                    with open(file_dir, "r") as file:  # Open the JSON file in read mode ("r").
+                        data = json.load(file)         # Load the details from the JSON file into the "settings" dictionary.
 
                 if file_data == "users":
                     if not isinstance(data, list):  # Check if the loaded data is a list.
@@ -275,27 +349,7 @@ class Tools:
                     users.clear()  # Clear the list to prevent duplicate entries.
                     users = data   # Assign the loaded data to the "users" list.
                     
-                    error_type = None
-                    for index, details in enumerate(users):
-                        if len(details) != 7:  # Check if the number of elements for each entry is not 7.
-                            error_type = 1
-                            response2 = messagebox.askyesno("Invalid Data", f"The {file_name} file contains invalid data:\nEntry #{index+1} is invalid (expected 7 elements, got {len(details)}).\n\nWould you like to remove this entry?")                 
-                        elif len(details[6]) != int(details[3]):  # Check if the number of saved questions is less than the recommended number of questions in any user's saved quiz.
-                            error_type = 2
-                            response2 = messagebox.askyesno("Invalid Data", f"The {file_name} file contains invalid data:\nEntry #{index+1} has an invalid list of saved questions (expected {details[3]} questions, got {len(details[6])}).\n\nWould you like to remove this entry?")
-                        
-                        if error_type != None:
-                            if response2 == True:
-                                # Remove invalid entries and update the scoreboard file.
-                                users = [details for details in users if len(details) == 7] if error_type == 1 else [details for details in users if len(details[6]) == details[3]]
-                                with open(file_dir, "w") as file:           # Open the JSON file in write mode ("w").
-                                    json.dump(users, file, indent=4)        # Write the valid users to the JSON file.
-                                    file.close()                            # Close the file after writing to it.
-                                break
-                            else:
-                                messagebox.showwarning("Invalid Data", f"The program will run in temporary storage mode until the {file_name} file is fixed.\n\n{full_directory}")
-                                users = [details for details in users if len(details) == 7] if error_type == 1 else [details for details in users if len(details[6]) == details[3]]  # Keep only the valid entries in memory.
-                                break
+                    self.validate_entries(file_name)  # Check the entries, asking whether to remove any invalid ones.
 
                 elif file_data == "settings":
                     if not isinstance(data, dict): # Check if the loaded data is a dictionary.
@@ -307,9 +361,11 @@ class Tools:
                     settings.clear()    # Clear the list to prevent duplicate entries.
                     settings = data     # Modify the "settings" dictionary in place.
                     timer.set(settings.get("enable_timer", default_settings["enable_timer"]))                                          # Set the timer to the value stored in the "settings" dictionary, or the default value if not found.
-                    enable_trigonometry.set(settings.get("enable_trigonometry", default_settings["enable_trigonometry"]))              # Set "enable_trigonometry" to the value stored in the "settings" dictionary, or the default value if not found.
-                    enable_algebra.set(settings.get("enable_algebra", default_settings["enable_algebra"]))                             # Set "enable_algebra" to the value stored in the "settings" dictionary, or the default value if not found.
+                    for topic, enabled in enabled_topics.items():
+                        settings_key = TOPIC_REGISTRY[topic].settings_key
+                        enabled.set(settings.get(settings_key, default_settings[settings_key]))                                        # Enable or disable each question topic with the value stored in the "settings" dictionary, or the default value if not found (e.g. for topics added after the file was written).
                     deletion_history_states.set(settings.get("deletion_history_states", default_settings["deletion_history_states"]))  # Set the deletion history states to the value stored in the "settings" dictionary, or the default value if not found.
+                    settings_manager.loaded(self.current_settings())  # Record the loaded settings, so that they aren't written again unless they change.
                 
                 data_loaded = True      # Set the "data_loaded" variable to True, so that the program doesn't reload data again from the JSON file before it is accessed.
             
@@ -331,10 +387,12 @@ class Tools:
             
             if self.loading_status[0] == "Error" and self.loading_status[1] == "Replace":  # Check if there is a loading error and that the user chose to replace the file.
                 try:
-                    with open(file_dir, "w") as file:  # Open the shortened_directory file in write mode ("w").
-                        if file_data == "users": json.dump([], file)                                # Write an empty list to the new JSON file.
-                        elif file_data == "settings": json.dump(default_settings, file, indent=4)   # Write an empty list to the new JSON file.
-                        file.close()    # Close the file after writing to it.
+                    if file_data == "users":
+                        scoreboard_store.reset([])  # Write an empty list to the replaced JSON file and clear the journal.
+                    elif file_data == "settings":
+                        with open(file_dir, "w") as file:  # Open the shortened_directory file in write mode ("w").
+                            json.dump(default_settings, file, indent=4)   # Write the default settings to the new JSON file.
+                            file.close()    # Close the file after writing to it.
                     self.error_control(file_name, file_dir, file_data, "Temporary")  # Call the error control function to handle temporary storage mode, which will clear the "users" list and add the default values to the "settings" dictionary.
                     data_loaded = True  # Set the "data_loaded" variable to True, so that the program doesn't reload data again from the JSON file before it is accessed.
                     messagebox.showinfo("File Replaced", f"The JSON {file_name} file has been successfully replaced and restored to defaults.\n\n{full_directory}")
@@ -361,6 +419,108 @@ class Tools:
                 return
 
 
+    # Function for checking the entries of the "users" list in a single pass, asking once whether to remove every invalid entry found. Returns None if every entry is valid, otherwise the list of problems found.
+    # The digest of the scoreboard files is recorded once they are found to be valid, so that files which haven't changed since are not checked again.
+    def validate_entries(self, file_name):
+        global users, scoreboard_reset_required
+        scoreboard_cache.update(scoreboard_store.file_signatures())  # Record the signature of the loaded files from the bytes the store read, so that the scoreboard isn't reloaded until they change.
+        if validation_record.matches(scoreboard_cache.digest) == True:
+            return None  # The files haven't changed since they were last found to be valid.
+
+        problems = find_invalid_entries(users)
+        if not problems:
+            validation_record.record(scoreboard_cache.digest)
+            return None
+
+        listed_problems = "\n".join(message for _, message in problems[:10]) + (f"\n...and {len(problems) - 10} more." if len(problems) > 10 else "")  # List the first 10 problems, so that the message box fits on the screen.
+        response2 = messagebox.askyesno("Invalid Data", f"The {file_name} file contains invalid data:\n{listed_problems}\n\nWould you like to remove {'this entry' if len(problems) == 1 else f'these {len(problems)} entries'}?")
+        users = remove_invalid_entries(users, problems)  # Keep only the valid entries.
+        if response2 == True:
+            # Update the scoreboard file with every invalid entry removed in a single rewrite.
+            scoreboard_store.reset(users)                        # Write the valid users to a new snapshot of the JSON file and clear the journal.
+            scoreboard_cache.update(scoreboard_store.file_signatures())  # Record the signature of the repaired file, so that it isn't reloaded until it changes.
+            validation_record.record(scoreboard_cache.digest)    # Record that the repaired file is valid.
+            scoreboard_reset_required = False
+        else:
+            messagebox.showwarning("Invalid Data", f"The program will run in temporary storage mode until the {file_name} file is fixed.\n\n{full_directory}")
+            scoreboard_cache.clear()                             # Forget the signature, so that the file is checked again when it is next loaded.
+            scoreboard_reset_required = True                     # The changes saved next refer to the positions of the valid entries, which don't match the file that still holds the invalid ones, so the next save writes the whole "users" list instead.
+        return problems
+
+
+    # Procedure for loading the "users" list from the scoreboard store in chunks, so that the scoreboard page can show the first scores straight away while the rest are loaded between window events.
+    # "on_rows" is called with each chunk of valid entries and the fraction of the scoreboard loaded so far. "on_done" is called once loading has finished, with True if the shown entries need to be replaced by the "users" list (e.g. if invalid entries were removed or an error was handled).
+    def stream_details(self, on_rows, on_done):
+        global data_loaded
+        self.cancel_stream_details()
+        settings_manager.flush()    # Write any settings waiting for the settings menu changes to stop.
+        persistence_worker.flush()  # Wait for any queued writes to finish, so that the files are complete before they are read.
+        if scoreboard_cache.is_current() == True:  # Skip reloading the scoreboard if its files haven't changed since the "users" list was last loaded from or saved to them.
+            data_loaded = True
+            on_done(True)
+            return
+        if not scoreboard_store.exists():
+            self.load_details("scoreboard", SCOREBOARD_FILE_PATH, "users")  # Load the scoreboard the usual way, which asks whether to create a new file.
+            on_done(True)
+            return
+        self.stream = {"generator": scoreboard_store.iter_load(), "users": [], "on_rows": on_rows, "on_done": on_done}
+        self.load_next_chunk()
+
+
+    # Procedure for loading the next chunk of the scoreboard, repeated with "after" until the whole scoreboard has been loaded.
+    def load_next_chunk(self):
+        global users, data_loaded
+        stream = self.stream
+        if stream == None:
+            return
+        if self.current_page != "Scoreboard" or not self.scoreboard.tree.winfo_exists():  # Stop loading if the scoreboard page has been closed.
+            self.cancel_stream_details()
+            return
+        try:
+            rows, progress = next(stream["generator"])
+        except StopIteration:
+            self.stream = None
+            users = stream["users"]
+            try:
+                error_type = self.validate_entries("scoreboard")  # Report any invalid entries now that the whole scoreboard has been loaded.
+            except Exception:
+                self.load_details("scoreboard", SCOREBOARD_FILE_PATH, "users")  # Load the scoreboard again the usual way, so that the existing error control reports the error.
+                stream["on_done"](True)
+                return
+            data_loaded = True
+            stream["on_done"](error_type != None)
+            return
+        except Exception:  # Error control for JSON, IO, and any other errors, which are reported by loading the scoreboard again the usual way.
+            self.stream = None
+            self.load_details("scoreboard", SCOREBOARD_FILE_PATH, "users")  # Load the scoreboard again the usual way, so that the existing error control reports the error and offers to replace the file.
+            stream["on_done"](True)
+            return
+        stream["users"].extend(rows)
+        stream["on_rows"]([details for details in rows if isinstance(details, list) and len(details) == 6], progress)  # Only show valid entries, since invalid entries are reported once the whole scoreboard has been loaded.
+        self.stream_after = main_window.after(1, self.load_next_chunk)  # Load the next chunk once the window has handled any waiting events, so that it stays responsive.
+
+
+    # Procedure for stopping a scoreboard load that is in progress (e.g. when the scoreboard page is closed), so that the scoreboard is reloaded when it is next needed.
+    def cancel_stream_details(self):
+        global data_loaded
+        if self.stream == None:
+            return
+        if self.stream_after != None:
+            main_window.after_cancel(self.stream_after)
+            self.stream_after = None
+        self.stream["generator"].close()  # Close the generator so that it closes the scoreboard file.
+        self.stream = None
+        data_loaded = False
+
+
+    # Function for checking if the scoreboard is still being loaded, showing a message if it is, so that scores can't be changed, printed, or reviewed until they have all been loaded.
+    def scores_loading(self):
+        if self.stream == None:
+            return False
+        messagebox.showinfo("Loading Scores", "Please wait until all of the scores have been loaded.")
+        return True
+
+
     # Function for validating user details and making sure there are no invalid entries inside any entry boxes.
     def validate_user_details(self):
         global overwrite_score, username
@@ -428,21 +588,20 @@ class Tools:
                     self.home.username_entry.insert(0, adjust_entry)  # Insert the adjusted username into the username entry box.
                 elif self.home.entry_type == "CTkComboBox":
                     self.home.username_entry.set(adjust_entry)
-            # Check if a user already exists with the same username and difficulty in the "users" list.
-            for user in users:
-                if user[1].lower() == username.lower() and user[2] == difficulty:  # Use ".lower()" to ignore case sensitivity when comparing the existing usernames with the entered username by making them both lowercase.
-                    response2 = messagebox.askyesno("Overwrite Score", "A score already exists for this username (case insensitive) and difficulty level. Continuing will replace this score with your final score after completion of the quiz. Are you sure you want to continue?", icon="warning")
-                    if response2 == True:
-                        overwrite_score = True
-                        return "Valid Entry"
-                    else:
-                        return "Invalid Entry"
+            # Check if a user already exists with the same username (case insensitive) and difficulty in the "users" list, using the scoreboard store's lookup (which is indexed for the SQLite store).
+            if scoreboard_store.find_user(users, username, difficulty) != None:
+                response2 = messagebox.askyesno("Overwrite Score", "A score already exists for this username (case insensitive) and difficulty level. Continuing will replace this score with your final score after completion of the quiz. Are you sure you want to continue?", icon="warning")
+                if response2 == True:
+                    overwrite_score = True
+                    return "Valid Entry"
+                else:
+                    return "Invalid Entry"
             return "Valid Entry"
             
 
     # Method for saving details specific to the specified window.
     def save_details(self, procedure, origin, scenario, file_dir):
-        global ref_number, username, difficulty_num, question_amount, settings, data_loaded, enable_trigonometry, enable_algebra, use_trigonometry_questions, use_algebra_questions
+        global ref_number, username, difficulty_num, question_amount, settings, data_loaded, quiz_topics, scoreboard_reset_required
         
         if origin == "Home":
             if scenario == "Temporary" or scenario == "Permanent":
@@ -451,36 +610,21 @@ class Tools:
                 question_amount = int(self.home.questions_slider.get())  # Get the questions slider value.
             
             if scenario == "Permanent":
-                if users != []:  # Check if the "users" list is not empty.
-                    existing_ref_numbers = [user[0] for user in users]  # Create a list of existing reference numbers from the "users" list.
-                else:
-                    existing_ref_numbers = []
-                
-                # Check if the maximum number of unique reference numbers has been reached, otherwise choose a random available reference number.
-                available_ref_numbers = list(set(range(1000, 1100)) - set(existing_ref_numbers)) if existing_ref_numbers else list(range(1000, 1100))  # Create a list of available reference numbers by subtracting the existing reference numbers from the list of all possible reference numbers.
-                if not available_ref_numbers:  # Check if all 100 possible unique 4-digit ref numbers from 1000 to 1099 have been chosen - i.e. if the "available_ref_numbers" list is empty (due to all possible existing ref numbers being removed from the list), meaning it's False.
-                    messagebox.showwarning("Maximum Scores Reached", "No more unique reference numbers can be generated.\nPlease delete old user scores to add new ones.")
-                    self.clear_widget(self.scoreboard.setup_scoreboard, True, None, None, None, None)  # Clear all current widgets (passing "True" clears all widgets), then go back to the home page.
-                    return
-                else:
-                    ref_number = random.choice(available_ref_numbers)
+                ref_number = None  # Clear the reference number, so that a new one is allocated by the "ref_allocator" when the score is submitted (quizzes that aren't finished don't use up a reference number).
             
             if procedure == "Quiz":
                 if self.validate_user_details()  == "Invalid Entry": return  # Run the "validate_user_details" function to ensure that the user details are valid before starting the quiz, otherwise return to home method.
 
-                use_trigonometry_questions = enable_trigonometry.get()
-                use_algebra_questions = enable_algebra.get()
-                if use_trigonometry_questions == False and use_algebra_questions == False:
+                quiz_topics = self.enabled_topic_names()
+                if quiz_topics == []:
                     response1 = messagebox.askyesno("No Question Topics Selected", "The quiz cannot be started until a question topic is selected from the settings menu. Do you want to enable all question topics?", icon="warning")
                     if response1 == False: return
                     else:
-                        enable_algebra.set(True)
-                        enable_trigonometry.set(True)
+                        quiz_topics = self.enable_all_topics()
+                        persistence_worker.flush()  # Wait for any settings queued by the settings menu to be written first, so that they don't replace these settings.
                         try:
-                            settings = {"enable_timer": timer.get(), "enable_trigonometry": enable_trigonometry.get(),"enable_algebra": enable_algebra.get(), "deletion_history_states": deletion_history_states.get()}
-                            with open(file_dir, "w") as file:        # Open the file in write mode ("w"). If it doesn't exist, a new file will be created.
-                                json.dump(settings, file, indent=4)  # Dump the entries from the "settings" list into the JSON file.
-                                file.close()                         # Close the file after writing to it.
+                            settings = self.current_settings()
+                            settings_manager.save_now(settings)      # Write the settings straight away (replacing any settings waiting to be written), since the quiz depends on them.
                             data_loaded = False                      # Set the "data_loaded" variable to false, so that the program will reload data from the JSON file when it next needs to be accessed.
                         except IOError as io_error:                  # Error control for instances such as the file being inaccessible or lacking the permission to write to it.
                             messagebox.showerror("File Error", f"Failed to write to 'settings.json'. Check file permissions, disk space, and ensure the file is not in use.\n\n{io_error}\n\n{full_directory}")  # Show an error message if the file cannot be written to.
@@ -494,38 +638,29 @@ class Tools:
             else:
                 return  # If the procedure is not "Quiz" or "Scoreboard", do nothing and return.
 
+        # The "scenario" parameter holds the list of changes made to the "users" list, where each change is a tuple of (operation, index, user).
         elif origin == "Completion" or origin == "Scoreboard":
-                try:
-                    with open(file_dir, "w") as file:        # Open the file in write mode ("w"). If it doesn't exist, a new file will be created.
-                        json.dump(users, file, indent=4)     # Dump the entries from the "users" list into the JSON file.
-                        file.close()                         # Close the file after writing to it.
-                    data_loaded = False                      # Set the "data_loaded" variable to false, so that the program will reload data from the JSON file when it next needs to be accessed.
-                except IOError as io_error:                  # Error control for instances such as the file being inaccessible or lacking the permission to write to it.
-                    messagebox.showerror("File Error", f"Failed to write to 'scoreboard.json'. Check file permissions, disk space, and ensure the file is not in use.\n\n{io_error}\n\n{full_directory}")  # Show an error message if the file cannot be written to.
-                except Exception as e:                       # Error control for any other exceptions that may occur.
-                    messagebox.showerror("Unexpected Error", f"An unexpected error occurred while writing to 'scoreboard.json'.\n\n{e}\n\n{full_directory}")  # Show an error message if there is an unexpected error.
+                # Queue the changes to be written on the background thread, so that the window doesn't freeze while the files are written. Copies are queued, since the "users" list may change again before the write runs.
+                quiz_saves = {ref_number: SeededQuizSave(self.quiz.quiz_save, self.quiz.quiz_recipe)} if origin == "Completion" else {}  # Save the questions of the completed quiz separately from the scoreboard, so that they are only loaded if the quiz is reviewed. Generated quizzes are saved as their recipe rather than their questions.
+                persistence_worker.submit("scoreboard", self.write_scoreboard, {"changes": list(scenario), "users": list(users), "reset": scoreboard_reset_required, "quiz_saves": quiz_saves, "ref_numbers": ref_allocator.snapshot(), "accuracy": accuracy_stats.snapshot()}, self.combine_scoreboard_writes, self.scoreboard_write_error)
+                scoreboard_reset_required = False            # Only the first save after the "users" list stopped matching the scoreboard file needs to write the whole list.
+                data_loaded = False                          # Set the "data_loaded" variable to false, so that the program will reload data from the JSON file when it next needs to be accessed.
         
         elif origin == "Menubar":
-                try:
-                    settings = {"enable_timer": timer.get(), "enable_trigonometry": enable_trigonometry.get(),"enable_algebra": enable_algebra.get(), "deletion_history_states": deletion_history_states.get()}
-                    with open(file_dir, "w") as file:        # Open the file in write mode ("w"). If it doesn't exist, a new file will be created.
-                        json.dump(settings, file, indent=4)  # Dump the entries from the "settings" list into the JSON file.
-                        file.close()                         # Close the file after writing to it.
-                    data_loaded = False                      # Set the "data_loaded" variable to false, so that the program will reload data from the JSON file when it next needs to be accessed.
-                except IOError as io_error:                  # Error control for instances such as the file being inaccessible or lacking the permission to write to it.
-                    messagebox.showerror("File Error", f"Failed to write to 'settings.json'. Check file permissions, disk space, and ensure the file is not in use.\n\n{io_error}\n\n{full_directory}")  # Show an error message if the file cannot be written to.
-                except Exception as e:                       # Error control for any other exceptions that may occur.
-                    messagebox.showerror("Unexpected Error", f"An unexpected error occurred while writing to 'settings.json'.\n\n{e}\n\n{full_directory}")  # Show an error message if there is an unexpected error.
+                settings = self.current_settings()
+                settings_manager.request(settings)           # Write the settings once the settings menu hasn't been changed for a moment, so that several quick changes are written once (and not at all if they are changed back).
+                data_loaded = False                          # Set the "data_loaded" variable to false, so that the program will reload data from the JSON file when it next needs to be accessed.
+                if self.current_page == "Home":
+                    self.home.limit_questions_slider()       # Limit the questions slider to the questions available for the enabled question topics.
+                self.prefetch_quiz()                         # Generate the next quiz again in case the question topics have changed.
 
         elif origin == "Quiz":
             if procedure == "New Quiz":
-                enable_algebra.set(True)
-                enable_trigonometry.set(True)
+                quiz_topics = self.enable_all_topics()
+                persistence_worker.flush()  # Wait for any settings queued by the settings menu to be written first, so that they don't replace these settings.
                 try:
-                    settings = {"enable_timer": timer.get(), "enable_trigonometry": enable_trigonometry.get(),"enable_algebra": enable_algebra.get(), "deletion_history_states": deletion_history_states.get()}
-                    with open(file_dir, "w") as file:        # Open the file in write mode ("w"). If it doesn't exist, a new file will be created.
-                        json.dump(settings, file, indent=4)  # Dump the entries from the "settings" list into the JSON file.
-                        file.close()                         # Close the file after writing to it.
+                    settings = self.current_settings()
+                    settings_manager.save_now(settings)      # Write the settings straight away (replacing any settings waiting to be written), since the quiz depends on them.
                     data_loaded = False                      # Set the "data_loaded" variable to false, so that the program will reload data from the JSON file when it next needs to be accessed.
                 except IOError as io_error:                  # Error control for instances such as the file being inaccessible or lacking the permission to write to it.
                     messagebox.showerror("File Error", f"Failed to write to 'settings.json'. Check file permissions, disk space, and ensure the file is not in use.\n\n{io_error}\n\n{full_directory}")  # Show an error message if the file cannot be written to.
@@ -535,9 +670,141 @@ class Tools:
                     return
 
 
+    # Procedure for writing queued scoreboard changes, run on the background thread by the "persistence_worker".
+    # Nothing here may show a message box or change a widget, since Tkinter can only be used from the thread running the window. Errors are reported by "scoreboard_write_error" instead.
+    def write_scoreboard(self, data):
+        for quiz_ref_number, quiz_save in data["quiz_saves"].items():
+            scoreboard_store.save_quiz_save(quiz_ref_number, quiz_save)  # Save the questions of each completed quiz separately from the scoreboard.
+        if data["reset"] == True:
+            scoreboard_store.reset(data["users"])                        # Write the whole "users" list, since the changes don't match the positions of the entries in the file (see "scoreboard_reset_required").
+        else:
+            scoreboard_store.record_changes(data["changes"], data["users"])  # Append the changes to the scoreboard journal rather than rewriting every user in the JSON file.
+        ref_allocator.write(data["ref_numbers"])                         # Save the allocated and released reference numbers (only written if they have changed).
+        accuracy_stats.write(data["accuracy"])                           # Save the accuracy statistics used by adaptive quizzes (only written if they have changed).
+        self.scoreboard_files_changed()
+
+
+    # Procedure for recording the signature of the scoreboard files after the program has changed them (e.g. after saving or compacting), since the "users" list already holds the changes and doesn't need to be reloaded.
+    # The "users" list only holds valid entries, so the new files are also recorded as valid as long as they matched the "users" list beforehand.
+    def scoreboard_files_changed(self):
+        scoreboard_cache.refresh(scoreboard_store.file_signatures())  # Use the signatures the store recorded while writing, so that the files aren't read again.
+        if scoreboard_cache.digest != None:
+            validation_record.record(scoreboard_cache.digest)
+
+
+    # Function for combining queued scoreboard changes that haven't been written yet with newer changes, so that they are written together.
+    def combine_scoreboard_writes(self, waiting, new):
+        return {"changes": waiting["changes"] + new["changes"], "users": new["users"], "reset": waiting["reset"] or new["reset"], "quiz_saves": {**waiting["quiz_saves"], **new["quiz_saves"]},
+                "ref_numbers": new["ref_numbers"] if new["ref_numbers"] != None else waiting["ref_numbers"],  # The newest allocator state replaces the older one, since it holds every change.
+                "accuracy": new["accuracy"] if new["accuracy"] != None else waiting["accuracy"]}           # The same applies to the accuracy statistics.
+
+
+    # Procedure for reporting a failed scoreboard write, called on the thread running the window by "report_write_errors".
+    def scoreboard_write_error(self, error):
+        global scoreboard_reset_required
+        scoreboard_cache.clear()     # Clear the cache so that the scoreboard is reloaded from the file when it next needs to be accessed.
+        scoreboard_reset_required = True  # Write the whole "users" list with the next change, since the changes that failed to be written may have left the file out of step with the list.
+        ref_allocator.changed = True  # Write the reference number allocator again with the next change, in case it was not written.
+        accuracy_stats.changed = True  # Write the accuracy statistics again with the next change, in case they were not written.
+        if isinstance(error, IOError):  # Error control for instances such as the file being inaccessible or lacking the permission to write to it.
+            messagebox.showerror("File Error", f"Failed to write to '{os.path.basename(SCOREBOARD_FILE_PATH)}'. Check file permissions, disk space, and ensure the file is not in use.\n\n{error}\n\n{full_directory}")  # Show an error message if the file cannot be written to.
+        else:                           # Error control for any other exceptions that may occur.
+            messagebox.showerror("Unexpected Error", f"An unexpected error occurred while writing to '{os.path.basename(SCOREBOARD_FILE_PATH)}'.\n\n{error}\n\n{full_directory}")  # Show an error message if there is an unexpected error.
+
+
+    # Function for getting the current settings from the settings menu variables.
+    def current_settings(self):
+        return {"enable_timer": timer.get(), **{TOPIC_REGISTRY[topic].settings_key: enabled.get() for topic, enabled in enabled_topics.items()}, "deletion_history_states": deletion_history_states.get()}
+
+
+    # Function for getting the names of the question topics enabled in the settings menu, in the order they were registered.
+    def enabled_topic_names(self):
+        return [topic for topic, enabled in enabled_topics.items() if enabled.get() == True]
+
+
+    # Function for enabling every question topic, returning their names.
+    def enable_all_topics(self):
+        for enabled in enabled_topics.values():
+            enabled.set(True)
+        return list(enabled_topics)
+
+
+    # Procedure for adding a checkbutton for each registered question topic to the "Question Topics" settings menu.
+    def add_topic_checkbuttons(self, menu):
+        for topic, enabled in enabled_topics.items():
+            menu.add_checkbutton(label=topic, variable=enabled, command=lambda: self.save_details(None, "Menubar", None, SETTINGS_FILE_PATH))
+
+
+    # Procedure for generating the next quiz on the background thread with the enabled question topics, so that it can start straight away. Called whenever the difficulty, number of questions, or question topics change.
+    # If the difficulty and number of questions aren't given, those of the last quiz generated ahead are used (e.g. when only the question topics have changed).
+    def prefetch_quiz(self, quiz_difficulty=None, amount=None):
+        if quiz_difficulty == ADAPTIVE:
+            question_prefetcher.cancel()  # Adaptive quizzes aren't generated ahead, since they depend on the accuracy statistics when the quiz starts.
+            return
+        if quiz_difficulty == None or amount == None:
+            if question_prefetcher.settings == None: return
+            quiz_difficulty, _, amount = question_prefetcher.settings
+        question_topics = self.enabled_topic_names()  # If no topics are enabled, all topics are used, since the user is asked to enable them all before the quiz starts.
+        question_prefetcher.request(quiz_difficulty, question_topics, amount)
+
+
+    # Procedure for queueing the settings to be written on the background thread, called by the "settings_manager" once the settings menu hasn't been changed for a moment.
+    def queue_settings_write(self, settings):
+        persistence_worker.submit("settings", settings_manager.write, settings, None, self.settings_write_error)  # If settings are still waiting to be written, they are replaced by the newer settings.
+
+
+    # Procedure for reporting a failed settings write, called on the thread running the window by "report_write_errors".
+    def settings_write_error(self, error):
+        settings_manager.forget()       # Write the settings again with the next change, even if it changes them back to the saved settings.
+        if isinstance(error, IOError):  # Error control for instances such as the file being inaccessible or lacking the permission to write to it.
+            messagebox.showerror("File Error", f"Failed to write to 'settings.json'. Check file permissions, disk space, and ensure the file is not in use.\n\n{error}\n\n{full_directory}")  # Show an error message if the file cannot be written to.
+        else:                           # Error control for any other exceptions that may occur.
+            messagebox.showerror("Unexpected Error", f"An unexpected error occurred while writing to 'settings.json'.\n\n{error}\n\n{full_directory}")  # Show an error message if there is an unexpected error.
+
+
+    # Procedure for showing the errors of failed background writes, repeated every 100 ms so that errors are shown soon after they occur.
+    def report_write_errors(self):
+        persistence_worker.report_errors()
+        main_window.after(100, self.report_write_errors)
+
+
+    # Procedure for closing the program, waiting for every queued write to finish first so that no changes are lost.
+    def close_program(self):
+        self.cancel_stream_details()        # Stop any scoreboard load in progress, so that the scoreboard file is closed.
+        settings_manager.flush()            # Write any settings waiting for the settings menu changes to stop.
+        persistence_worker.flush()
+        persistence_worker.report_errors()  # Show any errors from the last writes before the window closes.
+        scoreboard_store.wait()             # Wait for any background compaction of the scoreboard to finish.
+        if navigation_profiler != None:
+            for page in navigation_profiler.summary():  # Print the average navigation time of each page, comparing the first visit (when the page is built) with later visits.
+                print(f"{page['page']}: first visit {(page['first_seconds'] or 0) * 1000:.1f} ms ({page['first_widgets_created'] or 0:.0f} widgets created), "
+                      f"later visits ({page['visits']}) {(page['later_seconds'] or 0) * 1000:.1f} ms ({page['later_widgets_created'] or 0:.0f} widgets created)")
+        main_window.destroy()
+
+
+    # Function for loading the saved questions of a quiz from the scoreboard store when it is retried or its answers are viewed, returning None if they cannot be loaded.
+    # The saved questions are stored separately from the "users" list, so only the quiz being reviewed is read rather than the saved questions of every score.
+    def load_quiz_save(self, user):
+        try:
+            quiz_save = scoreboard_store.load_quiz_save(user[0])  # Load the saved questions using the reference number of the selected score.
+            if not isinstance(quiz_save, list) or len(quiz_save) != int(user[3]):  # Check if the number of saved questions matches the number of questions in the quiz.
+                messagebox.showerror("Invalid Data", f"The saved quiz for reference number {user[0]} has an invalid list of saved questions (expected {user[3]} questions, got {len(quiz_save) if isinstance(quiz_save, list) else 0}).\n\n{full_directory}")
+                return None
+            return quiz_save
+        except (IOError, KeyError) as io_error:  # Error control for instances such as the quiz save being missing, inaccessible, or lacking the permission to read it.
+            messagebox.showerror("File Error", f"The saved quiz for reference number {user[0]} could not be found or read.\n\n{io_error}\n\n{full_directory}")
+        except ValueError as value_error:  # Error control for instances such as the quiz save being corrupted or improperly formatted (including JSON decode errors from older quiz saves).
+            messagebox.showerror("File Error", f"Failed to decode the saved quiz for reference number {user[0]}. The file may be corrupted or improperly formatted.\n\n{value_error}\n\n{full_directory}")
+        except Exception as e:  # Error control for any other exceptions that may occur.
+            messagebox.showerror("Unexpected Error", f"An unexpected error occurred while reading the saved quiz for reference number {user[0]}.\n\n{e}\n\n{full_directory}")
+        return None
+
+
     # Method for printing details into a PDF.
     def print_details(self, selections):
         data = []
+        if self.scores_loading() == True: return
+        persistence_worker.flush()  # Wait for any queued writes to finish, so that the printed scores match the saved scoreboard.
         
         if selections == "all" and data_loaded == False:  # Check if the data has been loaded from the JSON file only if all scores are being printed.
             self.load_details("scoreboard", SCOREBOARD_FILE_PATH, "users")
@@ -548,17 +815,15 @@ class Tools:
                 if response1 == False:
                     return
             else:
-                # Load all data from JSON file.
-                with open("AppData/scoreboard.json", "r") as file:
-                    data = json.load(file)  # Load the details from the JSON file into the "data" list.
-                    data = [user[:6] for user in data]  # Trim each user record to include only the first 6 items (exluding the quiz saves).
+                data = [user[:6] for user in users]  # Copy the 6 summary items of each user record (the quiz saves are stored separately). The "users" list already holds the journaled changes, which the snapshot file may not include yet.
 
         else:
             if selections != []:  # Check if the "selections" list is not empty.
                 # Match the selected reference numbers in the treeview widget to the user reference numbers (user[0]) in the "users" list.
                 # This creates a new list of users that match the selected user reference numbers so that only the selected users are printed on the scoreboard PDF.
                 # "user[0]" is converted to a string to ensure that it matches the format used in the Treeview selection, which is passed as a string.
-                data = [user[:6] for user in users if str(user[0]) in selections]  # If selections are provided, use them as the scoreboard data directly.
+                selected_indices = sorted(index for index in (scoreboard_store.find_ref(users, selection) for selection in selections) if index != None)  # Find the index of each selected reference number, sorted so that the scores are printed in scoreboard order.
+                data = [users[index][:6] for index in selected_indices]  # If selections are provided, use them as the scoreboard data directly.
             else:
                 messagebox.showwarning("No Scores Selected", "Please select at least one score to print.")
                 return
@@ -617,6 +882,7 @@ class Tools:
     # Method for deleting details from the "users" list.
     def delete_details(self, selections):
         global users
+        if self.scores_loading() == True: return
         users_to_delete = []  # Create an empty list to store users to delete.
         
         if users == []:  # Check if the "users" list is empty.
@@ -633,9 +899,11 @@ class Tools:
                         if len(history_stack) > deletion_history_states.get():
                             history_stack.pop(0)  # Remove the last entry from the stack (corresponding to the oldest score, which has an index of 0) if the stack exceeds the history limit.
 
+                    for user in users:
+                        ref_allocator.release(user[0])  # Release the reference numbers of the deleted scores, so that they can be reused once the deletion can no longer be undone.
                     users = []
                     redo_stack.clear()  # Clear the "redo_stack" list to prevent any redo actions directly after deletion.
-                    self.save_details(None, "Scoreboard", None, SCOREBOARD_FILE_PATH)
+                    self.save_details(None, "Scoreboard", [("clear", None, None)], SCOREBOARD_FILE_PATH)
                     self.clear_widget(self.scoreboard.setup_scoreboard, True, None, None, None, None)  # Clear all current widgets (passing "True" clears all widgets) to refresh the scoreboard page.
                     messagebox.showinfo("Scores Deleted", "All recorded scores have been deleted.")
                 else:
@@ -647,9 +915,11 @@ class Tools:
                     if response == True:
                         # Find the users to delete and record their original index positions.
                         users_to_delete = []
-                        for index, user in enumerate(users):
-                            if str(user[0]) in selections:
-                                users_to_delete.append((user, index))  # Store (user, index) in the "users_to_delete" list.
+                        for selection in selections:
+                            index = scoreboard_store.find_ref(users, selection)  # Look up the index of the selected reference number (indexed for the SQLite store).
+                            if index != None:
+                                users_to_delete.append((users[index], index))  # Store (user, index) in the "users_to_delete" list.
+                        users_to_delete.sort(key=lambda x: x[1])  # Sort by index so that undoing the deletion reinserts the users in ascending index order.
                         
                         # Store all selected users with their indices in the "history_stack" list.
                         if deletion_history_states.get() > 0:             # Check if the "deletion_history_states" variable is greater than 0, which means that the deletion history is enabled.
@@ -663,12 +933,15 @@ class Tools:
                         # "users_to_delete" is a list of tuples in the form (user, index), where "index" is the user's position in the "users" list.
                         # Sorting this list by index in descending order ensures that when items are deleted, the positions of earlier items in the list are not affected.
                         # If deletions were done in ascending order, deleting an item would shift the indices of the items that follow it, leading to incorrect deletions if more than one item is deleted at once.
+                        changes = []
                         for user, index in sorted(users_to_delete, key=lambda x: x[1], reverse=True):  # Sort by the original index ("x[1]"), which refers to the second element ("1", being the index) in each (user, index) tuple, representing the user's original position.
                             del users[index]     # Delete the user from the "users" list at the specified index.
+                            changes.append(("delete", index, None))  # Record the deletion in the same order so that replaying the journal deletes the same users.
+                            ref_allocator.release(user[0])           # Release the reference number of the deleted score, so that it can be reused once the deletion can no longer be undone.
                         redo_stack.clear()       # Clear the "redo_stack" list to prevent any redo actions directly after deletion.
                         users_to_delete.clear()  # Clear the list of users to delete.
                         
-                        self.save_details(None, "Scoreboard", None, SCOREBOARD_FILE_PATH)
+                        self.save_details(None, "Scoreboard", changes, SCOREBOARD_FILE_PATH)
                         self.clear_widget(self.scoreboard.setup_scoreboard, True, None, None, None, None)  # Clear all current widgets (passing "True" clears all widgets) to refresh the scoreboard page.
                         messagebox.showinfo("Scores Deleted", f"The selected {words[0]} {words[1]} been deleted.")
                     else:
@@ -682,6 +955,7 @@ class Tools:
     # Method for undoing the deletion of scores.
     def undo_delete(self):
         global users, history_stack
+        if self.scores_loading() == True: return
         
         # Check if the history stack is empty.
         if not history_stack:  
@@ -691,14 +965,16 @@ class Tools:
         redo_stack.append([(user, index) for user, index in last_deleted])  # Store the last deleted users in the redo stack for potential future redoing.
         for user, index in last_deleted:  # Reinsert each user at their original index.
             users.insert(index, user)
+            ref_allocator.reserve(user[0])  # Reserve the reference number of the restored score again.
         
-        self.save_details(None, "Scoreboard", None, SCOREBOARD_FILE_PATH)
+        self.save_details(None, "Scoreboard", [("insert", index, user) for user, index in last_deleted], SCOREBOARD_FILE_PATH)
         self.clear_widget(self.scoreboard.setup_scoreboard, True, None, None, None, None)  # Clear all current widgets (passing "True" clears all widgets) to refresh the scoreboard page.
 
 
     # Method for redoing the deletion of scores that were previously undone.
     def redo_delete(self):
         global users, history_stack, redo_stack
+        if self.scores_loading() == True: return
 
         # Check if the redo stack is empty.
         if not redo_stack:
@@ -707,25 +983,28 @@ class Tools:
         last_redo = redo_stack.pop()  # Retrieve the last deleted users from the redo stack.
         history_stack.append([(user, index) for user, index in last_redo])       # Store the last deleted users in the history stack for potential future undoing.
         # Delete users in reverse index order to avoid shifting issues.
+        changes = []
         for user, index in sorted(last_redo, key=lambda x: x[1], reverse=True):  # Sort by the original index ("x[1]"), which refers to the second element ("1", being the index) in each (user, index) tuple, representing the user's original position.
             del users[index]  # Delete the user from the "users" list at the specified index.
+            changes.append(("delete", index, None))
+            ref_allocator.release(user[0])  # Release the reference number of the deleted score.
         
-        self.save_details(None, "Scoreboard", None, SCOREBOARD_FILE_PATH)
+        self.save_details(None, "Scoreboard", changes, SCOREBOARD_FILE_PATH)
         self.clear_widget(self.scoreboard.setup_scoreboard, True, None, None, None, None)  # Clear all current widgets (passing "True" clears all widgets) to refresh the scoreboard page.
 
 
     # Method for resetting details specific to the specified window.
     def reset_details(self, origin, action):
-        global history_stack, username, difficulty, difficulty_num, question_amount, question_details, temp_fake_answers
+        global history_stack, username, difficulty, difficulty_num, question_amount, question_details
         if origin == "Completion" or origin == "Quiz" and action == "User Reset":
             history_stack.clear() if origin == "Completion" else None  # Clear the history stack if the origin is "Completion" so that deleted scores cannot be restored after a new user score is added to the "users" list, preventing possible duplicate username and difficulty combinations.
             username = None
             difficulty = None
             difficulty_num = None
             question_amount = None
-            temp_fake_answers = []
             question_details.clear()
             self.quiz.quiz_save = []
+            self.quiz.quiz_recipe = None
         elif origin == "Scoreboard":
             self.scoreboard.sel_reference_numbers.clear()
         elif origin == "Quiz": 
@@ -734,13 +1013,13 @@ class Tools:
                     self.quiz.quiz_save = []
                 
                 if action == "New":
-                    temp_fake_answers = []
                     question_details.clear()
+                    self.quiz.quiz_recipe = None
                 elif action == "Home" or action == "Scoreboard":
                     self.quiz.score = 0
-                    temp_fake_answers = []
                     question_details.clear()
                     self.quiz.quiz_save = []
+                    self.quiz.quiz_recipe = None
                 
                 if action != "Restart":  # Only reset these variables if the user is not restarting the quiz, otherwise restarting during a quiz retry or answer viewing mode will cause issues.
                     self.quiz.answer_viewing_active = False
@@ -803,8 +1082,8 @@ class About:
         # Create a top-level window (separate from the main window).
         self.about_window = Toplevel(main_window, bg=MAIN_WINDOW_BG)
         self.about_window.withdraw()  # Withdraw the window so that it is not shown immediately.
-        if os.path.exists("AppData/Images/icon.png"):  # Check if the icon file exists before setting it.
-            self.about_window.iconphoto(False, PhotoImage(file="AppData/Images/icon.png"))  # Set the title bar icon for the "About" window.
+        if image_assets.exists("icon.png"):  # Check if the icon file exists before setting it.
+            self.about_window.iconphoto(False, image_assets.photo("icon.png"))  # Set the title bar icon for the "About" window.
         self.about_window.title("About")
         self.about_window.geometry("320x157")  # Set the size of the "About" window, calculated by finding the size after the child elements have been added.
         self.about_window.resizable(False, False)
@@ -860,34 +1139,102 @@ class Scoreboard:
         self.quiz = quiz_instance               # Store a reference to the "Quiz" class instance.
         self.home = homepage_instance           # Store a reference to the "Home" class instance.
         self.sel_reference_numbers = []         # Create a new list to store the selected reference numbers from the treeview widget.
+        self.virtual_rows = VirtualRows(8, 32)  # Create the virtual list of scores, which only keeps the 8 visible rows and 32 rows above and below them in the treeview, so that the page opens as quickly with 50,000 scores as with 50.
+        self.refill_after = None                # ID of the "after" call that refills the treeview with the rows around the visible rows.
 
 
-    # Function for handling the treeview items being selected or unselected ("<<TreeviewSelect>>" event is generated for both).
+    # Function for handling the treeview items being selected or unselected ("<<TreeviewSelect>>" event is generated for both), e.g. with the keyboard.
+    # The treeview only holds the rows around the visible rows, so only their selection is updated, and selected rows that have been scrolled out of the treeview stay selected.
     def on_item_selected(self, event):
-        selected_items = self.tree.selection()
-        self.sel_reference_numbers = []  # Clear the "sel_reference_numbers" list to ensure it only contains the currently selected items.
-        
-        # If items are selected, i.e. at least one item is selected in the treeview, then proceed to get the reference numbers of the selected items.
-        if selected_items:
-            # Loop through each selected item in the treeview.
-            for item_id in selected_items:
-                sel_ref_number = str(self.tree.item(item_id, "values")[0])  # Get the reference number of the selected item.
-                self.sel_reference_numbers.append(sel_ref_number)           # Append the selected reference number to the "sel_reference_numbers" list.
+        self.virtual_rows.sync_window(int(item_id) for item_id in self.tree.selection())  # Each item ID is the index of its row in the virtual list.
+        self.sel_reference_numbers = self.virtual_rows.selected_refs()  # Get the reference numbers of every selected row, including rows scrolled out of the treeview.
+
+
+    # Function for handling a row of the treeview being clicked, which selects rows in the virtual list (rather than only the treeview) so that Shift+click can select rows that have been scrolled out of the treeview.
+    def on_tree_click(self, event):
+        if self.tree.identify_region(event.x, event.y) not in ("cell", "tree"):
+            return  # Let the treeview handle clicks on the headings.
+        item_id = self.tree.identify_row(event.y)
+        if item_id == "":
+            return "break"
+        toggle = bool(event.state & 0x0004) or (operating_system == "Darwin" and bool(event.state & 0x0008))  # Check if Ctrl (or Command on macOS) is held.
+        self.virtual_rows.click(int(item_id), toggle=toggle, extend=bool(event.state & 0x0001))  # Check if Shift is held.
+        self.tree.focus_set()
+        self.tree.focus(item_id)
+        self.tree.selection_set([str(index) for index in self.virtual_rows.selected_in_window()])
+        self.sel_reference_numbers = self.virtual_rows.selected_refs()
+        return "break"  # Stop the treeview from changing the selection itself.
+
+
+    # Procedure for handling the treeview being scrolled (e.g. with the mouse wheel or keyboard), which moves the scrollbar and refills the treeview once the visible rows get close to the edge of the rows it holds.
+    def on_tree_view_changed(self, first, last):
+        top = self.virtual_rows.top_from_view(float(first))
+        self.virtual_rows.top = top
+        if self.scrollbar != None:
+            self.scrollbar.set(*self.virtual_rows.fractions(top))
+        if self.virtual_rows.needs_refill(top) and self.refill_after == None:
+            self.refill_after = main_window.after_idle(self.refill_rows)  # Refill once the scroll has finished, rather than while the treeview is still updating its view.
+
+
+    # Procedure for handling the scrollbar being moved, which scrolls the treeview if the rows are already in it, or refills it with the rows around the new position.
+    def on_scrollbar(self, action, amount, unit=None):
+        if action == "moveto":
+            top = self.virtual_rows.top_from_fraction(float(amount))
+        else:
+            top = self.virtual_rows.clamp_top(self.virtual_rows.top + int(amount) * (self.virtual_rows.visible if unit == "pages" else 1))
+        if self.virtual_rows.needs_refill(top):
+            self.refill_rows(top)
+        else:
+            self.tree.yview_moveto(self.virtual_rows.view_fraction(top))
+
+
+    # Procedure for refilling the treeview with the rows around the given first visible row (or the current first visible row), keeping the selection of the rows.
+    def refill_rows(self, top=None):
+        if self.refill_after != None:
+            main_window.after_cancel(self.refill_after)
+            self.refill_after = None
+        rows = self.virtual_rows.move_window(self.virtual_rows.top if top == None else top)
+        self.tree.delete(*self.tree.get_children())
+        for index in rows:
+            self.tree.insert("", "end", iid=str(index), values=self.virtual_rows.rows[index])
+        self.tree.selection_set([str(index) for index in self.virtual_rows.selected_in_window()])
+        self.tree.yview_moveto(self.virtual_rows.view_fraction(self.virtual_rows.top))
 
 
+    # Method for showing the scoreboard page, which is built the first time it is shown and has its scores reloaded each time after that.
     def setup_scoreboard(self):
-        global banners_loaded
-        banners_loaded = False  # Reset the flag to indicate that the banners have not been loaded yet, so that going to the home or quiz page will reload them.
+        self.tools.show_page("Scoreboard", self.build_scoreboard, self.refresh_scoreboard)
 
-        # Setting the main window geometry (size) before element creation ensures the window doesn't glitch between sizes.
+
+    # Method for refreshing the scoreboard page each time it is shown, reloading the scores shown in the Treeview.
+    def refresh_scoreboard(self):
+        # Setting the main window geometry (size) before the scores are loaded ensures the window doesn't glitch between sizes.
         if int(len(users)) > 8:
             main_window.geometry("868x411")  # Final size calculated based on the window size seen after the elements are all created, including the scrollbar when the users list is above 8.
         else:
             main_window.geometry("852x411")  # Final size calculated based on the window size seen after the elements are all created, excluding the scrollbar when the users list is at or below 8.
-        
-        # Set width for columns 0-1 (2 total) in the main window. Positive weight means the column will expand to fill the available space.
-        main_window.columnconfigure(0, weight=1, minsize=850)
-        main_window.columnconfigure(1, weight=1, minsize=0)
+
+        main_window.config(menu=self.scoreboard_menubar)
+
+        # Bind key shortcuts to perform actions.
+        main_window.bind("<Control-p>", lambda e: self.tools.print_details(self.sel_reference_numbers))  # Bind the "Ctrl+P" key to the "print_details" function so that the selected receipts can be printed.
+        main_window.bind("<Control-Shift-P>", lambda e: self.tools.print_details("all"))                 # Bind the "Ctrl+Shift+P" key to the "print_details" function so that all receipts can be printed.
+        main_window.bind("<Delete>", lambda e: self.tools.delete_details(self.sel_reference_numbers))    # Bind the "del" key to the "delete_details" function so that the selected receipts can be deleted.
+        main_window.bind("<Shift-Delete>", lambda e: self.tools.delete_details("all"))                   # Bind the "Shift+del" key to the "delete_details" function so that all receipts can be deleted.
+        main_window.bind("<Control-z>", lambda e: self.tools.undo_delete())                              # Bind the "Ctrl+Z" key to the "undo_delete" function so that the last deletion can be undone.
+        main_window.bind("<Control-Shift-Z>", lambda e: self.tools.redo_delete())                        # Bind the "Ctrl+Shift+Z" key to the "redo_delete" function so that the last deletion can be redone if it was previously undone.
+        self.binded_keys = ["<Control-p>", "<Control-Shift-P>", "<Delete>", "<Shift-Delete>", "<Control-z>", "<Control-Shift-Z>"]  # Create a list of binded keys to be used later for unbinding them when the user goes back to the home page.
+
+        # Remove the scores shown last time, then load the user scores from the scoreboard file, adding them to the Treeview in chunks as they are loaded so that the first scores are shown straight away.
+        self.clear_rows()
+        self.tools.stream_details(self.insert_rows, self.rows_loaded)
+
+
+    # Method for building the scoreboard page inside its page frame, which is only done the first time it is shown.
+    def build_scoreboard(self, page_frame):
+        # Set width for columns 0-1 (2 total) in the page frame. Positive weight means the column will expand to fill the available space.
+        page_frame.columnconfigure(0, weight=1, minsize=850)
+        page_frame.columnconfigure(1, weight=1, minsize=0)
 
         # Set up the menu bar.
         scoreboard_menubar = Menu(main_window)  # Create a new menu bar.
@@ -912,8 +1259,7 @@ class Scoreboard:
         timer_settings.add_radiobutton(label="Disabled", variable=timer, value=False, command=lambda: self.tools.save_details(None, "Menubar", None, SETTINGS_FILE_PATH))
         question_settings = Menu(scoreboard_menubar, tearoff=0, activebackground=MENU_HOVER, activeforeground=MENU_ACTIVE_FG)
         settings_menu.add_cascade(menu=question_settings, label="Question Topics")
-        question_settings.add_checkbutton(label="Trigonometry", variable=enable_trigonometry, command=lambda: self.tools.save_details(None, "Menubar", None, SETTINGS_FILE_PATH))
-        question_settings.add_checkbutton(label="Algebra", variable=enable_algebra, command=lambda: self.tools.save_details(None, "Menubar", None, SETTINGS_FILE_PATH))
+        self.tools.add_topic_checkbuttons(question_settings)
         history_settings = Menu(scoreboard_menubar, tearoff=0, activebackground=MENU_HOVER, activeforeground=MENU_ACTIVE_FG)
         settings_menu.add_cascade(menu=history_settings, label="Score Deletion History States")
         history_settings.add_radiobutton(label="Disabled", variable=deletion_history_states, value=0, command=lambda: self.tools.save_details(None, "Menubar", None, SETTINGS_FILE_PATH))
@@ -925,20 +1271,10 @@ class Scoreboard:
         scoreboard_menubar.add_cascade(label="Help", menu=help_menu)
         help_menu.add_command(label="Documentation", command=lambda: self.tools.open_file("Scoreboard", documentation_path, "readme.pdf"))
         help_menu.add_command(label="About", command=lambda: self.about.setup_about("Scoreboard"))
+        self.scoreboard_menubar = scoreboard_menubar  # Keep the menu bar, so that it is shown again each time the page is shown.
 
-        main_window.config(menu=scoreboard_menubar)
-
-        # Bind key shortcuts to perform actions.
-        main_window.bind("<Control-p>", lambda e: self.tools.print_details(self.sel_reference_numbers))  # Bind the "Ctrl+P" key to the "print_details" function so that the selected receipts can be printed.
-        main_window.bind("<Control-Shift-P>", lambda e: self.tools.print_details("all"))                 # Bind the "Ctrl+Shift+P" key to the "print_details" function so that all receipts can be printed.
-        main_window.bind("<Delete>", lambda e: self.tools.delete_details(self.sel_reference_numbers))    # Bind the "del" key to the "delete_details" function so that the selected receipts can be deleted.
-        main_window.bind("<Shift-Delete>", lambda e: self.tools.delete_details("all"))                   # Bind the "Shift+del" key to the "delete_details" function so that all receipts can be deleted.
-        main_window.bind("<Control-z>", lambda e: self.tools.undo_delete())                              # Bind the "Ctrl+Z" key to the "undo_delete" function so that the last deletion can be undone.
-        main_window.bind("<Control-Shift-Z>", lambda e: self.tools.redo_delete())                        # Bind the "Ctrl+Shift+Z" key to the "redo_delete" function so that the last deletion can be redone if it was previously undone.
-        self.binded_keys = ["<Control-p>", "<Control-Shift-P>", "<Delete>", "<Shift-Delete>", "<Control-z>", "<Control-Shift-Z>"]  # Create a list of binded keys to be used later for unbinding them when the user goes back to the home page.
-        
         # Set up a content frame to place the main scoreboard top elements inside.
-        top_frame1 = CTk.CTkFrame(main_window, fg_color="transparent")
+        top_frame1 = CTk.CTkFrame(page_frame, fg_color="transparent")
         top_frame1.grid(column=0, row=0, sticky=EW, padx=20, pady=(20,5))
 
         # Set width for columns 0-2 (3 total) in top frame 1. Total minimum column width is 810px.
@@ -950,8 +1286,7 @@ class Scoreboard:
         total_height = 70  # Height for the canvas and vertical centre position is calculated by the height of two buttons (60px) + 10px padding.
         self.logo_canvas = Canvas(top_frame1, bg=MAIN_WINDOW_BG, bd=0, highlightthickness=0, width=400, height=total_height)  # Create a canvas for the banner image.
         self.logo_canvas.grid(column=0, row=0, rowspan=2, sticky=EW)
-        self.logo = Image.open("AppData/Images/logo_small.png")
-        self.logo = ImageTk.PhotoImage(self.logo)
+        self.logo = image_assets.photo("logo_small.png")  # Use the cached logo image, which is only decoded once.
         self.logo_canvas.create_image(0, total_height / 2, anchor=W, image=self.logo)  # Add the image to the canvas by calculating the x and y coordinates for centre-left position.
         self.logo_canvas.image = self.logo
 
@@ -978,11 +1313,8 @@ class Scoreboard:
         self.retry_button.grid(column=2, row=1, padx=(5,0), pady=(5,0))
         self.retry_button.bind("<Enter>", lambda e: self.tools.on_ctkbutton_enter(self.retry_button))  # Bind the "Enter" event to the "on_ctkbutton_enter" method so that the button changes to a darker colour when the mouse hovers over it.
 
-        # Reload the user scores from the scoreboard.json file.
-        self.tools.load_details("scoreboard", SCOREBOARD_FILE_PATH, "users")
-
         # Create a frame to hold the Treeview and scrollbar.
-        tree_frame = CTk.CTkFrame(main_window, fg_color="transparent")
+        tree_frame = CTk.CTkFrame(page_frame, fg_color="transparent")
         tree_frame.grid(column=0, row=1, sticky=EW, padx=20, pady=(5,20))
 
         treestyle = ttk.Style()
@@ -1044,25 +1376,12 @@ class Scoreboard:
             else:
                 self.tree.column(col, anchor=CENTER, width=column_widths[col])
 
-        try:
-            # Add each item in the list into the Treeview.
-            for index, details in enumerate(users):
-                index += 1  # Increment the index by 1 each time a new item is added.
-                self.tree.insert("", "end", values=(details[0], details[1], details[2], details[3], details[4], details[5]))
-        except IndexError as index_error:  # Error control for instances such as the "users" list being empty.
-            messagebox.showerror("Invalid Data", f"The saved JSON data is invalid or incomplete.\nPlease check the file for missing fields.\n\n{index_error}\n\n{full_directory}")
-            return  # Return from the method if an IndexError occurs, preventing further execution.
-
         self.tree.bind("<<TreeviewSelect>>", self.on_item_selected)  # Bind the treeview item selection event to the "on_item_selected" method.
+        self.tree.bind("<Button-1>", self.on_tree_click)             # Bind the left mouse button click event to the "on_tree_click" method, which selects the clicked rows in the virtual list.
         self.tree.bind("<Motion>", "break")  # Prevent the treeview columns from being manually resized by the user by breaking the motion event.
-
-        # Create a vertical scrollbar for the Treeview if the list is higher than 8 entries.
-        if int(len(users)) > 8:
-            self.scrollbar = CTk.CTkScrollbar(tree_frame, orientation="vertical", command=self.tree.yview, height=10, button_color=BUTTON_FG, button_hover_color=BUTTON_HOVER)
-            self.tree.configure(yscrollcommand=self.scrollbar.set)
-            self.scrollbar.pack(side=RIGHT, fill=Y)  # Position the scrollbar inside the frame by using ".pack()".
-            self.scrollbar.bind("<Button-1>", lambda e: self.tools.on_mbtn1_click("Scoreboard", "Scrollbar"))           # Bind the left mouse button click event to the "on_mbtn1_click" method in the "Tools" class, so that the color stays dim while clicked.
-            self.scrollbar.bind("<ButtonRelease-1>", lambda e: self.tools.on_mbtn1_release("Scoreboard", "Scrollbar"))  # Bind the left mouse button release event to the "on_mbtn1_release" method in the "Tools" class, so that the color returns to normal when released.
+        self.tree.configure(yscrollcommand=self.on_tree_view_changed)  # Follow the scroll position of the treeview, so that the scrollbar shows the position in the whole scoreboard rather than the rows in the treeview.
+        self.tree_frame = tree_frame
+        self.scrollbar = None  # The scrollbar is created once there are more than 8 entries in the Treeview.
 
         # Position the Treeview inside the frame by using ".pack()".
         self.tree.pack(side=LEFT, fill=BOTH, expand=True)
@@ -1072,6 +1391,58 @@ class Scoreboard:
         tree_frame.grid_rowconfigure(0, weight=1)
 
 
+    # Procedure for removing every entry from the Treeview and the virtual list, clearing the selection.
+    def clear_rows(self):
+        if self.refill_after != None:
+            main_window.after_cancel(self.refill_after)
+            self.refill_after = None
+        self.tree.delete(*self.tree.get_children())
+        self.virtual_rows.clear()
+        self.sel_reference_numbers = []
+
+
+    # Procedure for adding a chunk of loaded entries to the virtual list, showing how much of the scoreboard has been loaded in the window title.
+    # Only the entries that fit in the Treeview's window of rows are added to the Treeview, so a chunk of entries below the visible rows costs no more than appending them to a list.
+    def insert_rows(self, rows, progress=None):
+        try:
+            rows = [(details[0], details[1], details[2], details[3], details[4], details[5]) for details in rows]
+        except IndexError as index_error:  # Error control for instances such as an entry missing fields.
+            messagebox.showerror("Invalid Data", f"The saved JSON data is invalid or incomplete.\nPlease check the file for missing fields.\n\n{index_error}\n\n{full_directory}")
+            return  # Return from the method if an IndexError occurs, preventing further execution.
+        for index in self.virtual_rows.extend(rows):
+            self.tree.insert("", "end", iid=str(index), values=self.virtual_rows.rows[index])
+        self.update_scrollbar()
+        if progress != None:
+            main_window.title(f"QWhizz Math - Loading Scores ({progress:.0%})")  # Show the loading progress in the window title.
+
+
+    # Procedure for finishing the scoreboard load, replacing the shown entries with the "users" list if needed (e.g. if invalid entries were removed or the file was replaced).
+    def rows_loaded(self, replace):
+        main_window.title("QWhizz Math")  # Restore the window title.
+        if replace == True:
+            self.clear_rows()
+            self.insert_rows(users)
+        self.update_scrollbar()
+
+
+    # Procedure for creating the vertical scrollbar for the Treeview once it has more than 8 entries, and resizing the window to fit it (or removing it if there are 8 or fewer entries).
+    # The scrollbar scrolls the virtual list rather than the Treeview, since the Treeview only holds the rows around the visible rows.
+    def update_scrollbar(self):
+        if len(self.virtual_rows) > 8 and self.scrollbar == None:
+            main_window.geometry("868x411")  # Final size calculated based on the window size seen after the elements are all created, including the scrollbar when the users list is above 8.
+            self.scrollbar = CTk.CTkScrollbar(self.tree_frame, orientation="vertical", command=self.on_scrollbar, height=10, button_color=BUTTON_FG, button_hover_color=BUTTON_HOVER)
+            self.scrollbar.pack(side=RIGHT, fill=Y, before=self.tree)  # Position the scrollbar inside the frame by using ".pack()", to the right of the Treeview.
+            self.scrollbar.bind("<Button-1>", lambda e: self.tools.on_mbtn1_click("Scoreboard", "Scrollbar"))           # Bind the left mouse button click event to the "on_mbtn1_click" method in the "Tools" class, so that the color stays dim while clicked.
+            self.scrollbar.bind("<ButtonRelease-1>", lambda e: self.tools.on_mbtn1_release("Scoreboard", "Scrollbar"))  # Bind the left mouse button release event to the "on_mbtn1_release" method in the "Tools" class, so that the color returns to normal when released.
+        elif len(self.virtual_rows) <= 8 and self.scrollbar != None:
+            self.scrollbar.destroy()
+            self.scrollbar = None
+            main_window.geometry("852x411")  # Final size calculated based on the window size seen after the elements are all created, excluding the scrollbar when the users list is at or below 8.
+        elif len(self.virtual_rows) <= 8:
+            main_window.geometry("852x411")
+        if self.scrollbar != None:
+            self.scrollbar.set(*self.virtual_rows.fractions(self.virtual_rows.top))  # Resize the scrollbar for the number of rows loaded so far.
+
 
 class Completion:
     # Constructor for the "Completion" class, which takes an instance of the class names as a parameter and stores it in their unique attributes.
@@ -1093,28 +1464,52 @@ class Completion:
             self.time = self.quiz.total_time
         else:
             self.time = "Disabled"
+        if ref_number == None:
+            ref_number = ref_allocator.allocate()  # Allocate a reference number for a new score, reusing the reference number of a deleted score if there is one.
+        changes = []  # Create an empty list to store the changes made to the "users" list, so that they can be appended to the scoreboard journal.
         if overwrite_score == True:
-            # Check if a user already exists with the same username and difficulty in the "users" list.
-            for index, user in enumerate(users):
-                if user[1].lower() == username.lower() and user[2] == difficulty:  # Use ".lower()" to ignore case sensitivity when comparing the existing usernames with the entered username by making them both lowercase.
-                    users[index] = [ref_number, username, difficulty, question_amount, self.time, self.quiz.final_score, self.quiz.quiz_save]  # Replace the existing user details with the new ones.
-                    overwrite_score = False  # Reset the "overwrite_score" flag.
-                    break
+            # Check if a user already exists with the same username (case insensitive) and difficulty in the "users" list.
+            index = scoreboard_store.find_user(users, username, difficulty)
+            if index != None:
+                if str(users[index][0]) != str(ref_number):
+                    ref_allocator.release(users[index][0])  # Release the reference number of the score being replaced, since the new score has its own reference number.
+                users[index] = [ref_number, username, difficulty, question_amount, self.time, self.quiz.final_score]  # Replace the existing user details with the new ones (the quiz questions are saved separately in "save_details").
+                changes = [("replace", index, users[index])]
+                overwrite_score = False  # Reset the "overwrite_score" flag.
         else:
-            users.append([ref_number, username, difficulty, question_amount, self.time, self.quiz.final_score, self.quiz.quiz_save])  # Add the next user and their quiz details to the "users" list.
-        self.tools.save_details(None, "Completion", None, SCOREBOARD_FILE_PATH)  # Save the details to the JSON file.
+            users.append([ref_number, username, difficulty, question_amount, self.time, self.quiz.final_score])  # Add the next user and their quiz details to the "users" list (the quiz questions are saved separately in "save_details").
+            changes = [("append", None, users[-1])]
+        accuracy_stats.record(username, difficulty, self.quiz.quiz_save)  # Add the answers to the user's accuracy statistics as the score is submitted, so that adaptive quizzes don't need to read the saved quizzes.
+        self.tools.save_details(None, "Completion", changes, SCOREBOARD_FILE_PATH)  # Save the changes to the scoreboard journal.
         self.setup_completion()
 
 
+    # Method for showing the completion page, which is built the first time it is shown and has the results of the quiz updated each time after that.
     def setup_completion(self):
-        global banners_loaded
+        self.tools.show_page("Completion", self.build_completion, self.refresh_completion)
+
 
-        # Setting the main window geometry (size) before element creation ensures the window doesn't glitch between sizes.
+    # Method for refreshing the completion page each time it is shown, showing the results of the quiz just completed.
+    def refresh_completion(self):
+        # Setting the main window geometry (size) before the page is shown ensures the window doesn't glitch between sizes.
         main_window.geometry("758x434")  # Final size calculated based on the window size seen after the elements are all created.
-        
-        # Set width for columns 0-1 (2 total) in the main window. Positive weight means the column will expand to fill the available space.
-        main_window.columnconfigure(0, weight=1, minsize=0)
-        main_window.columnconfigure(1, weight=1, minsize=450)
+        main_window.config(menu=self.completion_menubar)
+
+        self.score_lbl.configure(text=f"Total Score: {self.quiz.score}/{question_amount}")
+        self.difficulty_lbl.configure(text=f"Difficulty: {difficulty}")
+        if timer.get() == True:
+            self.total_time_lbl.configure(text=self.tools.timer_config("Completion", "Enable", None))  # Use the "timer_config" function to update the label text relative to the state of the timer.
+        if timer.get() == False:
+            self.total_time_lbl.configure(text=self.tools.timer_config("Completion", "Disable", None))  # Use the "timer_config" function to update the label text relative to the state of the timer.
+
+        self.tools.prefetch_quiz(difficulty, question_amount)  # Generate the next quiz on the background thread while the results are shown, so that it is ready if the user starts another quiz with the same settings.
+
+
+    # Method for building the completion page inside its page frame, which is only done the first time it is shown.
+    def build_completion(self, page_frame):
+        # Set width for columns 0-1 (2 total) in the page frame. Positive weight means the column will expand to fill the available space.
+        page_frame.columnconfigure(0, weight=1, minsize=0)
+        page_frame.columnconfigure(1, weight=1, minsize=450)
 
         # Set up the menu bar.
         completion_menubar = Menu(main_window)  # Create a new menu bar.
@@ -1127,8 +1522,7 @@ class Completion:
         timer_settings.add_radiobutton(label="Disabled", variable=timer, command=lambda: self.tools.save_details(None, "Menubar", None, SETTINGS_FILE_PATH), value=False)
         question_settings = Menu(completion_menubar, tearoff=0, activebackground=MENU_HOVER, activeforeground=MENU_ACTIVE_FG)
         settings_menu.add_cascade(menu=question_settings, label="Question Topics")
-        question_settings.add_checkbutton(label="Trigonometry", variable=enable_trigonometry, command=lambda: self.tools.save_details(None, "Menubar", None, SETTINGS_FILE_PATH))
-        question_settings.add_checkbutton(label="Algebra", variable=enable_algebra, command=lambda: self.tools.save_details(None, "Menubar", None, SETTINGS_FILE_PATH))
+        self.tools.add_topic_checkbuttons(question_settings)
         history_settings = Menu(completion_menubar, tearoff=0, activebackground=MENU_HOVER, activeforeground=MENU_ACTIVE_FG)
         settings_menu.add_cascade(menu=history_settings, label="Score Deletion History States")
         history_settings.add_radiobutton(label="Disabled", variable=deletion_history_states, value=0, command=lambda: self.tools.save_details(None, "Menubar", None, SETTINGS_FILE_PATH))
@@ -1140,39 +1534,18 @@ class Completion:
         completion_menubar.add_cascade(label="Help", menu=help_menu)
         help_menu.add_command(label="Documentation", command=lambda: self.tools.open_file("Completion", documentation_path, "readme.pdf"))
         help_menu.add_command(label="About", command=lambda: self.about.setup_about("Completion"))
+        self.completion_menubar = completion_menubar  # Keep the menu bar, so that it is shown again each time the page is shown.
 
-        main_window.config(menu=completion_menubar)
-
-        if banners_loaded == False:
-            # Banner creation (left side).
-            lbanner_canvas = Canvas(main_window, bg=MAIN_WINDOW_BG, bd=0, highlightthickness=0)  # Create a canvas for the banner image.
-            lbanner_canvas.grid(column=0, row=0, sticky=EW, padx=(20, 0), pady=27)
-            lbanner = Image.open("AppData/Images/lbanner.png")
-            lbanner = ImageTk.PhotoImage(lbanner)
-            lbanner_canvas.configure(width=lbanner.width()+2, height=lbanner.height())  # Add 2 pixels to width to prevent image clipping on the right of image.
-            lbanner_canvas.create_image(lbanner.width() / 2, lbanner.height() / 2, anchor=CENTER, image=lbanner)  # Add the image to the canvas by calculating the x and y coordinates for centre position.
-            lbanner_canvas.image = lbanner
-
-            # Banner creation (right side).
-            rbanner_canvas = Canvas(main_window, bg=MAIN_WINDOW_BG, bd=0, highlightthickness=0)  # Create a canvas for the banner image.
-            rbanner_canvas.grid(column=2, row=0, sticky=EW, padx=(0, 20), pady=27)
-            rbanner = Image.open("AppData/Images/rbanner.png")
-            rbanner = ImageTk.PhotoImage(rbanner)
-            rbanner_canvas.configure(width=rbanner.width()+2, height=rbanner.height())  # Add 2 pixels to width to prevent image clipping on the left of image.
-            rbanner_canvas.create_image(rbanner.width() / 2, rbanner.height() / 2, anchor=CENTER, image=rbanner)  # Add the image to the canvas by calculating the x and y coordinates for centre position.
-            rbanner_canvas.image = rbanner
-
-            banners_loaded = True
+        self.tools.create_banners(page_frame)  # Create the banners on the left and right of the page.
 
         # Set up the main content frame to place the main completion frames and elements inside.
-        self.main_content_frame = CTk.CTkFrame(main_window, fg_color="transparent")
+        self.main_content_frame = CTk.CTkFrame(page_frame, fg_color="transparent")
         self.main_content_frame.grid(column=1, row=0, sticky=EW, padx=35, pady=(0,20))
 
         # Logo creation.
         self.logo_canvas = Canvas(self.main_content_frame, bg=MAIN_WINDOW_BG, bd=0, highlightthickness=0)  # Create a canvas for the banner image.
         self.logo_canvas.grid(column=0, row=0, sticky=EW, padx=20, pady=(20,0))
-        self.logo = Image.open("AppData/Images/logo.png")
-        self.logo = ImageTk.PhotoImage(self.logo)
+        self.logo = image_assets.photo("logo.png")
         self.logo_canvas.configure(width=410, height=self.logo.height()+5)  # Add 5 pixels to height to prevent image clipping on the bottom of image.
         self.logo_canvas.create_image(410 / 2, self.logo.height() / 2, anchor=CENTER, image=self.logo)  # Add the image to the canvas by calculating the x and y coordinates for centre position.
         self.logo_canvas.image = self.logo
@@ -1186,16 +1559,13 @@ class Completion:
 
         # Create the labels to be placed next to their relevant entry boxes.
         CTk.CTkLabel(completion_frame1, text="Quiz Complete!", font=(DEFAULT_FONT, 20, "bold"), text_color=FONT_COLOUR).grid(column=0, row=0, sticky=EW, padx=5, pady=(20,8))
-        CTk.CTkLabel(completion_frame1, text=f"Total Score: {self.quiz.score}/{question_amount}", font=(SEMIBOLD_DEFAULT_FONT, 16), text_color=FONT_COLOUR).grid(column=0, row=1, sticky=EW, padx=5)
-        CTk.CTkLabel(completion_frame1, text=f"Difficulty: {difficulty}", font=(SEMIBOLD_DEFAULT_FONT, 16), text_color=FONT_COLOUR).grid(column=0, row=2, sticky=EW, padx=5)
+        self.score_lbl = CTk.CTkLabel(completion_frame1, text="", font=(SEMIBOLD_DEFAULT_FONT, 16), text_color=FONT_COLOUR)       # Make empty labels for the results, which are filled in each time the page is shown (see "refresh_completion").
+        self.score_lbl.grid(column=0, row=1, sticky=EW, padx=5)
+        self.difficulty_lbl = CTk.CTkLabel(completion_frame1, text="", font=(SEMIBOLD_DEFAULT_FONT, 16), text_color=FONT_COLOUR)
+        self.difficulty_lbl.grid(column=0, row=2, sticky=EW, padx=5)
         self.total_time_lbl = CTk.CTkLabel(completion_frame1, text="", font=(SEMIBOLD_DEFAULT_FONT, 16), text_color=FONT_COLOUR)  # Make an empty label for the timer until the state of the timer is determined (enabled/disabled).
         self.total_time_lbl.grid(column=0, row=3, sticky=EW, padx=5, pady=(0,20))
 
-        if timer.get() == True:
-            self.total_time_lbl.configure(text=self.tools.timer_config("Completion", "Enable", None))  # Use the "timer_config" function to update the label text relative to the state of the timer.
-        if timer.get() == False:
-            self.total_time_lbl.configure(text=self.tools.timer_config("Completion", "Disable", None))  # Use the "timer_config" function to update the label text relative to the state of the timer.
-
         # Create a frame to place the buttons inside.
         button_frame = CTk.CTkFrame(self.main_content_frame, fg_color="transparent")
         button_frame.grid(column=0, row=2, sticky=EW, padx=20, pady=(5,0))
@@ -1243,7 +1613,8 @@ class Quiz:
         self.timer_active = False               # Variable to store the state of the timer, defaulting to False (off).
         self.answer_viewing_active = False      # Variable to store the state of the quiz (False indicating a standard quiz, True indicating that the user is viewing the answers), defaulting to False.
         self.retry_active = False               # Variable to store the state of the quiz (False indicating a standard quiz, True indicating a retried quiz), defaulting to False.
-        self.active_topic = None                # Variable to store the active question topic (either trigonometry or algebra), defaulting to "None".
+        self.active_renderer = None             # Variable to store the renderer of the question being shown (see "renderers"), defaulting to "None".
+        self.renderer_widgets = {}              # Dictionary to store the elements created for each renderer on the quiz page, which are kept and hidden (rather than destroyed) while questions of another renderer are shown.
         self.elapsed_time = 0                   # Variable to store the elapsed time, defaulting to 0.
         self.calculated_elapsed_time = 0        # Variable to store the calculated elapsed time, defaulting to 0.
         self.quiz_start_time = None             # Variable to store the start time of the quiz, defaulting to None.
@@ -1253,6 +1624,12 @@ class Quiz:
         self.total_time = "00:00:00"            # Variable to store the formatted total time, defaulting to "00:00:00".
         self.user_answers = []                  # Inalise a list to store the user's answers, defaulting to an empty list.
         self.quiz_save = []                     # Create empty list for completed quiz saves to be stored inside.
+        # Methods for setting up and updating the elements of each question layout, and the minimum heights of the rows of the question frame, keyed by the renderer named by each question topic (see "Topic" in the "AppData.QWhizz.engine" module).
+        self.renderers = {
+            "Text": (self.setup_text_question, self.update_text_question, (55, 50, 60)),
+            "Triangle": (self.setup_triangle_question, self.update_triangle_question, (165, 0, 0)),
+        }
+        self.quiz_recipe = None                 # Variable to store the recipe the quiz questions were generated from (see "make_recipe"), so that the quiz can be saved as its recipe rather than its questions, defaulting to None.
         self.final_score = "0/0"                # Variable to store the final score, defaulting to "0/0".
         self.score = 0                          # Variable to store the active score during the quiz, defaulting to 0.
 
@@ -1283,7 +1660,7 @@ class Quiz:
 
 
     def stop_timer(self, command, origin):
-        global use_trigonometry_questions, use_algebra_questions
+        global quiz_topics
         self.timer_active = False
         # Cancel the "after" job if it is currently still running.
         if hasattr(self, "timer_job") and self.timer_job != None:
@@ -1304,9 +1681,8 @@ class Quiz:
                     return
                 response1 = messagebox.askyesno("New Quiz", "Are you sure you want to start a new quiz?\nAll progress will be lost.", icon="warning")
                 if response1 == False: return
-                use_trigonometry_questions = enable_trigonometry.get()
-                use_algebra_questions = enable_algebra.get()
-                if use_trigonometry_questions == False and use_algebra_questions == False:
+                quiz_topics = self.tools.enabled_topic_names()
+                if quiz_topics == []:
                     response1 = messagebox.askyesno("No Question Topics Selected", "A new quiz cannot be started until a question topic is selected from the settings menu. Do you want to enable all question topics?", icon="warning")
                     if response1 == False: return
                     else: self.tools.save_details("New Quiz", "Quiz", None, SETTINGS_FILE_PATH) 
@@ -1351,16 +1727,10 @@ class Quiz:
         self.pause_start_time = time.time()  # Record the real-world time for when the pause started.
         self.pause_button.configure(command=lambda: self.tools.on_ctkbutton_click(self.pause_button, None, self.unpause_quiz), image=self.play_image)
         
-        # Create a pause overlay to visually block the quiz content until the quiz is unpaused.
-        height = self.question_frame.winfo_height() + self.answer_frame.winfo_height() + 10  # Get the total height of both frames (question and answer frames), including the height of padding.
-        self.pause_frame = CTk.CTkFrame(self.main_content_frame, fg_color=FRAME_FG, corner_radius=10)
-        self.pause_frame.grid(column=0, row=1, rowspan=2, sticky=EW, padx=20, pady=(5,0))
-        
-        # Set width for column 0 (1 total) and row 0 (1 total) in the pause frame.
-        self.pause_frame.columnconfigure(0, weight=0, minsize=410)
-        self.pause_frame.rowconfigure(0, weight=0, minsize=height)
-
-        CTk.CTkLabel(self.pause_frame, text="Quiz Paused", font=(DEFAULT_FONT, 20, "bold"), text_color=FONT_COLOUR).grid(column=0, row=0, columnspan=2, sticky=EW)
+        # Show the pause overlay (see "build_quiz") to visually block the quiz content until the quiz is unpaused.
+        height = self.question_frame.winfo_height() + self.answering_frames[1].winfo_height() + 10  # Get the total height of both frames (question and answer frames), including the height of padding.
+        self.pause_frame.rowconfigure(0, weight=0, minsize=height)  # Set height for row 0 (1 total) in the pause frame.
+        self.pause_frame.grid()
         
 
     def unpause_quiz(self):
@@ -1371,8 +1741,8 @@ class Quiz:
             self.total_paused_time += pause_duration
             self.pause_start_time = None  # Reset the pause start time tracker to be used again for the next pause.
         
-        # Remove the pause overlay and restore the pause button to its original command, then start the timer again.
-        self.pause_frame.destroy()
+        # Hide the pause overlay and restore the pause button to its original command, then start the timer again.
+        self.pause_frame.grid_remove()
         quiz_paused = False  # Set the flag to indicate that the quiz is unpaused.
         self.pause_button.configure(command=lambda: self.tools.on_ctkbutton_click(self.pause_button, None, self.pause_quiz), image=self.pause_image)
         self.start_timer()     
@@ -1381,6 +1751,7 @@ class Quiz:
     # Method for either retrying a saved quiz or viewing the answers of a saved quiz.
     def review_quiz(self, mode, origin, selection):
         global overwrite_score, ref_number, username, difficulty, difficulty_num, question_amount, question_details
+        if origin == "Scoreboard" and self.tools.scores_loading() == True: return  # Wait until every score has been loaded before a saved quiz is reviewed.
         if mode == "Retry":
             if origin == "Scoreboard":
                 if users == []:
@@ -1394,10 +1765,10 @@ class Quiz:
                         messagebox.showwarning("No Saved Quiz Selected", "Please select a saved quiz to retry.")
                         return
 
-                    for i, user in enumerate(users):
-                        if str(user[0]) == selection[0]:
-                            index = i
-                            break
+                    index = scoreboard_store.find_ref(users, selection[0])  # Find the index of the selected saved quiz (indexed for the SQLite store).
+                    quiz_save = self.tools.load_quiz_save(users[index])   # Load the saved questions of the selected quiz only (they are not kept in the "users" list).
+                    if quiz_save == None:
+                        return
                     
                     overwrite_score = True
                     self.retry_active = True
@@ -1406,12 +1777,13 @@ class Quiz:
                     ref_number = users[index][0]
                     username = users[index][1]
                     difficulty = users[index][2]
-                    difficulty_num = 0 if users[index][2] == "Easy" else 1 if users[index][2] == "Medium" else 2
+                    difficulty_num = 0 if users[index][2] == "Easy" else 1 if users[index][2] == "Medium" else 2 if users[index][2] == "Hard" else 3
                     question_amount = users[index][3]
 
-                    # For each question in the saved quiz from the "users" list, append the 6 elements of the question to the "question_details" list (this excludes the original user answer [7th element]).
-                    for question in users[index][6]:
-                        question_details.append(question[:6])
+                    # For each question in the saved quiz, append the question to the "question_details" list (this excludes the original user answer [7th element]).
+                    for question in quiz_save:
+                        question_details.append(Question.from_list(question))
+                    self.quiz_recipe = getattr(quiz_save, "recipe", None)  # Keep the recipe of the saved quiz (if it was saved as one), since the retried quiz has the same questions.
                     
                     self.tools.clear_widget(lambda: self.setup_quiz("Retry Quiz"), True, None, None, None, None)  # Clear all current widgets (passing "True" clears all widgets), then go to the quiz page.
             
@@ -1437,10 +1809,10 @@ class Quiz:
                         messagebox.showwarning("No Saved Quiz Selected", "Please select a saved quiz to view the answers of.")
                         return
 
-                    for i, user in enumerate(users):
-                        if str(user[0]) == selection[0]:
-                            index = i
-                            break
+                    index = scoreboard_store.find_ref(users, selection[0])  # Find the index of the selected saved quiz (indexed for the SQLite store).
+                    quiz_save = self.tools.load_quiz_save(users[index])   # Load the saved questions of the selected quiz only (they are not kept in the "users" list).
+                    if quiz_save == None:
+                        return
                     
                     self.answer_viewing_active = True
                     self.scoreboard.sel_reference_numbers.clear()  # Clear the selected reference numbers of the scoreboard's treeview widget to ensure a score has to be selected again before it can be managed when returning to the scoreboard.
@@ -1448,15 +1820,15 @@ class Quiz:
                     ref_number = users[index][0]
                     username = users[index][1]
                     difficulty = users[index][2]
-                    difficulty_num = 0 if users[index][2] == "Easy" else 1 if users[index][2] == "Medium" else 2
+                    difficulty_num = 0 if users[index][2] == "Easy" else 1 if users[index][2] == "Medium" else 2 if users[index][2] == "Hard" else 3
                     question_amount = users[index][3]
 
-                    # For each question in the saved quiz from the "users" list, append the 7 elements of the question to the "question_details" list (this includes the original user answer [7th element]).
-                    for question in users[index][6]:
-                        question_details.append(question[:7])
+                    # For each question in the saved quiz, append the question and the original user answer [7th element] to the "question_details" list.
+                    for question in quiz_save:
+                        question_details.append(AnsweredQuestion.from_list(question))
                         
                         # Create a list of the answers and shuffle them only once (as using the shuffle in "update_question" each time Next or Previous is pressed would result in the answers being arranged when going to the previous question).
-                        answer_choices = [question[4]] + question[5]
+                        answer_choices = question_details[-1].answer_choices()
                         random.shuffle(answer_choices)
                         self.all_answers.append(answer_choices)
                     
@@ -1469,7 +1841,7 @@ class Quiz:
 
                 # Create a list of the answers and shuffle them only once (as using the shuffle in "update_question" each time Next or Previous is pressed would result in the answers being arranged when going to the previous question).
                 for question in question_details:
-                    answer_choices = [question[4]] + question[5]
+                    answer_choices = question.answer_choices()
                     random.shuffle(answer_choices)
                     self.all_answers.append(answer_choices)
                 
@@ -1508,15 +1880,16 @@ class Quiz:
             self.timer_job = self.timer_lbl.after(1000, self.timer_loop)
 
 
-    # Method for setting up the algebra questions.
-    def setup_algebra(self):
-        self.inner_frame.rowconfigure(0, weight=0, minsize=55)
-        self.inner_frame.rowconfigure(1, weight=0, minsize=50)
-        self.inner_frame.rowconfigure(2, weight=0, minsize=60)
+    # Function for getting the renderer used to show a question, which is named by the question's topic. Questions of topics that aren't registered are shown as text.
+    def question_renderer(self, question):
+        topic = TOPIC_REGISTRY.get(question.topic)
+        return topic.renderer if topic != None else "Text"
 
-        self.active_topic = "Algebra"
-        self.current_statement = question_details[self.current_index][2]  # Define the current statement individually for either topic, since the statement datatype is different for both topics.
-        self.current_question = question_details[self.current_index][3]   # Define the current question individually for either topic, since the question datatype is different for both topics.
+
+    # Function for setting up questions written as text (e.g. algebra questions), returning the elements that are gridded in the question frame.
+    def setup_text_question(self):
+        self.current_statement = question_details[self.current_index].statement  # Define the current statement individually for either topic, since the statement datatype is different for both topics.
+        self.current_question = question_details[self.current_index].question    # Define the current question individually for either topic, since the question datatype is different for both topics.
 
         # Create a label for the title text.
         self.title_lbl = CTk.CTkLabel(self.inner_frame, text=self.current_title, font=(DEFAULT_FONT, 22, "bold"), text_color=FONT_COLOUR)
@@ -1529,59 +1902,37 @@ class Quiz:
         # Create a label for the question text.
         self.question_lbl = CTk.CTkLabel(self.inner_frame, text=self.current_question, font=(DEFAULT_FONT, 21, "bold"), text_color=FONT_COLOUR)
         self.question_lbl.grid(column=0, row=2, sticky=N)
-        return
+        return [self.title_lbl, self.statement_lbl, self.question_lbl]
 
 
-    # Method for setting up the trigonometry questions.
-    def setup_trigonometry(self):
-        self.inner_frame.rowconfigure(0, weight=0, minsize=165)
-        self.inner_frame.rowconfigure(1, weight=0, minsize=0)
-        self.inner_frame.rowconfigure(2, weight=0, minsize=0)
-
-        self.active_topic = "Trigonometry"
-        self.current_top_statement = question_details[self.current_index][2][0]     # Get the first value of the "question_statement" list within the "question_details" list.
-        self.current_bottom_statement = question_details[self.current_index][2][1]  # Get the second value of the "question_statement" list within the "question_details" list.
-        self.hypotenuse_value = question_details[self.current_index][3][0]  # Get the first value of the "question" list within the "question_details" list.
-        self.left_value = question_details[self.current_index][3][1]        # Get the second value of the "question" list within the "question_details" list.
-        self.bottom_value = question_details[self.current_index][3][2]      # Get the third value of the "question" list within the "question_details" list.
-        self.angle_value = question_details[self.current_index][3][3]       # Get the fourth value of the "question" list within the "question_details" list.
-
-        # Create a blank transparent image 200x160 px in size.
-        image = Image.new("RGBA", (200, 160), (0, 0, 0, 0))  # "RGBA" for RBG with transparency (A for alpha - transparency level), using (0 (Red), 0 (Green), 0 (Blue), 0 (Alpha)) for transparent background colour.
-        draw = ImageDraw.Draw(image)
-
-        # Coordinates of the right-angled triangle (at bottom-left corner).
-        # Triangle points: (x1, y1), (x2, y2), (x3, y3), with the zero point (0, 0) being the top left.
-        # Vertical line is from (65, 120) to (65, 20), horizontal line is from (190, 120) to (65, 120), and a hypotenuse connecting the top of the vertical line to the end of the horizontal line.
-        points = [(65, 120), (65, 20), (190, 120)]
-
-        # Draw triangle using lines.
-        draw.line([points[0], points[1]], fill="white", width=3)  # Draw a vertical line (opposite).
-        draw.line([points[2], points[0]], fill="white", width=3)  # Draw a horizontal line (adjacent).
-        draw.line([points[1], points[2]], fill="white", width=3)  # Draw a diagonal line (hypotenuse).
-
-        # Define the points for the right-angle square, which tucks into the bottom-left corner of the triangle.
-        square_size = 15
-        square_points = [
-            (points[0][0], points[0][1] - square_size),                # Move vertically up from the right-angle corner.
-            (points[0][0] + square_size, points[0][1] - square_size),  # Move diagonally up-right.
-            (points[0][0] + square_size, points[0][1])                 # Move horizontally right.
-        ]
-
-        # Draw the small square using two connected lines to represent the right-angle symbol.
-        draw.line([square_points[0], square_points[1]], fill="white", width=3)  # Top side of the square (horizontal).
-        draw.line([square_points[1], square_points[2]], fill="white", width=3)  # Right side of the square (vertical).
-
-        # Load the triangle image.
-        triangle_img = CTk.CTkImage(image, size=(200, 160))  # Create a CTkImage object with the image to allow scaling to be used. Define the size of the image with "size" (width, height).
+    # Method for updating the text question elements for the current question.
+    def update_text_question(self):
+        self.current_statement = question_details[self.current_index].statement  # Define the current statement individually for either topic, since the statement datatype is different for both topics.
+        self.current_question = question_details[self.current_index].question    # Define the current question individually for either topic, since the question datatype is different for both topics.
+        self.title_lbl.configure(text=self.current_title)
+        self.statement_lbl.configure(text=self.current_statement)
+        self.question_lbl.configure(text=self.current_question)
+
+
+    # Function for setting up questions shown with a right-angled triangle (e.g. trigonometry questions), returning the elements that are gridded in the question frame. The side and angle labels are placed on the triangle label, so they are hidden with it.
+    def setup_triangle_question(self):
+        self.current_top_statement = question_details[self.current_index].statement[0]     # Get the first value of the statement list of the current question.
+        self.current_bottom_statement = question_details[self.current_index].statement[1]  # Get the second value of the statement list of the current question.
+        self.hypotenuse_value = question_details[self.current_index].question[0]  # Get the first value of the question list of the current question.
+        self.left_value = question_details[self.current_index].question[1]        # Get the second value of the question list of the current question.
+        self.bottom_value = question_details[self.current_index].question[2]      # Get the third value of the question list of the current question.
+        self.angle_value = question_details[self.current_index].question[3]       # Get the fourth value of the question list of the current question.
+
+        # Get the triangle image, which is only drawn once for each scaling factor (see "DiagramCache"), since only the labels placed over it change between questions.
+        triangle_img = diagram_cache.ctk("Right Triangle", CTk.ScalingTracker.get_widget_scaling(self.inner_frame))
 
         # Create a label to display the image.
         self.triangle_lbl = CTk.CTkLabel(self.inner_frame, image=triangle_img, text=None)
         self.triangle_lbl.grid(row=0, column=0, sticky=E, padx=(0,20))
 
         # Create a label for the title text.
-        self.title_lbl = CTk.CTkLabel(self.inner_frame, text=self.current_title, font=(DEFAULT_FONT, 17, "bold"), text_color=FONT_COLOUR, justify=LEFT)
-        self.title_lbl.grid(column=0, row=0, sticky=NW, padx=(20,0), pady=(18,0))
+        self.triangle_title_lbl = CTk.CTkLabel(self.inner_frame, text=self.current_title, font=(DEFAULT_FONT, 17, "bold"), text_color=FONT_COLOUR, justify=LEFT)
+        self.triangle_title_lbl.grid(column=0, row=0, sticky=NW, padx=(20,0), pady=(18,0))
         
         # Create labels for the statement text regarding the question, placing the top statement after the bottom statement so that the top statement appears above the bottom statement.
         # Having seperate labels for multiple lines allows for adjustment of the line height too.
@@ -1605,7 +1956,39 @@ class Quiz:
         # Create a label for the triangle's angle value.
         self.angle_value_lbl = CTk.CTkLabel(self.triangle_lbl, text=self.angle_value, font=(DEFAULT_FONT, 16, "bold"), text_color=FONT_COLOUR)
         self.angle_value_lbl.place(relx=0.678, rely=0.658, anchor=CENTER)
-        return
+        return [self.triangle_lbl, self.triangle_title_lbl, self.bottom_statement_lbl, self.top_statement_lbl]
+
+
+    # Method for updating the triangle question elements for the current question.
+    def update_triangle_question(self):
+        self.current_top_statement = question_details[self.current_index].statement[0]     # Get the first value of the statement list of the current question.
+        self.current_bottom_statement = question_details[self.current_index].statement[1]  # Get the second value of the statement list of the current question.
+        self.hypotenuse_value = question_details[self.current_index].question[0]  # Get the first value of the question list of the current question.
+        self.left_value = question_details[self.current_index].question[1]        # Get the second value of the question list of the current question.
+        self.bottom_value = question_details[self.current_index].question[2]      # Get the third value of the question list of the current question.
+        self.angle_value = question_details[self.current_index].question[3]       # Get the fourth value of the question list of the current question.
+        self.triangle_title_lbl.configure(text=self.current_title)
+        self.top_statement_lbl.configure(text=self.current_top_statement)
+        self.bottom_statement_lbl.configure(text=self.current_bottom_statement)
+        self.hypotenuse_length_lbl.configure(text=self.hypotenuse_value)
+        self.left_length_lbl.configure(text=self.left_value)
+        self.bottom_length_lbl.configure(text=self.bottom_value)
+        self.angle_value_lbl.configure(text=self.angle_value)
+
+
+    # Method for showing the elements of a renderer in place of the elements of the renderer being shown. The elements are created the first time the renderer is used on the quiz page, and hidden with "grid_remove" (which remembers their grid options) rather than destroyed, so switching back only shows them again.
+    def show_renderer(self, renderer):
+        for widget in self.renderer_widgets.get(self.active_renderer, []):
+            widget.grid_remove()
+        setup_renderer, _, row_sizes = self.renderers[renderer]
+        for row, row_size in enumerate(row_sizes):
+            self.inner_frame.rowconfigure(row, weight=0, minsize=row_size)
+        if renderer in self.renderer_widgets:
+            for widget in self.renderer_widgets[renderer]:
+                widget.grid()
+        else:
+            self.renderer_widgets[renderer] = setup_renderer()
+        self.active_renderer = renderer
 
 
     # Method for updating the question and answer options for the current question.
@@ -1624,68 +2007,34 @@ class Quiz:
                 self.next_button.configure(text="Next")
         
         self.current_index = self.question_no - 1  # Remove 1 to correctly index from the "question_details" list (since lists start at index 0, but the question numbers start at 1).
-        self.upcoming_topic = question_details[self.current_index][0]
-        self.current_title = question_details[self.current_index][1]
-        self.correct_answer = question_details[self.current_index][4]
-        self.fake_answers = question_details[self.current_index][5]
-
-        if self.active_topic == "Algebra" and self.upcoming_topic == "Trigonometry":  # Check if the current topic is algebra and the next topic is trigonometry, so that the previous algebra elements can be removed.
-            self.title_lbl.destroy()
-            self.statement_lbl.destroy()
-            self.question_lbl.destroy()
-            self.setup_trigonometry()
-
-        elif self.active_topic == "Trigonometry" and self.upcoming_topic == "Algebra":  # Check if the current topic is trigonometry and the next topic is algebra, so that the previous trigonometry elements can be removed.
-            self.title_lbl.destroy()
-            self.top_statement_lbl.destroy()
-            self.bottom_statement_lbl.destroy()
-            self.triangle_lbl.destroy()
-            self.hypotenuse_length_lbl.destroy()
-            self.left_length_lbl.destroy()
-            self.bottom_length_lbl.destroy()
-            self.angle_value_lbl.destroy()
-            self.setup_algebra()
-        
-        elif self.active_topic == "Algebra" and self.upcoming_topic == "Algebra":  # Check if the current topic is algebra and the next topic is algebra, meaning no elements need to be removed.
-            self.current_statement = question_details[self.current_index][2]  # Define the current statement individually for either topic, since the statement datatype is different for both topics.
-            self.current_question = question_details[self.current_index][3]   # Define the current question individually for either topic, since the question datatype is different for both topics.
-            self.title_lbl.configure(text=self.current_title)
-            self.statement_lbl.configure(text=self.current_statement)
-            self.question_lbl.configure(text=self.current_question)
-        
-        elif self.active_topic == "Trigonometry" and self.upcoming_topic == "Trigonometry":  # Check if the current topic is trigonometry and the next topic is trigonometry, meaning no elements need to be removed.
-            self.current_top_statement = question_details[self.current_index][2][0]     # Get the first value of the "question_statement" list within the "question_details" list.
-            self.current_bottom_statement = question_details[self.current_index][2][1]  # Get the second value of the "question_statement" list within the "question_details" list.
-            self.hypotenuse_value = question_details[self.current_index][3][0]  # Get the first value of the "question" list within the "question_details" list.
-            self.left_value = question_details[self.current_index][3][1]        # Get the second value of the "question" list within the "question_details" list.
-            self.bottom_value = question_details[self.current_index][3][2]      # Get the third value of the "question" list within the "question_details" list.
-            self.angle_value = question_details[self.current_index][3][3]       # Get the fourth value of the "question" list within the "question_details" list.
-            self.top_statement_lbl.configure(text=self.current_top_statement)
-            self.bottom_statement_lbl.configure(text=self.current_bottom_statement)
-            self.hypotenuse_length_lbl.configure(text=self.hypotenuse_value)
-            self.left_length_lbl.configure(text=self.left_value)
-            self.bottom_length_lbl.configure(text=self.bottom_value)
-            self.angle_value_lbl.configure(text=self.angle_value)
+        self.current_title = question_details[self.current_index].title
+        self.correct_answer = question_details[self.current_index].answer
+        self.fake_answers = question_details[self.current_index].fake_answers
+
+        upcoming_renderer = self.question_renderer(question_details[self.current_index])
+        if upcoming_renderer != self.active_renderer:  # Check if the next question uses a different renderer to the current question, meaning its elements need to be shown in place of the current ones.
+            self.show_renderer(upcoming_renderer)
+        self.renderers[upcoming_renderer][1]()  # Update the text of the elements for the next question.
 
         if self.answer_viewing_active == True:
             self.ans_button_1.configure(text=f" A.    {self.all_answers[self.current_index][0]}", fg_color=BUTTON_FG, border_width=0, text_color_disabled=DISABLED_FONT_COLOUR)
             for widget in self.ans_button_1.place_slaves():
-                widget.place_forget()  # Clear any existing placed tick/cross images from button 1 for the next question so the new tick/cross image can be added later to the relevant button.
+                widget.destroy()  # Clear any existing placed tick/cross images from button 1 for the next question so the new tick/cross image can be added later to the relevant button. They are destroyed since the buttons are kept between quizzes.
             self.answer_management(self.ans_button_1, self.all_answers[self.current_index][0])  # Send the button name and the answer to the answer management method so that the specific button (self.ans_button_1) will be highlighted if it contains the correct or user-chosen incorrect answer.
             
             self.ans_button_2.configure(text=f" B.    {self.all_answers[self.current_index][1]}", fg_color=BUTTON_FG, border_width=0, text_color_disabled=DISABLED_FONT_COLOUR)
             for widget in self.ans_button_2.place_slaves():
-                widget.place_forget()  # Clear any existing placed tick/cross images from button 2 for the next question so the new tick/cross image can be added later to the relevant button.
+                widget.destroy()  # Clear any existing placed tick/cross images from button 2 for the next question so the new tick/cross image can be added later to the relevant button. They are destroyed since the buttons are kept between quizzes.
             self.answer_management(self.ans_button_2, self.all_answers[self.current_index][1])  # Send the button name and the answer to the answer management method so that the specific button (self.ans_button_2) will be highlighted if it contains the correct or user-chosen incorrect answer.
             
             self.ans_button_3.configure(text=f" C.    {self.all_answers[self.current_index][2]}", fg_color=BUTTON_FG, border_width=0, text_color_disabled=DISABLED_FONT_COLOUR)
             for widget in self.ans_button_3.place_slaves():
-                widget.place_forget()  # Clear any existing placed tick/cross images from button 3 for the next question so the new tick/cross image can be added later to the relevant button.
+                widget.destroy()  # Clear any existing placed tick/cross images from button 3 for the next question so the new tick/cross image can be added later to the relevant button. They are destroyed since the buttons are kept between quizzes.
             self.answer_management(self.ans_button_3, self.all_answers[self.current_index][2])  # Send the button name and the answer to the answer management method so that the specific button (self.ans_button_3) will be highlighted if it contains the correct or user-chosen incorrect answer.
             
             self.ans_button_4.configure(text=f" D.    {self.all_answers[self.current_index][3]}", fg_color=BUTTON_FG, border_width=0, text_color_disabled=DISABLED_FONT_COLOUR)
             for widget in self.ans_button_4.place_slaves():
-                widget.place_forget()  # Clear any existing placed tick/cross images from button 4 for the next question so the new tick/cross image can be added later to the relevant button.
+                widget.destroy()  # Clear any existing placed tick/cross images from button 4 for the next question so the new tick/cross image can be added later to the relevant button. They are destroyed since the buttons are kept between quizzes.
             self.answer_management(self.ans_button_4, self.all_answers[self.current_index][3])  # Send the button name and the answer to the answer management method so that the specific button (self.ans_button_4) will be highlighted if it contains the correct or user-chosen incorrect answer.
 
         else:
@@ -1721,13 +2070,13 @@ class Quiz:
         
             else:
                 self.current_index = self.question_no - 1  # Remove 1 to correctly index from the "question_details" list (since lists start at index 0, but the question numbers start at 1).
-                self.user_answer = question_details[self.current_index][6]
+                self.user_answer = question_details[self.current_index].user_answer
 
                 # Load the correct answer button image.
-                self.tick_image = CTk.CTkImage(Image.open("AppData/Images/tick.png"), size=(16, 17))  # Create a CTkImage object with the tick image to allow scaling to be used. Define the size of the image with "size" (width, height).
+                self.tick_image = image_assets.ctk("tick.png", (16, 17))  # Get the CTkImage object of the tick image (cached for each size, so the image is only decoded once). Define the size of the image with the size (width, height).
 
                 # Load the incorrect answer button image.
-                self.cross_image = CTk.CTkImage(Image.open("AppData/Images/cross.png"), size=(16, 17))  # Create a CTkImage object with the cross image to allow scaling to be used. Define the size of the image with "size" (width, height).
+                self.cross_image = image_assets.ctk("cross.png", (16, 17))  # Get the CTkImage object of the cross image.
 
                 # Check if the user answer was incorrect.
                 if self.user_answer != self.correct_answer:
@@ -1752,13 +2101,7 @@ class Quiz:
         else:
             self.current_index = self.question_no - 1  # Remove 1 to correctly index from the "question_details" list (since lists start at index 0, but the question numbers start at 1).
 
-            self.quiz_save.append([question_details[self.current_index][0],
-                                question_details[self.current_index][1],
-                                question_details[self.current_index][2],
-                                question_details[self.current_index][3],
-                                question_details[self.current_index][4],
-                                question_details[self.current_index][5],
-                                answer])
+            self.quiz_save.append(AnsweredQuestion(question_details[self.current_index], answer))  # Save the user's answer with a reference to the question, rather than copying the details of the question.
             
             if answer == self.correct_answer:  # Check if the most recent answer matches the correct answer for the current question.
                 self.score += 1 
@@ -1775,321 +2118,98 @@ class Quiz:
         return
 
 
-    # Method for generating the hard mode questions.
-    def hard_mode(self):
-        global question_details, temp_fake_answers
+    # Method for setting up a quiz and showing the quiz page, which is built the first time it is shown. The layout of the quiz's mode is shown and updated for each quiz (see "refresh_quiz").
+    def setup_quiz(self, scenario):
+        global quiz_paused
+        quiz_paused = False  # Set the flag to indicate that the quiz is not paused.
 
-        for i in range(question_amount):  # Loop through the number of questions to be generated.
-            if use_trigonometry_questions == True and use_algebra_questions == False:
-                question_topic = "Trigonometry"
-            elif use_trigonometry_questions == False and use_algebra_questions == True:
-                question_topic = "Algebra"
+        if scenario != "Restart Quiz" and scenario != "Retry Quiz" and scenario != "View Answers":  # Ensure that questions are not generated again when restarting or retrying the quiz.
+            # Generate the questions for the difficulty level of the quiz, using the enabled question topics.
+            question_topics = quiz_topics
+            prefetched_quiz = question_prefetcher.take(difficulty, question_topics, question_amount) if difficulty != ADAPTIVE else None  # Use the quiz generated ahead on the background thread if it was generated with these settings (the next quiz is then generated ahead for "New Quiz").
+            if prefetched_quiz != None:
+                seed, questions = prefetched_quiz
             else:
-                question_topic = random.choice(["Trigonometry", "Algebra"])
-            
-            if question_topic == "Trigonometry":
-                letter = "x"
-                angle_deg = 40  # Angle in degrees.
-                angle_rad = math.radians(angle_deg)  # Convert angle to radians to use in calculations.
-                formatted_angle = f"{angle_deg}\u00B0"
-                question_title = "Trigonometric\nRatios"
-
-                question_type = random.randint(0, 2)  # Generate a random number between 0 and 2 for the question type, which determines what side of the triangle the number is placed on.
-                side = "opposite" if question_type == 0 else "hypotenuse" if question_type == 1 else "adjacent"
-                statement_s1 = "Find the length"  # Set the question statement for section 1 (top).
-                statement_s2 = f"of the {side}:"  # Set the question statement for section 2 (bottom).
-                question_statement = [statement_s1, statement_s2]  # Create a list of the question statement sections.
-
-                # Question list order is [hypotenuse, left side, bottom side, angle].
-                # Make the hypotenuse the known side of the triangle, and the left side (opposite) the unknown side.
-                if question_type == 0:
-                    number1 = random.randint(6, 24)                            # Generate a random number between 6 and 24 for the hypotenuse of the triangle. This number has a higher threshold since the hypotenuse is always the longest side in right-angled triangles.
-                    question = [f"{number1} cm", letter, "", formatted_angle]  # Since there is no question, make the "question" a list with the values associated with the triangle.
-                    answer = number1 * math.sin(angle_rad)                     # Calculate the left side (opposite) using the sine of the angle.
-                # Make the bottom side (adjacent) the known side of the triangle, and the hypotenuse the unknown side.
-                elif question_type == 1:
-                    number1 = random.randint(4, 16)                            # Generate a random number between 4 and 16 for the left side of the triangle (opposite).
-                    question = [letter, "", f"{number1} cm", formatted_angle]  # Since there is no question, make the "question" a list with the values associated with the triangle.
-                    answer = number1 / math.cos(angle_rad)                     # Calculate the hypotenuse using the cosine of the angle.
-                # Make the left side (opposite) the known side of the triangle, and the bottom side (adjacent) the unknown side.
-                elif question_type == 2:
-                    number1 = random.randint(4, 16)                            # Generate a random number between 4 and 16 for the bottom side of the triangle (adjacent).
-                    question = ["", f"{number1} cm", letter, formatted_angle]  # Since there is no question, make the "question" a list with the values associated with the triangle.
-                    answer = number1 / math.tan(angle_rad)                     # Calculate the bottom side (adjacent) using the tangent of the angle.
-
-                formatted_answer = f"{str(int(answer)) if answer == int(answer) else '{:.2f}'.format(answer)} cm"  # Format the answer to 2 decimal places if it is a float (decimal number).
-
-                temp_fake_answers = []
-                while len(temp_fake_answers) < 3:  # Generate 3 fake answers for each question.
-                    if answer == int(answer):  # Check if the answer is an integer.
-                        offset = random.randint(1, 6)  # Generate a random offset between 1 and 6.
+                seed = random.getrandbits(64)  # Generate the questions from a random seed, so that the quiz can be saved as its recipe and generated again when it is reviewed.
+                if difficulty == ADAPTIVE:
+                    question_families, family_weights = accuracy_stats.adaptive_families(username, question_topics)  # Choose the difficulty of each topic from the user's accuracy statistics.
+                else:
+                    question_families = [(difficulty, topic) for topic in question_topics]
+                try:
+                    if difficulty == ADAPTIVE:
+                        questions = question_engine.generate_families(question_families, question_amount, seed, family_weights)
                     else:
-                        offset = random.uniform(1, 6)  # Generate a random decimal offset between 1 and 6.
-                    fake = answer + offset
-                    formatted_fake = f"{str(int(fake)) if fake == int(fake) else '{:.2f}'.format(fake)} cm"  # Format the answer to 2 decimal places if it is a float (decimal number).
-                    if formatted_fake != formatted_answer and formatted_fake not in temp_fake_answers:  # Check if the formatted fake answer is different from the correct answer and not already in the list of fake answers.
-                        temp_fake_answers.append(formatted_fake)  # Append each formatted fake answer to the fake answers list.
-            
-            elif question_topic == "Algebra":
-                letters = ["x", "y", "z", "a", "b", "c", "m", "n"]
-                question_title = "Binomial Expansion"
-                question_statement = "Expand the following:"
-                
-                # e.g. (x - 3)(x + 2) = ?.
-                letter = random.choice(letters)
-                number1 = random.choice([-1, 1]) * random.randint(1, 12)  # Generate a random number between 1 and 12, then multiply it by -1 or 1 to create a random number between -12 and 12.
-                number2 = random.choice([-1, 1]) * random.randint(1, 12)  # Generate a random number between 1 and 12, then multiply it by -1 or 1 to create a random number between -12 and 12.
-                # Create the question, using if statements to ensure that the number will have an addition sign if it isn't negative, or will have a negative sign if it is negative. ".removeprefix('-')" removes the original negative sign from the number if it is negative, so that a negative sign with spaces can be used instead.
-                question = f"({letter}{' + ' if not str(number1).startswith('-') else ' - '}{str(number1).removeprefix('-') if str(number1).startswith('-') else number1})({letter}{' + ' if not str(number2).startswith('-') else ' - '}{str(number2).removeprefix('-') if str(number2).startswith('-') else number2}) = ?"
+                        questions = question_engine.generate(difficulty, question_topics, question_amount, seed)
                 
-                section1 = f"{letter}\u00b2"  # Square the letter using the Unicode character for superscript 2 (\u00b2).
-                section2 = number2 + number1  # Combine the like terms, e.g. 2x + 3x = 5x.
-                section3 = number1 * number2  # Multiply the last terms, e.g. 2 * 3 = 6.
-
-                # If section 2 is 0, make "formatted_section2" an empty string. If it's -1, use just a negative letter for "formatted_section2".
-                # If it's 1, use just a positive letter for "formatted_section2". If it's not 0 or -1 or 1, use a positive sign with section 2 and the letter for "formatted_section2".
-                # Finally, if section 2 is negative, use a negative sign with section 2 and the letter for "formatted_section2".
-                formatted_section2 = f"" if section2 == 0 else f" - {letter}" if section2 == -1 else f" + {letter}" if section2 == 1 else f" + {section2}{letter}" if not str(section2).startswith("-") else f" - {str(section2).removeprefix('-')}{letter}"  # If section 2 is 1 or -1, use just the letter as the answer (this follows algebra rules where "1x" is the same as "x" and "-1x" is the same as "-x").
-                formatted_section3 = f" + {section3}" if not str(section3).startswith("-") else f" - {str(section3).removeprefix('-')}"  # If section 3 isn't negative, use a positive sign with section 3 for "formatted_section3". If section 3 is negative, use a negative sign with section 3 for "formatted_section3".
-                formatted_answer = f"{section1}{formatted_section2}{formatted_section3}"  # Combine the sections to create the answer.
-
-                temp_fake_answers = []
-                while len(temp_fake_answers) < 3:  # Generate 3 fake answers for each question.
-                    offset1 = random.choice([-1, 1]) * random.randint(2, 10)  # Generate a random offset between 2 and 10, then multiply it by -1 or 1 to create a random number between -10 and 10.
-                    offset2 = random.choice([-1, 1]) * random.randint(2, 10)  # Generate a random offset between 2 and 10, then multiply it by -1 or 1 to create a random number between -10 and 10.
-                    fake1 = section2 + offset1  # Add the offset to section 2 to create a fake answer.
-                    fake2 = section3 + offset2  # Add the offset to section 3 to create a fake answer.
-                    
-                    # If fake 1 is 0, make "formatted_fake1" an empty string. If it's -1, use just a negative letter for "formatted_fake1".
-                    # If it's 1, use just a positive letter for "formatted_fake1". If it's not 0 or -1 or 1, use a positive sign with fake 1 and the letter for "formatted_fake1".
-                    # Finally, if fake 1 is negative, use a negative sign with fake 1 and the letter for "formatted_fake1".
-                    formatted_fake1 = f"" if fake1 == 0 else f" - {letter}" if fake1 == -1 else f" + {letter}" if fake1 == 1 else f" + {fake1}{letter}" if not str(fake1).startswith("-") else f" - {str(fake1).removeprefix('-')}{letter}"
-                    formatted_fake2 = f"" if fake2 == 0 else f" + {fake2}" if not str(fake2).startswith("-") else f" - {str(fake2).removeprefix('-')}"
-                    complete_fake = f"{section1}{formatted_fake1}{formatted_fake2}"
-
-                    if complete_fake != formatted_answer and complete_fake not in temp_fake_answers:  # Check if the formatted fake answer is different from the correct answer and not already in the list of fake answers.
-                        temp_fake_answers.append(complete_fake)  # Append each formatted fake answer to the fake answers list.
-
-            # Append the question details to the question_details list.
-            question_details.append([question_topic, question_title, question_statement, question, formatted_answer, temp_fake_answers])
-        return
-    
+                # Error control for quizzes with more questions than can be generated without repeating one (e.g. with a question topic that has few different questions), staying on the current page.
+                except ValueError as error:
+                    limit = question_engine.question_limit(question_families)
+                    if limit != None:
+                        messagebox.showwarning("Too Many Questions", f"Only {limit} different questions can be generated for the {difficulty} difficulty with the enabled question topics, but {question_amount} were chosen. Please choose {limit} questions or fewer.")
+                    else:
+                        messagebox.showwarning("Too Many Questions", f"The questions for this quiz cannot be generated.\n\n{error}")
+                    return
+                self.tools.prefetch_quiz(difficulty, question_amount)
+            question_details.extend(Question.from_list(question) for question in questions)  # Store each question as a "Question" record, which uses less memory than a list.
+            self.quiz_recipe = make_recipe(difficulty, question_topics, question_amount, seed) if difficulty != ADAPTIVE else None  # Recipes only cover quizzes of one difficulty, so adaptive quizzes are saved as their questions.
 
-    # Method for generating the medium mode questions.
-    def medium_mode(self):
-        global question_details, temp_fake_answers
+        self.tools.show_page("Quiz", self.build_quiz, self.refresh_quiz)
 
-        for i in range(question_amount):  # Loop through the number of questions to be generated.
-            if use_trigonometry_questions == True and use_algebra_questions == False:
-                question_topic = "Trigonometry"
-            elif use_trigonometry_questions == False and use_algebra_questions == True:
-                question_topic = "Algebra"
-            else:
-                question_topic = random.choice(["Trigonometry", "Algebra"])
-            
-            if question_topic == "Trigonometry":
-                letter = "x"
-                question_title = "Pythagorean\nTheorem"
-
-                question_type = random.randint(0, 2)  # Generate a random number between 0 and 2 for the question type, which determines what sides of the triangle the two numbers are placed on.
-                side = "hypotenuse" if question_type == 0 else "adjacent" if question_type == 1 else "opposite"
-                statement_s1 = "Find the length"  # Set the question statement for section 1 (top).
-                statement_s2 = f"of the {side}:"  # Set the question statement for section 2 (bottom).
-                question_statement = [statement_s1, statement_s2]  # Create a list of the question statement sections.
-
-                # Question list order is [hypotenuse, left side, bottom side, angle(not used - set to None)].
-                # Make the hypotenuse the unknown side of the triangle.
-                if question_type == 0:
-                    number1 = random.randint(2, 12)                        # Generate a random number between 2 and 12 for the left side of the triangle (opposite).
-                    # Use "math.ceil" to round up the number to the nearest integer.
-                    min_num2 = math.ceil(number1*1.1)                      # Ensure the minimum number for the bottom side (adjacent) is larger than the left side (opposite) by at least 1.1x.
-                    number2 = random.randint(min_num2, min_num2+3)         # Generate a random number at least 1.1x larger than the left side, for the bottom side of the triangle (adjacent).
-                    question = [letter, f"{number1} cm", f"{number2} cm", None]  # Since there is no question, make the "question" a list with the values associated with the triangle.
-                    answer = math.sqrt(number1**2 + number2**2)            # Calculate the hypotenuse using Pythagorean theorem.
-                # Make the bottom side (adjacent) the unknown side of the triangle.
-                elif question_type == 1:
-                    number1 = random.randint(2, 12)                        # Generate a random number between 2 and 12 for the left side of the triangle (opposite).
-                    # Use "math.ceil" to round up the number to the nearest integer.
-                    min_num2 = math.ceil(number1*1.1)                      # Ensure the minimum number for the hypotenuse (hypotenuse) is larger than the left side (opposite) by at least 1.1x.
-                    number2 = random.randint(min_num2, min_num2+3)         # Generate a random number at least 1.1x larger than the left side, for the hypotenuse of the triangle.
-                    question = [f"{number2} cm", f"{number1} cm", letter, None]  # Since there is no question, make the "question" a list with the values associated with the triangle.
-                    answer = math.sqrt(number2**2 - number1**2)            # Calculate the bottom side (adjacent) using Pythagorean theorem.
-                # Make the left side (opposite) the unknown side of the triangle.
-                elif question_type == 2:
-                    number1 = random.randint(2, 12)                        # Generate a random number between 2 and 12 for the bottom side of the triangle (adjacent).
-                    # Use "math.ceil" to round up the number to the nearest integer.
-                    min_num2 = math.ceil(number1*1.1)                      # Ensure the minimum number for the hypotenuse is larger than the bottom side (adjacent) by at least 1.1x.
-                    number2 = random.randint(min_num2, min_num2+3)         # Generate a random number at least 1.1x larger than the bottom side, for the hypotenuse of the triangle.
-                    question = [f"{number2} cm", letter, f"{number1} cm", None]  # Since there is no question, make the "question" a list with the values associated with the triangle.
-                    answer = math.sqrt(number2**2 - number1**2)            # Calculate the left side (opposite) using Pythagorean theorem.
-
-                formatted_answer = f"{str(int(answer)) if answer == int(answer) else '{:.2f}'.format(answer)} cm"  # Format the answer to 2 decimal places if it is a float (decimal number).
-
-                temp_fake_answers = []
-                while len(temp_fake_answers) < 3:  # Generate 3 fake answers for each question.
-                    if answer == int(answer):  # Check if the answer is an integer.
-                        offset = random.randint(1, 6)  # Generate a random offset between 1 and 6.
-                    else:
-                        offset = random.uniform(1, 6)  # Generate a random decimal offset between 1 and 6.
-                    fake = answer + offset
-                    formatted_fake = f"{str(int(fake)) if fake == int(fake) else '{:.2f}'.format(fake)} cm"  # Format the answer to 2 decimal places if it is a float (decimal number).
-                    if formatted_fake != formatted_answer and formatted_fake not in temp_fake_answers:  # Check if the formatted fake answer is different from the correct answer and not already in the list of fake answers.
-                        temp_fake_answers.append(formatted_fake)  # Append each formatted fake answer to the fake answers list.
-            
-            elif question_topic == "Algebra":
-                letters = ['x', 'y', 'z', 'a', 'b', 'c', 'm', 'n']
-                letter = random.choice(letters)
-                question_title = "One Step Equations"
-                question_statement = f"Solve for {letter}:"
-                
-                question_type = random.randint(0, 3)
-                if question_type == 0:
-                    # e.g. a - 2 = 4 >> a = 6.
-                    number1 = random.randint(1, 20)  # Generate a random number between 1 and 20.
-                    number2 = random.randint(1, 50)  # Generate a random number between 1 and 50.
-                    question = f"{letter} - {number1} = {number2}"
-                    answer = number2+number1
-                elif question_type == 1:
-                    # e.g. a + 2 = 4 >> a = 2.
-                    number1 = random.randint(1, 20)  # Generate a random number between 1 and 20.
-                    number2 = random.randint(1, 50)  # Generate a random number between 1 and 50.
-                    question = f"{letter} + {number1} = {number2}"
-                    answer = number2-number1
-                elif question_type == 2:
-                    # e.g. 2a = 4 >> a = 2.
-                    number1 = random.randint(1, 10)  # Generate a random number between 1 and 10, since division is involved and a lower number will help maintain easiness.
-                    number2 = random.randint(number1, number1+10)  # Ensure that the second number to divide is greater than the first number, by making the minimum value as "number1" and the maximum value as "number1" + 10.
-                    question = f"{number1}{letter} = {number2}"
-                    answer = number2/number1
-                elif question_type == 3:
-                    # e.g. a / 2 = 4 >> a = 8.
-                    number1 = random.randint(1, 12)  # Generate a random number between 1 and 12, since multiplication is involved and a lower number will help maintain easiness.
-                    number2 = random.randint(1, 12)  # Generate a random number between 1 and 12, since multiplication is involved and a lower number will help maintain easiness.
-                    question = f"{letter} / {number1} = {number2}"
-                    answer = number2*number1
-
-                formatted_answer = str(int(answer)) if answer == int(answer) else "{:.2f}".format(answer)  # Format the answer to 2 decimal places if it is a float (decimal number).
-
-                temp_fake_answers = []
-                while len(temp_fake_answers) < 3:   # Generate 3 fake answers for each question.
-                    if answer == int(answer):  # Check if the answer is an integer.
-                        offset = random.choice([-1, 1]) * random.randint(1, 8)  # Generate a random offset between 2 and 10, then multiply it by -1 or 1 to create a random number between -10 and 10.
-                    else:
-                        offset = random.choice([-1, 1]) * random.uniform(1, 6)  # Generate a random decimal offset between 2 and 8, then multiply it by -1 or 1 to create a random number between -8 and 8.
-                    fake = answer + offset
-                    formatted_fake = str(int(fake)) if fake == int(fake) else "{:.2f}".format(fake)  # Format the answer to 2 decimal places if it is a float (decimal number).
-                    if formatted_fake != formatted_answer and formatted_fake not in temp_fake_answers:  # Check if the formatted fake answer is different from the correct answer and not already in the list of fake answers.
-                        temp_fake_answers.append(formatted_fake)  # Append each formatted fake answer to the fake answers list.
-
-            # Append the question details to the question_details list.
-            question_details.append([question_topic, question_title, question_statement, question, formatted_answer, temp_fake_answers])
-        return
 
+    # Method for refreshing the quiz page each time a quiz is shown, showing the layout of the quiz's mode (answering or viewing answers) and updating it for the first question.
+    # The layouts of both modes are built once (see "build_quiz") and hidden with "grid_remove" while the other mode is shown, so only their values change between quizzes.
+    def refresh_quiz(self):
+        # Setting the main window geometry (size) before the quiz content is shown ensures the window doesn't glitch between sizes.
+        main_window.geometry("758x434")  # Final size calculated based on the window size seen after the elements are all created.
 
-    # Method for generating the easy mode questions.
-    def easy_mode(self):
-        global question_details, temp_fake_answers
+        main_window.config(menu=self.quiz_menubar)
 
-        for i in range(question_amount):  # Loop through the number of questions to be generated.
-            if use_trigonometry_questions == True and use_algebra_questions == False:
-                question_topic = "Trigonometry"
-            elif use_trigonometry_questions == False and use_algebra_questions == True:
-                question_topic = "Algebra"
-            else:
-                question_topic = random.choice(["Trigonometry", "Algebra"])
-
-            if question_topic == "Trigonometry":
-                question_title = "Area of Triangles"
-                statement_s1 = "Find the area"     # Set the question statement for section 1 (top).
-                statement_s2 = "of the triangle:"  # Set the question statement for section 2 (bottom).
-                question_statement = [statement_s1, statement_s2]  # Create a list of the question statement sections.
-
-                number1 = random.randint(2, 12)                        # Generate a random number between 2 and 12 for the left side of the triangle (opposite).
-                # Use "math.ceil" to round up the number to the nearest integer.
-                min_num2 = math.ceil(number1*1.1)                      # Ensure the minimum number for the bottom side (adjacent) is larger than the left side (opposite) by at least 1.1x.
-                number2 = random.randint(min_num2, min_num2+3)         # Generate a random number at least 1.1x larger than the left side, for the adjacent side of the triangle.
-                # Question list order is [hypotenuse (not used - set to None), left side, bottom side, angle (not used - set to None)].
-                question = [None, f"{number1} cm", f"{number2} cm", None]  # Since there is no question, make the "question" a list with the values associated with the triangle.
-                answer = (number1*number2)/2                           # Calculate the area of the triangle.
-
-                formatted_answer = f"{str(int(answer)) if answer == int(answer) else '{:.2f}'.format(answer)} cm"  # Format the answer to 2 decimal places if it is a float (decimal number).
-
-                temp_fake_answers = []
-                while len(temp_fake_answers) < 3:   # Generate 3 fake answers for each question.
-                    if answer == int(answer):  # Check if the answer is an integer.
-                        offset = random.randint(1, 6)  # Generate a random offset between 1 and 6.
-                    else:
-                        offset = random.uniform(1, 6)  # Generate a random decimal offset between 1 and 6.
-                    fake = answer + offset
-                    formatted_fake = f"{str(int(fake)) if fake == int(fake) else '{:.2f}'.format(fake)} cm"  # Format the answer to 2 decimal places if it is a float (decimal number).
-                    if formatted_fake != formatted_answer and formatted_fake not in temp_fake_answers:  # Check if the formatted fake answer is different from the correct answer and not already in the list of fake answers.
-                        temp_fake_answers.append(formatted_fake)  # Append each formatted fake answer to the fake answers list.
-
-            elif question_topic == "Algebra":
-                letters = ["x", "y", "z", "a", "b", "c", "m", "n"]
-                letter = random.choice(letters)
-                question_title = "Like Terms"
-                question_statement = "Simplify the following:"
-                
-                question_type = random.randint(0, 1)
-                if question_type == 0:
-                    # e.g. 2x - 4x - 6x = ?.
-                    number1 = random.randint(1, 12)  # Generate a random number between 1 and 12.
-                    number2 = random.randint(1, 12)  # Generate a random number between 1 and 12.
-                    number3 = random.randint(1, 12)  # Generate a random number between 1 and 12.
-                    question = f"{number1 if number1 != 1 else ''}{letter} - {number2 if number2 != 1 else ''}{letter} - {number3 if number3 != 1 else ''}{letter} = ?"  # If any numbers are 1 then only include the letter beside those numbers.
-                    answer = number1-number2-number3
-                elif question_type == 1:
-                    # e.g. 2x + 4x + 6x = ?.
-                    number1 = random.randint(1, 12)  # Generate a random number between 1 and 12.
-                    number2 = random.randint(1, 12)  # Generate a random number between 1 and 12.
-                    number3 = random.randint(1, 12)  # Generate a random number between 1 and 12.
-                    question = f"{number1 if number1 != 1 else ''}{letter} + {number2 if number2 != 1 else ''}{letter} + {number3 if number3 != 1 else ''}{letter} = ?"  # If any numbers are 1 then only include the letter beside those numbers.
-                    answer = number1+number2+number3
-
-                # For instances where the answer is 1 or -1, use just the letter as the answer (this follows algebra rules where "1x" is the same as "x" and "-1x" is the same as "-x").
-                if answer == 1:
-                    formatted_answer = f"{letter}"
-                elif answer == -1:
-                    formatted_answer = f"-{letter}"
-                else:
-                    formatted_answer = f"{answer}{letter}"
-
-                temp_fake_answers = []
-                while len(temp_fake_answers) < 3:  # Generate 3 fake answers for each question.
-                    offset = random.choice([-1, 1]) * random.randint(2, 10)  # Generate a random offset between 2 and 10, then multiply it by -1 or 1 to create a random number between -10 and 10.
-                    fake = answer + offset
-                    # If the fake answer is 1 or -1, use just the letter as the formatted fake answer (this follows algebra rules where "1x" is the same as "x" and "-1x" is the same as "-x").
-                    # If it is 0, use just the number as the formatted fake answer. If it is not 1, -1, or 0, use the number and letter as the formatted fake answer.
-                    formatted_fake = f"{letter}" if fake == 1 else f"-{letter}" if fake == -1 else f"{fake}" if fake == 0 else f"{fake}{letter}"
-                    if formatted_fake != formatted_answer and formatted_fake not in temp_fake_answers:  # Check if the formatted fake answer is different from the correct answer and not already in the list of fake answers.
-                        temp_fake_answers.append(formatted_fake)  # Append each formatted fake answer to the fake answers list.
-
-            # Append the question details to the question_details list.
-            question_details.append([question_topic, question_title, question_statement, question, formatted_answer, temp_fake_answers])
-        return
+        # Bind key shortcuts to perform actions.
+        main_window.bind("<Control-r>", lambda e: self.stop_timer("Restart Quiz", "Quiz"))  # Bind Ctrl+R to restart the quiz.
+        main_window.bind("<Control-n>", lambda e: self.stop_timer("New Quiz", "Quiz"))      # Bind Ctrl+N to start a new quiz.
+        main_window.bind("<Escape>", lambda e: self.exit_quiz("Scoreboard" if self.answer_viewing_active == True or self.retry_active == True else "Home", "Quiz"))              # Bind Escape to exit the quiz and return to the home page.
+        self.binded_keys = ["<Control-r>", "<Control-n>", "<Escape>"]                       # Create a list of binded keys to be used later for unbinding them when the user goes to a different page.
 
+        # Show the frames of the quiz's mode in place of the frames of the other mode.
+        shown_frames, hidden_frames = (self.viewing_frames, self.answering_frames) if self.answer_viewing_active == True else (self.answering_frames, self.viewing_frames)
+        for frame in hidden_frames:
+            frame.grid_remove()
+        for frame in shown_frames:
+            frame.grid()
+        self.pause_frame.grid_remove()  # Hide the pause overlay, since the last quiz may have been exited while paused.
 
-    # Procedure for setting up the UI elements consisting of images, labels, entry boxes, sliders (scales), and buttons.
-    def setup_quiz(self, scenario):
-        global quiz_paused, banners_loaded
-        quiz_paused = False  # Set the flag to indicate that the quiz is not paused.
+        if self.answer_viewing_active == True:
+            # Use the question number label and disabled answer buttons of the answer viewing layout.
+            self.question_no_lbl = self.viewing_question_no_lbl
+            self.ans_button_1, self.ans_button_2, self.ans_button_3, self.ans_button_4 = self.viewing_answer_buttons
 
-        if scenario != "Restart Quiz" and scenario != "Retry Quiz" and scenario != "View Answers":  # Ensure that questions are not generated again when restarting or retrying the quiz.
-            # Set the difficulty level of the quiz.
-            if difficulty == "Easy":
-                self.easy_mode()
-            elif difficulty == "Medium":
-                self.medium_mode()
-            elif difficulty == "Hard":
-                self.hard_mode()
-
-        # Setting the main window geometry (size) before element creation ensures the window doesn't glitch between sizes.
-        main_window.geometry("758x434")  # Final size calculated based on the window size seen after the elements are all created.
+        else:
+            # Use the question number label and answer buttons of the answering layout.
+            self.question_no_lbl = self.answering_question_no_lbl
+            self.ans_button_1, self.ans_button_2, self.ans_button_3, self.ans_button_4 = self.answering_answer_buttons
+
+            # Restore the pause button to its original command and image, since the last quiz may have been exited while paused.
+            self.pause_button.configure(command=lambda: self.tools.on_ctkbutton_click(self.pause_button, None, self.pause_quiz), image=self.pause_image, fg_color=BUTTON_FG)
+            if timer.get() == True:
+                self.timer_lbl.configure(text=self.tools.timer_config("Quiz", "Enable", None))
+            elif timer.get() == False:
+                self.timer_lbl.configure(text=self.tools.timer_config("Quiz", "Disable", None))
 
-        # Set width for columns 0-1 (2 total) in the main window. Positive weight means the column will expand to fill the available space.
-        main_window.columnconfigure(0, weight=1, minsize=0)
-        main_window.columnconfigure(1, weight=1, minsize=450)
+        self.question_no_lbl.configure(text=f"Question: {self.question_no}/{question_amount}")
+        self.update_question()  # Show the first question and its answer options (the elements of each renderer are kept between quizzes, see "show_renderer").
+
+        if self.answer_viewing_active == False:
+            self.start_timer()  # Only start the timer if answer viewing is not active (False), since the timer does not need to be used when viewing quiz answers.
+
+
+    # Method for building the quiz page inside its page frame, which is only done the first time it is shown.
+    # The frames of the answering and answer viewing layouts are both created here, and "refresh_quiz" shows the frames of each quiz's mode.
+    def build_quiz(self, page_frame):
+        self.page_frame = page_frame
+
+        # Set width for columns 0-1 (2 total) in the page frame. Positive weight means the column will expand to fill the available space.
+        page_frame.columnconfigure(0, weight=1, minsize=0)
+        page_frame.columnconfigure(1, weight=1, minsize=450)
 
         # Set up the menu bar.
         quiz_menubar = Menu(main_window)  # Create a new menu bar.
@@ -2108,8 +2228,7 @@ class Quiz:
         timer_settings.add_radiobutton(label="Disabled", variable=timer, command=lambda: self.tools.timer_config("Quiz Menubar", "Disable", self.tools.save_details(None, "Menubar", None, SETTINGS_FILE_PATH)), value=False)     # Use lambda so that the method is called only when the radiobutton is clicked, rather than when it's defined.
         question_settings = Menu(quiz_menubar, tearoff=0, activebackground=MENU_HOVER, activeforeground=MENU_ACTIVE_FG)
         settings_menu.add_cascade(menu=question_settings, label="Question Topics")
-        question_settings.add_checkbutton(label="Trigonometry", variable=enable_trigonometry, command=lambda: self.tools.save_details(None, "Menubar", None, SETTINGS_FILE_PATH))
-        question_settings.add_checkbutton(label="Algebra", variable=enable_algebra, command=lambda: self.tools.save_details(None, "Menubar", None, SETTINGS_FILE_PATH))
+        self.tools.add_topic_checkbuttons(question_settings)
         history_settings = Menu(quiz_menubar, tearoff=0, activebackground=MENU_HOVER, activeforeground=MENU_ACTIVE_FG)
         settings_menu.add_cascade(menu=history_settings, label="Score Deletion History States")
         history_settings.add_radiobutton(label="Disabled", variable=deletion_history_states, value=0, command=lambda: self.tools.save_details(None, "Menubar", None, SETTINGS_FILE_PATH))
@@ -2119,182 +2238,127 @@ class Quiz:
 
         help_menu = Menu(quiz_menubar, tearoff=0, activebackground=MENU_HOVER, activeforeground=MENU_ACTIVE_FG)
         quiz_menubar.add_cascade(label="Help", menu=help_menu)
-        origin = "Quiz Answers" if self.answer_viewing_active == True else "Quiz"  # Documentation file opening command and about window utilises pause functionality when a quiz is active, so the origin needs to be something other than "Quiz" for this to not be used (since the answer viewing mode cannot be paused).
-        help_menu.add_command(label="Documentation", command=lambda: self.tools.open_file(origin, documentation_path, "readme.pdf"))
-        help_menu.add_command(label="About", command=lambda: self.about.setup_about(origin))
-
-        main_window.config(menu=quiz_menubar)
-
-        # Bind key shortcuts to perform actions.
-        main_window.bind("<Control-r>", lambda e: self.stop_timer("Restart Quiz", "Quiz"))  # Bind Ctrl+R to restart the quiz.
-        main_window.bind("<Control-n>", lambda e: self.stop_timer("New Quiz", "Quiz"))      # Bind Ctrl+N to start a new quiz.
-        main_window.bind("<Escape>", lambda e: self.exit_quiz("Scoreboard" if self.answer_viewing_active == True or self.retry_active == True else "Home", "Quiz"))              # Bind Escape to exit the quiz and return to the home page.
-        self.binded_keys = ["<Control-r>", "<Control-n>", "<Escape>"]                       # Create a list of binded keys to be used later for unbinding them when the user goes to a different page.
+        # Documentation file opening command and about window utilises pause functionality when a quiz is active, so the origin needs to be something other than "Quiz" for this to not be used (since the answer viewing mode cannot be paused).
+        # The origin is checked when the menu item is clicked, since the menu bar is kept between quizzes.
+        help_menu.add_command(label="Documentation", command=lambda: self.tools.open_file("Quiz Answers" if self.answer_viewing_active == True else "Quiz", documentation_path, "readme.pdf"))
+        help_menu.add_command(label="About", command=lambda: self.about.setup_about("Quiz Answers" if self.answer_viewing_active == True else "Quiz"))
+        self.quiz_menubar = quiz_menubar  # Keep the menu bar, so that it is shown again each time the page is shown.
 
-        if banners_loaded == False:
-            # Banner creation (left side).
-            lbanner_canvas = Canvas(main_window, bg=MAIN_WINDOW_BG, bd=0, highlightthickness=0)  # Create a canvas for the banner image.
-            lbanner_canvas.grid(column=0, row=0, sticky=EW, padx=(20, 0), pady=27)
-            lbanner = Image.open("AppData/Images/lbanner.png")
-            lbanner = ImageTk.PhotoImage(lbanner)
-            lbanner_canvas.configure(width=lbanner.width()+2, height=lbanner.height())  # Add 2 pixels to width to prevent image clipping on the right of image.
-            lbanner_canvas.create_image(lbanner.width() / 2, lbanner.height() / 2, anchor=CENTER, image=lbanner)  # Add the image to the canvas by calculating the x and y coordinates for centre position.
-            lbanner_canvas.image = lbanner
-
-            # Banner creation (right side).
-            rbanner_canvas = Canvas(main_window, bg=MAIN_WINDOW_BG, bd=0, highlightthickness=0)  # Create a canvas for the banner image.
-            rbanner_canvas.grid(column=2, row=0, sticky=EW, padx=(0, 20), pady=27)
-            rbanner = Image.open("AppData/Images/rbanner.png")
-            rbanner = ImageTk.PhotoImage(rbanner)
-            rbanner_canvas.configure(width=rbanner.width()+2, height=rbanner.height())  # Add 2 pixels to width to prevent image clipping on the left of image.
-            rbanner_canvas.create_image(rbanner.width() / 2, rbanner.height() / 2, anchor=CENTER, image=rbanner)  # Add the image to the canvas by calculating the x and y coordinates for centre position.
-            rbanner_canvas.image = rbanner
-
-            banners_loaded = True
+        self.tools.create_banners(page_frame)  # Create the banners on the left and right of the page.
 
         # Set up the main content frame to place the main quiz frames and elements inside.
-        self.main_content_frame = CTk.CTkFrame(main_window, fg_color="transparent")
+        self.main_content_frame = CTk.CTkFrame(page_frame, fg_color="transparent")
         self.main_content_frame.grid(column=1, row=0, sticky=EW, padx=35, pady=(24,25))
 
-        # Set up a content frame to place the top quiz elements inside.
-        quiz_dtls_frame1 = CTk.CTkFrame(self.main_content_frame, fg_color=FRAME_FG, corner_radius=10)
-        quiz_dtls_frame1.grid(column=0, row=0, sticky=EW, padx=20, pady=(0,5))
-        
-        if self.answer_viewing_active == True:
-            # Set width for columns 0-2 (3 total) in quiz details frame 1. Total minimum column width is 410px.
-            quiz_dtls_frame1.columnconfigure(0, weight=0, minsize=190)
-            quiz_dtls_frame1.columnconfigure(1, weight=0, minsize=110)
-            quiz_dtls_frame1.columnconfigure(2, weight=0, minsize=110)
-            
-            # Create the labels and pause button to be placed at the top of the quiz page.
-            self.question_no_lbl = CTk.CTkLabel(quiz_dtls_frame1, text=f"Question: {self.question_no}/{question_amount}", font=(DEFAULT_FONT, 14, "bold"), text_color=FONT_COLOUR)
-            self.question_no_lbl.grid(column=0, row=0, pady=10, sticky=NSEW)
-            
-            self.reviewing_btn_sizes = [100, 30, 14]  # Specify the sizing to be used for buttons (width, height, font size).
+        # Set up a content frame to place the top quiz elements of the answer viewing layout inside.
+        viewing_dtls_frame = CTk.CTkFrame(self.main_content_frame, fg_color=FRAME_FG, corner_radius=10)
+        viewing_dtls_frame.grid(column=0, row=0, sticky=EW, padx=20, pady=(0,5))
 
-            self.previous_button = CTk.CTkButton(quiz_dtls_frame1, text="Previous", command=lambda: self.tools.on_ctkbutton_click(self.previous_button, None, lambda: self.answer_management(self.previous_button, None)),
-                                              width=self.reviewing_btn_sizes[0], height=self.reviewing_btn_sizes[1], corner_radius=7.5, fg_color=BUTTON_FG, hover=None, state="disabled", font=(DEFAULT_FONT, self.reviewing_btn_sizes[2], "bold"), text_color=FONT_COLOUR, text_color_disabled=DISABLED_FONT_COLOUR)
-            self.previous_button.grid(column=1, row=0, padx=(0,10), pady=10)
-            
-            self.next_button = CTk.CTkButton(quiz_dtls_frame1, text="Next", command=lambda: self.tools.on_ctkbutton_click(self.next_button, None, lambda: self.answer_management(self.next_button, None)),
-                                          width=self.reviewing_btn_sizes[0], height=self.reviewing_btn_sizes[1], corner_radius=7.5, fg_color=BUTTON_FG, hover=None, font=(DEFAULT_FONT, self.reviewing_btn_sizes[2], "bold"), text_color=FONT_COLOUR)
-            self.next_button.grid(column=2, row=0, padx=(0,10), pady=10)
-            self.next_button.bind("<Enter>", lambda e: self.tools.on_ctkbutton_enter(self.next_button))  # Bind the "Enter" event to the "on_ctkbutton_enter" method so that the button changes to a darker colour when the mouse hovers over it.
-        
-        else:
-            # Set width for columns 0-2 (3 total) in quiz details frame 1. Total minimum column width is 410px.
-            quiz_dtls_frame1.columnconfigure(0, weight=0, minsize=185)
-            quiz_dtls_frame1.columnconfigure(1, weight=0, minsize=40)
-            quiz_dtls_frame1.columnconfigure(2, weight=0, minsize=185)
+        # Set width for columns 0-2 (3 total) in the viewing details frame. Total minimum column width is 410px.
+        viewing_dtls_frame.columnconfigure(0, weight=0, minsize=190)
+        viewing_dtls_frame.columnconfigure(1, weight=0, minsize=110)
+        viewing_dtls_frame.columnconfigure(2, weight=0, minsize=110)
 
-            # Load the pause button image.
-            self.pause_image = CTk.CTkImage(Image.open("AppData/Images/pause.png"), size=(16, 17))  # Create a CTkImage object with the pause image to allow scaling to be used. Define the size of the image with "size" (width, height).
+        # Create the label and buttons to be placed at the top of the quiz page when viewing answers.
+        self.viewing_question_no_lbl = CTk.CTkLabel(viewing_dtls_frame, text="", font=(DEFAULT_FONT, 14, "bold"), text_color=FONT_COLOUR)
+        self.viewing_question_no_lbl.grid(column=0, row=0, pady=10, sticky=NSEW)
 
-            # Load the play button image.
-            self.play_image = CTk.CTkImage(Image.open("AppData/Images/play.png"), size=(16, 17))  # Create a CTkImage object with the play image to allow scaling to be used. Define the size of the image with "size" (width, height).
+        self.reviewing_btn_sizes = [100, 30, 14]  # Specify the sizing to be used for buttons (width, height, font size).
 
-            # Create the labels and pause button to be placed at the top of the quiz page.
-            self.question_no_lbl = CTk.CTkLabel(quiz_dtls_frame1, text=f"Question: {self.question_no}/{question_amount}", font=(DEFAULT_FONT, 14, "bold"), text_color=FONT_COLOUR)
-            self.question_no_lbl.grid(column=0, row=0, pady=10, sticky=NSEW)
-            
-            self.pause_btn_sizes = [40, 30, 14]  # Specify the sizing to be used for buttons (width, height, font size).
+        self.previous_button = CTk.CTkButton(viewing_dtls_frame, text="Previous", command=lambda: self.tools.on_ctkbutton_click(self.previous_button, None, lambda: self.answer_management(self.previous_button, None)),
+                                          width=self.reviewing_btn_sizes[0], height=self.reviewing_btn_sizes[1], corner_radius=7.5, fg_color=BUTTON_FG, hover=None, state="disabled", font=(DEFAULT_FONT, self.reviewing_btn_sizes[2], "bold"), text_color=FONT_COLOUR, text_color_disabled=DISABLED_FONT_COLOUR)
+        self.previous_button.grid(column=1, row=0, padx=(0,10), pady=10)
 
-            self.pause_button = CTk.CTkButton(quiz_dtls_frame1, text=None, command=lambda: self.tools.on_ctkbutton_click(self.pause_button, None, self.pause_quiz),
-                                              width=self.pause_btn_sizes[0], height=self.pause_btn_sizes[1], corner_radius=7.5, image=self.pause_image, fg_color=BUTTON_FG, hover=None, font=(DEFAULT_FONT, self.pause_btn_sizes[2], "bold"), text_color=FONT_COLOUR)
-            self.pause_button.grid(column=1, row=0, pady=10)
-            self.pause_button.bind("<Enter>", lambda e: self.tools.on_ctkbutton_enter(self.pause_button))  # Bind the "Enter" event to the "on_ctkbutton_enter" method so that the button changes to a darker colour when the mouse hovers over it.
-            
-            self.timer_lbl = CTk.CTkLabel(quiz_dtls_frame1, text="", font=(DEFAULT_FONT, 14, "bold"), text_color=FONT_COLOUR)  # Make an empty label for the timer until the state of the timer is determined (enabled/disabled).
-            self.timer_lbl.grid(column=2, row=0, pady=10, sticky=NSEW)
-            if timer.get() == True:
-                self.timer_lbl.configure(text=self.tools.timer_config("Quiz", "Enable", None))
-            elif timer.get() == False:
-                self.timer_lbl.configure(text=self.tools.timer_config("Quiz", "Disable", None))
+        self.next_button = CTk.CTkButton(viewing_dtls_frame, text="Next", command=lambda: self.tools.on_ctkbutton_click(self.next_button, None, lambda: self.answer_management(self.next_button, None)),
+                                      width=self.reviewing_btn_sizes[0], height=self.reviewing_btn_sizes[1], corner_radius=7.5, fg_color=BUTTON_FG, hover=None, font=(DEFAULT_FONT, self.reviewing_btn_sizes[2], "bold"), text_color=FONT_COLOUR)
+        self.next_button.grid(column=2, row=0, padx=(0,10), pady=10)
+        self.next_button.bind("<Enter>", lambda e: self.tools.on_ctkbutton_enter(self.next_button))  # Bind the "Enter" event to the "on_ctkbutton_enter" method so that the button changes to a darker colour when the mouse hovers over it.
+
+        # Set up a content frame to place the top quiz elements of the answering layout inside, in the same place as the viewing details frame.
+        answering_dtls_frame = CTk.CTkFrame(self.main_content_frame, fg_color=FRAME_FG, corner_radius=10)
+        answering_dtls_frame.grid(column=0, row=0, sticky=EW, padx=20, pady=(0,5))
+
+        # Set width for columns 0-2 (3 total) in the answering details frame. Total minimum column width is 410px.
+        answering_dtls_frame.columnconfigure(0, weight=0, minsize=185)
+        answering_dtls_frame.columnconfigure(1, weight=0, minsize=40)
+        answering_dtls_frame.columnconfigure(2, weight=0, minsize=185)
+
+        # Load the pause button image.
+        self.pause_image = image_assets.ctk("pause.png", (16, 17))  # Get the CTkImage object of the pause image (cached for each size, so the image is only decoded once). Define the size of the image with the size (width, height).
+
+        # Load the play button image.
+        self.play_image = image_assets.ctk("play.png", (16, 17))  # Get the CTkImage object of the play image.
+
+        # Create the labels and pause button to be placed at the top of the quiz page when answering.
+        self.answering_question_no_lbl = CTk.CTkLabel(answering_dtls_frame, text="", font=(DEFAULT_FONT, 14, "bold"), text_color=FONT_COLOUR)
+        self.answering_question_no_lbl.grid(column=0, row=0, pady=10, sticky=NSEW)
 
-        # Create a frame for the question label or question image.
+        self.pause_btn_sizes = [40, 30, 14]  # Specify the sizing to be used for buttons (width, height, font size).
+
+        self.pause_button = CTk.CTkButton(answering_dtls_frame, text=None, command=lambda: self.tools.on_ctkbutton_click(self.pause_button, None, self.pause_quiz),
+                                          width=self.pause_btn_sizes[0], height=self.pause_btn_sizes[1], corner_radius=7.5, image=self.pause_image, fg_color=BUTTON_FG, hover=None, font=(DEFAULT_FONT, self.pause_btn_sizes[2], "bold"), text_color=FONT_COLOUR)
+        self.pause_button.grid(column=1, row=0, pady=10)
+        self.pause_button.bind("<Enter>", lambda e: self.tools.on_ctkbutton_enter(self.pause_button))  # Bind the "Enter" event to the "on_ctkbutton_enter" method so that the button changes to a darker colour when the mouse hovers over it.
+
+        self.timer_lbl = CTk.CTkLabel(answering_dtls_frame, text="", font=(DEFAULT_FONT, 14, "bold"), text_color=FONT_COLOUR)  # Make an empty label for the timer until the state of the timer is determined (enabled/disabled) for each quiz.
+        self.timer_lbl.grid(column=2, row=0, pady=10, sticky=NSEW)
+
+        # Create a frame for the question label or question image, which is shared by both layouts.
         self.question_frame = CTk.CTkFrame(self.main_content_frame, fg_color=FRAME_FG, corner_radius=10)
         self.question_frame.grid(column=0, row=1, sticky=EW, padx=20, pady=5)
-        
-        # Set width for column 0 (1 total) and row 0 (1 total) in quiz details frame 1.
+
+        # Set width for column 0 (1 total) and rows 0-1 (2 total) in the question frame.
         self.question_frame.columnconfigure(0, weight=0, minsize=410)
         self.question_frame.rowconfigure(0, weight=0, minsize=50)
         self.question_frame.rowconfigure(1, weight=0, minsize=155)
 
+        # The elements of each renderer are created inside the inner frame the first time a question of that renderer is shown, and kept for every quiz after that (see "show_renderer").
         self.inner_frame = CTk.CTkFrame(self.question_frame, fg_color="#78b0f4", corner_radius=10)
         self.inner_frame.grid(column=0, row=0, rowspan=2, padx=20)
         self.inner_frame.columnconfigure(0, weight=0, minsize=370)
 
-        self.upcoming_topic = question_details[self.current_index][0]
-        self.current_title = question_details[self.current_index][1]
-        self.correct_answer = question_details[self.current_index][4]
-        self.fake_answers = question_details[self.current_index][5]
+        # Create a frame for the disabled answer buttons of the answer viewing layout, which are highlighted to show the stored user answer and the correct answer (see "answer_management").
+        viewing_answer_frame = CTk.CTkFrame(self.main_content_frame, fg_color="transparent")
+        viewing_answer_frame.grid(column=0, row=2, sticky=EW, padx=20, pady=(5,0))
 
-        # Set up the main question GUI contents depending on the topic.
-        if self.upcoming_topic == "Trigonometry":
-            self.setup_trigonometry()
-        elif self.upcoming_topic == "Algebra":
-            self.setup_algebra()
+        # Set width for columns 0-1 (2 total) in the viewing answer frame. Total minimum column width is 410px.
+        viewing_answer_frame.columnconfigure(0, weight=0, minsize=205)
+        viewing_answer_frame.columnconfigure(1, weight=0, minsize=205)
 
-        # Create a frame for the answer buttons.
-        self.answer_frame = CTk.CTkFrame(self.main_content_frame, fg_color="transparent")
-        self.answer_frame.grid(column=0, row=2, sticky=EW, padx=20, pady=(5,0))
-        
-        # Set width for columns 0-1 (2 total) in the answer frame. Total minimum column width is 410px.
-        self.answer_frame.columnconfigure(0, weight=0, minsize=205)
-        self.answer_frame.columnconfigure(1, weight=0, minsize=205)
-
-        if self.answer_viewing_active == True:
-            # Create the disabled answer buttons, which automatically send their value to answer management (using invoke) to identify what button displays the stored user answer and the correct answer.
-            self.ans_button_1 = CTk.CTkButton(self.answer_frame, text=f" A.    {self.all_answers[self.current_index][0]}", font=(DEFAULT_FONT, 16, "bold"), text_color=FONT_COLOUR,
-                                       anchor=W, width=200, height=40, corner_radius=10, fg_color=BUTTON_FG, hover=None, state="disabled", text_color_disabled=DISABLED_FONT_COLOUR)
-            self.ans_button_1.grid(column=0, row=0, padx=(0, 5), pady=(0,5))
-            self.answer_management(self.ans_button_1, self.all_answers[self.current_index][0])  # Send the button name and the answer to the answer management method so that the specific button (self.ans_button_1) will be highlighted if it contains the correct or user-chosen incorrect answer.
-            
-            self.ans_button_2 = CTk.CTkButton(self.answer_frame, text=f" B.    {self.all_answers[self.current_index][1]}", font=(DEFAULT_FONT, 16, "bold"), text_color=FONT_COLOUR,
-                                       anchor=W, width=200, height=40, corner_radius=10, fg_color=BUTTON_FG, hover=None, state="disabled", text_color_disabled=DISABLED_FONT_COLOUR)
-            self.ans_button_2.grid(column=1, row=0, padx=(5, 0), pady=(0,5))
-            self.answer_management(self.ans_button_2, self.all_answers[self.current_index][1])  # Send the button name and the answer to the answer management method so that the specific button (self.ans_button_2) will be highlighted if it contains the correct or user-chosen incorrect answer.
-            
-            self.ans_button_3 = CTk.CTkButton(self.answer_frame, text=f" C.    {self.all_answers[self.current_index][2]}", font=(DEFAULT_FONT, 16, "bold"), text_color=FONT_COLOUR,
+        self.viewing_answer_buttons = []
+        for column, row in ((0, 0), (1, 0), (0, 1), (1, 1)):
+            ans_button = CTk.CTkButton(viewing_answer_frame, text="", font=(DEFAULT_FONT, 16, "bold"), text_color=FONT_COLOUR,
                                        anchor=W, width=200, height=40, corner_radius=10, fg_color=BUTTON_FG, hover=None, state="disabled", text_color_disabled=DISABLED_FONT_COLOUR)
-            self.ans_button_3.grid(column=0, row=1, padx=(0, 5), pady=(5,0))
-            self.answer_management(self.ans_button_3, self.all_answers[self.current_index][2])  # Send the button name and the answer to the answer management method so that the specific button (self.ans_button_3) will be highlighted if it contains the correct or user-chosen incorrect answer.
-            
-            self.ans_button_4 = CTk.CTkButton(self.answer_frame, text=f" D.    {self.all_answers[self.current_index][3]}", font=(DEFAULT_FONT, 16, "bold"), text_color=FONT_COLOUR,
-                                       anchor=W, width=200, height=40, corner_radius=10, fg_color=BUTTON_FG, hover=None, state="disabled", text_color_disabled=DISABLED_FONT_COLOUR)
-            self.ans_button_4.grid(column=1, row=1, padx=(5, 0), pady=(5,0))
-            self.answer_management(self.ans_button_4, self.all_answers[self.current_index][3])  # Send the button name and the answer to the answer management method so that the specific button (self.ans_button_4) will be highlighted if it contains the correct or user-chosen incorrect answer.
-        
-        else:
-            # Create a list of the answers and shuffle them.
-            answer_choices = [self.correct_answer] + self.fake_answers
-            random.shuffle(answer_choices)
+            ans_button.grid(column=column, row=row, padx=(0, 5) if column == 0 else (5, 0), pady=(0,5) if row == 0 else (5,0))
+            self.viewing_answer_buttons.append(ans_button)
 
-            # Create the answer buttons.
-            self.ans_btn_sizes = [200, 40, 16]  # Specify the sizing to be used for buttons (width, height, font size).
+        # Create a frame for the answer buttons of the answering layout, in the same place as the viewing answer frame. The answers and commands of the buttons are set for each question (see "update_question").
+        answering_answer_frame = CTk.CTkFrame(self.main_content_frame, fg_color="transparent")
+        answering_answer_frame.grid(column=0, row=2, sticky=EW, padx=20, pady=(5,0))
 
-            self.ans_button_1 = CTk.CTkButton(self.answer_frame, text=f" A.    {answer_choices[0]}", command=lambda: self.tools.on_ctkbutton_click(self.ans_button_1, None, lambda: self.answer_management(self.ans_button_1, answer_choices[0])),
-                                       anchor=W, width=self.ans_btn_sizes[0], height=self.ans_btn_sizes[1], corner_radius=10, fg_color=BUTTON_FG, hover=None, font=(DEFAULT_FONT, self.ans_btn_sizes[2], "bold"), text_color=FONT_COLOUR)
-            self.ans_button_1.grid(column=0, row=0, padx=(0, 5), pady=(0,5))
-            self.ans_button_1.bind("<Enter>", lambda e: self.tools.on_ctkbutton_enter(self.ans_button_1))  # Bind the "Enter" event to the "on_ctkbutton_enter" method so that the button changes to a darker colour when the mouse hovers over it.
+        # Set width for columns 0-1 (2 total) in the answering answer frame. Total minimum column width is 410px.
+        answering_answer_frame.columnconfigure(0, weight=0, minsize=205)
+        answering_answer_frame.columnconfigure(1, weight=0, minsize=205)
 
-            self.ans_button_2 = CTk.CTkButton(self.answer_frame, text=f" B.    {answer_choices[1]}", command=lambda: self.tools.on_ctkbutton_click(self.ans_button_2, None, lambda: self.answer_management(self.ans_button_2, answer_choices[1])),
-                                       anchor=W, width=self.ans_btn_sizes[0], height=self.ans_btn_sizes[1], corner_radius=10, fg_color=BUTTON_FG, hover=None, font=(DEFAULT_FONT, self.ans_btn_sizes[2], "bold"), text_color=FONT_COLOUR)
-            self.ans_button_2.grid(column=1, row=0, padx=(5, 0), pady=(0,5))
-            self.ans_button_2.bind("<Enter>", lambda e: self.tools.on_ctkbutton_enter(self.ans_button_2))  # Bind the "Enter" event to the "on_ctkbutton_enter" method so that the button changes to a darker colour when the mouse hovers over it.
+        self.ans_btn_sizes = [200, 40, 16]  # Specify the sizing to be used for buttons (width, height, font size).
 
-            self.ans_button_3 = CTk.CTkButton(self.answer_frame, text=f" C.    {answer_choices[2]}", command=lambda: self.tools.on_ctkbutton_click(self.ans_button_3, None, lambda: self.answer_management(self.ans_button_3, answer_choices[2])),
-                                       anchor=W, width=self.ans_btn_sizes[0], height=self.ans_btn_sizes[1], corner_radius=10, fg_color=BUTTON_FG, hover=None, font=(DEFAULT_FONT, self.ans_btn_sizes[2], "bold"), text_color=FONT_COLOUR)
-            self.ans_button_3.grid(column=0, row=1, padx=(0, 5), pady=(5,0))
-            self.ans_button_3.bind("<Enter>", lambda e: self.tools.on_ctkbutton_enter(self.ans_button_3))  # Bind the "Enter" event to the "on_ctkbutton_enter" method so that the button changes to a darker colour when the mouse hovers over it.
+        self.answering_answer_buttons = []
+        for column, row in ((0, 0), (1, 0), (0, 1), (1, 1)):
+            ans_button = CTk.CTkButton(answering_answer_frame, text="", anchor=W, width=self.ans_btn_sizes[0], height=self.ans_btn_sizes[1], corner_radius=10, fg_color=BUTTON_FG, hover=None, font=(DEFAULT_FONT, self.ans_btn_sizes[2], "bold"), text_color=FONT_COLOUR)
+            ans_button.grid(column=column, row=row, padx=(0, 5) if column == 0 else (5, 0), pady=(0,5) if row == 0 else (5,0))
+            ans_button.bind("<Enter>", lambda e, button=ans_button: self.tools.on_ctkbutton_enter(button))  # Bind the "Enter" event to the "on_ctkbutton_enter" method so that the button changes to a darker colour when the mouse hovers over it.
+            self.answering_answer_buttons.append(ans_button)
 
-            self.ans_button_4 = CTk.CTkButton(self.answer_frame, text=f" D.    {answer_choices[3]}", command=lambda: self.tools.on_ctkbutton_click(self.ans_button_4, None, lambda: self.answer_management(self.ans_button_4, answer_choices[3])),
-                                       anchor=W, width=self.ans_btn_sizes[0], height=self.ans_btn_sizes[1], corner_radius=10, fg_color=BUTTON_FG, hover=None, font=(DEFAULT_FONT, self.ans_btn_sizes[2], "bold"), text_color=FONT_COLOUR)
-            self.ans_button_4.grid(column=1, row=1, padx=(5, 0), pady=(5,0))
-            self.ans_button_4.bind("<Enter>", lambda e: self.tools.on_ctkbutton_enter(self.ans_button_4))  # Bind the "Enter" event to the "on_ctkbutton_enter" method so that the button changes to a darker colour when the mouse hovers over it.
+        self.answering_frames = [answering_dtls_frame, answering_answer_frame]  # The frames shown when answering a quiz.
+        self.viewing_frames = [viewing_dtls_frame, viewing_answer_frame]        # The frames shown when viewing the answers of a quiz.
 
-        if self.answer_viewing_active == False:
-            self.start_timer()  # Only start the timer if answer viewing is not active (False), since the timer does not need to be used when viewing quiz answers.
+        # Create the pause overlay, which is shown over the question and answer frames to visually block the quiz content while the quiz is paused (see "pause_quiz").
+        # It is created after those frames so that it is stacked above them.
+        self.pause_frame = CTk.CTkFrame(self.main_content_frame, fg_color=FRAME_FG, corner_radius=10)
+        self.pause_frame.grid(column=0, row=1, rowspan=2, sticky=EW, padx=20, pady=(5,0))
+        self.pause_frame.columnconfigure(0, weight=0, minsize=410)  # Set width for column 0 (1 total) in the pause frame.
+        CTk.CTkLabel(self.pause_frame, text="Quiz Paused", font=(DEFAULT_FONT, 20, "bold"), text_color=FONT_COLOUR).grid(column=0, row=0, columnspan=2, sticky=EW)
+        self.pause_frame.grid_remove()
 
 
 
@@ -2321,10 +2385,14 @@ class Home:
                 difficulty = "Medium"
                 color = "#ffdf9f"
                 hover_color = "#d8ba8b"
-            else:
+            elif value == 2:
                 difficulty = "Hard"
                 color = "#f37272"
                 hover_color = "#d36565"
+            else:
+                difficulty = ADAPTIVE  # Adaptive quizzes choose the difficulty of each question topic from the user's previous answers.
+                color = "#c6a4f5"
+                hover_color = "#a98bd8"
             return ([difficulty, color, hover_color])
         if slider_id == "S2":
             return (f"{int(value)} Questions")
@@ -2337,8 +2405,35 @@ class Home:
                 self.difficulty_slider.configure(button_color=self.process_slider_value(slider_id, value)[1], 
                                                  progress_color=self.process_slider_value(slider_id, value)[1], 
                                                  button_hover_color=self.process_slider_value(slider_id, value)[2])
+                self.limit_questions_slider()
         if slider_id == "S2":
             self.question_amnt_lbl.configure(text=self.process_slider_value(slider_id, value))
+        self.tools.prefetch_quiz(self.process_slider_value("S1", self.difficulty_slider.get())[0], int(self.questions_slider.get()))  # Generate the quiz for the new slider values on the background thread, so that it is ready when the quiz is started.
+
+
+    # Function for getting the number of different questions that can be generated for the chosen difficulty and the enabled question topics (all topics if none are enabled), or None if there is no limit.
+    # Adaptive quizzes use the difficulty of each topic chosen for the entered username.
+    def question_limit(self):
+        quiz_difficulty = self.process_slider_value("S1", self.difficulty_slider.get())[0]
+        question_topics = self.tools.enabled_topic_names() or list(TOPIC_REGISTRY)
+        if quiz_difficulty == ADAPTIVE:
+            question_families = accuracy_stats.adaptive_families(self.username_entry.get().strip() if self.username_entry != None else "", question_topics)[0]
+        else:
+            question_families = [(quiz_difficulty, topic) for topic in question_topics]
+        return question_engine.question_limit(question_families)
+
+
+    # Procedure for limiting the questions slider to the number of different questions that can be generated (see "question_limit"), so that a quiz can't ask for more questions than there are.
+    # Called whenever the difficulty or question topics change.
+    def limit_questions_slider(self):
+        lowest, highest = self.question_range
+        limit = self.question_limit()
+        if limit != None:
+            highest = max(lowest + 1, min(highest, limit))  # The slider needs at least 2 values. Quizzes with too few questions available are reported when they are started.
+        self.questions_slider.configure(to=highest, number_of_steps=highest - lowest)
+        if self.questions_slider.get() > highest:
+            self.questions_slider.set(highest)
+            self.question_amnt_lbl.configure(text=self.process_slider_value("S2", highest))
 
 
     # Method to insert the chosen option from the autocomplete.
@@ -2347,17 +2442,81 @@ class Home:
         self.username_entry.insert(0, e)
 
 
-    # Procedure for setting up the UI elements consisting of images, labels, entry boxes, sliders (scales), and buttons.
+    # Procedure for showing the home page, which is built the first time it is shown and has the user details updated each time after that.
     def setup_homepage(self):
-        global users, deiconify_reqd, banners_loaded
+        self.tools.show_page("Home", self.build_homepage, self.refresh_homepage)
+
 
-        # Setting the main window geometry (size) before element creation ensures the window doesn't glitch between sizes.
+    # Procedure for refreshing the home page each time it is shown, updating the username entry and sliders (scales) with the previously recorded values (used for going from scoreboard back to homepage).
+    def refresh_homepage(self):
+        global deiconify_reqd
+
+        # Setting the main window geometry (size) before the page is shown ensures the window doesn't glitch between sizes.
         main_window.geometry("758x434")  # Final size calculated based on the window size seen after the elements are all created.
+        main_window.config(menu=self.home_menubar)
+        self.tools.clear_widget(None, False, self.home_frame1, 2, 0, None)  # Clear any error label left from the last visit (passing "False" means the program will rely on the specified element, column, and row to clear the widgets from).
 
-        # Set width for columns 0-1 (2 total) in the main window. Positive weight means the column will expand to fill the available space.
-        main_window.columnconfigure(0, weight=1, minsize=0)
-        main_window.columnconfigure(1, weight=1, minsize=450)
-        main_window.columnconfigure(2, weight=1, minsize=0)
+        self.setup_username_entry()
+        if self.entry_type == "CTkEntry":  # Check if the username entry is an entry box, as combo boxes don't support the "insert" method but entry boxes do.
+            self.username_entry.delete(0, END)
+            if username != None:
+                self.username_entry.insert(0, username)
+        elif self.entry_type == "CTkComboBox":  # Check if the username entry is a combo box, as entry boxes don't support the "set" method but combo boxes do.
+            self.username_entry.set(username if username != None else "")
+        self.difficulty_slider.set(difficulty_num if difficulty_num != None else self.default_slider_values[0])  # Use the starting value of the slider if there is no previously recorded value.
+        self.questions_slider.set(question_amount if question_amount != None else self.default_slider_values[1])
+
+        # Update the labels next to the sliders with their relevant values.
+        self.slider_label_update("S1", self.difficulty_slider.get())
+        self.slider_label_update("S2", self.questions_slider.get())
+
+        if deiconify_reqd == True:   # Check if deiconify is required, which is True when the main window is first created on program start. 
+            main_window.deiconify()  # Show the main window after all elements are created to prevent flickering of the window before the UI is set up.
+            deiconify_reqd = False   # Set the flag to False so that the main window is not deiconified again when the Home page is shown again.
+
+
+    # Procedure for setting up the username entry, which is either an entry box if there are no usernames saved, or a combo box if there are usernames saved. This prevents the user from trying to open a combo box dropdown when there are no usernames saved.
+    # The entry is only created again if it needs to change between an entry box and a combo box, otherwise the usernames of the combo box are updated.
+    def setup_username_entry(self):
+        self.display_usernames = [user[1] for user in users]  # Get the usernames from the users list.
+        self.processed = []  # Create an empty list to store one instance of each username, ensuring that there are no duplicates.
+        # Create a list of usernames that are unique regardless of casing (e.g., "Jack" and "JACK" are treated as the same username - "jack"), using ".lower" so that all pr usernames are converted to lowercase.
+        # Only the first occurrence of each lowercase name is included in "unique_display_usernames", as all lowercase versions are added to the "processed" list to find duplicates.
+        self.unique_display_usernames = [name for name in self.display_usernames if not (name.lower() in self.processed or self.processed.append(name.lower()))]  # Usernames included in "unique_display_usernames" are ones that are not already in the "processed" list. If they aren't in the "processed" list, add them to the list to prevent future duplicates.
+
+        entry_type = "CTkEntry" if self.unique_display_usernames == [] else "CTkComboBox"  # Check if the usernames list is empty.
+        if self.username_entry != None and self.entry_type == entry_type:
+            if entry_type == "CTkComboBox":
+                self.dropdown.configure(values=self.unique_display_usernames)  # Update the values of the combo box with the usernames of the users in the users list (user[1]).
+            return
+        if self.username_entry != None:
+            self.username_entry.destroy()  # The dropdown of a combo box is destroyed along with it.
+
+        if entry_type == "CTkEntry":
+            self.username_entry = CTk.CTkEntry(self.home_frame1, fg_color="#73ace0", border_color="#6aa5db", text_color=FONT_COLOUR, corner_radius=10)
+            self.username_entry.insert(0, "")
+            self.entry_type = "CTkEntry"
+        else:
+            # Setup combo box.
+            self.username_entry = CTk.CTkComboBox(self.home_frame1, fg_color="#73ace0", border_color="#6aa5db", button_color="#6aa5db", button_hover_color="#5997d5", text_color=FONT_COLOUR, corner_radius=10)
+            self.username_entry.set("")
+            self.entry_type = "CTkComboBox"
+            # Attach the scrollable dropdown library to the username entry combo box.
+            self.dropdown = CTkScrollableDropdown(self.username_entry, values=[""], justify="left", button_color="transparent", fg_color="#73ace0", bg_color=FRAME_FG, frame_border_color="#6aa5db", frame_corner_radius=10,
+                                                  scrollbar_button_color="#5997d5", scrollbar_button_hover_color="#497caf", hover_color=MENU_HOVER, text_color=FONT_COLOUR, autocomplete=True)
+            self.dropdown.configure(values=self.unique_display_usernames)  # Set the values of the combo box to the usernames of the users in the users list (user[1]).
+            # CTkScrollableDropdown library utilises "transient()" to stay on top, so after creating the combo box again (when the usernames saved change from none to some), the main window needs to be focused. 
+            # If this isn't done, the focus will go back to the dropdown and prevent interaction with the combo box entry section, stopping users from being able to type inside it.
+            main_window.focus_force()  # Focus the main window to ensure interaction with the combo box entry section.
+        self.username_entry.grid(column=1, row=0, padx=5, pady=(20,0), sticky=EW)
+
+
+    # Procedure for building the home page inside its page frame, consisting of images, labels, entry boxes, sliders (scales), and buttons. This is only done the first time it is shown.
+    def build_homepage(self, page_frame):
+        # Set width for columns 0-1 (2 total) in the page frame. Positive weight means the column will expand to fill the available space.
+        page_frame.columnconfigure(0, weight=1, minsize=0)
+        page_frame.columnconfigure(1, weight=1, minsize=450)
+        page_frame.columnconfigure(2, weight=1, minsize=0)
 
         # Set up the menu bar.
         home_menubar = Menu(main_window)
@@ -2370,8 +2529,7 @@ class Home:
         timer_settings.add_radiobutton(label="Disabled", variable=timer, value=False, command=lambda: self.tools.save_details(None, "Menubar", None, SETTINGS_FILE_PATH))
         question_settings = Menu(home_menubar, tearoff=0, activebackground=MENU_HOVER, activeforeground=MENU_ACTIVE_FG)
         settings_menu.add_cascade(menu=question_settings, label="Question Topics")
-        question_settings.add_checkbutton(label="Trigonometry", variable=enable_trigonometry, command=lambda: self.tools.save_details(None, "Menubar", None, SETTINGS_FILE_PATH))
-        question_settings.add_checkbutton(label="Algebra", variable=enable_algebra, command=lambda: self.tools.save_details(None, "Menubar", None, SETTINGS_FILE_PATH))
+        self.tools.add_topic_checkbuttons(question_settings)
         history_settings = Menu(home_menubar, tearoff=0, activebackground=MENU_HOVER, activeforeground=MENU_ACTIVE_FG)
         settings_menu.add_cascade(menu=history_settings, label="Score Deletion History States")
         history_settings.add_radiobutton(label="Disabled", variable=deletion_history_states, value=0, command=lambda: self.tools.save_details(None, "Menubar", None, SETTINGS_FILE_PATH))
@@ -2383,39 +2541,18 @@ class Home:
         home_menubar.add_cascade(label="Help", menu=help_menu)
         help_menu.add_command(label="Documentation", command=lambda: self.tools.open_file("Home", documentation_path, "readme.pdf"))
         help_menu.add_command(label="About", command=lambda: self.about.setup_about("Home"))
+        self.home_menubar = home_menubar  # Keep the menu bar, so that it is shown again each time the page is shown.
 
-        main_window.config(menu=home_menubar)
-
-        if banners_loaded == False:
-            # Banner creation (left side).
-            lbanner_canvas = Canvas(main_window, bg=MAIN_WINDOW_BG, bd=0, highlightthickness=0)  # Create a canvas for the banner image.
-            lbanner_canvas.grid(column=0, row=0, sticky=EW, padx=(20, 0), pady=27)
-            lbanner = Image.open("AppData/Images/lbanner.png")
-            lbanner = ImageTk.PhotoImage(lbanner)
-            lbanner_canvas.configure(width=lbanner.width()+2, height=lbanner.height())  # Add 2 pixels to width to prevent image clipping on the right of image.
-            lbanner_canvas.create_image(lbanner.width() / 2, lbanner.height() / 2, anchor=CENTER, image=lbanner)  # Add the image to the canvas by calculating the x and y coordinates for centre position.
-            lbanner_canvas.image = lbanner
-
-            # Banner creation (right side).
-            rbanner_canvas = Canvas(main_window, bg=MAIN_WINDOW_BG, bd=0, highlightthickness=0)  # Create a canvas for the banner image.
-            rbanner_canvas.grid(column=2, row=0, sticky=EW, padx=(0, 20), pady=27)
-            rbanner = Image.open("AppData/Images/rbanner.png")
-            rbanner = ImageTk.PhotoImage(rbanner)
-            rbanner_canvas.configure(width=rbanner.width()+2, height=rbanner.height())  # Add 2 pixels to width to prevent image clipping on the left of image.
-            rbanner_canvas.create_image(rbanner.width() / 2, rbanner.height() / 2, anchor=CENTER, image=rbanner)  # Add the image to the canvas by calculating the x and y coordinates for centre position.
-            rbanner_canvas.image = rbanner
-
-            banners_loaded = True
+        self.tools.create_banners(page_frame)  # Create the banners on the left and right of the page.
 
         # Set up the main content frame to place the main home frames and elements inside.
-        self.main_content_frame = CTk.CTkFrame(main_window, fg_color="transparent")
+        self.main_content_frame = CTk.CTkFrame(page_frame, fg_color="transparent")
         self.main_content_frame.grid(column=1, row=0, sticky=EW, padx=35, pady=(0,20))
 
         # Logo creation.
         logo_canvas = Canvas(self.main_content_frame, bg=MAIN_WINDOW_BG, bd=0, highlightthickness=0)  # Create a canvas for the banner image.
         logo_canvas.grid(column=0, row=0, sticky=EW, padx=20, pady=(20,0))
-        logo = Image.open("AppData/Images/logo.png")
-        logo = ImageTk.PhotoImage(logo)
+        logo = image_assets.photo("logo.png")
         logo_canvas.configure(width=410, height=logo.height()+5)  # Add 5 pixels to height to prevent image clipping on the bottom of image.
         logo_canvas.create_image(410 / 2, logo.height() / 2, anchor=CENTER, image=logo)  # Add the image to the canvas by calculating the x and y coordinates for centre position.
         logo_canvas.image = logo
@@ -2439,50 +2576,15 @@ class Home:
         self.question_amnt_lbl = CTk.CTkLabel(self.home_frame1, text="", font=(DEFAULT_FONT, 12, "bold"), text_color=FONT_COLOUR)  # Create an empty placeholder label to display the number of questions.
         self.question_amnt_lbl.grid(column=2, row=2, sticky=W, padx=(5,0), pady=(0,20))
 
-        # Set up the username entry, which is either an entry box if there are no usernames saved, or a combo box if there are usernames saved. This prevents the user from trying to open a combo box dropdown when there are no usernames saved.
-        self.display_usernames = [user[1] for user in users]  # Get the usernames from the users list.
-        self.processed = []  # Create an empty list to store one instance of each username, ensuring that there are no duplicates.
-        # Create a list of usernames that are unique regardless of casing (e.g., "Jack" and "JACK" are treated as the same username - "jack"), using ".lower" so that all pr usernames are converted to lowercase.
-        # Only the first occurrence of each lowercase name is included in "unique_display_usernames", as all lowercase versions are added to the "processed" list to find duplicates.
-        self.unique_display_usernames = [name for name in self.display_usernames if not (name.lower() in self.processed or self.processed.append(name.lower()))]  # Usernames included in "unique_display_usernames" are ones that are not already in the "processed" list. If they aren't in the "processed" list, add them to the list to prevent future duplicates.
-
-        if self.unique_display_usernames == []:  # Check if the usernames list is empty.
-            self.username_entry = CTk.CTkEntry(self.home_frame1, fg_color="#73ace0", border_color="#6aa5db", text_color=FONT_COLOUR, corner_radius=10)
-            self.username_entry.insert(0, "")
-            self.entry_type = "CTkEntry"
-        else:
-            # Setup combo box and sliders (scales).
-            self.username_entry = CTk.CTkComboBox(self.home_frame1, fg_color="#73ace0", border_color="#6aa5db", button_color="#6aa5db", button_hover_color="#5997d5", text_color=FONT_COLOUR, corner_radius=10)
-            self.username_entry.set("")
-            self.entry_type = "CTkComboBox"
-            # Attach the scrollable dropdown library to the username entry combo box.
-            self.dropdown = CTkScrollableDropdown(self.username_entry, values=[""], justify="left", button_color="transparent", fg_color="#73ace0", bg_color=FRAME_FG, frame_border_color="#6aa5db", frame_corner_radius=10,
-                                                  scrollbar_button_color="#5997d5", scrollbar_button_hover_color="#497caf", hover_color=MENU_HOVER, text_color=FONT_COLOUR, autocomplete=True)
-            self.dropdown.configure(values=self.unique_display_usernames)  # Set the values of the combo box to the usernames of the users in the users list (user[1]).
-            # CTkScrollableDropdown library utilises "transient()" to stay on top, so after destroying the combo box (by going to a new page - Scoreboard or Quiz) and creating it again (going back to the Home page), the main window needs to be focused. 
-            # If this isn't done, the focus will go back to the dropdown and prevent interaction with the combo box entry section, stopping users from being able to type inside it.
-            main_window.focus_force()  # Focus the main window to ensure interaction with the combo box entry section.
-        self.username_entry.grid(column=1, row=0, padx=5, pady=(20,0), sticky=EW)
+        self.username_entry = None  # The username entry is created when the page is refreshed (see "setup_username_entry"), since its type depends on the usernames saved.
 
-        self.difficulty_slider = CTk.CTkSlider(self.home_frame1, from_=0, to=2, number_of_steps=2, command=lambda value: self.slider_label_update("S1", value), orientation=HORIZONTAL, fg_color="#73ace0", button_color="#4d97e8")
+        # Setup sliders (scales).
+        self.difficulty_slider = CTk.CTkSlider(self.home_frame1, from_=0, to=3, number_of_steps=3, command=lambda value: self.slider_label_update("S1", value), orientation=HORIZONTAL, fg_color="#73ace0", button_color="#4d97e8")
         self.difficulty_slider.grid(column=1, row=1, padx=5, pady=15, sticky=EW)
-        self.questions_slider = CTk.CTkSlider(self.home_frame1, from_=5, to=35, number_of_steps=30, command=lambda value: self.slider_label_update("S2", value), orientation=HORIZONTAL, progress_color="#4d97e8", fg_color="#73ace0", button_color="#4d97e8", button_hover_color="#3b83c4")
+        self.question_range = (5, 35)  # Smallest and largest number of questions the slider allows, before it is limited to the number of different questions (see "limit_questions_slider").
+        self.questions_slider = CTk.CTkSlider(self.home_frame1, from_=self.question_range[0], to=self.question_range[1], number_of_steps=self.question_range[1] - self.question_range[0], command=lambda value: self.slider_label_update("S2", value), orientation=HORIZONTAL, progress_color="#4d97e8", fg_color="#73ace0", button_color="#4d97e8", button_hover_color="#3b83c4")
         self.questions_slider.grid(column=1, row=2, padx=5, pady=(0,20), sticky=EW)
-        
-        # Update the value of the entry box and the sliders (scales) with the previously recorded values (used for going from scoreboard back to homepage).
-        if username != None:
-            if self.entry_type == "CTkEntry":  # Check if the username entry is an entry box, as combo boxes don't support the "insert" method but entry boxes do.
-                self.username_entry.insert(0, username)
-            elif self.entry_type == "CTkComboBox":  # Check if the username entry is a combo box, as entry boxes don't support the "set" method but combo boxes do.
-                self.username_entry.set(username)
-        if difficulty_num != None:
-            self.difficulty_slider.set(difficulty_num)
-        if question_amount != None:
-            self.questions_slider.set(question_amount)
-
-        # Update the labels next to the sliders with their relevant values.
-        self.slider_label_update("S1", self.difficulty_slider.get())
-        self.slider_label_update("S2", self.questions_slider.get())
+        self.default_slider_values = (self.difficulty_slider.get(), self.questions_slider.get())  # Keep the starting values of the sliders, which are used when there are no previously recorded values.
 
         # Create a frame to place the buttons inside.
         self.button_frame = CTk.CTkFrame(self.main_content_frame, fg_color="transparent")
@@ -2504,18 +2606,14 @@ class Home:
                       width=self.button_sizes[0], height=self.button_sizes[1], corner_radius=10, fg_color=BUTTON_FG, hover=None, font=(DEFAULT_FONT, self.button_sizes[2], "bold"), text_color=FONT_COLOUR)
         self.start_button.grid(column=1, row=1, padx=(5,0))
         self.start_button.bind("<Enter>", lambda e: self.tools.on_ctkbutton_enter(self.start_button))  # Bind the "Enter" event to the "on_ctkbutton_enter" method so that the button changes to a darker colour when the mouse hovers over it.
-        
-        if deiconify_reqd == True:   # Check if deiconify is required, which is True when the main window is first created on program start. 
-            main_window.deiconify()  # Show the main window after all elements are created to prevent flickering of the window before the UI is set up.
-            deiconify_reqd = False   # Set the flag to False so that the main window is not deiconified again when the Home page is set up again.
 
 
 
 # Main function for starting the program.
 def main(): 
-    global operating_system, APP_VERSION, main_window, deiconify_reqd, MAIN_WINDOW_BG, FRAME_FG, BUTTON_FG, BUTTON_HOVER, BUTTON_CLICKED, MENU_ACTIVE_FG, MENU_HOVER, FONT_COLOUR, DISABLED_FONT_COLOUR, DEFAULT_FONT, SEMIBOLD_DEFAULT_FONT  # Global variables and constants for the operating system and window UI elements/design.
-    global full_directory, initial_pdf_directory, INITIAL_PDF_NAME, documentation_path, SCOREBOARD_FILE_PATH, SETTINGS_FILE_PATH  # Global variables and constants for the file paths of the general directories, JSON files, and the PDF scoreboard file.
-    global users, overwrite_score, quiz_paused, banners_loaded, username, difficulty_num, question_amount, question_details, settings, default_settings, timer, enable_trigonometry, enable_algebra, deletion_history_states, history_stack, redo_stack, data_loaded  # Global lists and variables for data and flags.
+    global operating_system, APP_VERSION, main_window, image_assets, diagram_cache, navigation_profiler, deiconify_reqd, MAIN_WINDOW_BG, FRAME_FG, BUTTON_FG, BUTTON_HOVER, BUTTON_CLICKED, MENU_ACTIVE_FG, MENU_HOVER, FONT_COLOUR, DISABLED_FONT_COLOUR, DEFAULT_FONT, SEMIBOLD_DEFAULT_FONT  # Global variables and constants for the operating system and window UI elements/design.
+    global full_directory, initial_pdf_directory, INITIAL_PDF_NAME, documentation_path, SCOREBOARD_FILE_PATH, SETTINGS_FILE_PATH, REF_NUMBERS_FILE_PATH, ACCURACY_FILE_PATH, scoreboard_store, scoreboard_cache, ref_allocator, accuracy_stats, persistence_worker, settings_manager, VALIDATION_FILE_PATH, validation_record, question_engine, question_prefetcher  # Global variables and constants for the file paths of the general directories, JSON files, and the PDF scoreboard file.
+    global users, overwrite_score, quiz_paused, ref_number, username, difficulty_num, question_amount, question_details, quiz_topics, settings, default_settings, timer, enabled_topics, deletion_history_states, history_stack, redo_stack, data_loaded, scoreboard_reset_required  # Global lists and variables for data and flags.
 
     # Get the operating system name to manage functionalities in the program with limited support for multiple operating systems.
     # When run on Linux, this will return "Linux". On macOS, this will return "Darwin". On Windows, this will return "Windows".
@@ -2530,9 +2628,14 @@ def main():
     deiconify_reqd = True                           # Initialise a flag to track whether the main window should be deiconified (shown) after all elements are created.
     CTk.deactivate_automatic_dpi_awareness()        # Deactivate the automatic DPI awareness of the CTk library, allowing it to work with Tkinter's DPI scaling. This resolves an issue with the custom combobox not scaling correctly.
     main_window.title("QWhizz Math")                # Set the title of the window.
-    if os.path.exists("AppData/Images/icon.png"):   # Check if the icon file exists before setting it.
-        main_window.iconphoto(False, PhotoImage(file="AppData/Images/icon.png"))  # Set the title bar icon.
+    image_assets = ImageAssets("AppData/Images", ImageTk.PhotoImage, CTk.CTkImage)  # Create the image cache, which decodes each image once and reuses it whenever a page is built.
+    diagram_cache = DiagramCache(CTk.CTkImage)      # Create the cache of the diagrams drawn for questions (e.g. the triangle of trigonometry questions).
+    image_assets.preload(["logo.png", "logo_small.png", "lbanner.png", "rbanner.png", "pause.png", "play.png", "tick.png", "cross.png"])  # Decode the page images on a background thread while the window is set up.
+    if image_assets.exists("icon.png"):             # Check if the icon file exists before setting it.
+        main_window.iconphoto(False, image_assets.photo("icon.png"))  # Set the title bar icon.
     main_window.resizable(False, False)             # Set the program window's resizable property for height and width to False.
+    main_window.columnconfigure(0, weight=1)        # Each page is built inside its own frame in column 0, row 0 of the main window (see "show_page"), which fills the window.
+    main_window.rowconfigure(0, weight=1)
     
     # Colour hex codes for UI elements.
     MAIN_WINDOW_BG = "#d0ebfc"                  # Set the background colour to be used for the main window.
@@ -2555,27 +2658,47 @@ def main():
     initial_pdf_directory = f"{os.path.dirname(os.path.abspath(__file__))}"          # Get the absolute intended path of the scoreboard PDF file for debugging purposes when errors and warnings occur, storing it in "initial_pdf_directory".
     documentation_path = f"{os.path.dirname(os.path.abspath(__file__))}/readme.pdf"  # Get the absolute intended path of the documentation PDF file, for both general use and debugging purposes when errors and warnings occur, storing it in "documentation_path".
     INITIAL_PDF_NAME = "QWhizz Math Scoreboard.pdf"   # Set the file path for the scoreboard PDF file.
-    SCOREBOARD_FILE_PATH = "AppData/scoreboard.json"  # Set the file path for the scoreboard JSON file.
+    SCOREBOARD_JSON_PATH = "AppData/scoreboard.json"  # Set the file path for the scoreboard JSON file.
+    SCOREBOARD_FILE_PATH = "AppData/scoreboard.db" if SCOREBOARD_BACKEND == "SQLite" else SCOREBOARD_JSON_PATH  # Set the file path for the scoreboard file used by the selected storage.
     SETTINGS_FILE_PATH = "AppData/settings.json"      # Set the file path for the settings JSON file.
+    REF_NUMBERS_FILE_PATH = "AppData/ref_numbers.json"  # Set the file path for the reference number allocator JSON file.
+    ACCURACY_FILE_PATH = "AppData/accuracy.json"        # Set the file path for the accuracy statistics JSON file, used by adaptive quizzes.
+    PROFILE_NAVIGATION = False                        # Set to True to print how long each change of page takes and how many widgets it creates (and a summary of each page when the program is closed).
+    VALIDATION_FILE_PATH = "AppData/validation.json"    # Set the file path for the JSON file recording the digest of the last scoreboard found to be valid.
+    if SCOREBOARD_BACKEND == "SQLite":
+        scoreboard_store = ScoreboardDatabase(SCOREBOARD_FILE_PATH, SCOREBOARD_JSON_PATH)  # Create the SQLite store for the scoreboard, which imports the scores from "scoreboard.json" the first time it is used.
+    else:
+        scoreboard_store = ScoreboardJournal(SCOREBOARD_FILE_PATH)  # Create the journaled store for the scoreboard, which appends each change to "scoreboard.journal" and compacts it into "scoreboard.json" in the background.
+    scoreboard_cache = ScoreboardCache(scoreboard_store.data_paths)  # Create the cache that detects changes to the scoreboard files, so that the scoreboard is only reloaded when they change on disk.
+    validation_record = ValidationRecord(VALIDATION_FILE_PATH)       # Create the record of the last scoreboard found to be valid, so that unchanged files aren't checked again.
+    validation_record.load()
+    question_engine = QuestionEngine()                               # Create the question engine that generates the questions of each quiz.
+    navigation_profiler = NavigationProfiler(lambda: tools.widget_names(), main_window.update_idletasks, lambda measurement: print(format_measurement(measurement))) if PROFILE_NAVIGATION == True else None  # Create the profiler that measures each change of page, including the layout of the page.
+    question_prefetcher = QuizPrefetcher(question_engine)            # Create the background thread that generates the next quiz ahead, so that quizzes start straight away.
+    ref_allocator = RefAllocator(REF_NUMBERS_FILE_PATH)              # Create the allocator that hands out the reference numbers of new scores.
+    accuracy_stats = AccuracyStats(ACCURACY_FILE_PATH)               # Create the per-user accuracy statistics that adaptive quizzes choose their question difficulties from.
+    persistence_worker = WriteBehindWorker()                         # Create the background thread that writes scoreboard and settings changes, so that saving doesn't freeze the window.
+    settings_manager = SettingsManager(SETTINGS_FILE_PATH, main_window.after, main_window.after_cancel)  # Create the settings manager, which writes the settings once the settings menu hasn't been changed for half a second.
 
     # Initialise global lists and variables.
     users = []                              # Create empty list for user details and their quiz results to be stored inside.
     overwrite_score = True                  # Initialise a flag to track whether a score should be overwritten or not if a user already exists with the same username and difficulty.
     quiz_paused = False                     # Initialise a flag to track whether the quiz is paused or not.
-    banners_loaded = False                  # Initialise a flag to track whether the banner images have been loaded or not, so that they aren't reloaded when switching between pages that both use the banenr images.
+    ref_number = None                       # Initialise the ref_number attribute as None.
     username = None                         # Initialise the username attribute as None.
     difficulty_num = None                   # Initialise the difficulty_num attribute as None.
     question_amount = None                  # Initialise the question_amount attribute as None.
     question_details = []                   # Create empty list for question details to be stored inside.
+    quiz_topics = []                        # Create empty list for the question topics of the current quiz to be stored inside.
     settings = []                           # Create empty list for settings to be stored inside.
-    default_settings = {"enable_timer": True, "enable_trigonometry": True, "enable_algebra": True, "deletion_history_states": 10}  # Create a dictionary for default settings, with the "enable_timer", "enable_trigonometry", and "enable_algebra" keys set to True and the "deletion_history_states" (amount of deletion events that can be undone) key set to 10.
+    default_settings = {"enable_timer": True, **{topic.settings_key: True for topic in TOPIC_REGISTRY.values()}, "deletion_history_states": 10}  # Create a dictionary for default settings, with the "enable_timer" key and the key of each question topic (e.g. "enable_trigonometry" and "enable_algebra") set to True and the "deletion_history_states" (amount of deletion events that can be undone) key set to 10.
     timer = BooleanVar(value=default_settings["enable_timer"])                           # Create a "timer" BooleanVar global reference to control the timer checkbutton state, with the default value being dependent on the "enable_timer" key in the "default_settings" dictionary, setting the checkbutton in an on state.
-    enable_trigonometry = BooleanVar(value=default_settings["enable_trigonometry"])      # Create an "enable_trigonometry" BooleanVar global reference to control the trigonometry checkbutton state, with the default value being dependent on the "enable_trigonometry" key in the "default_settings" dictionary, setting the checkbutton in an on state.
-    enable_algebra = BooleanVar(value=default_settings["enable_algebra"])                # Create an "enabled_algebra" BooleanVar global reference to control the algebra checkbutton state, with the default value being dependent on the "enable_algebra" key in the "default_settings" dictionary, setting the checkbutton in an on state.
+    enabled_topics = {topic.name: BooleanVar(value=default_settings[topic.settings_key]) for topic in TOPIC_REGISTRY.values()}  # Create a BooleanVar for each registered question topic to control its checkbutton state, with the default value being dependent on the topic's key in the "default_settings" dictionary, setting the checkbuttons in an on state.
     deletion_history_states = IntVar(value=default_settings["deletion_history_states"])  # Create a "deletion_history_states" IntVar global reference to control the deletion history states checkbutton state, with the default value being dependent on the "deletion_history_states" key in the "default_settings" dictionary, setting the "10" checkbutton in an on state.
     history_stack = []                      # Create an empty list stack to store deleted scores, used for undo functionality.
     redo_stack = []                         # Create an empty list stack to store undone deletions, used for redo functionality.
     data_loaded = False                     # Initialise a flag to track whether the JSON file data has been loaded, setting it to False so that the program will attempt to reload data from the file before displaying the scoreboard.
+    scoreboard_reset_required = False       # Initialise a flag to track whether the next scoreboard save must write the whole "users" list (e.g. after the user declined to remove invalid entries from the file), setting it to False so that changes are appended to the journal.
 
     # Set up the class instances.
     # The classes (Tools, Scoreboard, Completion, Quiz, and Home) reference each other, so some instances are first given placeholder values (None) and are linked once the other necessary instances are created.
@@ -2609,10 +2732,25 @@ def main():
     quiz_page.home = home_page                      # Link the "home_page" instance to the "quiz_page" instance to allow access to "Home" class attributes and methods from within the "Quiz" class.
 
     # Load the data from the JSON files and setup the home page.
+    scoreboard_store.compaction_callback = tools.scoreboard_files_changed  # Record the new signature after a background compaction, since compacting doesn't change the scores.
     tools.load_details("scoreboard", SCOREBOARD_FILE_PATH, "users")     # Load the user scores from the scoreboard.json file.
+    if data_loaded == True:
+        try:
+            scoreboard_store.remove_orphan_quiz_saves(users)            # Remove the saved questions of scores that were deleted or overwritten in the last session.
+        except Exception:
+            pass  # Leftover quiz saves only take up disk space, so the program can continue if they cannot be removed.
+    ref_allocator.load(users if data_loaded == True else None)          # Load the reference number allocator, checking it against the loaded scores (or rebuilding it from them if needed).
+    accuracy_stats.load(users if data_loaded == True else None, scoreboard_store.load_quiz_save)  # Load the accuracy statistics, rebuilding them from the saved quizzes if the file is missing (e.g. the first time this version is run).
+    try:
+        accuracy_stats.save()                                           # Save the statistics straight away if they were rebuilt, so that they are only rebuilt once.
+    except OSError:
+        accuracy_stats.changed = True
     tools.load_details("settings", SETTINGS_FILE_PATH, "settings")      # Load the settings from the settings.json file.
     main_window.configure(bg=MAIN_WINDOW_BG)                            # Configure the main window to use the background colour (value) of the "MAIN_WINDOW_BG variable".
     home_page.setup_homepage()                                          # Call the "setup_homepage" method from the "home_page" class instance to set up the home page UI elements.
+    settings_manager.on_flush = tools.queue_settings_write              # Write the settings on the background thread, so that a slow network drive doesn't freeze the settings menu.
+    tools.report_write_errors()                                         # Start checking for failed background writes, so that their error messages are shown.
+    main_window.protocol("WM_DELETE_WINDOW", tools.close_program)       # Wait for any queued writes to finish when the window is closed.
 
     # Start the Tkinter event loop so that the GUI window stays open.
     main_window.mainloop()
@@ -0,0 +1,22 @@
+# Date Created: 17/10/2026
+# Purpose: Shared setup for the tests of the supporting QWhizz Math modules, which are run with pytest from the repository folder.
+
+import os, sys
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # Make the "AppData" package importable when pytest is run from any folder.
+
+from AppData.QWhizz import ScoreboardJournal
+
+
+# Function for creating a score entry in the layout of the "users" list (see "Completion.submit_details"): [reference number, username, difficulty, number of questions, total time, score].
+def make_user(ref_number, username="Jack", difficulty="Easy"):
+    return [ref_number, username, difficulty, 10, "00:01:30", "7/10"]
+
+
+# Fixture for a journaled scoreboard stored in a temporary folder, starting with an empty snapshot.
+@pytest.fixture
+def journal(tmp_path):
+    journal = ScoreboardJournal(str(tmp_path / "scoreboard.json"), compact_threshold=1000)
+    journal.reset([])
+    return journal
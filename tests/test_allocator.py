@@ -0,0 +1,69 @@
+# Date Created: 17/10/2026
+# Purpose: Tests for the allocation of unique reference numbers, which reuses the reference numbers of deleted scores once their deletion can no longer be undone.
+
+import json
+from AppData.QWhizz import RefAllocator
+from conftest import make_user
+
+
+# Function for getting the path of the allocator state file in a temporary folder.
+def state_path(tmp_path):
+    return str(tmp_path / "ref_numbers.json")
+
+
+# Test for counting up from the first reference number when there are no scores.
+def test_allocates_from_first_ref(tmp_path):
+    allocator = RefAllocator(state_path(tmp_path))
+    allocator.load([])
+    assert [allocator.allocate() for _ in range(3)] == [1000, 1001, 1002]
+
+
+# Test for rebuilding the state from the scores when the state file is missing, reusing the gaps between the reference numbers in use.
+def test_rebuilds_from_users(tmp_path):
+    allocator = RefAllocator(state_path(tmp_path))
+    allocator.load([make_user(1000), make_user(1003), make_user("1004"), make_user("not a number")])
+    assert sorted(allocator.allocate() for _ in range(2)) == [1001, 1002]
+    assert allocator.allocate() == 1005
+
+
+# Test for keeping released reference numbers out of use until the program restarts, since their deletion can still be undone.
+def test_released_refs_are_reused_after_restart(tmp_path):
+    allocator = RefAllocator(state_path(tmp_path))
+    allocator.load([make_user(1000), make_user(1001)])
+    allocator.release(1000)
+    assert allocator.allocate() == 1002
+    allocator.save()
+
+    restarted = RefAllocator(state_path(tmp_path))
+    restarted.load([make_user(1001), make_user(1002)])
+    assert restarted.allocate() == 1000
+    assert restarted.allocate() == 1003
+
+
+# Test for reserving the reference number of a restored score, including one above every reference number allocated so far.
+def test_reserve_removes_ref_from_use(tmp_path):
+    allocator = RefAllocator(state_path(tmp_path))
+    allocator.load([make_user(1000), make_user(1002)])
+    allocator.reserve(1001)
+    allocator.reserve(1005)
+    assert sorted(allocator.allocate() for _ in range(3)) == [1003, 1004, 1006]
+
+
+# Test for rebuilding the state when the saved state could allocate a reference number that is already in use (e.g. after the scoreboard was replaced).
+def test_load_rebuilds_conflicting_state(tmp_path):
+    with open(state_path(tmp_path), "w") as file:
+        json.dump({"next": 1001, "free": [], "released": []}, file)
+    allocator = RefAllocator(state_path(tmp_path))
+    allocator.load([make_user(1000), make_user(1004)])
+    assert allocator.next_ref == 1005
+    assert sorted(allocator.free) == [1001, 1002, 1003]
+
+
+# Test for only saving the state when it has changed.
+def test_snapshot_only_when_changed(tmp_path):
+    allocator = RefAllocator(state_path(tmp_path))
+    allocator.load([])
+    assert allocator.snapshot() != None
+    assert allocator.snapshot() == None
+    allocator.allocate()
+    assert allocator.snapshot() == {"next": 1001, "free": [], "released": []}
@@ -0,0 +1,44 @@
+# Date Created: 17/10/2026
+# Purpose: Tests for the NumPy bulk question generation, checking that each bulk generator writes the same kinds of questions as the question generator it copies (see "generation_benchmarks.check_generation").
+
+import math
+import pytest
+from AppData.QWhizz.engine import GENERATORS
+from AppData.QWhizz.generation_benchmarks import CRITICAL_Z, SAMPLE_AMOUNT, family_name, family_sample, summarise_sample, compare_counts
+
+numpy = pytest.importorskip("numpy")  # NumPy is optional, so the bulk generators are only tested if it is installed.
+from AppData.QWhizz.bulk import BULK_GENERATORS, generate_bulk
+
+
+# Test for having a bulk generator for every question family of the question engine.
+def test_every_family_has_bulk_generator():
+    assert set(BULK_GENERATORS) == set(GENERATORS)
+
+
+# Test for generating questions with the same titles, answer formats, fake answer formats and answer values as the question engine, with no fake answers that are repeated or the same as the answer.
+# The samples are the size used by the generation checks, since rare fake answer formats (e.g. "a²") may not appear in smaller samples.
+@pytest.mark.parametrize("family", sorted(GENERATORS), ids=family_name)
+def test_bulk_matches_engine(family):
+    expected = summarise_sample(family_sample(family, SAMPLE_AMOUNT))
+    observed = summarise_sample(BULK_GENERATORS[family](numpy.random.default_rng(1), SAMPLE_AMOUNT))
+    assert observed["invalid_fakes"] == 0
+    for key in ("titles", "answer_formats", "fake_formats"):
+        new_categories, passed = compare_counts(expected[key], observed[key])
+        assert new_categories == [], key
+        assert passed, key
+    standard_error = math.sqrt((expected["answer_sd"] ** 2 + observed["answer_sd"] ** 2) / SAMPLE_AMOUNT)
+    assert abs(observed["answer_mean"] - expected["answer_mean"]) <= CRITICAL_Z * standard_error + 1e-9
+
+
+# Test for generating the same questions for the same seed, in the layout of "engine.generate", with the topic of each question chosen from the given topics.
+def test_generate_bulk_layout():
+    questions = generate_bulk("Medium", ["Trigonometry", "Algebra"], 200, seed=4)
+    assert questions == generate_bulk("Medium", ["Algebra", "Trigonometry"], 200, seed=4)
+    assert {question[0] for question in questions} == {"Trigonometry", "Algebra"}
+    assert all(len(question) == 6 for question in questions)
+
+
+# Test for reporting a difficulty that has no bulk generators with a ValueError.
+def test_generate_bulk_unknown_difficulty():
+    with pytest.raises(ValueError):
+        generate_bulk("Impossible", [], 5, seed=1)
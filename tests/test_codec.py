@@ -0,0 +1,95 @@
+# Date Created: 17/10/2026
+# Purpose: Tests for the compact encoding of quiz saves, checking that every quiz save decodes back to the same questions and that invalid data is reported with a ValueError.
+
+import pytest
+from AppData.QWhizz import SeededQuizSave, AnsweredQuestion, Question, generate, make_recipe
+from AppData.QWhizz.codec import MAGIC, RECIPE_MAGIC, encode_quiz_save, decode_quiz_save
+
+
+# Function for answering each generated question, choosing the answer at a different position for each question so that both correct and incorrect answers are saved.
+def answer_questions(questions):
+    return [question + [([question[4]] + question[5])[index % (len(question[5]) + 1)]] for index, question in enumerate(questions)]
+
+
+# Test for round-tripping generated quizzes of every difficulty, which use the static question types, strings and shapes.
+@pytest.mark.parametrize("difficulty", ["Easy", "Medium", "Hard"])
+def test_round_trip_generated_quiz(difficulty):
+    quiz_save = answer_questions(generate(difficulty, [], 35, seed=7))
+    data = encode_quiz_save(quiz_save)
+    assert data.startswith(MAGIC)
+    assert decode_quiz_save(data) == quiz_save
+
+
+# Test for round-tripping questions that aren't a known question type, with values of other types and numbers that can't be packed.
+def test_round_trip_unknown_values():
+    quiz_save = [
+        ["Geometry", "Circle Area", ["Find the area", "of the circle:"], ["r = 4 cm", None], "50.27 cm²", ["48.00 cm²", "-0.05", "007", "1234567890"], "007"],
+        ["Algebra", "Like Terms", "Simplify:", "4y + 2y", 6, [5.5, True, None], None],
+        ["Números", "Ünïcode ✓", "", "", "-12", ["-0.50", "0.00", "12.5"], "-12"],
+        [],
+    ]
+    data = encode_quiz_save(quiz_save)
+    assert data.startswith(MAGIC)
+    assert decode_quiz_save(data) == quiz_save
+
+
+# Test for round-tripping an empty quiz save.
+def test_round_trip_empty():
+    assert decode_quiz_save(encode_quiz_save([])) == []
+
+
+# Test for encoding question records, which are saved in the same layout as lists.
+def test_encodes_question_records():
+    quiz_save = answer_questions(generate("Medium", ["Algebra"], 5, seed=3))
+    records = [AnsweredQuestion(Question.from_list(question), question[6]) for question in quiz_save]
+    assert decode_quiz_save(encode_quiz_save(records)) == quiz_save
+
+
+# Test for saving a quiz generated from a recipe as the recipe and the positions of the user answers, which decodes back to the same questions and recipe.
+def test_round_trip_recipe():
+    recipe = make_recipe("Hard", ["Trigonometry", "Algebra"], 20, 99)
+    quiz_save = SeededQuizSave(answer_questions(generate("Hard", ["Trigonometry", "Algebra"], 20, seed=99)), recipe)
+    data = encode_quiz_save(quiz_save)
+    assert data.startswith(RECIPE_MAGIC)
+    assert len(data) < 100
+    decoded = decode_quiz_save(data)
+    assert isinstance(decoded, SeededQuizSave)
+    assert decoded == quiz_save
+    assert decoded.recipe == recipe
+
+
+# Test for storing the questions when the recipe doesn't fit the quiz save (a different number of questions, or a user answer that isn't one of the options).
+def test_recipe_falls_back_to_questions():
+    recipe = make_recipe("Easy", [], 5, 1)
+    quiz_save = answer_questions(generate("Easy", [], 5, seed=1))
+    assert encode_quiz_save(quiz_save[:4], recipe).startswith(MAGIC)
+    quiz_save[2][6] = "Not an option"
+    data = encode_quiz_save(quiz_save, recipe)
+    assert data.startswith(MAGIC)
+    assert decode_quiz_save(data) == quiz_save
+
+
+# Test for reporting invalid data with a ValueError, so that the program can report the quiz save as invalid.
+@pytest.mark.parametrize("data", [b"", b"junk", MAGIC, MAGIC + b"\x05\x00\x00\x00[1,", RECIPE_MAGIC, RECIPE_MAGIC + b"\x02\x00\x00\x00[]", RECIPE_MAGIC + b"\x11\x00\x00\x00[9,1,\"Easy\",[],1]\x00"])
+def test_decode_invalid_data(data):
+    with pytest.raises(ValueError):
+        decode_quiz_save(data)
+
+
+# Test for reporting every truncated quiz save, and extra data after a quiz save, with a ValueError.
+def test_decode_truncated_data():
+    data = encode_quiz_save(answer_questions(generate("Easy", [], 5, seed=2)))
+    for length in range(len(data)):
+        with pytest.raises(ValueError):
+            decode_quiz_save(data[:length])
+    with pytest.raises(ValueError):
+        decode_quiz_save(data + b"\x00")
+
+
+# Test for reporting user answer positions that aren't one of the options of a question stored as a recipe.
+def test_decode_invalid_recipe_answers():
+    data = encode_quiz_save(SeededQuizSave(answer_questions(generate("Easy", [], 3, seed=4)), make_recipe("Easy", [], 3, 4)))
+    with pytest.raises(ValueError):
+        decode_quiz_save(data[:-1] + b"\x09")
+    with pytest.raises(ValueError):
+        decode_quiz_save(data + b"\x00")
@@ -0,0 +1,62 @@
+# Date Created: 17/10/2026
+# Purpose: Tests for the SQLite scoreboard store, checking that changes keep the rows in the order of the "users" list and that the indexed lookups agree with the list when it is ahead of the database.
+
+import pytest
+from AppData.QWhizz import ScoreboardDatabase
+from conftest import make_user
+
+
+# Fixture for a SQLite scoreboard stored in a temporary folder, holding 3 scores.
+@pytest.fixture
+def database(tmp_path):
+    database = ScoreboardDatabase(str(tmp_path / "scoreboard.db"))
+    database.reset([make_user(1000, "Jack"), make_user(1001, "Amy"), make_user(1002, "Ben")])
+    yield database
+    database.connection.close()
+
+
+# Test for applying every kind of change, which writes one row each while keeping the rows in the order of the "users" list.
+def test_changes_keep_order(database):
+    users = database.load()
+    changes = [("insert", 0, make_user(1003, "Cal")), ("delete", 2, None), ("replace", 1, make_user(1000, "Jack", "Hard")), ("insert", 2, make_user(1004, "Dee")), ("append", None, make_user(1005, "Eve"))]
+    for operation, index, user in changes:
+        if operation == "insert": users.insert(index, user)
+        elif operation == "delete": del users[index]
+        elif operation == "replace": users[index] = user
+        elif operation == "append": users.append(user)
+    database.record_changes(changes, users)
+    assert database.load() == users
+
+
+# Test for finding scores with the indexed lookups, ignoring the case of the username.
+def test_find_user_and_ref(database):
+    users = database.load()
+    assert database.find_user(users, "AMY", "Easy") == 1
+    assert database.find_user(users, "Amy", "Hard") == None
+    assert database.find_ref(users, "1002") == 2
+    assert database.find_ref(users, 1999) == None
+
+
+# Test for finding scores that are in the "users" list but not yet in the database (e.g. while a change is waiting to be written), so that an existing score isn't added a second time.
+def test_find_when_users_ahead_of_database(database):
+    users = database.load() + [make_user(1003, "Cal")]
+    assert database.find_user(users, "cal", "Easy") == 3
+    assert database.find_ref(users, 1003) == 3
+
+
+# Test for finding scores that have moved in the "users" list since the database was last written.
+def test_find_when_rows_have_moved(database):
+    users = database.load()
+    users.insert(0, make_user(1003, "Cal"))
+    assert database.find_user(users, "Ben", "Easy") == 3
+    assert database.find_ref(users, 1002) == 3
+
+
+# Test for rolling back every change when one of them doesn't fit the database (after the appended score), rather than applying the rest to the wrong rows.
+@pytest.mark.parametrize("change", [("delete", 4, None), ("replace", -1, make_user(1003)), ("insert", 5, make_user(1003)), ("delete", None, None)])
+def test_changes_that_do_not_fit(database, change):
+    users = database.load()
+    with pytest.raises(ValueError):
+        database.record_changes([("append", None, make_user(1004)), change], users)
+    assert database.load() == users
+    assert database.find_ref(users, 1004) == None
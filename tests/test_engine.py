@@ -0,0 +1,139 @@
+# Date Created: 17/10/2026
+# Purpose: Tests for the question engine, checking that quizzes are generated the same way for the same seed, that every generated question has the layout the window expects, that recipes of every version of the generators still generate the same questions, and that quizzes without repeated questions fail quickly when there aren't enough questions.
+
+import hashlib, json
+import pytest
+from AppData.QWhizz import QuestionEngine, GENERATOR_VERSION, generate, make_recipe, generate_from_recipe
+from AppData.QWhizz.engine import TOPICS, DIFFICULTIES, recipe_engines, question_fingerprint, MAX_REPEATS
+
+# SHA-1 digests of the questions generated from the recipe [version, 2026, difficulty, ["Trigonometry", "Algebra"], 30] by each version of the generators.
+# Saved quizzes are generated again from their recipes, so these must never change. A change to the generators needs a new GENERATOR_VERSION (with its digests added here) instead.
+RECIPE_DIGESTS = {
+    (1, "Easy"): "00b8daa0bc4376f6036641ca5a4412a5b4834118",
+    (1, "Medium"): "1a58707303ab69fa6fb2b7b250b22703432ab8d2",
+    (1, "Hard"): "48d8acaa534a94fe000d5816f878065434bb39d7",
+    (2, "Easy"): "d2020b1b811fa81b46afb47c3bf2adad79b40f8f",
+    (2, "Medium"): "077e3bb291ae5d90ceed7a647861a8149f6d9dd8",
+    (2, "Hard"): "069410c042d45b2adde6d2a1109567ab119182ce",
+    (3, "Easy"): "ab1284055935e00d1cf43133a0ea5fe24c7ed999",
+    (3, "Medium"): "077e3bb291ae5d90ceed7a647861a8149f6d9dd8",
+    (3, "Hard"): "cf0f555c855bc746cad041646caebef1ff92e4fe",
+    (4, "Easy"): "a8cb7dfb383204459f6468e70bc69714b157a073",
+    (4, "Medium"): "24b4af29ba33fdeff889a8d643c1c02e176eb05f",
+    (4, "Hard"): "7de75d7e4f1804a78ac0ed7a8cadecebc25ecd46",
+}
+
+
+# Test for generating the same quiz for the same seed, and a different quiz for a different seed.
+@pytest.mark.parametrize("difficulty", DIFFICULTIES)
+def test_same_seed_same_questions(difficulty):
+    assert generate(difficulty, [], 20, seed=42) == generate(difficulty, [], 20, seed=42)
+    assert generate(difficulty, [], 20, seed=42) != generate(difficulty, [], 20, seed=43)
+
+
+# Test for the layout of every generated question: [topic, title, statement, question, answer, fake answers], with 3 different fake answers that aren't the answer.
+@pytest.mark.parametrize("difficulty", DIFFICULTIES)
+@pytest.mark.parametrize("topics", [["Trigonometry"], ["Algebra"], []])
+def test_question_layout(difficulty, topics):
+    for question in generate(difficulty, topics, 40, seed=9):
+        assert len(question) == 6
+        topic, title, statement, text, answer, fake_answers = question
+        assert topic in (topics or TOPICS)
+        assert isinstance(title, str) and isinstance(answer, str)
+        assert len(fake_answers) == 3 and len(set(fake_answers)) == 3
+        assert answer not in fake_answers
+
+
+# Test for generating many quizzes at once from one seed, which is the same each time for the same seed.
+def test_generate_batch():
+    engine = QuestionEngine()
+    batch = engine.generate_batch("Medium", ["Algebra"], 10, 5, seed=3)
+    assert len(batch) == 5 and all(len(quiz) == 10 for quiz in batch)
+    assert batch == engine.generate_batch("Medium", ["Algebra"], 10, 5, seed=3)
+
+
+# Test for choosing topics in a fixed order, so that the order the topics are given in doesn't change the quiz.
+def test_topic_order_does_not_change_quiz():
+    assert generate("Hard", ["Algebra", "Trigonometry"], 20, seed=11) == generate("Hard", ["Trigonometry", "Algebra"], 20, seed=11)
+
+
+# Test for reporting a difficulty that has no question generators with a ValueError.
+def test_unknown_difficulty():
+    with pytest.raises(ValueError):
+        generate("Impossible", [], 5, seed=1)
+
+
+# Function for getting the SHA-1 digest of a list of questions.
+def questions_digest(questions):
+    return hashlib.sha1(json.dumps(questions, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+# Test for generating the same questions from the recipes of every version of the generators.
+@pytest.mark.parametrize("version, difficulty", sorted(RECIPE_DIGESTS))
+def test_recipe_regenerates_same_questions(version, difficulty):
+    assert questions_digest(generate_from_recipe([version, 2026, difficulty, ["Trigonometry", "Algebra"], 30])) == RECIPE_DIGESTS[(version, difficulty)]
+
+
+# Test for covering every version of the generators that recipes can be generated from.
+def test_every_recipe_version_is_covered():
+    assert set(recipe_engines) == {version for version, _ in RECIPE_DIGESTS}
+    assert GENERATOR_VERSION == max(recipe_engines)
+
+
+# Test for generating the same questions from a new recipe as the quiz it was made for.
+def test_make_recipe_matches_generate():
+    recipe = make_recipe("Medium", ["Algebra", "Trigonometry"], 25, 12345)
+    assert recipe[0] == GENERATOR_VERSION
+    assert generate_from_recipe(recipe) == generate("Medium", ["Trigonometry", "Algebra"], 25, seed=12345)
+
+
+# Test for reporting recipes that are invalid or were made by an unknown version of the generators.
+@pytest.mark.parametrize("recipe", [None, [], [GENERATOR_VERSION, 1, "Easy", []], [GENERATOR_VERSION + 1, 1, "Easy", [], 5], [GENERATOR_VERSION, "1", "Easy", [], 5], [GENERATOR_VERSION, 1, "Easy", [], -1]])
+def test_invalid_recipe(recipe):
+    with pytest.raises(ValueError):
+        generate_from_recipe(recipe)
+
+
+# Test for generating every different question of a family without repeating one, and failing for one more question.
+def test_unique_questions_up_to_limit():
+    engine = QuestionEngine()
+    limit = engine.question_limit([("Easy", "Trigonometry")])
+    assert limit == 44
+    questions = engine.generate("Easy", ["Trigonometry"], limit, seed=5)
+    assert len({question_fingerprint(question) for question in questions}) == limit
+    with pytest.raises(ValueError):
+        engine.generate("Easy", ["Trigonometry"], limit + 1, seed=5)
+
+
+# Test for failing before any question is generated when a quiz asks for more questions than its families can generate.
+def test_unique_fails_fast_with_known_counts():
+    calls = []
+    def generator(rng, distractors):
+        calls.append(None)
+        return ["Test", "Same", "", str(rng.randrange(3)), "1", ["2", "3", "4"]]
+    engine = QuestionEngine(generators={("Easy", "Test"): generator}, question_counts={("Easy", "Test"): 3})
+    assert engine.question_limit([("Easy", "Test")]) == 3
+    with pytest.raises(ValueError):
+        engine.generate_families([("Easy", "Test")], 4, seed=1)
+    assert calls == []
+
+
+# Test for failing, rather than repeating forever, when a generator whose number of different questions isn't known runs out of questions.
+def test_unique_fails_when_generator_runs_out():
+    calls = []
+    def generator(rng, distractors):
+        calls.append(None)
+        return ["Test", "Same", "", str(rng.randrange(2)), "1", ["2", "3", "4"]]
+    engine = QuestionEngine(generators={("Easy", "Test"): generator})
+    assert engine.question_limit([("Easy", "Test")]) == None
+    with pytest.raises(ValueError):
+        engine.generate_families([("Easy", "Test")], 3, seed=1)
+    assert len(calls) < 2 + 2 * MAX_REPEATS
+
+
+# Test for the question limits of engines that can repeat questions, and of families that can't be generated.
+def test_question_limit_without_uniqueness():
+    assert QuestionEngine(unique=False).question_limit([("Easy", "Trigonometry")]) == None
+    assert QuestionEngine().question_limit([("Impossible", "Trigonometry")]) == 0
+    assert QuestionEngine().question_limit([("Easy", "Trigonometry"), ("Hard", "Trigonometry")]) == 44 + 45
+    assert len(QuestionEngine(unique=False).generate("Easy", ["Trigonometry"], 100, seed=1)) == 100
@@ -0,0 +1,194 @@
+# Date Created: 17/10/2026
+# Purpose: Tests for the journaled scoreboard storage, covering the replay of journal records and recovery from compactions that were interrupted part of the way through.
+
+import hashlib, json, os
+import pytest
+from AppData.QWhizz import ScoreboardJournal
+from conftest import make_user
+
+
+# Function for loading the scoreboard with a new journal, as the program does when it starts again (e.g. after being closed during a compaction).
+def reload(journal):
+    return ScoreboardJournal(journal.snapshot_path).load()
+
+
+# Function for reading the scoreboard snapshot file without replaying the journal.
+def read_snapshot(journal):
+    with open(journal.snapshot_path, "r") as file:
+        return json.load(file)
+
+
+# Test for replaying every kind of journal record on top of the snapshot.
+def test_replay_applies_records_to_snapshot(journal):
+    users = [make_user(1000), make_user(1001, "Amy")]
+    journal.reset(users)
+    journal.record_changes([("append", None, make_user(1002, "Ben")), ("replace", 0, make_user(1000, "Jack", "Hard")), ("delete", 1, None), ("insert", 0, make_user(1003, "Cal"))], users)
+
+    assert read_snapshot(journal) == [make_user(1000), make_user(1001, "Amy")]  # The changes are only in the journal until it is compacted.
+    assert reload(journal) == [make_user(1003, "Cal"), make_user(1000, "Jack", "Hard"), make_user(1002, "Ben")]
+
+
+# Test for replaying a "clear" record followed by new records.
+def test_replay_clear_then_append(journal):
+    users = [make_user(1000), make_user(1001)]
+    journal.reset(users)
+    journal.record_changes([("clear", None, None), ("append", None, make_user(1002))], users)
+    assert reload(journal) == [make_user(1002)]
+
+
+# Test for folding the replayed records into a new snapshot when the scoreboard is loaded, so that they aren't replayed again.
+def test_load_folds_journal_into_snapshot(journal):
+    journal.record_changes([("append", None, make_user(1000)), ("append", None, make_user(1001))], [])
+    assert reload(journal) == [make_user(1000), make_user(1001)]
+    assert not os.path.exists(journal.journal_path)
+    assert read_snapshot(journal) == [make_user(1000), make_user(1001)]
+    assert reload(journal) == [make_user(1000), make_user(1001)]
+
+
+# Test for skipping a partially written record left at the end of the journal by an interrupted save.
+def test_replay_skips_partial_record(journal):
+    journal.record_changes([("append", None, make_user(1000))], [])
+    with open(journal.journal_path, "ab") as file:
+        file.write(b'{"seq": 2, "op": "append", "index": null, "user": [1001, "Am')
+    assert reload(journal) == [make_user(1000)]
+
+
+# Test for reporting records that don't fit the snapshot (e.g. a deletion of a score removed by hand) with a JSONDecodeError, rather than skipping them or applying the records after them to the wrong scores.
+@pytest.mark.parametrize("change", [("delete", 5, None), ("replace", 3, make_user(1001)), ("insert", 7, make_user(1001)), ("delete", -1, None), ("delete", None, None), ("move", 0, None)])
+def test_replay_rejects_records_that_do_not_fit(journal, change):
+    users = [make_user(1000)]
+    journal.reset(users)
+    journal.record_changes([change, ("append", None, make_user(1002))], users)
+    with pytest.raises(json.JSONDecodeError):
+        reload(journal)
+    assert read_snapshot(journal) == [make_user(1000)]  # The snapshot and journal are left unchanged, so that no change is lost.
+    assert os.path.exists(journal.journal_path)
+
+
+# Test for inserting a score after the last score, which fits the snapshot.
+def test_replay_insert_at_end(journal):
+    users = [make_user(1000)]
+    journal.reset(users)
+    journal.record_changes([("insert", 1, make_user(1001))], users)
+    assert reload(journal) == [make_user(1000), make_user(1001)]
+
+
+# Test for saving after the user declined to remove the invalid entries from the snapshot, which the program does by writing the whole list of valid entries (see "scoreboard_reset_required") rather than journaling changes by position.
+# Journaling the deletion of the second valid entry would delete the invalid entry from the snapshot instead, bringing the deleted score back.
+def test_save_after_declined_repair(journal):
+    journal.reset([make_user(1000), ["invalid"], make_user(1002)])
+    users = [make_user(1000), make_user(1002)]  # The invalid entry is only removed from the list in memory.
+
+    del users[1]
+    journal.reset(users)  # The first save after the declined repair.
+    journal.record_changes([("append", None, make_user(1003))], users + [make_user(1003)])
+    assert reload(journal) == [make_user(1000), make_user(1003)]
+
+
+# Test for a compaction that finishes, which replaces the snapshot and removes the rotated journal, leaving records made after it in the new journal.
+def test_compaction_writes_snapshot(journal):
+    users = [make_user(1000)]
+    journal.record_changes([("append", None, users[0])], users)
+    journal.compact(users)
+    journal.wait()
+    users.append(make_user(1001))
+    journal.record_changes([("append", None, users[1])], users)
+
+    assert journal.compaction_error == None
+    assert read_snapshot(journal) == [make_user(1000)]
+    assert not os.path.exists(journal.rotated_path)
+    assert reload(journal) == [make_user(1000), make_user(1001)]
+
+
+# Test for recovering from a compaction interrupted after the journal was rotated but before the new snapshot was written.
+# The records are split between the rotated journal and the new journal, and both are replayed in order.
+def test_recovery_after_rotation(journal):
+    users = [make_user(1000), make_user(1001)]
+    journal.reset(users)
+    journal.record_changes([("delete", 0, None)], users)
+    with journal.lock:
+        journal.rotate()
+    journal.record_changes([("append", None, make_user(1002))], users)
+
+    assert os.path.exists(journal.rotated_path)
+    assert reload(journal) == [make_user(1001), make_user(1002)]
+    assert not os.path.exists(journal.rotated_path)
+
+
+# Test for recovering from a compaction interrupted after the checkpoint was written but before the snapshot was replaced.
+# The checkpoint doesn't match the old snapshot, so every record is replayed on top of it.
+def test_recovery_after_checkpoint_written(journal, monkeypatch):
+    users = [make_user(1000)]
+    journal.reset(users)
+    journal.record_changes([("append", None, make_user(1001))], users)
+    users.append(make_user(1001))
+
+    replace = os.replace
+    def interrupted_replace(source, destination):
+        if destination == journal.snapshot_path:
+            raise OSError("Interrupted before the snapshot was replaced")
+        return replace(source, destination)
+    monkeypatch.setattr(os, "replace", interrupted_replace)
+    journal.compact(users)
+    journal.wait()
+    monkeypatch.undo()
+
+    assert isinstance(journal.compaction_error, OSError)
+    assert read_snapshot(journal) == [make_user(1000)]
+    assert reload(journal) == [make_user(1000), make_user(1001)]
+
+
+# Test for recovering from a compaction interrupted after the snapshot was replaced but before the rotated journal was removed.
+# The checkpoint matches the new snapshot, so the records already folded into it aren't replayed a second time.
+def test_recovery_after_snapshot_replaced(journal, monkeypatch):
+    users = [make_user(1000)]
+    journal.reset(users)
+    journal.record_changes([("append", None, make_user(1001))], users)
+    users.append(make_user(1001))
+
+    remove = os.remove
+    def interrupted_remove(path):
+        if path == journal.rotated_path:
+            raise OSError("Interrupted before the rotated journal was removed")
+        return remove(path)
+    monkeypatch.setattr(os, "remove", interrupted_remove)
+    journal.compact(users)
+    journal.wait()
+    monkeypatch.undo()
+    journal.record_changes([("append", None, make_user(1002))], users)
+
+    assert isinstance(journal.compaction_error, OSError)
+    assert os.path.exists(journal.rotated_path)
+    assert read_snapshot(journal) == [make_user(1000), make_user(1001)]
+    assert reload(journal) == [make_user(1000), make_user(1001), make_user(1002)]
+
+
+# Test for keeping the records of a failed compaction when the next compaction rotates the journal again, so that no change is lost.
+def test_compaction_after_failed_compaction(journal, monkeypatch):
+    users = [make_user(1000)]
+    journal.record_changes([("append", None, users[0])], users)
+
+    def failed_write(snapshot, seq):
+        raise OSError("Disk full")
+    monkeypatch.setattr(journal, "write_snapshot", failed_write)
+    journal.compact(users)
+    journal.wait()
+    monkeypatch.undo()
+    assert isinstance(journal.compaction_error, OSError)
+
+    users.append(make_user(1001))
+    journal.record_changes([("append", None, users[1])], users)
+    with journal.lock:
+        journal.rotate()  # Adds the new records to the rotated journal left by the failed compaction.
+    assert not os.path.exists(journal.journal_path)
+    assert reload(journal) == [make_user(1000), make_user(1001)]
+
+
+# Test for the signatures recorded by the store, which match the digest of each file without it being read again.
+def test_signatures_match_files(journal):
+    journal.record_changes([("append", None, make_user(1000))], [])
+    signatures = journal.file_signatures()
+    for path in (journal.snapshot_path, journal.journal_path):
+        with open(path, "rb") as file:
+            assert signatures[path][1] == hashlib.sha1(file.read()).hexdigest()
+    assert signatures[journal.rotated_path] == (None, None)
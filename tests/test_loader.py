@@ -0,0 +1,66 @@
+# Date Created: 17/10/2026
+# Purpose: Tests for the incremental reading of scoreboard files, checking that every block size reads the same items as "json.loads" and that incorrectly formatted files are reported with a JSONDecodeError.
+
+import hashlib, io, json
+import pytest
+from AppData.QWhizz.loader import DigestReader, iter_json_array
+from conftest import make_user
+
+SCOREBOARD = [make_user(1000), make_user(1001, "Zoë ✓", "Hard"), [1002, "Amy", "Medium", 25, "00:10:05", "-7.5e3"], -12.25e-3, "a, \"quoted\" ]", {"key": [1, 2]}, [], True, None, 1234567890]  # Items with numbers, escaped strings and characters that cross block boundaries.
+
+
+# Function for reading every item of the JSON array in the data.
+def read_items(data, block_size=1 << 16):
+    return list(iter_json_array(io.BytesIO(data), block_size))
+
+
+# Test for reading the same items as "json.loads" for every block size, so that items, numbers and multi-byte characters split across blocks are read correctly.
+@pytest.mark.parametrize("block_size", range(1, 65))
+def test_matches_json_loads(block_size):
+    for text in (json.dumps(SCOREBOARD), json.dumps(SCOREBOARD, ensure_ascii=False, indent=4), "[]", " [ ] \n", "[7]", "[-7.5e3 , 12]"):
+        data = text.encode("utf-8")
+        assert read_items(data, block_size) == json.loads(text)
+
+
+# Test for skipping a byte order mark at the start of the file, which some text editors add when a file is saved.
+@pytest.mark.parametrize("block_size", [1, 2, 3, 1 << 16])
+def test_skips_byte_order_mark(block_size):
+    data = b"\xef\xbb\xbf" + json.dumps(SCOREBOARD, ensure_ascii=False).encode("utf-8")
+    assert read_items(data, block_size) == SCOREBOARD
+
+
+# Test for reporting incorrectly formatted files with a JSONDecodeError, like "json.loads" would, for every block size.
+@pytest.mark.parametrize("text", ["", "   ", "[1,]", "[1 2]", "[1]x", "[1] [2]", "[,1]", "[1,,2]", "[\"unterminated]", "[tru]"])
+@pytest.mark.parametrize("block_size", [1, 2, 5, 1 << 16])
+def test_rejects_invalid_files(text, block_size):
+    with pytest.raises(json.JSONDecodeError):
+        json.loads(text)
+    with pytest.raises(json.JSONDecodeError):
+        read_items(text.encode("utf-8"), block_size)
+
+
+# Test for reporting files that are valid JSON but not a list with a JSONDecodeError, which the program reports as an invalid scoreboard.
+@pytest.mark.parametrize("text", ["{\"users\": []}", "1", "\"[]\"", "null"])
+def test_rejects_files_that_are_not_lists(text):
+    with pytest.raises(json.JSONDecodeError):
+        read_items(text.encode("utf-8"))
+
+
+# Test for reporting every truncated scoreboard file with a JSONDecodeError, rather than returning the scores read before the end of the file.
+def test_rejects_truncated_files():
+    data = json.dumps(SCOREBOARD, ensure_ascii=False).encode("utf-8")
+    for length in range(len(data)):
+        try:
+            data[:length].decode("utf-8")
+        except UnicodeDecodeError:
+            continue  # A file cut off inside a character is reported by the decoder instead.
+        with pytest.raises(json.JSONDecodeError):
+            read_items(data[:length], 7)
+
+
+# Test for adding every block read through a "DigestReader" to the digest, so that the digest matches the whole file.
+def test_digest_reader_matches_file():
+    data = json.dumps(SCOREBOARD).encode("utf-8")
+    digest = hashlib.sha1()
+    assert list(iter_json_array(DigestReader(io.BytesIO(data), digest), 5)) == SCOREBOARD
+    assert digest.hexdigest() == hashlib.sha1(data).hexdigest()
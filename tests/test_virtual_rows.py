@@ -0,0 +1,101 @@
+# Date Created: 17/10/2026
+# Purpose: Tests for the virtual list of scoreboard rows, checking the rows kept in the window and that the selection follows the "extended" selection mode of the Treeview, including for rows outside the window.
+
+from AppData.QWhizz import VirtualRows
+from conftest import make_user
+
+
+# Function for creating virtual rows holding the given number of scores, with reference numbers counting up from 1000.
+def make_rows(count, visible=10, buffer=5):
+    rows = VirtualRows(visible, buffer)
+    rows.extend([make_user(1000 + index) for index in range(count)])
+    return rows
+
+
+# Test for only adding rows to the Treeview until the window is full.
+def test_extend_fills_window():
+    rows = VirtualRows(10, 5)
+    assert rows.extend([make_user(1000 + index) for index in range(12)]) == range(0, 12)
+    assert rows.extend([make_user(1012 + index) for index in range(12)]) == range(12, 20)
+    assert rows.extend([make_user(1024)]) == range(0)
+    assert len(rows) == 25
+
+
+# Test for moving the window to keep a buffer of rows on each side of the visible rows, staying full at the end of the list.
+def test_move_window():
+    rows = make_rows(100)
+    assert rows.move_window(50) == range(45, 65)
+    assert rows.needs_refill(51) == False
+    assert rows.needs_refill(60) == True
+    assert rows.move_window(95) == range(80, 100)
+    assert rows.top == 90
+
+
+# Test for selecting only the clicked row.
+def test_click_selects_row():
+    rows = make_rows(30)
+    rows.click(3)
+    rows.click(5)
+    assert rows.selected_refs() == ["1005"]
+
+
+# Test for adding and removing rows from the selection with Ctrl+click.
+def test_toggle_click():
+    rows = make_rows(30)
+    rows.click(7)
+    rows.click(2, toggle=True)
+    rows.click(9, toggle=True)
+    rows.click(7, toggle=True)
+    assert rows.selected_refs() == ["1002", "1009"]
+
+
+# Test for selecting every row from the last row clicked with Shift+click, in either direction.
+def test_extend_click():
+    rows = make_rows(30)
+    rows.click(4)
+    rows.click(7, extend=True)
+    assert rows.selected_refs() == ["1004", "1005", "1006", "1007"]
+    rows.click(2, extend=True)
+    assert rows.selected_refs() == ["1002", "1003", "1004"]
+
+
+# Test for a Shift+click with no row clicked before it, which selects only the clicked row.
+def test_extend_click_without_anchor():
+    rows = make_rows(30)
+    rows.click(6, extend=True)
+    assert rows.selected_refs() == ["1006"]
+
+
+# Test for keeping the selection of rows that have been scrolled out of the window.
+def test_selection_kept_outside_window():
+    rows = make_rows(200)
+    rows.move_window(0)
+    rows.click(3)
+    rows.move_window(150)
+    rows.click(160, toggle=True)
+    assert rows.selected_in_window() == [160]
+    assert rows.selected_refs() == ["1003", "1160"]
+    rows.move_window(0)
+    assert rows.selected_in_window() == [3]
+
+
+# Test for updating the selection from the rows selected in the Treeview, which only changes the rows in the window.
+def test_sync_window():
+    rows = make_rows(200)
+    rows.click(2)
+    rows.click(180, toggle=True)
+    rows.move_window(0)
+    rows.sync_window([4, 5])
+    assert rows.selected_refs() == ["1004", "1005", "1180"]
+    rows.sync_window([])
+    assert rows.selected_refs() == ["1180"]
+
+
+# Test for clearing the rows and the selection.
+def test_clear():
+    rows = make_rows(30)
+    rows.click(1)
+    rows.clear()
+    assert len(rows) == 0
+    assert rows.selected_refs() == []
+    assert rows.fractions(0) == (0.0, 1.0)